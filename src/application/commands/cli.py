@@ -1,23 +1,43 @@
 # main.py 또는 commands/cli.py (조립 계층)
-import os
+import asyncio
+import datetime
 import sys
 
 from dotenv import load_dotenv
 
 # 환경 변수 로드 (예: MONGO_URI)
-from application.services.youtube_service import ChannelInsertService, RawDataCrawlService
-from domain.model.youtube import YoutubeChannel
-from infrastructure.api.youtube_api_client import YoutubeAPIClient
-from infrastructure.persistence.mongo_repository import MongoYoutubeRepository
-
 load_dotenv()
 
+from application.routers.youtube.dependencies import (  # noqa: E402
+    get_embedder,
+    get_embedding_cache_repository,
+    get_embedding_ingestion_service,
+    get_lexical_index_service,
+    get_log_repository,
+    get_qdrant_client,
+    get_raw_data_crawl_service,
+    get_raw_data_export_service,
+    get_youtube_api_client,
+)
+from application.services.youtube_service import ChannelCreateService  # noqa: E402
+from domain.repository.embedding import EmbeddingCacheRepository  # noqa: E402
+from infrastructure.api.cached_embedder import CachedEmbedder  # noqa: E402
+from infrastructure.api.youtube_api_client import YoutubeAPIClient  # noqa: E402
+from infrastructure.persistence.mongo_repository import (  # noqa: E402
+    MongoAPIKeyRepository,
+    MongoYoutubeRepository,
+)
+from shared.config.settings import get_settings  # noqa: E402
+
 
 # --- 3. 실행 함수 ---
-def run_channel_insert_command(channel_name: str, channel_handle: str, streamer_name: str) -> None:
+async def run_channel_insert_command(
+    api_client: YoutubeAPIClient, channel_name: str, channel_handle: str, streamer_name: str
+) -> None:
     """채널 정보를 수집하고 데이터베이스에 저장합니다.
 
     Args:
+        api_client (YoutubeAPIClient): 커넥션 풀을 공유하는 API 클라이언트
         channel_name (str): 채널 이름
         channel_handle (str): 채널 핸들
         streamer_name (str): 스트리머 이름
@@ -26,78 +46,125 @@ def run_channel_insert_command(channel_name: str, channel_handle: str, streamer_
     # [A] 리포지토리 구현체 객체 생성 (인프라스트럭처)
     # 실제 MongoDB 연결 설정이 여기서 이루어집니다.
     mongo_repo = MongoYoutubeRepository()
-    api_key = os.getenv("YOUTUBE_API_KEY")
-    if not api_key:
-        print("❌ YOUTUBE_API_KEY 환경 변수가 설정되지 않았습니다.")
-        sys.exit(1)
-    api_client = YoutubeAPIClient(api_key=api_key)
+    api_key_repo = MongoAPIKeyRepository()
     # [B] 응용 서비스 객체 생성 및 의존성 주입 (DIP)
     # 서비스는 인터페이스(YoutubeChannelRepository)를 통해 구현체를 전달받습니다.
-    crawl_service = ChannelInsertService(channel_repo=mongo_repo, api_client=api_client)
+    create_service = ChannelCreateService(channel_repo=mongo_repo, api_key_repo=api_key_repo, api_client=api_client)
 
     # [C] 서비스 메서드 실행
     print(f"\n🚀 크롤링을 시작합니다: {channel_name} ({channel_handle})")
-    try:
-        crawl_service.insert_channel(
-            channel_name=channel_name,
-            channel_handle=channel_handle,
-            streamer_name=streamer_name,
-        )
-        print("🎉 크롤링 및 저장이 성공적으로 완료되었습니다.")
-
-    except Exception as e:
-        print(f"❌ 크롤링 중 오류가 발생했습니다: {e}")
-        # 실제 환경에서는 로깅 처리
-        sys.exit(1)
+    await create_service.insert_channel(
+        channel_name=channel_name,
+        channel_handle=channel_handle,
+        streamer_name=streamer_name,
+    )
+    print("🎉 크롤링 및 저장이 성공적으로 완료되었습니다.")
 
 
-def run_video_rawdata_crawl_command() -> None:
-    """유튜브 원시 데이터를 수집하고 데이터베이스에 저장합니다.
+async def run_video_rawdata_crawl_command() -> None:
+    """초기화되지 않은 채널들의 유튜브 원시 데이터를 수집하고 데이터베이스에 저장합니다.
 
-    Args:
-        youtube_channel (YoutubeChannel): 유튜브 채널 객체
+    API와 같은 설정(수집 시작 시각, 워터마크, 열거 방식 등)으로 조립한 서비스를 사용하며,
+    API 클라이언트와 로그 저장소는 main에서 연 공유 인스턴스를 그대로 사용합니다.
     """
+    raw_data_crawl_service = get_raw_data_crawl_service()
+    await raw_data_crawl_service.initialize_you_tube_video_data()
 
-    # [A] 리포지토리 구현체 객체 생성 (인프라스트럭처)
-    # 실제 MongoDB 연결 설정이 여기서 이루어집니다.
-    mongo_repo = MongoYoutubeRepository()
-    api_key = os.getenv("YOUTUBE_API_KEY")
-    if not api_key:
-        print("❌ YOUTUBE_API_KEY 환경 변수가 설정되지 않았습니다.")
-        sys.exit(1)
-    api_client = YoutubeAPIClient(api_key=api_key)
 
-    # youtube_channel = mongo_repo.get_channel_by_id("UCZznqq0-ZBvtel1ieA8f35g")  # 예시 채널 ID
-    youtube_channels = mongo_repo._db["channels"].find({"initialized": False})
-    for channel_data in youtube_channels:
-        channel_data.pop("_id", None)  # MongoDB의 _id 필드 제거
-        youtube_channel = YoutubeChannel(**channel_data)
+async def run_embedding_cache_cleanup_command(cache_repo: EmbeddingCacheRepository) -> None:
+    """오래 사용하지 않은 임베딩 캐시를 삭제하고 저장 공간을 회수합니다.
 
-        raw_data_crawl_service = RawDataCrawlService(
-            youtube_repo=mongo_repo,
-            api_client=api_client,
-        )
-        raw_data_crawl_service.initialize_you_tube_video_data(youtube_channel=youtube_channel)
+    Args:
+        cache_repo (EmbeddingCacheRepository): 정리할 임베딩 캐시 저장소
+    """
+    settings = get_settings()
+    before = await cache_repo.count()
+    evicted = await cache_repo.evict(
+        max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+        unused_before=datetime.datetime.now(datetime.timezone.utc)
+        - datetime.timedelta(days=settings.EMBEDDING_CACHE_MAX_UNUSED_DAYS),
+    )
+    await cache_repo.compact()
+    remaining = await cache_repo.count()
+    print(f"임베딩 캐시를 정리했습니다: {before}개 중 {evicted}개 삭제, {remaining}개 남음")
+
+
+async def main(command: str) -> None:
+    # CLI 실행 동안 하나의 커넥션 풀과 로그 버퍼를 열어두고, 종료 시 정리 (남은 로그 저장 포함)
+    async with get_youtube_api_client() as api_client, get_log_repository():
+        if command == "채널":
+            while True:
+                print("유튜브 채널 아이디를 수집합니다. Ctrl+C로 종료할 수 있습니다.")
+                input_name = input("채널 이름을 입력하세요: ")
+                input_handle = input("채널 핸들을 입력하세요: ")
+                input_streamer = input("스트리머 이름을 입력하세요: ")
+                try:
+                    await run_channel_insert_command(
+                        api_client=api_client,
+                        channel_name=input_name,
+                        channel_handle=input_handle,
+                        streamer_name=input_streamer,
+                    )
+                except Exception as e:
+                    print(f"❌ 크롤링 중 오류가 발생했습니다: {e}")
+        elif command == "비디오":
+            try:
+                await run_video_rawdata_crawl_command()
+            except Exception as e:
+                print(f"❌ 크롤링 중 오류가 발생했습니다: {e}")
+                sys.exit(1)
+            print("비디오 원시 데이터 수집이 완료되었습니다.")
+        elif command == "임베딩":
+            try:
+                report = await get_embedding_ingestion_service().ingest()
+            except Exception as e:
+                print(f"❌ 임베딩 중 오류가 발생했습니다: {e}")
+                sys.exit(1)
+            finally:
+                await get_qdrant_client().close()
+            print(f"임베딩 적재가 완료되었습니다: {report.to_dict()}")
+            embedder = get_embedder()
+            if isinstance(embedder, CachedEmbedder):
+                print(f"임베딩 캐시 적중률: {embedder.metrics.to_dict()}")
+        elif command == "캐시정리":
+            cache_repo = get_embedding_cache_repository()
+            if cache_repo is None:
+                print("임베딩 캐시가 비활성화되어 있습니다. (EMBEDDING_CACHE_BACKEND)")
+                return
+            try:
+                await run_embedding_cache_cleanup_command(cache_repo)
+            except Exception as e:
+                print(f"❌ 임베딩 캐시 정리 중 오류가 발생했습니다: {e}")
+                sys.exit(1)
+        elif command == "색인":
+            service = get_lexical_index_service()
+            if service is None:
+                print("단어 색인이 비활성화되어 있습니다. (LEXICAL_INDEX_ENABLED)")
+                return
+            try:
+                report = await service.build()
+            except Exception as e:
+                print(f"❌ 단어 색인 중 오류가 발생했습니다: {e}")
+                sys.exit(1)
+            print(f"단어 색인이 완료되었습니다: {report.to_dict()}")
+        elif command == "내보내기":
+            full = input("이전 파일을 지우고 처음부터 내보낼까요? (y/N): ").strip().lower() == "y"
+            try:
+                report = await get_raw_data_export_service().export(full=full)
+            except Exception as e:
+                print(f"❌ 내보내기 중 오류가 발생했습니다: {e}")
+                sys.exit(1)
+            print(f"원시 데이터 내보내기가 완료되었습니다: {report.to_dict()}")
 
 
 # --- 4. CLI 진입점 ---
 if __name__ == "__main__":
     # 커맨드라인 인수로 채널 정보를 받는다고 가정
-    command = input("커맨드를 선택해주세요. '채널' 저장 또는 '비디오' 수집: ")
-    if command == "채널":
-        while True:
-            print("유튜브 채널 아이디를 수집합니다. Ctrl+C로 종료할 수 있습니다.")
-            input_name = input("채널 이름을 입력하세요: ")
-            input_handle = input("채널 핸들을 입력하세요: ")
-            input_streamer = input("스트리머 이름을 입력하세요: ")
-            try:
-                run_channel_insert_command(
-                    channel_name=input_name,
-                    channel_handle=input_handle,
-                    streamer_name=input_streamer,
-                )
-            except Exception as e:
-                print(f"❌ 크롤링 중 오류가 발생했습니다: {e}")
-    elif command == "비디오":
-        run_video_rawdata_crawl_command()
-        print("비디오 원시 데이터 수집이 완료되었습니다.")
+    command = input(
+        "커맨드를 선택해주세요. '채널' 저장, '비디오' 수집, '임베딩' 적재, 임베딩 '캐시정리', 단어 '색인' "
+        "또는 원시 데이터 '내보내기': "
+    )
+    try:
+        asyncio.run(main(command))
+    except KeyboardInterrupt:
+        pass
@@ -26,3 +26,18 @@ class YoutubeAPIRequestError(Exception):
 
     def __str__(self):
         return f"YoutubeAPIRequestError: {self.message}"
+
+
+class APIQuotaExhaustedError(Exception):
+    """사용 가능한 쿼터가 남은 API 키가 없을 때 발생하는 예외 클래스
+
+    Args:
+        Exception (_type_): _description_
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return f"APIQuotaExhaustedError: {self.message}"
@@ -1,8 +1,58 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from application.routers.search.router import router as search_router
+from application.routers.youtube.dependencies import (
+    get_crawl_job_runner,
+    get_crawler_schedule_service,
+    get_log_repository,
+    get_qdrant_client,
+    get_youtube_api_client,
+)
 from application.routers.youtube.router import router as youtube_router
+from infrastructure.persistence.mongo_repository import (
+    MongoApiResponseCacheRepository,
+    MongoCrawlerScheduleRepository,
+    MongoCrawlJobRepository,
+    MongoEmbeddingCacheRepository,
+    MongoEmbeddingStateRepository,
+    MongoYoutubeRepository,
+)
+from shared.config.settings import get_settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 시작 시 커넥션 풀을 열고, 종료 시 남은 커넥션을 정리
+    await MongoYoutubeRepository().ensure_indexes()
+    await MongoCrawlJobRepository().ensure_indexes()
+    await MongoCrawlerScheduleRepository().ensure_indexes()
+    await MongoEmbeddingStateRepository().ensure_indexes()
+    if get_settings().EMBEDDING_CACHE_BACKEND == "mongo":
+        await MongoEmbeddingCacheRepository().ensure_indexes()
+    if get_settings().YOUTUBE_CACHE_MONGO_ENABLED:
+        await MongoApiResponseCacheRepository().ensure_indexes()
+    youtube_client = get_youtube_api_client()
+    await youtube_client.start()
+    log_repo = get_log_repository()
+    await log_repo.start()
+    job_runner = get_crawl_job_runner()
+    await job_runner.start()
+    scheduler = get_crawler_schedule_service()
+    if get_settings().SCHEDULER_ENABLED:
+        await scheduler.start()
+    yield
+    await scheduler.aclose()
+    # 실행 중인 크롤링 작업은 중단되고 다음 시작 시 다시 대기열에 들어감
+    await job_runner.aclose()
+    await youtube_client.aclose()
+    await get_qdrant_client().close()
+    # 버퍼에 남은 로그를 모두 저장한 뒤 종료
+    await log_repo.aclose()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/")
@@ -11,3 +61,4 @@ def read_root():
 
 
 app.include_router(youtube_router)
+app.include_router(search_router)
@@ -0,0 +1,22 @@
+from functools import lru_cache
+
+from application.routers.youtube.dependencies import get_embedder, get_lexical_index, get_vector_repository
+from application.services.search_service import SearchService
+from shared.config.settings import get_settings
+
+
+@lru_cache
+def get_search_service() -> SearchService:
+    """검색어 임베딩 캐시와 지연 시간 통계를 공유하도록 애플리케이션 전체에서 하나의 검색 서비스를 사용합니다."""
+    settings = get_settings()
+    return SearchService(
+        embedder=get_embedder(),
+        vector_repo=get_vector_repository(),
+        lexical_index=get_lexical_index(),
+        rrf_k=settings.SEARCH_RRF_K,
+        candidate_multiplier=settings.SEARCH_CANDIDATE_MULTIPLIER,
+        query_cache_size=settings.SEARCH_QUERY_CACHE_SIZE,
+        batch_max_size=settings.SEARCH_BATCH_MAX_SIZE,
+        batch_max_wait=settings.SEARCH_BATCH_MAX_WAIT,
+        latency_window=settings.SEARCH_LATENCY_WINDOW,
+    )
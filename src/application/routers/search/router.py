@@ -0,0 +1,45 @@
+import datetime
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from application.services.search_service import SearchMode, SearchService
+from domain.model.search import SearchFilter
+
+from .dependencies import get_search_service
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("/")
+async def search_videos(
+    q: str = Query(min_length=1, description="검색어"),
+    streamer_name: str | None = None,
+    channel_id: str | None = None,
+    published_from: datetime.datetime | None = None,
+    published_to: datetime.datetime | None = None,
+    limit: int = Query(default=10, ge=1, le=100),
+    mode: SearchMode = Query(default="hybrid", description="hybrid(벡터 + 단어), vector, lexical"),
+    service: SearchService = Depends(get_search_service),
+):
+    search_filter = SearchFilter(
+        streamer_name=streamer_name,
+        channel_id=channel_id,
+        published_from=published_from,
+        published_to=published_to,
+    )
+    try:
+        hits = await service.search(q, limit=limit, search_filter=search_filter, mode=mode)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"query": q, "mode": mode, "hits": [{**asdict(hit), "url": hit.url} for hit in hits]}
+
+
+@router.get("/metrics/")
+async def get_search_metrics(
+    service: SearchService = Depends(get_search_service),
+):
+    metrics = service.metrics()
+    if service.lexical_index is not None:
+        metrics["lexical_index"] = await service.lexical_index.stats()
+    return metrics
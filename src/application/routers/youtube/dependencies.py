@@ -1,29 +1,239 @@
+import datetime
+from functools import lru_cache
+
+from qdrant_client import AsyncQdrantClient
+
+from application.services.channel_import_service import ChannelImportService
+from application.services.chunking import ChunkingConfig
+from application.services.crawl_engine import CrawlEngine
+from application.services.crawl_job_service import CrawlJobRunner
+from application.services.embedding_service import EmbeddingIngestionService
+from application.services.lexical_index_service import LexicalIndexService
+from application.services.raw_data_export_service import RawDataExportService
+from application.services.schedule_service import CrawlerScheduleService
 from application.services.youtube_service import (
     APIKeyService,
     ChannelCreateService,
     ChannelReadService,
     RawDataCrawlService,
+    VideoReadService,
 )
+from domain.adapter.embedder import Embedder
+from domain.repository.embedding import EmbeddingCacheRepository
+from infrastructure.api.cached_embedder import CachedEmbedder
+from infrastructure.api.gemini_embedder import GeminiEmbedder
+from infrastructure.api.hashing_embedder import HashingEmbedder
+from infrastructure.api.resilience import RequestPipeline
+from infrastructure.api.response_cache import ResponseCache
+from infrastructure.api.transcript_client import YoutubeTranscriptClient
 from infrastructure.api.youtube_api_client import YoutubeAPIClient
+from infrastructure.persistence.bm25_index import DiskBm25Index
+from infrastructure.persistence.embedding_cache import MmapEmbeddingCacheRepository
 from infrastructure.persistence.mongo_repository import (
+    BufferedMongoLogRepository,
     MongoAPIKeyRepository,
-    MongoLogRepository,
+    MongoApiResponseCacheRepository,
+    MongoCrawlCheckpointRepository,
+    MongoCrawlerScheduleRepository,
+    MongoCrawlJobRepository,
+    MongoEmbeddingCacheRepository,
+    MongoEmbeddingStateRepository,
     MongoYoutubeRepository,
 )
+from infrastructure.persistence.qdrant_repository import QdrantVectorRepository
+from infrastructure.persistence.raw_data_export import create_raw_data_export_store
+from shared.config.settings import get_settings
+from shared.utils import parse_youtube_datetime
+
+
+@lru_cache
+def get_youtube_api_client() -> YoutubeAPIClient:
+    """애플리케이션 전체에서 공유하는 커넥션 풀 기반 YouTube API 클라이언트를 반환합니다.
+
+    열고 닫는 것은 application.main의 lifespan에서 처리합니다.
+    """
+    settings = get_settings()
+    return YoutubeAPIClient(
+        http2=settings.YOUTUBE_HTTP2,
+        max_connections=settings.YOUTUBE_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.YOUTUBE_HTTP_KEEPALIVE_EXPIRY,
+        timeout=settings.YOUTUBE_HTTP_TIMEOUT,
+        connect_timeout=settings.YOUTUBE_HTTP_CONNECT_TIMEOUT,
+        pipeline=RequestPipeline(
+            rate_per_key=settings.YOUTUBE_RATE_LIMIT_PER_SECOND,
+            burst_per_key=settings.YOUTUBE_RATE_LIMIT_BURST,
+            max_attempts=settings.YOUTUBE_RETRY_MAX_ATTEMPTS,
+            base_delay=settings.YOUTUBE_RETRY_BASE_DELAY,
+            max_delay=settings.YOUTUBE_RETRY_MAX_DELAY,
+            failure_threshold=settings.YOUTUBE_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.YOUTUBE_CIRCUIT_RESET_TIMEOUT,
+        ),
+        cache=get_response_cache(),
+    )
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache | None:
+    """YouTube API 응답 캐시를 반환합니다. 비활성화되어 있으면 None을 반환합니다."""
+    settings = get_settings()
+    if not settings.YOUTUBE_CACHE_ENABLED:
+        return None
+    return ResponseCache(
+        max_entries=settings.YOUTUBE_CACHE_MAX_ENTRIES,
+        ttl_by_endpoint=settings.YOUTUBE_CACHE_TTL,
+        stale_ttl=settings.YOUTUBE_CACHE_STALE_TTL,
+        repository=MongoApiResponseCacheRepository() if settings.YOUTUBE_CACHE_MONGO_ENABLED else None,
+    )
+
+
+@lru_cache
+def get_log_repository() -> BufferedMongoLogRepository:
+    """애플리케이션 전체에서 공유하는 버퍼링 로그 저장소를 반환합니다.
+
+    시작과 종료(남은 로그 저장)는 application.main의 lifespan에서 처리합니다.
+    """
+    settings = get_settings()
+    return BufferedMongoLogRepository(
+        batch_size=settings.LOG_BATCH_SIZE,
+        flush_interval=settings.LOG_FLUSH_INTERVAL,
+        max_queue_size=settings.LOG_MAX_QUEUE_SIZE,
+        overflow_policy=settings.LOG_OVERFLOW_POLICY,
+    )
 
 
 def get_channel_read_service() -> ChannelReadService:
     youtube_repo = MongoYoutubeRepository()
-    return ChannelReadService(youtube_repo)
+    return ChannelReadService(youtube_repo, stream_page_size=get_settings().LIST_STREAM_PAGE_SIZE)
+
+
+def get_video_read_service() -> VideoReadService:
+    youtube_repo = MongoYoutubeRepository()
+    return VideoReadService(youtube_repo, stream_page_size=get_settings().LIST_STREAM_PAGE_SIZE)
 
 
 def get_channel_create_service() -> ChannelCreateService:
     youtube_repo = MongoYoutubeRepository()
     api_key_repo = MongoAPIKeyRepository()
-    youtube_client = YoutubeAPIClient()
+    youtube_client = get_youtube_api_client()
     return ChannelCreateService(youtube_repo, api_key_repo, youtube_client)
 
 
+def get_channel_import_service() -> ChannelImportService:
+    return ChannelImportService(
+        MongoYoutubeRepository(),
+        MongoAPIKeyRepository(),
+        get_youtube_api_client(),
+        concurrency=get_settings().CHANNEL_IMPORT_CONCURRENCY,
+    )
+
+
+@lru_cache
+def get_qdrant_client() -> AsyncQdrantClient:
+    """애플리케이션 전체에서 공유하는 Qdrant 클라이언트를 반환합니다.
+
+    종료는 application.main의 lifespan에서 처리합니다.
+    """
+    settings = get_settings()
+    if settings.QDRANT_URL == ":memory:":
+        return AsyncQdrantClient(location=":memory:")
+    return AsyncQdrantClient(url=settings.QDRANT_URL, api_key=settings.QDRANT_API_KEY)
+
+
+@lru_cache
+def get_embedding_cache_repository() -> EmbeddingCacheRepository | None:
+    """임베딩 캐시 저장소를 반환합니다. 비활성화되어 있으면 None을 반환합니다."""
+    settings = get_settings()
+    if settings.EMBEDDING_CACHE_BACKEND == "disk":
+        return MmapEmbeddingCacheRepository(
+            settings.EMBEDDING_CACHE_DIR, dimension=settings.EMBEDDING_DIMENSION, dtype=settings.EMBEDDING_CACHE_DTYPE
+        )
+    if settings.EMBEDDING_CACHE_BACKEND == "mongo":
+        return MongoEmbeddingCacheRepository(dtype=settings.EMBEDDING_CACHE_DTYPE)
+    return None
+
+
+@lru_cache
+def get_embedder() -> Embedder:
+    """임베딩 모델 어댑터를 반환합니다. 임베딩 캐시가 켜져 있으면 캐시를 먼저 조회하도록 감쌉니다."""
+    settings = get_settings()
+    embedder: Embedder
+    if settings.EMBEDDING_PROVIDER == "hashing":
+        embedder = HashingEmbedder(dimension=settings.EMBEDDING_DIMENSION)
+    else:
+        embedder = GeminiEmbedder(
+            api_key=settings.GEMINI_API_KEY, model=settings.EMBEDDING_MODEL, dimension=settings.EMBEDDING_DIMENSION
+        )
+    cache_repo = get_embedding_cache_repository()
+    if cache_repo is None:
+        return embedder
+    return CachedEmbedder(embedder, cache_repo)
+
+
+def get_vector_repository() -> QdrantVectorRepository:
+    return QdrantVectorRepository(get_qdrant_client(), collection_name=get_settings().QDRANT_COLLECTION)
+
+
+def get_chunking_config() -> ChunkingConfig:
+    settings = get_settings()
+    return ChunkingConfig(
+        strategy=settings.CHUNK_STRATEGY,
+        window_seconds=settings.CHUNK_WINDOW_SECONDS,
+        overlap_seconds=settings.CHUNK_OVERLAP_SECONDS,
+        max_tokens=settings.CHUNK_MAX_TOKENS,
+        overlap_tokens=settings.CHUNK_OVERLAP_TOKENS,
+    )
+
+
+def get_embedding_ingestion_service() -> EmbeddingIngestionService:
+    settings = get_settings()
+    return EmbeddingIngestionService(
+        youtube_repo=MongoYoutubeRepository(),
+        state_repo=MongoEmbeddingStateRepository(),
+        vector_repo=get_vector_repository(),
+        embedder=get_embedder(),
+        chunking=get_chunking_config(),
+        embed_batch_size=settings.EMBEDDING_BATCH_SIZE,
+        embed_concurrency=settings.EMBEDDING_CONCURRENCY,
+        upsert_batch_size=settings.EMBEDDING_UPSERT_BATCH_SIZE,
+    )
+
+
+@lru_cache
+def get_lexical_index() -> DiskBm25Index | None:
+    """애플리케이션 전체에서 공유하는 BM25 단어 색인을 반환합니다. 비활성화되어 있으면 None을 반환합니다."""
+    settings = get_settings()
+    if not settings.LEXICAL_INDEX_ENABLED:
+        return None
+    return DiskBm25Index(settings.LEXICAL_INDEX_DIR)
+
+
+def get_lexical_index_service() -> LexicalIndexService | None:
+    index = get_lexical_index()
+    if index is None:
+        return None
+    settings = get_settings()
+    return LexicalIndexService(
+        youtube_repo=MongoYoutubeRepository(),
+        index=index,
+        chunking=get_chunking_config(),
+        commit_every=settings.LEXICAL_INDEX_COMMIT_EVERY,
+        max_segments=settings.LEXICAL_INDEX_MAX_SEGMENTS,
+    )
+
+
+def get_raw_data_export_service() -> RawDataExportService:
+    settings = get_settings()
+    return RawDataExportService(
+        youtube_repo=MongoYoutubeRepository(),
+        store=create_raw_data_export_store(settings.RAW_DATA_EXPORT_DIR, settings.RAW_DATA_EXPORT_FORMAT),
+        batch_size=settings.RAW_DATA_EXPORT_BATCH_SIZE,
+        rows_per_shard=settings.RAW_DATA_EXPORT_ROWS_PER_SHARD,
+        settle=datetime.timedelta(minutes=settings.RAW_DATA_EXPORT_SETTLE_MINUTES),
+        include_raw=settings.RAW_DATA_EXPORT_INCLUDE_RAW,
+    )
+
+
 def get_api_key_service() -> APIKeyService:
     api_key_repo = MongoAPIKeyRepository()
     return APIKeyService(api_key_repo)
@@ -32,6 +242,58 @@ def get_api_key_service() -> APIKeyService:
 def get_raw_data_crawl_service() -> RawDataCrawlService:
     youtube_repo = MongoYoutubeRepository()
     api_key_repo = MongoAPIKeyRepository()
-    youtube_client = YoutubeAPIClient()
-    log_repo = MongoLogRepository()
-    return RawDataCrawlService(youtube_repo, api_key_repo, youtube_client, log_repo)
+    youtube_client = get_youtube_api_client()
+    log_repo = get_log_repository()
+    settings = get_settings()
+    crawl_engine = CrawlEngine(
+        max_concurrency=settings.CRAWL_MAX_CONCURRENCY,
+        per_key_concurrency=settings.CRAWL_PER_KEY_CONCURRENCY,
+    )
+    return RawDataCrawlService(
+        youtube_repo,
+        api_key_repo,
+        youtube_client,
+        log_repo,
+        crawl_engine,
+        backfill_start=parse_youtube_datetime(settings.CRAWL_BACKFILL_START),
+        watermark_lookback=datetime.timedelta(minutes=settings.CRAWL_WATERMARK_LOOKBACK_MINUTES),
+        enumeration_mode=settings.CRAWL_ENUMERATION_MODE,
+        transcript_client=YoutubeTranscriptClient(),
+        transcript_languages=settings.TRANSCRIPT_LANGUAGES,
+        checkpoint_repo=MongoCrawlCheckpointRepository(),
+        upload_rate_lookback=datetime.timedelta(days=settings.CRAWL_UPLOAD_RATE_LOOKBACK_DAYS),
+        min_expected_videos=settings.CRAWL_MIN_EXPECTED_NEW_VIDEOS,
+    )
+
+
+@lru_cache
+def get_crawl_job_runner() -> CrawlJobRunner:
+    """애플리케이션 전체에서 공유하는 크롤링 작업 실행기를 반환합니다.
+
+    워커 시작과 종료는 application.main의 lifespan에서 처리합니다.
+    """
+    settings = get_settings()
+    return CrawlJobRunner(
+        MongoCrawlJobRepository(),
+        get_raw_data_crawl_service,
+        embedding_service_factory=get_embedding_ingestion_service,
+        lexical_index_service_factory=get_lexical_index_service,
+        export_service_factory=get_raw_data_export_service,
+        workers=settings.CRAWL_JOB_WORKERS,
+        progress_interval=settings.CRAWL_JOB_PROGRESS_INTERVAL,
+    )
+
+
+@lru_cache
+def get_crawler_schedule_service() -> CrawlerScheduleService:
+    """애플리케이션 전체에서 공유하는 수집 스케줄러를 반환합니다.
+
+    스케줄러 루프의 시작과 종료는 application.main의 lifespan에서 처리합니다.
+    """
+    settings = get_settings()
+    return CrawlerScheduleService(
+        MongoCrawlerScheduleRepository(),
+        get_crawl_job_runner(),
+        poll_interval=settings.SCHEDULER_POLL_INTERVAL,
+        max_channels_per_run=settings.SCHEDULER_MAX_CHANNELS_PER_RUN,
+    )
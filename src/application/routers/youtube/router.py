@@ -1,30 +1,109 @@
-from fastapi import APIRouter, Depends, Form
+import datetime
+import json
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from typing_extensions import Annotated
 
-from application.schemas.youtube import ChannelInsertRequest
+from application.schemas.youtube import ChannelInsertRequest, CrawlerScheduleRequest
+from application.services.channel_import_service import ChannelImportService, parse_channel_import
+from application.services.crawl_job_service import CrawlJobRunner
+from application.services.schedule_service import CrawlerScheduleService
 from application.services.youtube_service import (
     APIKeyService,
     ChannelCreateService,
     ChannelReadService,
+    EnumerationMode,
     RawDataCrawlService,
+    VideoReadService,
 )
+from domain.adapter.embedder import Embedder
+from domain.model.youtube import VideoFilter
+from infrastructure.api.cached_embedder import CachedEmbedder
+from infrastructure.api.response_cache import ResponseCache
+from shared.config.settings import get_settings
 
 from .dependencies import (
     get_api_key_service,
     get_channel_create_service,
+    get_channel_import_service,
     get_channel_read_service,
+    get_crawl_job_runner,
+    get_crawler_schedule_service,
+    get_embedder,
     get_raw_data_crawl_service,
+    get_response_cache,
+    get_video_read_service,
 )
 
 router = APIRouter(prefix="/youtube", tags=["youtube"])
 
 
+# json: 한 페이지와 next_cursor, ndjson: 커서부터 끝까지 한 줄에 하나씩 스트리밍
+ListFormat = Literal["json", "ndjson"]
+MAX_PAGE_SIZE = 500
+NDJSON_LINES_PER_CHUNK = 200
+
+
+async def _ndjson(items: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    lines = []
+    async for item in items:
+        lines.append(json.dumps(item.to_dict(), ensure_ascii=False, default=datetime.datetime.isoformat))
+        if len(lines) >= NDJSON_LINES_PER_CHUNK:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
 @router.get("/channels/")
 async def list_channels(
+    streamer_name: str | None = None,
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    format: ListFormat = "json",
     service: ChannelReadService = Depends(get_channel_read_service),
 ):
-    channels = await service.list_channels()
-    return {"channels": [channel.to_dict() for channel in channels]}
+    try:
+        if format == "ndjson":
+            channels = await service.stream_channels(streamer_name=streamer_name, cursor=cursor)
+            return StreamingResponse(_ndjson(channels), media_type="application/x-ndjson")
+        page = await service.list_channels(streamer_name=streamer_name, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"channels": [channel.to_dict() for channel in page.items], "next_cursor": page.next_cursor}
+
+
+@router.get("/videos/")
+async def list_videos(
+    channel_id: str | None = None,
+    streamer_name: str | None = None,
+    published_after: datetime.datetime | None = None,
+    published_before: datetime.datetime | None = None,
+    fields: str | None = Query(default=None, description="쉼표로 구분한 필드 (예: video_id,published_at,raw_data)"),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    format: ListFormat = "json",
+    service: VideoReadService = Depends(get_video_read_service),
+):
+    video_filter = VideoFilter(
+        channel_id=channel_id,
+        streamer_name=streamer_name,
+        published_after=published_after,
+        published_before=published_before,
+    )
+    field_names = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+    try:
+        if format == "ndjson":
+            videos = await service.stream_videos(video_filter, fields=field_names, cursor=cursor)
+            return StreamingResponse(_ndjson(videos), media_type="application/x-ndjson")
+        page = await service.list_videos(video_filter, fields=field_names, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"videos": [video.to_dict() for video in page.items], "next_cursor": page.next_cursor}
 
 
 @router.post("/insert_channel/")
@@ -40,20 +119,194 @@ async def insert_channel(
     return {"status": "Channel insertion initiated"}
 
 
+@router.post("/channels/import/")
+async def import_channels(
+    file: UploadFile,
+    service: ChannelImportService = Depends(get_channel_import_service),
+):
+    try:
+        rows = parse_channel_import(await file.read(), file.filename or "")
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    max_rows = get_settings().CHANNEL_IMPORT_MAX_ROWS
+    if len(rows) > max_rows:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {max_rows}개 채널까지 등록할 수 있습니다")
+    report = await service.import_channels(rows)
+    return report.to_dict()
+
+
 @router.post("/videos/raw_data/initialize/")
 async def initialize_raw_data(
-    service: RawDataCrawlService = Depends(get_raw_data_crawl_service),
+    published_after: datetime.datetime | None = None,
+    published_before: datetime.datetime | None = None,
+    mode: EnumerationMode | None = None,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
 ):
-    await service.initialize_you_tube_video_data()
-    return {"status": "Raw data crawling initiated"}
+    job = await runner.enqueue(
+        "initialize", {"published_after": published_after, "published_before": published_before, "mode": mode}
+    )
+    return {"status": "Raw data crawling queued", "job_id": job.job_id}
 
 
 @router.post("/videos/raw_data/fetch/")
 async def fetch_raw_data(
+    mode: EnumerationMode | None = None,
+    quota_budget: int | None = None,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    if quota_budget is None:
+        quota_budget = get_settings().CRAWL_FETCH_QUOTA_BUDGET
+    job = await runner.enqueue("fetch", {"mode": mode, "quota_budget": quota_budget})
+    return {"status": "Raw data fetch queued", "job_id": job.job_id}
+
+
+@router.get("/jobs/")
+async def list_jobs(
+    limit: int = 50,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    jobs = await runner.list_jobs(limit=limit)
+    return {"jobs": [job.to_dict() for job in jobs]}
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: str,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    job = await runner.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"job": job.to_dict()}
+
+
+@router.post("/jobs/{job_id}/cancel/")
+async def cancel_job(
+    job_id: str,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    job = await runner.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"status": "Job cancellation requested", "job": job.to_dict()}
+
+
+@router.post("/videos/details/enrich/")
+async def enrich_video_details(
+    max_videos: int | None = None,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    job = await runner.enqueue("enrich_details", {"max_videos": max_videos})
+    return {"status": "Video details enrichment queued", "job_id": job.job_id}
+
+
+@router.post("/videos/transcripts/crawl/")
+async def crawl_transcripts(
+    max_videos: int | None = None,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    settings = get_settings()
+    job = await runner.enqueue(
+        "crawl_transcripts",
+        {
+            "concurrency": settings.TRANSCRIPT_CONCURRENCY,
+            "batch_size": settings.TRANSCRIPT_BATCH_SIZE,
+            "max_attempts": settings.TRANSCRIPT_MAX_ATTEMPTS,
+            "max_videos": max_videos,
+        },
+    )
+    return {"status": "Transcript crawling queued", "job_id": job.job_id}
+
+
+@router.post("/embeddings/ingest/")
+async def ingest_embeddings(
+    max_documents: int | None = None,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    job = await runner.enqueue("ingest_embeddings", {"max_documents": max_documents})
+    return {"status": "Embedding ingestion queued", "job_id": job.job_id}
+
+
+@router.get("/embeddings/cache/metrics/")
+async def get_embedding_cache_metrics(
+    embedder: Embedder = Depends(get_embedder),
+):
+    if not isinstance(embedder, CachedEmbedder):
+        return {"enabled": False}
+    return {"enabled": True, "entries": await embedder.repository.count(), "metrics": embedder.metrics.to_dict()}
+
+
+@router.post("/lexical_index/build/")
+async def build_lexical_index(
+    max_documents: int | None = None,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    if not get_settings().LEXICAL_INDEX_ENABLED:
+        raise HTTPException(status_code=409, detail="단어 색인이 비활성화되어 있습니다")
+    job = await runner.enqueue("build_lexical_index", {"max_documents": max_documents})
+    return {"status": "Lexical index build queued", "job_id": job.job_id}
+
+
+@router.post("/raw_data/export/")
+async def export_raw_data(
+    full: bool = False,
+    runner: CrawlJobRunner = Depends(get_crawl_job_runner),
+):
+    job = await runner.enqueue("export_raw_data", {"full": full})
+    return {"status": "Raw data export queued", "job_id": job.job_id}
+
+
+@router.get("/schedules/")
+async def list_schedules(
+    service: CrawlerScheduleService = Depends(get_crawler_schedule_service),
+):
+    schedules = await service.list_schedules()
+    return {"schedules": [schedule.to_dict() for schedule in schedules]}
+
+
+@router.post("/schedules/")
+async def add_schedule(
+    request: Annotated[CrawlerScheduleRequest, Form()],
+    service: CrawlerScheduleService = Depends(get_crawler_schedule_service),
+):
+    try:
+        schedule = await service.add_schedule(
+            channel_id=request.channel_id,
+            interval_minutes=request.interval_minutes,
+            cron=request.cron,
+            priority=request.priority,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"status": "Schedule saved", "schedule": schedule.to_dict()}
+
+
+@router.delete("/schedules/{channel_id}")
+async def delete_schedule(
+    channel_id: str,
+    service: CrawlerScheduleService = Depends(get_crawler_schedule_service),
+):
+    await service.delete_schedule(channel_id)
+    return {"status": "Schedule deleted"}
+
+
+@router.get("/channels/priorities/")
+async def list_channel_priorities(
+    quota_budget: int | None = None,
+    mode: EnumerationMode | None = None,
     service: RawDataCrawlService = Depends(get_raw_data_crawl_service),
 ):
-    await service.fetch_videos_from_initialized_channels()
-    return {"status": "Raw data fetched"}
+    priorities = await service.prioritize_channels(quota_budget=quota_budget, mode=mode)
+    return {"priorities": [{**asdict(priority), "score": priority.score} for priority in priorities]}
+
+
+@router.get("/api_cache/metrics/")
+async def get_api_cache_metrics(
+    cache: ResponseCache | None = Depends(get_response_cache),
+):
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, "entries": len(cache), "metrics": cache.metrics.to_dict()}
 
 
 # @router.get("/api_keys/")
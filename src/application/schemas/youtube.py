@@ -9,3 +9,12 @@ class ChannelInsertRequest(BaseModel):
     channel_name: str = Field(default=..., description="유튜브 채널 이름", examples=["시부키 다시보기"])
     channel_handle: str = Field(default=..., description="유튜브 채널 핸들", examples=["@shibuki"])
     streamer_name: str = Field(default=..., description="스트리머 이름", examples=["시부키"])
+
+
+class CrawlerScheduleRequest(BaseModel):
+    """채널 수집 일정 등록 요청 스키마 (interval_minutes와 cron 중 하나만 지정)"""
+
+    channel_id: str = Field(default=..., description="유튜브 채널 ID", examples=["UCxxxxxxxxxxxxxxxxxxxxxx"])
+    interval_minutes: int | None = Field(default=None, description="수집 간격(분)", examples=[360])
+    cron: str | None = Field(default=None, description="cron 표현식 (분 시 일 월 요일, UTC)", examples=["30 */6 * * *"])
+    priority: int = Field(default=0, description="우선순위 (높을수록 먼저 수집)", examples=[0])
@@ -0,0 +1,70 @@
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import TypeVar
+
+from application.exceptions import APIQuotaExhaustedError
+from domain.adapter.youtube_api_adapter import YoutubeApiAdapter, YoutubeQuotaExceededError
+from domain.repository.youtube_repository import APIKeyRepository
+from shared.utils import YOUTUBE_QUOTA_COSTS, YOUTUBE_QUOTA_THRESHOLDS
+
+T = TypeVar("T")
+
+
+async def request_with_quota(
+    api_key_repo: APIKeyRepository,
+    api_client: YoutubeApiAdapter,
+    endpoint: str,
+    call: Callable[[str], Awaitable[T]],
+    on_quota_spent: Callable[[int], None] | None = None,
+    on_key_parked: Callable[[YoutubeQuotaExceededError], Awaitable[None]] | None = None,
+    key_slot: Callable[[str], AbstractAsyncContextManager] | None = None,
+) -> T:
+    """키 풀에서 쿼터를 예약한 키로 API를 호출합니다.
+
+    - 요청마다 엔드포인트 비용만큼 쿼터를 원자적으로 예약하므로, 요청마다 다른 키가 사용될 수 있습니다.
+    - YouTube API가 키의 쿼터 소진(quotaExceeded)을 알리면 그 키를 리셋 시각까지 제외하고 다른 키로 다시 요청합니다.
+    - 캐시로 응답된 요청은 API를 호출하지 않았으므로 예약한 쿼터를 돌려줍니다.
+    - 그 밖의 오류는 요청을 보낸 것이므로 쿼터를 사용한 것으로 기록한 뒤 그대로 발생시킵니다.
+
+    Args:
+        api_key_repo (APIKeyRepository): 쿼터를 예약할 API 키 저장소
+        api_client (YoutubeApiAdapter): 캐시 응답 여부를 확인할 API 클라이언트
+        endpoint (str): 쿼터 비용을 계산할 엔드포인트 (예: "search", "channels")
+        call (Callable[[str], Awaitable[T]]): API 키를 받아 요청을 보내는 함수
+        on_quota_spent (Callable[[int], None] | None, optional): 실제로 사용한 쿼터를 기록하는 함수. Defaults to None.
+        on_key_parked (Callable[[YoutubeQuotaExceededError], Awaitable[None]] | None, optional):
+            쿼터가 소진된 키를 제외한 뒤 호출할 함수. Defaults to None.
+        key_slot (Callable[[str], AbstractAsyncContextManager] | None, optional): 키별 동시 요청 수를 제한하는
+            컨텍스트 매니저를 반환하는 함수. Defaults to None.
+
+    Raises:
+        APIQuotaExhaustedError: 예약 가능한 키가 없는 경우
+
+    Returns:
+        T: API 응답
+    """
+    cost = YOUTUBE_QUOTA_COSTS[endpoint]
+    while True:
+        api_key = await api_key_repo.reserve_quota(
+            amount=cost, max_quota_used=YOUTUBE_QUOTA_THRESHOLDS[endpoint], endpoint=endpoint
+        )
+        if api_key is None:
+            raise APIQuotaExhaustedError("사용 가능한 쿼터가 남은 API 키가 없습니다")
+        try:
+            async with key_slot(api_key.api_key) if key_slot is not None else nullcontext():
+                response = await call(api_key.api_key)
+        except YoutubeQuotaExceededError as e:
+            # 저장된 사용량과 실제 쿼터가 어긋난 키는 리셋 시각까지 제외하고 다른 키로 다시 요청
+            await api_key_repo.park_api_key(api_key.api_key)
+            if on_key_parked is not None:
+                await on_key_parked(e)
+            continue
+        except Exception:
+            if on_quota_spent is not None:
+                on_quota_spent(cost)
+            raise
+        if api_client.served_from_cache():
+            await api_key_repo.release_quota(api_key.api_key, cost, endpoint)
+        elif on_quota_spent is not None:
+            on_quota_spent(cost)
+        return response
@@ -0,0 +1,231 @@
+import asyncio
+import csv
+import io
+import json
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any, TypeVar
+
+from application.services.api_quota import request_with_quota
+from domain.adapter.youtube_api_adapter import YoutubeApiAdapter
+from domain.model.youtube import YoutubeChannel
+from domain.repository.youtube_repository import APIKeyRepository, YoutubeRepository
+
+T = TypeVar("T")
+
+CHANNELS_PER_REQUEST = 50  # channels.list id 파라미터로 한 번에 조회할 수 있는 최대 채널 수
+_CHANNEL_ID_PATTERN = re.compile(r"UC[0-9A-Za-z_-]{22}")
+_CHANNEL_URL_PATTERN = re.compile(r"youtube\.com/(?:channel/(UC[0-9A-Za-z_-]{22})|(@[^/?#\s]+))")
+
+
+@dataclass
+class ChannelImportRow:
+    """일괄 등록할 채널 한 건 (channel_handle과 channel_id 중 하나는 필요)"""
+
+    channel_handle: str | None = None
+    channel_id: str | None = None
+    channel_name: str | None = None
+    streamer_name: str | None = None
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "ChannelImportRow":
+        """CSV 행이나 JSON 객체로부터 등록 요청을 만듭니다. 핸들 자리에 채널 URL이나 채널 ID를 넣어도 됩니다."""
+        values = {key: str(value).strip() for key, value in data.items() if key and value not in (None, "")}
+        handle = values.get("channel_handle")
+        channel_id = values.get("channel_id")
+        if handle:
+            url_match = _CHANNEL_URL_PATTERN.search(handle)
+            if url_match:
+                channel_id = channel_id or url_match.group(1)
+                handle = url_match.group(2)
+            elif _CHANNEL_ID_PATTERN.fullmatch(handle):
+                channel_id, handle = channel_id or handle, None
+            elif not handle.startswith("@"):
+                handle = f"@{handle}"
+        if not handle and not channel_id:
+            raise ValueError(f"channel_handle 또는 channel_id가 필요합니다: {data}")
+        return ChannelImportRow(
+            channel_handle=handle,
+            channel_id=channel_id,
+            channel_name=values.get("channel_name"),
+            streamer_name=values.get("streamer_name"),
+        )
+
+
+@dataclass
+class ChannelImportReport:
+    """채널 일괄 등록 결과"""
+
+    total: int = 0
+    inserted_count: int = 0
+    updated_count: int = 0
+    cached_count: int = 0  # 이미 저장된 채널이라 핸들을 API로 조회하지 않은 수
+    resolved_count: int = 0  # 핸들을 API로 조회한 수
+    quota_used: int = 0
+    failed: list[dict[str, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def parse_channel_import(content: bytes, filename: str = "") -> list[ChannelImportRow]:
+    """CSV 또는 JSON 파일 내용을 채널 등록 요청 목록으로 변환합니다.
+
+    - CSV: 헤더가 있는 파일 (channel_handle, channel_id, channel_name, streamer_name 열)
+    - JSON: 객체 배열 또는 {"channels": [...]}
+
+    Args:
+        content (bytes): 파일 내용 (UTF-8)
+        filename (str, optional): 파일 이름. 확장자가 .json이면 JSON으로 읽습니다. Defaults to "".
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 핸들과 채널 ID가 모두 없는 항목이 있는 경우
+
+    Returns:
+        list[ChannelImportRow]: 채널 등록 요청 목록
+    """
+    text = content.decode("utf-8-sig")
+    if filename.lower().endswith(".json") or text.lstrip().startswith(("[", "{")):
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 형식이 잘못되었습니다: {e}")
+        if isinstance(data, dict):
+            data = data.get("channels", [])
+        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+            raise ValueError("JSON은 채널 객체의 배열이어야 합니다")
+        return [ChannelImportRow.from_dict(item) for item in data]
+    return [ChannelImportRow.from_dict(row) for row in csv.DictReader(io.StringIO(text))]
+
+
+class ChannelImportService:
+    """여러 채널을 한 번에 등록하는 서비스
+
+    - 이미 저장된 채널의 핸들은 저장소의 핸들 → 채널 ID 매핑으로 바로 찾고 API를 호출하지 않습니다.
+    - 새 핸들은 concurrency개씩 동시에 channels.list(forHandle)로 조회합니다.
+    - 채널 ID만 주어졌거나 이름이 비어 있는 채널은 channels.list(id)로 50개씩 묶어서 조회합니다.
+    - 조회한 채널은 한 번의 bulk_write로 업서트하므로, 이미 수집 중인 채널의 상태는 바뀌지 않습니다.
+    """
+
+    def __init__(
+        self,
+        channel_repo: YoutubeRepository,
+        api_key_repo: APIKeyRepository,
+        api_client: YoutubeApiAdapter,
+        concurrency: int = 8,
+    ):
+        if concurrency < 1:
+            raise ValueError("동시성 제한 값은 1 이상이어야 합니다")
+        self.channel_repo = channel_repo
+        self.api_key_repo = api_key_repo
+        self.api_client = api_client
+        self.concurrency = concurrency
+
+    async def import_channels(self, rows: list[ChannelImportRow]) -> ChannelImportReport:
+        """채널 목록의 핸들을 채널 ID로 변환해 한 번에 저장합니다.
+
+        조회에 실패한 채널은 결과의 failed에 기록하고 나머지 채널은 그대로 저장합니다.
+
+        Args:
+            rows (list[ChannelImportRow]): 등록할 채널 목록
+
+        Returns:
+            ChannelImportReport: 등록 결과
+        """
+        started = time.perf_counter()
+        report = ChannelImportReport(total=len(rows))
+
+        # 1. 이미 저장된 채널의 핸들은 저장소에서 바로 찾음
+        handles = list(
+            dict.fromkeys(row.channel_handle for row in rows if row.channel_id is None and row.channel_handle)
+        )
+        channel_ids = await self.channel_repo.get_channel_ids_by_handles(handles)
+        report.cached_count = len(channel_ids)
+
+        # 2. 처음 보는 핸들은 동시에 조회 (forHandle은 한 번에 하나만 조회 가능)
+        items: dict[str, dict] = {}
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _resolve(handle: str) -> None:
+            async with semaphore:
+                try:
+                    item = await self._request(lambda key: self.api_client.fetch_channel_by_handle(handle, key), report)
+                except Exception as e:
+                    report.failed.append({"channel_handle": handle, "error": str(e)})
+                    return
+            if item is None:
+                report.failed.append({"channel_handle": handle, "error": "채널을 찾을 수 없습니다"})
+                return
+            channel_ids[handle] = item["id"]
+            items[item["id"]] = item
+            report.resolved_count += 1
+
+        async with asyncio.TaskGroup() as task_group:
+            for handle in handles:
+                if handle not in channel_ids:
+                    task_group.create_task(_resolve(handle))
+
+        # 3. 채널 정보가 더 필요한 채널(채널 ID만 주어졌거나 이름이 없는 채널)은 50개씩 묶어서 조회
+        targets: list[tuple[ChannelImportRow, str]] = []
+        for row in rows:
+            channel_id = row.channel_id or channel_ids.get(row.channel_handle or "")
+            if channel_id is not None:
+                targets.append((row, channel_id))
+        missing = list(
+            dict.fromkeys(
+                channel_id
+                for row, channel_id in targets
+                if channel_id not in items and (row.channel_handle is None or row.channel_name is None)
+            )
+        )
+        failed_ids: set[str] = set()
+        for index in range(0, len(missing), CHANNELS_PER_REQUEST):
+            batch = missing[index : index + CHANNELS_PER_REQUEST]
+            try:
+                response = await self._request(lambda key: self.api_client.fetch_channels(batch, key), report)
+            except Exception as e:
+                report.failed.extend({"channel_id": channel_id, "error": str(e)} for channel_id in batch)
+                failed_ids.update(batch)
+                continue
+            for item in (response or {}).get("items", []):
+                items[item["id"]] = item
+
+        # 4. 한 번의 bulk_write로 업서트 (같은 채널이 여러 번 있으면 마지막 항목 사용)
+        channels: dict[str, YoutubeChannel] = {}
+        for row, channel_id in targets:
+            item = items.get(channel_id)
+            if channel_id in failed_ids:
+                continue
+            if row.channel_handle is None and item is None:
+                report.failed.append({"channel_id": channel_id, "error": "채널을 찾을 수 없습니다"})
+                continue
+            channels[channel_id] = self._build_channel(row, channel_id, item)
+        result = await self.channel_repo.bulk_save_channels(list(channels.values()))
+        report.inserted_count = result.inserted_count
+        report.updated_count = result.updated_count
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    @staticmethod
+    def _build_channel(row: ChannelImportRow, channel_id: str, item: dict | None) -> YoutubeChannel:
+        snippet = (item or {}).get("snippet", {})
+        channel_handle = row.channel_handle or snippet.get("customUrl") or channel_id
+        channel_name = row.channel_name or snippet.get("title") or channel_handle
+        return YoutubeChannel(
+            channel_name=channel_name,
+            channel_handle=channel_handle,
+            channel_id=channel_id,
+            streamer_name=row.streamer_name or channel_name,
+            uploads_playlist_id=(item or {}).get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads"),
+        )
+
+    async def _request(self, call: Callable[[str], Awaitable[T]], report: ChannelImportReport) -> T:
+        """channels.list 쿼터를 예약한 키로 API를 호출합니다. (request_with_quota 참고)"""
+
+        def _add_quota(cost: int) -> None:
+            report.quota_used += cost
+
+        return await request_with_quota(self.api_key_repo, self.api_client, "channels", call, on_quota_spent=_add_quota)
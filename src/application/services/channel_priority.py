@@ -0,0 +1,110 @@
+import datetime
+import math
+from dataclasses import dataclass
+
+from domain.model.youtube import ChannelUploadStats, YoutubeChannel
+from shared.utils import YOUTUBE_VIDEOS_PER_REQUEST, as_utc
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+@dataclass
+class ChannelPriority:
+    """증분 수집 우선순위 계산 결과"""
+
+    channel_id: str
+    upload_rate: float  # 하루 평균 업로드 수 추정치
+    expected_new_videos: float  # 마지막 수집 이후 올라왔을 것으로 예상되는 비디오 수
+    expected_cost: int  # 방문 한 번의 예상 쿼터 비용
+
+    @property
+    def score(self) -> float:
+        """쿼터 1 유닛당 예상 신규 비디오 수"""
+        return self.expected_new_videos / self.expected_cost
+
+
+def estimate_upload_rate(
+    video_count: int, observed_days: float, prior_videos: float = 1.0, prior_days: float = 30.0
+) -> float:
+    """관측된 업로드 수로 하루 평균 업로드 수를 추정합니다.
+
+    감마-포아송 모델의 사후 평균으로, 관측이 적은 채널은 사전값(prior_videos / prior_days)에 가깝게,
+    관측이 많은 채널은 실제 업로드 빈도에 가깝게 추정합니다. 업로드가 없던 채널도 0이 되지 않아 가끔은 방문합니다.
+
+    Args:
+        video_count (int): 관측 기간 동안의 업로드 수
+        observed_days (float): 관측 기간(일)
+        prior_videos (float, optional): 사전 업로드 수. Defaults to 1.0.
+        prior_days (float, optional): 사전 관측 기간(일). Defaults to 30.0.
+
+    Returns:
+        float: 하루 평균 업로드 수 추정치
+    """
+    return (video_count + prior_videos) / (max(observed_days, 0.0) + prior_days)
+
+
+def prioritize_channels(
+    channels: list[YoutubeChannel],
+    upload_stats: list[ChannelUploadStats],
+    now: datetime.datetime,
+    lookback: datetime.timedelta,
+    request_cost: int,
+    quota_budget: int | None = None,
+    min_expected_videos: float = 0.0,
+) -> list[ChannelPriority]:
+    """업로드 빈도로 예상 신규 비디오 수를 계산해, 쿼터 대비 효율이 높은 채널부터 예산 안에서 고릅니다.
+
+    예상 신규 비디오 수는 (추정 업로드 빈도 × 마지막 수집 이후 경과 일수)이므로,
+    자주 올리는 채널은 자주, 드물게 올리는 채널은 시간이 충분히 지나야 다시 선택됩니다.
+
+    Args:
+        channels (list[YoutubeChannel]): 후보 채널
+        upload_stats (list[ChannelUploadStats]): lookback 기간 동안의 채널별 업로드 기록
+        now (datetime.datetime): 기준 시각
+        lookback (datetime.timedelta): 업로드 빈도를 추정한 기간
+        request_cost (int): 목록 요청 한 번의 쿼터 비용 (search 100, playlistItems 1)
+        quota_budget (int | None, optional): 이번 실행의 쿼터 예산. Defaults to None (모든 채널).
+        min_expected_videos (float, optional): 이보다 예상 신규 비디오가 적은 채널은 방문하지 않음. Defaults to 0.0.
+
+    Returns:
+        list[ChannelPriority]: 효율이 높은 순서로 정렬된, 예산 안에 들어가는 채널 목록
+    """
+    now = as_utc(now)
+    stats_by_channel = {stats.channel_id: stats for stats in upload_stats}
+    lookback_days = lookback.total_seconds() / SECONDS_PER_DAY
+
+    priorities = []
+    for channel in channels:
+        stats = stats_by_channel.get(channel.channel_id)
+        observed_days = lookback_days
+        if stats is not None and stats.first_published_at is not None and channel.created_at is not None:
+            # 수집을 시작한 지 lookback보다 짧은 채널은 실제로 관측한 기간으로 나눔
+            tracked_since = min(as_utc(channel.created_at), as_utc(stats.first_published_at))
+            observed_days = min(lookback_days, (now - tracked_since).total_seconds() / SECONDS_PER_DAY)
+        upload_rate = estimate_upload_rate(stats.video_count if stats else 0, observed_days)
+
+        last_checked = channel.last_crawled_at or channel.last_published_at or channel.created_at
+        elapsed_days = (now - as_utc(last_checked)).total_seconds() / SECONDS_PER_DAY if last_checked else lookback_days
+        expected_new_videos = upload_rate * max(elapsed_days, 0.0)
+        if expected_new_videos < min_expected_videos:
+            continue
+        pages = max(1, math.ceil(expected_new_videos / YOUTUBE_VIDEOS_PER_REQUEST))
+        priorities.append(
+            ChannelPriority(
+                channel_id=channel.channel_id,
+                upload_rate=upload_rate,
+                expected_new_videos=expected_new_videos,
+                expected_cost=pages * request_cost,
+            )
+        )
+
+    priorities.sort(key=lambda priority: priority.score, reverse=True)
+    if quota_budget is None:
+        return priorities
+    selected = []
+    remaining = quota_budget
+    for priority in priorities:
+        if priority.expected_cost <= remaining:
+            selected.append(priority)
+            remaining -= priority.expected_cost
+    return selected
@@ -0,0 +1,146 @@
+import hashlib
+import uuid
+from dataclasses import dataclass
+from typing import Literal
+
+from domain.model.embedding import ChunkSource, DocumentChunk, IngestionDocument
+
+ChunkStrategy = Literal["time", "token"]
+
+
+@dataclass(frozen=True)
+class ChunkingConfig:
+    """청크 분할 설정
+
+    - time: 자막을 window_seconds 길이의 시간 구간으로 나누고, 구간끼리 overlap_seconds만큼 겹칩니다.
+    - token: 자막을 max_tokens 단어씩 나누고, 청크끼리 overlap_tokens 단어만큼 겹칩니다.
+    제목과 설명은 자막 설정과 관계없이 토큰 기준으로 나눕니다.
+    """
+
+    strategy: ChunkStrategy = "time"
+    window_seconds: float = 60.0
+    overlap_seconds: float = 10.0
+    max_tokens: int = 200
+    overlap_tokens: int = 40
+
+    def __post_init__(self):
+        if self.window_seconds <= 0 or not 0 <= self.overlap_seconds < self.window_seconds:
+            raise ValueError("overlap_seconds는 0 이상 window_seconds 미만이어야 합니다")
+        if self.max_tokens < 1 or not 0 <= self.overlap_tokens < self.max_tokens:
+            raise ValueError("overlap_tokens는 0 이상 max_tokens 미만이어야 합니다")
+
+
+def make_chunk_id(video_id: str, source: ChunkSource, chunk_index: int) -> str:
+    """같은 비디오의 같은 위치 청크가 항상 같은 ID를 갖도록 UUID5로 만듭니다."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"youtube:{video_id}:{source}:{chunk_index}"))
+
+
+def chunk_document(document: IngestionDocument, config: ChunkingConfig) -> list[DocumentChunk]:
+    """비디오 원문을 제목/설명 청크와 자막 청크로 나눕니다.
+
+    Args:
+        document (IngestionDocument): 비디오 원문
+        config (ChunkingConfig): 청크 분할 설정
+
+    Returns:
+        list[DocumentChunk]: 청크 목록 (제목/설명 청크가 먼저, 자막 청크는 시간 순서)
+    """
+    chunks: list[DocumentChunk] = []
+    snippet_text = "\n".join(part for part in (document.title.strip(), document.description.strip()) if part)
+    for index, text in enumerate(_split_tokens(snippet_text.split(), config.max_tokens, config.overlap_tokens)):
+        chunks.append(_make_chunk(document, "snippet", index, text, None, None))
+
+    segments = [segment for segment in document.segments or [] if str(segment.get("text", "")).strip()]
+    if config.strategy == "time":
+        windows = _split_time_windows(segments, config.window_seconds, config.overlap_seconds)
+    else:
+        windows = _split_token_windows(segments, config.max_tokens, config.overlap_tokens)
+    for index, (text, start, end) in enumerate(windows):
+        chunks.append(_make_chunk(document, "transcript", index, text, start, end))
+    return chunks
+
+
+def content_hash(chunks: list[DocumentChunk], config: ChunkingConfig, model_id: str) -> str:
+    """청크 텍스트와 시각, 청크 설정, 임베딩 모델로 비디오의 임베딩 상태 해시를 만듭니다."""
+    digest = hashlib.sha256(f"{model_id}|{config}".encode())
+    for chunk in chunks:
+        digest.update(f"\x00{chunk.source}|{chunk.start_seconds}|{chunk.end_seconds}|{chunk.text}".encode())
+    return digest.hexdigest()
+
+
+def _make_chunk(
+    document: IngestionDocument,
+    source: ChunkSource,
+    index: int,
+    text: str,
+    start: float | None,
+    end: float | None,
+) -> DocumentChunk:
+    return DocumentChunk(
+        chunk_id=make_chunk_id(document.video_id, source, index),
+        video_id=document.video_id,
+        channel_id=document.channel_id,
+        streamer_name=document.streamer_name,
+        source=source,
+        chunk_index=index,
+        text=text,
+        start_seconds=start,
+        end_seconds=end,
+        published_at=document.published_at,
+    )
+
+
+def _split_tokens(tokens: list[str], max_tokens: int, overlap_tokens: int) -> list[str]:
+    step = max_tokens - overlap_tokens
+    texts = []
+    for start in range(0, len(tokens), step):
+        texts.append(" ".join(tokens[start : start + max_tokens]))
+        if start + max_tokens >= len(tokens):
+            break
+    return texts
+
+
+def _split_time_windows(
+    segments: list[dict], window_seconds: float, overlap_seconds: float
+) -> list[tuple[str, float, float]]:
+    windows: list[tuple[str, float, float]] = []
+    step = window_seconds - overlap_seconds
+    first = 0
+    while first < len(segments):
+        window_start = float(segments[first]["start"])
+        window_end = window_start + window_seconds
+        texts, end, last = [], window_start, first
+        for index in range(first, len(segments)):
+            segment = segments[index]
+            if float(segment["start"]) >= window_end:
+                break
+            texts.append(str(segment["text"]).strip())
+            end = float(segment["start"]) + float(segment.get("duration", 0.0))
+            last = index
+        windows.append((" ".join(texts), window_start, end))
+        if last == len(segments) - 1:
+            break
+        # 다음 구간은 겹치는 시간만큼 앞에서 시작하되, 적어도 한 세그먼트는 앞으로 이동
+        next_start = window_start + step
+        following = first + 1
+        while following <= last and float(segments[following]["start"]) < next_start:
+            following += 1
+        first = following
+    return windows
+
+
+def _split_token_windows(segments: list[dict], max_tokens: int, overlap_tokens: int) -> list[tuple[str, float, float]]:
+    # 단어마다 속한 세그먼트의 시각을 기억해 청크의 시작/끝 시각을 계산
+    words: list[tuple[str, float, float]] = []
+    for segment in segments:
+        start = float(segment["start"])
+        end = start + float(segment.get("duration", 0.0))
+        words.extend((word, start, end) for word in str(segment["text"]).split())
+    windows = []
+    step = max_tokens - overlap_tokens
+    for first in range(0, len(words), step):
+        window = words[first : first + max_tokens]
+        windows.append((" ".join(word for word, _, _ in window), window[0][1], window[-1][2]))
+        if first + max_tokens >= len(words):
+            break
+    return windows
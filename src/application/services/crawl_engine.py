@@ -0,0 +1,59 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class CrawlEngine:
+    """채널 단위 크롤링 작업을 제한된 동시성으로 병렬 실행하는 엔진
+
+    - 한 번의 실행(run)에서 동시에 처리되는 작업 수는 max_concurrency로 제한됩니다.
+    - 같은 API 키로 동시에 보내는 요청 수는 per_key_concurrency로 제한됩니다.
+    """
+
+    def __init__(self, max_concurrency: int = 8, per_key_concurrency: int = 4):
+        if max_concurrency < 1 or per_key_concurrency < 1:
+            raise ValueError("동시성 제한 값은 1 이상이어야 합니다")
+        self.max_concurrency = max_concurrency
+        self.per_key_concurrency = per_key_concurrency
+        self._key_slots: dict[str, asyncio.Semaphore] = {}
+        self._stopped = asyncio.Event()
+
+    async def run(self, items: Iterable[T], worker: Callable[[T], Awaitable[None]]) -> None:
+        """작업 목록을 병렬로 실행하고 모든 작업이 끝날 때까지 기다립니다.
+
+        worker 내부에서 발생한 예외는 TaskGroup에 의해 나머지 작업을 취소하므로,
+        작업 단위의 예외 처리는 worker 안에서 해야 합니다.
+
+        Args:
+            items (Iterable[T]): 처리할 작업 목록
+            worker (Callable[[T], Awaitable[None]]): 작업 하나를 처리하는 코루틴 함수
+        """
+        self._stopped.clear()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _guarded(item: T) -> None:
+            async with semaphore:
+                # 대기하는 동안 중단 요청이 들어왔다면 작업을 시작하지 않음
+                if self._stopped.is_set():
+                    return
+                await worker(item)
+
+        async with asyncio.TaskGroup() as task_group:
+            for item in items:
+                task_group.create_task(_guarded(item))
+
+    def stop(self) -> None:
+        """아직 시작되지 않은 작업들을 건너뛰도록 요청합니다. (예: 쿼터 초과)"""
+        self._stopped.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def key_slot(self, api_key: str) -> asyncio.Semaphore:
+        """API 키별 동시 요청 수를 제한하는 세마포어를 반환합니다."""
+        if api_key not in self._key_slots:
+            self._key_slots[api_key] = asyncio.Semaphore(self.per_key_concurrency)
+        return self._key_slots[api_key]
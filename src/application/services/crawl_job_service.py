@@ -0,0 +1,200 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from application.services.embedding_service import EmbeddingIngestionService
+from application.services.lexical_index_service import LexicalIndexService
+from application.services.raw_data_export_service import RawDataExportService
+from application.services.youtube_service import RawDataCrawlService
+from domain.model.crawl_job import CrawlJob, CrawlJobType, CrawlProgress
+from domain.repository.crawl_job import CrawlJobRepository
+
+
+class CrawlJobRunner:
+    """크롤링 작업을 저장소에 기록하고 프로세스 안의 비동기 워커 풀에서 실행하는 실행기
+
+    - enqueue()는 작업을 저장한 뒤 바로 반환하고, 워커가 대기 중인 작업을 하나씩 가져가 실행합니다.
+    - 실행 중에는 progress_interval초마다 진행 상황을 저장하고 취소 요청을 확인합니다.
+    - 작업 상태가 저장소에 남으므로, 서버가 중간에 종료되면 다음 시작 시 실행 중이던 작업을 다시 대기열에 넣습니다.
+      (채널 초기화 수집은 체크포인트가 있어 멈춘 지점부터 이어서 실행됩니다)
+    - 수집 외에도 상세 정보 보강, 자막 수집, 임베딩 적재, 단어 색인 구축, 원시 데이터 내보내기처럼 요청 안에서
+      끝나지 않는 작업을 같은 방식으로 실행합니다.
+    """
+
+    def __init__(
+        self,
+        job_repo: CrawlJobRepository,
+        service_factory: Callable[[], RawDataCrawlService],
+        embedding_service_factory: Callable[[], EmbeddingIngestionService] | None = None,
+        lexical_index_service_factory: Callable[[], LexicalIndexService | None] | None = None,
+        export_service_factory: Callable[[], RawDataExportService] | None = None,
+        workers: int = 1,
+        progress_interval: float = 2.0,
+    ):
+        if workers < 1:
+            raise ValueError("워커 수는 1 이상이어야 합니다")
+        self.job_repo = job_repo
+        self.service_factory = service_factory
+        self.embedding_service_factory = embedding_service_factory
+        self.lexical_index_service_factory = lexical_index_service_factory
+        self.export_service_factory = export_service_factory
+        self.workers = workers
+        self.progress_interval = progress_interval
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._worker_tasks: list[asyncio.Task] = []
+        self._running: dict[str, asyncio.Task] = {}
+        self._closing = False
+
+    async def start(self) -> None:
+        """중단된 작업을 다시 대기열에 넣고 워커를 시작합니다."""
+        if self._worker_tasks:
+            return
+        self._closing = False
+        await self.job_repo.requeue_interrupted_jobs()
+        for job_id in await self.job_repo.list_queued_job_ids():
+            self._queue.put_nowait(job_id)
+        self._worker_tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def aclose(self) -> None:
+        """워커를 종료합니다. 실행 중이던 작업은 실행 중 상태로 남아 다음 시작 시 다시 실행됩니다."""
+        self._closing = True
+        for task in [*self._running.values(), *self._worker_tasks]:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    async def enqueue(self, job_type: CrawlJobType, params: dict[str, Any] | None = None) -> CrawlJob:
+        """크롤링 작업을 대기열에 넣고 바로 반환합니다.
+
+        Args:
+            job_type (CrawlJobType): 작업 종류
+            params (dict[str, Any] | None, optional): 서비스 메서드에 전달할 인자. Defaults to None.
+
+        Returns:
+            CrawlJob: 저장된 작업
+        """
+        # quota_budget=0처럼 거짓으로 평가되는 값도 유효한 인자이므로 None만 제외
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        job = CrawlJob(job_type=job_type, params=params)
+        await self.job_repo.insert_job(job)
+        self._queue.put_nowait(job.job_id)
+        return job
+
+    async def get_job(self, job_id: str) -> CrawlJob | None:
+        return await self.job_repo.get_job(job_id)
+
+    async def list_jobs(self, limit: int = 50) -> list[CrawlJob]:
+        return await self.job_repo.list_jobs(limit=limit)
+
+    async def cancel(self, job_id: str) -> CrawlJob | None:
+        """작업 취소를 요청합니다. 이 프로세스에서 실행 중인 작업은 즉시 중단합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            CrawlJob | None: 갱신된 작업 (없으면 None)
+        """
+        job = await self.job_repo.request_cancel(job_id)
+        if job_id in self._running:
+            self._running[job_id].cancel()
+        return job
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                # 다른 프로세스가 먼저 가져갔거나 대기 중에 취소된 작업은 None
+                job = await self.job_repo.claim_job(job_id)
+                if job is not None:
+                    await self._execute(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error running crawl job {job_id}: {e}")
+
+    async def _execute(self, job: CrawlJob) -> None:
+        progress = CrawlProgress()
+        task = asyncio.create_task(self._run_job(job, progress))
+        self._running[job.job_id] = task
+        reporter = asyncio.create_task(self._report_progress(job.job_id, progress, task))
+        error = result = None
+        try:
+            result = await task
+            status = "succeeded"
+        except asyncio.CancelledError:
+            # 서버 종료로 중단된 작업은 실행 중 상태로 남겨 다음 시작 시 다시 실행
+            if self._closing:
+                raise
+            status = "cancelled"
+        except Exception as e:
+            status, error = "failed", str(e)
+        finally:
+            reporter.cancel()
+            self._running.pop(job.job_id, None)
+        await self.job_repo.finish_job(job.job_id, status, progress, error, result)
+
+    async def _run_job(self, job: CrawlJob, progress: CrawlProgress) -> dict[str, Any] | None:
+        """작업 종류에 맞는 서비스 메서드를 실행하고, 결과 보고서가 있으면 딕셔너리로 반환합니다."""
+        if job.job_type == "ingest_embeddings":
+            if self.embedding_service_factory is None:
+                raise ValueError("임베딩 적재 서비스가 설정되지 않았습니다")
+            report = await self.embedding_service_factory().ingest(
+                max_documents=job.params.get("max_documents"), progress=progress
+            )
+            return report.to_dict()
+        if job.job_type == "build_lexical_index":
+            # 단어 색인이 비활성화되어 있으면 팩토리가 None을 반환함
+            lexical_service = self.lexical_index_service_factory() if self.lexical_index_service_factory else None
+            if lexical_service is None:
+                raise ValueError("단어 색인이 비활성화되어 있습니다")
+            report = await lexical_service.build(max_documents=job.params.get("max_documents"), progress=progress)
+            return report.to_dict()
+        if job.job_type == "export_raw_data":
+            if self.export_service_factory is None:
+                raise ValueError("원시 데이터 내보내기 서비스가 설정되지 않았습니다")
+            report = await self.export_service_factory().export(full=job.params.get("full", False), progress=progress)
+            return report.to_dict()
+        service = self.service_factory()
+        if job.job_type == "initialize":
+            await service.initialize_you_tube_video_data(
+                published_after=job.params.get("published_after"),
+                published_before=job.params.get("published_before"),
+                mode=job.params.get("mode"),
+                progress=progress,
+            )
+        elif job.job_type == "fetch":
+            await service.fetch_videos_from_initialized_channels(
+                mode=job.params.get("mode"),
+                progress=progress,
+                channel_ids=job.params.get("channel_ids"),
+                quota_budget=job.params.get("quota_budget"),
+            )
+        elif job.job_type == "enrich_details":
+            report = await service.enrich_video_details(max_videos=job.params.get("max_videos"), progress=progress)
+            return report.to_dict()
+        elif job.job_type == "crawl_transcripts":
+            report = await service.crawl_transcripts(
+                concurrency=job.params.get("concurrency", 4),
+                batch_size=job.params.get("batch_size", 100),
+                max_attempts=job.params.get("max_attempts", 3),
+                max_videos=job.params.get("max_videos"),
+                progress=progress,
+            )
+            return report.to_dict()
+        else:
+            raise ValueError(f"지원하지 않는 작업 종류입니다: {job.job_type}")
+
+    async def _report_progress(self, job_id: str, progress: CrawlProgress, task: asyncio.Task) -> None:
+        """주기적으로 진행 상황을 저장하고, 다른 프로세스에서 들어온 취소 요청을 확인합니다."""
+        while not task.done():
+            await asyncio.sleep(self.progress_interval)
+            try:
+                await self.job_repo.update_progress(job_id, progress)
+                job = await self.job_repo.get_job(job_id)
+            except Exception as e:
+                print(f"Error reporting progress for crawl job {job_id}: {e}")
+                continue
+            if job is not None and job.cancel_requested:
+                task.cancel()
+                return
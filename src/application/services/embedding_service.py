@@ -0,0 +1,161 @@
+import asyncio
+import datetime
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from application.services.chunking import ChunkingConfig, chunk_document, content_hash
+from domain.adapter.embedder import Embedder
+from domain.model.crawl_job import CrawlProgress
+from domain.model.embedding import DocumentChunk, EmbeddingState, IngestionDocument
+from domain.repository.embedding import EmbeddingStateRepository
+from domain.repository.vector_repository import VectorRepository
+from domain.repository.youtube_repository import YoutubeRepository
+
+
+@dataclass
+class IngestionReport:
+    """임베딩 적재 결과"""
+
+    documents_seen: int = 0
+    documents_embedded: int = 0  # 새로 추가되었거나 내용이 바뀌어 다시 임베딩한 비디오 수
+    documents_skipped: int = 0  # 이전 임베딩과 내용이 같아 건너뛴 비디오 수
+    chunks_embedded: int = 0
+    embed_requests: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.chunks_embedded / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "chunks_per_second": round(self.chunks_per_second, 2)}
+
+
+class EmbeddingIngestionService:
+    """수집한 비디오의 제목/설명과 자막을 청크로 나눠 임베딩하고 벡터 저장소에 적재하는 서비스
+
+    - 비디오 원문을 커서로 document_batch_size개씩 읽어 처리하므로 전체를 메모리에 올리지 않습니다.
+    - 비디오별로 청크 내용, 청크 설정, 임베딩 모델의 해시를 저장해 두고, 해시가 같은 비디오는 건너뜁니다.
+    - 청크는 embed_batch_size개씩 묶어 최대 embed_concurrency개의 요청을 동시에 보내 임베딩합니다.
+    - 벡터는 upsert_batch_size개씩 업서트하고, 다시 임베딩하는 비디오는 기존 청크를 먼저 지웁니다.
+    """
+
+    def __init__(
+        self,
+        youtube_repo: YoutubeRepository,
+        state_repo: EmbeddingStateRepository,
+        vector_repo: VectorRepository,
+        embedder: Embedder,
+        chunking: ChunkingConfig | None = None,
+        document_batch_size: int = 200,
+        embed_batch_size: int = 64,
+        embed_concurrency: int = 4,
+        upsert_batch_size: int = 512,
+    ):
+        if min(document_batch_size, embed_batch_size, embed_concurrency, upsert_batch_size) < 1:
+            raise ValueError("배치 크기와 동시성 제한 값은 1 이상이어야 합니다")
+        self.youtube_repo = youtube_repo
+        self.state_repo = state_repo
+        self.vector_repo = vector_repo
+        self.embedder = embedder
+        self.chunking = chunking or ChunkingConfig()
+        self.document_batch_size = document_batch_size
+        self.embed_batch_size = embed_batch_size
+        self.embed_concurrency = embed_concurrency
+        self.upsert_batch_size = upsert_batch_size
+
+    async def ingest(self, max_documents: int | None = None, progress: CrawlProgress | None = None) -> IngestionReport:
+        """새로 수집되었거나 내용이 바뀐 비디오만 임베딩해 벡터 저장소에 적재합니다.
+
+        Args:
+            max_documents (int | None, optional): 이번 실행에서 확인할 최대 비디오 수. Defaults to None.
+            progress (CrawlProgress | None, optional): 확인한 비디오 수를 기록할 객체. Defaults to None.
+
+        Returns:
+            IngestionReport: 적재 결과
+        """
+        started = time.perf_counter()
+        report = IngestionReport()
+        await self.vector_repo.ensure_collection(self.embedder.dimension)
+
+        batch: list[IngestionDocument] = []
+        async for document in self.youtube_repo.iter_ingestion_documents(batch_size=self.document_batch_size):
+            batch.append(document)
+            if len(batch) >= self.document_batch_size:
+                await self._ingest_batch(batch, report, progress)
+                batch = []
+            if max_documents is not None and report.documents_seen + len(batch) >= max_documents:
+                break
+        if batch:
+            await self._ingest_batch(batch, report, progress)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    async def _ingest_batch(
+        self, documents: list[IngestionDocument], report: IngestionReport, progress: CrawlProgress | None = None
+    ) -> None:
+        report.documents_seen += len(documents)
+        if progress is not None:
+            progress.videos_collected += len(documents)
+        states = await self.state_repo.get_states([document.video_id for document in documents])
+        model_id = self.embedder.model_id
+
+        changed: list[tuple[IngestionDocument, list[DocumentChunk], str]] = []
+        for document in documents:
+            chunks = chunk_document(document, self.chunking)
+            document_hash = content_hash(chunks, self.chunking, model_id)
+            state = states.get(document.video_id)
+            if state is not None and state.content_hash == document_hash:
+                report.documents_skipped += 1
+                continue
+            changed.append((document, chunks, document_hash))
+        if not changed:
+            return
+
+        chunks = [chunk for _, document_chunks, _ in changed for chunk in document_chunks]
+        vectors = await self._embed([chunk.text for chunk in chunks], report)
+
+        # 청크 수가 줄어든 비디오의 남는 청크가 검색되지 않도록 기존 청크를 먼저 삭제
+        stale_video_ids = [document.video_id for document, _, _ in changed if document.video_id in states]
+        await self.vector_repo.delete_video_chunks(stale_video_ids)
+        for index in range(0, len(chunks), self.upsert_batch_size):
+            await self.vector_repo.upsert_chunks(
+                chunks[index : index + self.upsert_batch_size], vectors[index : index + self.upsert_batch_size]
+            )
+
+        embedded_at = datetime.datetime.now(datetime.timezone.utc)
+        await self.state_repo.save_states(
+            [
+                EmbeddingState(
+                    video_id=document.video_id,
+                    content_hash=document_hash,
+                    chunk_count=len(document_chunks),
+                    model_id=model_id,
+                    embedded_at=embedded_at,
+                )
+                for document, document_chunks, document_hash in changed
+            ]
+        )
+        report.documents_embedded += len(changed)
+        report.chunks_embedded += len(chunks)
+
+    async def _embed(self, texts: list[str], report: IngestionReport) -> list[list[float]]:
+        """텍스트를 embed_batch_size개씩 나눠 동시에 임베딩하고 입력 순서대로 합칩니다."""
+        semaphore = asyncio.Semaphore(self.embed_concurrency)
+
+        async def _embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                vectors = await self.embedder.embed(batch)
+            report.embed_requests += 1
+            if len(vectors) != len(batch):
+                raise ValueError(f"임베딩 결과 수가 입력과 다릅니다: {len(vectors)} != {len(batch)}")
+            return vectors
+
+        size = self.embed_batch_size
+        batches = [texts[index : index + size] for index in range(0, len(texts), size)]
+        results = await asyncio.gather(*(_embed_batch(batch) for batch in batches))
+        return [vector for vectors in results for vector in vectors]
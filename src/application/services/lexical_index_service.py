@@ -0,0 +1,117 @@
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from application.services.chunking import ChunkingConfig, chunk_document, content_hash
+from domain.model.crawl_job import CrawlProgress
+from domain.model.embedding import IngestionDocument
+from domain.repository.lexical_index import LexicalIndexRepository
+from domain.repository.youtube_repository import YoutubeRepository
+
+LEXICAL_INDEX_ID = "bm25"  # 색인 상태 해시에 임베딩 모델 대신 들어가는 식별자
+
+
+@dataclass
+class LexicalIndexReport:
+    """단어 색인 결과"""
+
+    documents_seen: int = 0
+    documents_indexed: int = 0  # 새로 추가되었거나 내용이 바뀌어 다시 색인한 비디오 수
+    documents_skipped: int = 0
+    chunks_indexed: int = 0
+    merged: bool = False
+    elapsed_seconds: float = 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.chunks_indexed / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "chunks_per_second": round(self.chunks_per_second, 2)}
+
+
+class LexicalIndexService:
+    """수집한 비디오를 임베딩 적재와 같은 방식으로 청크로 나눠 단어 색인에 추가하는 서비스
+
+    - 청크 ID가 벡터 저장소와 같으므로 검색할 때 두 결과를 청크 단위로 합칠 수 있습니다.
+    - 비디오별 내용 해시가 같으면 건너뛰고, commit_every개 청크마다 색인을 저장해 메모리 사용량을 제한합니다.
+    - 색인 조각(세그먼트)이 max_segments개를 넘으면 하나로 합칩니다.
+    """
+
+    def __init__(
+        self,
+        youtube_repo: YoutubeRepository,
+        index: LexicalIndexRepository,
+        chunking: ChunkingConfig | None = None,
+        document_batch_size: int = 500,
+        commit_every: int = 200_000,
+        max_segments: int = 8,
+    ):
+        if min(document_batch_size, commit_every, max_segments) < 1:
+            raise ValueError("배치 크기와 세그먼트 수 제한 값은 1 이상이어야 합니다")
+        self.youtube_repo = youtube_repo
+        self.index = index
+        self.chunking = chunking or ChunkingConfig()
+        self.document_batch_size = document_batch_size
+        self.commit_every = commit_every
+        self.max_segments = max_segments
+
+    async def build(
+        self, max_documents: int | None = None, progress: CrawlProgress | None = None
+    ) -> LexicalIndexReport:
+        """새로 수집되었거나 내용이 바뀐 비디오만 색인합니다.
+
+        Args:
+            max_documents (int | None, optional): 이번 실행에서 확인할 최대 비디오 수. Defaults to None.
+            progress (CrawlProgress | None, optional): 확인한 비디오 수를 기록할 객체. Defaults to None.
+
+        Returns:
+            LexicalIndexReport: 색인 결과
+        """
+        started = time.perf_counter()
+        report = LexicalIndexReport()
+        uncommitted = 0
+
+        batch: list[IngestionDocument] = []
+        async for document in self.youtube_repo.iter_ingestion_documents(batch_size=self.document_batch_size):
+            batch.append(document)
+            reached_limit = max_documents is not None and report.documents_seen + len(batch) >= max_documents
+            if len(batch) >= self.document_batch_size or reached_limit:
+                uncommitted += await self._index_batch(batch, report, progress)
+                batch = []
+                if uncommitted >= self.commit_every:
+                    await self.index.commit()
+                    uncommitted = 0
+            if reached_limit:
+                break
+        if batch:
+            await self._index_batch(batch, report, progress)
+        await self.index.commit()
+
+        if (await self.index.stats())["segments"] > self.max_segments:
+            await self.index.merge_segments()
+            report.merged = True
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    async def _index_batch(
+        self, documents: list[IngestionDocument], report: LexicalIndexReport, progress: CrawlProgress | None = None
+    ) -> int:
+        report.documents_seen += len(documents)
+        if progress is not None:
+            progress.videos_collected += len(documents)
+        hashes = await self.index.get_content_hashes([document.video_id for document in documents])
+        chunk_count = 0
+        for document in documents:
+            chunks = chunk_document(document, self.chunking)
+            document_hash = content_hash(chunks, self.chunking, LEXICAL_INDEX_ID)
+            if hashes.get(document.video_id) == document_hash:
+                report.documents_skipped += 1
+                continue
+            await self.index.add_video(document.video_id, document_hash, chunks)
+            report.documents_indexed += 1
+            chunk_count += len(chunks)
+        report.chunks_indexed += chunk_count
+        return chunk_count
@@ -0,0 +1,122 @@
+import datetime
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from domain.model.crawl_job import CrawlProgress
+from domain.model.export import ExportShard, export_month
+from domain.repository.export import RawDataExportStore
+from domain.repository.youtube_repository import YoutubeRepository
+
+
+@dataclass
+class RawDataExportReport:
+    """raw_data 내보내기 결과"""
+
+    format: str = ""
+    full: bool = False  # 이전 파일을 지우고 처음부터 내보냈는지 여부
+    rows_exported: int = 0
+    shards_written: int = 0
+    bytes_written: int = 0
+    partitions: int = 0  # 이번 실행에서 파일을 쓴 (채널, 월) 파티션 수
+    watermark: str | None = None  # 내보낸 행의 마지막 created_at
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows_exported / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "rows_per_second": round(self.rows_per_second, 2)}
+
+
+class RawDataExportService:
+    """raw_data를 채널/월 파티션별 파일로 스트리밍해 내보내는 서비스
+
+    - 필요한 필드만 조회하는 커서를 batch_size개씩 읽으며, YoutubeVideoRawData로 변환하지 않고 행 딕셔너리로 처리합니다.
+    - 파티션별로 행을 모으다가 rows_per_shard개가 되면 파일 하나로 쓰고, 모아 둔 행이 max_buffered_rows개를 넘으면
+      가장 큰 파티션부터 써서 메모리 사용량을 제한합니다.
+    - 마지막으로 내보낸 행의 created_at을 워터마크로 저장해 다음 실행에서는 그 이후에 저장된 비디오만 내보냅니다.
+      저장이 늦게 끝나는 비디오를 놓치지 않도록 settle 시간보다 오래된 비디오만 내보냅니다.
+    - created_at은 처음 저장할 때만 기록되므로, 이후의 보강(details)이나 자막 상태 변경을 반영하려면 full로
+      다시 내보냅니다.
+    """
+
+    def __init__(
+        self,
+        youtube_repo: YoutubeRepository,
+        store: RawDataExportStore,
+        batch_size: int = 2000,
+        rows_per_shard: int = 100_000,
+        max_buffered_rows: int = 200_000,
+        settle: datetime.timedelta = datetime.timedelta(minutes=10),
+        include_raw: bool = True,
+    ):
+        if min(batch_size, rows_per_shard, max_buffered_rows) < 1:
+            raise ValueError("배치 크기와 파일당 행 수는 1 이상이어야 합니다")
+        self.youtube_repo = youtube_repo
+        self.store = store
+        self.batch_size = batch_size
+        self.rows_per_shard = rows_per_shard
+        self.max_buffered_rows = max_buffered_rows
+        self.settle = settle
+        self.include_raw = include_raw
+
+    async def export(
+        self, full: bool = False, now: datetime.datetime | None = None, progress: CrawlProgress | None = None
+    ) -> RawDataExportReport:
+        """마지막 내보내기 이후에 저장된 비디오를 내보냅니다.
+
+        Args:
+            full (bool, optional): 이전에 내보낸 파일을 지우고 처음부터 내보낼지 여부. Defaults to False.
+            now (datetime.datetime | None, optional): 기준 시각. Defaults to 현재 시각.
+            progress (CrawlProgress | None, optional): 내보낸 비디오 수를 기록할 객체. Defaults to None.
+
+        Returns:
+            RawDataExportReport: 내보내기 결과
+        """
+        started = time.perf_counter()
+        report = RawDataExportReport(format=self.store.format, full=full)
+        if full:
+            await self.store.reset()
+        watermark = await self.store.get_watermark()
+        created_before = (now or datetime.datetime.now(datetime.timezone.utc)) - self.settle
+
+        buffers: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        buffered = 0
+        shards: list[ExportShard] = []
+        async for row in self.youtube_repo.iter_raw_data_export_rows(
+            created_after=watermark,
+            created_before=created_before,
+            include_raw=self.include_raw,
+            batch_size=self.batch_size,
+        ):
+            key = (row["channel_id"], export_month(row))
+            rows = buffers.setdefault(key, [])
+            rows.append(row)
+            buffered += 1
+            report.rows_exported += 1
+            if progress is not None:
+                progress.videos_collected += 1
+            watermark = row["created_at"]
+            if len(rows) >= self.rows_per_shard:
+                shards.append(await self.store.write_shard(*key, buffers.pop(key)))
+                buffered -= len(rows)
+            elif buffered > self.max_buffered_rows:
+                largest = max(buffers, key=lambda partition: len(buffers[partition]))
+                rows = buffers.pop(largest)
+                shards.append(await self.store.write_shard(*largest, rows))
+                buffered -= len(rows)
+        for key, rows in buffers.items():
+            shards.append(await self.store.write_shard(*key, rows))
+
+        # 모든 파일을 쓴 뒤에 목록과 워터마크를 함께 갱신하므로, 중간에 실패하면 다음 실행에서 같은 범위를 다시 내보냄
+        await self.store.commit(shards, watermark if report.rows_exported else None)
+        report.shards_written = len(shards)
+        report.bytes_written = sum(shard.size_bytes for shard in shards)
+        report.partitions = len({(shard.channel_id, shard.month) for shard in shards})
+        report.watermark = watermark.isoformat() if watermark else None
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
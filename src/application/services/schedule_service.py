@@ -1,3 +1,101 @@
+import asyncio
+import datetime
+
+from application.services.crawl_job_service import CrawlJobRunner
+from domain.model.crawl_job import CrawlJob
+from domain.model.crawler_schedule import CrawlerSchedule
+from domain.repository.crawler_schedule import RawDataCrawlerScheduleRepository
+
+
 class CrawlerScheduleService:
-    pass
+    """채널별 수집 일정에 따라 증분 수집 작업을 등록하는 스케줄러
+
+    poll_interval초마다 실행 시각이 된 채널을 우선순위 순서로 최대 max_channels_per_run개 골라
+    하나의 fetch 작업으로 등록합니다. 간격 일정은 쿼터 리셋 시각을 기준으로 채널마다 위상이 달라
+    실행이 하루에 고르게 퍼지므로, 수동 실행처럼 한꺼번에 쿼터를 쓰지 않습니다.
+    """
+
+    def __init__(
+        self,
+        schedule_repo: RawDataCrawlerScheduleRepository,
+        job_runner: CrawlJobRunner,
+        poll_interval: float = 60.0,
+        max_channels_per_run: int = 20,
+    ):
+        self.schedule_repo = schedule_repo
+        self.job_runner = job_runner
+        self.poll_interval = poll_interval
+        self.max_channels_per_run = max_channels_per_run
+        self._task: asyncio.Task | None = None
+
+    async def add_schedule(
+        self, channel_id: str, interval_minutes: int | None = None, cron: str | None = None, priority: int = 0
+    ) -> CrawlerSchedule:
+        """채널의 수집 일정을 등록하거나 바꿉니다.
+
+        Args:
+            channel_id (str): 채널 ID
+            interval_minutes (int | None, optional): 수집 간격(분). Defaults to None.
+            cron (str | None, optional): cron 표현식 (분 시 일 월 요일, UTC). Defaults to None.
+            priority (int, optional): 우선순위 (높을수록 먼저 수집). Defaults to 0.
+
+        Raises:
+            ValueError: 간격과 cron을 둘 다 지정하거나 둘 다 지정하지 않은 경우, cron 형식이 잘못된 경우
+
+        Returns:
+            CrawlerSchedule: 저장된 일정
+        """
+        schedule = CrawlerSchedule(
+            channel_id=channel_id, interval_minutes=interval_minutes, cron=cron, priority=priority
+        )
+        schedule.next_run_at = schedule.compute_next_run(datetime.datetime.now(datetime.timezone.utc))
+        await self.schedule_repo.add_schedule(schedule)
+        return schedule
+
+    async def list_schedules(self) -> list[CrawlerSchedule]:
+        return await self.schedule_repo.get_schedules()
+
+    async def delete_schedule(self, channel_id: str) -> None:
+        await self.schedule_repo.delete_schedule(channel_id)
+
+    async def run_due(self, now: datetime.datetime | None = None) -> CrawlJob | None:
+        """실행 시각이 된 채널들을 하나의 증분 수집 작업으로 등록하고 다음 실행 시각을 갱신합니다.
+
+        Args:
+            now (datetime.datetime | None, optional): 기준 시각. Defaults to 현재 시각.
+
+        Returns:
+            CrawlJob | None: 등록된 작업 (실행할 채널이 없으면 None)
+        """
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        schedules = await self.schedule_repo.get_due_schedules(now, limit=self.max_channels_per_run)
+        if not schedules:
+            return None
+        job = await self.job_runner.enqueue("fetch", {"channel_ids": [schedule.channel_id for schedule in schedules]})
+        for schedule in schedules:
+            schedule.mark_run(now, job.job_id)
+            await self.schedule_repo.update_schedule(schedule)
+        return job
+
+    async def start(self) -> None:
+        """스케줄러 루프를 시작합니다. 여러 번 호출해도 안전합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """스케줄러 루프를 종료합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
 
+    async def _run(self) -> None:
+        while True:
+            try:
+                # 한 번에 max_channels_per_run개까지만 가져오므로, 밀린 일정이 남아 있으면 바로 이어서 등록
+                while await self.run_due() is not None:
+                    pass
+            except Exception as e:
+                print(f"Error running crawler schedules: {e}")
+            await asyncio.sleep(self.poll_interval)
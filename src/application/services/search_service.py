@@ -0,0 +1,275 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Literal
+
+from domain.adapter.embedder import Embedder
+from domain.model.search import SearchFilter, SearchHit
+from domain.repository.lexical_index import LexicalIndexRepository
+from domain.repository.vector_repository import VectorRepository
+
+SearchMode = Literal["hybrid", "vector", "lexical"]
+
+
+class LatencyTracker:
+    """단계별로 최근 window개 요청의 지연 시간을 보관하고 p50/p95를 계산합니다."""
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        self._samples.setdefault(stage, deque(maxlen=self.window)).append(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """단계별 표본 수와 p50/p95 지연 시간(밀리초)"""
+        result = {}
+        for stage, samples in self._samples.items():
+            ordered = sorted(samples)
+            result[stage] = {
+                "count": len(ordered),
+                "p50_ms": round(_percentile(ordered, 50) * 1000, 2),
+                "p95_ms": round(_percentile(ordered, 95) * 1000, 2),
+            }
+        return result
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    # nearest-rank 방식
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+class QueryEmbeddingBatcher:
+    """동시에 들어온 검색어를 모아 한 번의 임베딩 요청으로 보냅니다.
+
+    첫 검색어가 들어온 뒤 max_wait초 동안 기다리거나 서로 다른 검색어가 max_batch_size개 모이면 요청을 보냅니다.
+    같은 배치 안의 같은 검색어는 한 번만 임베딩합니다.
+    """
+
+    def __init__(self, embedder: Embedder, max_batch_size: int = 16, max_wait: float = 0.005):
+        if max_batch_size < 1 or max_wait < 0:
+            raise ValueError("max_batch_size는 1 이상, max_wait는 0 이상이어야 합니다")
+        self.embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batch_count = 0
+        self.query_count = 0
+        self._pending: dict[str, list[asyncio.Future[list[float]]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def embed(self, query: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.setdefault(query, []).append(future)
+        self.query_count += 1
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        task = asyncio.create_task(self._embed_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _embed_batch(self, pending: dict[str, list[asyncio.Future[list[float]]]]) -> None:
+        self.batch_count += 1
+        try:
+            vectors = await self.embedder.embed(list(pending), task="query")
+            if len(vectors) != len(pending):
+                raise ValueError(f"임베딩 결과 수가 입력과 다릅니다: {len(vectors)} != {len(pending)}")
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for vector, futures in zip(vectors, pending.values()):
+            for future in futures:
+                # 요청이 취소된 경우에는 결과를 버림
+                if not future.done():
+                    future.set_result(vector)
+
+
+def reciprocal_rank_fusion(rankings: list[list[str]], k: int = 60) -> list[tuple[str, float]]:
+    """여러 검색 결과의 순위를 RRF(순위 역수의 합, 1 / (k + 순위))로 합칩니다.
+
+    Args:
+        rankings (list[list[str]]): 검색 방식별 청크 ID 목록 (좋은 결과가 앞)
+        k (int, optional): 낮은 순위의 영향을 줄이는 상수. Defaults to 60.
+
+    Returns:
+        list[tuple[str, float]]: (청크 ID, 합친 점수) 목록 (점수 내림차순)
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, chunk_id in enumerate(ranking, start=1):
+            scores[chunk_id] = scores.get(chunk_id, 0.0) + 1 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+@dataclass
+class SearchMetrics:
+    """검색 요청 수와 검색어 임베딩 캐시/배치 통계"""
+
+    requests: int = 0
+    query_cache_hits: int = 0
+    embedded_queries: int = 0  # 배치로 보낸 검색어 수 (캐시에 없던 검색어)
+    embed_batches: int = 0  # 실제 임베딩 요청 수
+
+    def to_dict(self) -> dict[str, Any]:
+        hit_ratio = self.query_cache_hits / self.requests if self.requests else 0.0
+        return {**asdict(self), "query_cache_hit_ratio": hit_ratio}
+
+
+class SearchService:
+    """검색어를 임베딩해 벡터 저장소에서 조건에 맞는 비디오 청크를 찾는 서비스
+
+    - 최근 검색어의 임베딩은 query_cache_size개까지 LRU로 보관해 다시 임베딩하지 않습니다.
+    - 캐시에 없는 검색어는 QueryEmbeddingBatcher로 모아서 임베딩합니다.
+    - 단어 색인이 있으면 벡터 검색과 BM25 검색을 동시에 실행해 RRF로 합칩니다(hybrid).
+      각 방식에서 limit * candidate_multiplier개의 후보를 가져오고, 단어 검색에만 나온 청크는 벡터 저장소에서
+      조회합니다.
+    - 임베딩, 벡터 검색, 단어 검색, 전체 단계의 지연 시간을 LatencyTracker로 기록합니다.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        vector_repo: VectorRepository,
+        lexical_index: LexicalIndexRepository | None = None,
+        rrf_k: int = 60,
+        candidate_multiplier: int = 4,
+        query_cache_size: int = 1024,
+        batch_max_size: int = 16,
+        batch_max_wait: float = 0.005,
+        latency_window: int = 1000,
+    ):
+        self.embedder = embedder
+        self.vector_repo = vector_repo
+        self.lexical_index = lexical_index
+        self.rrf_k = rrf_k
+        self.candidate_multiplier = candidate_multiplier
+        self.query_cache_size = query_cache_size
+        self.batcher = QueryEmbeddingBatcher(embedder, max_batch_size=batch_max_size, max_wait=batch_max_wait)
+        self.latency = LatencyTracker(window=latency_window)
+        self._metrics = SearchMetrics()
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._collection_ready = False
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        search_filter: SearchFilter | None = None,
+        mode: SearchMode = "hybrid",
+    ) -> list[SearchHit]:
+        """검색어와 관련된 비디오 청크를 찾습니다.
+
+        Args:
+            query (str): 검색어
+            limit (int, optional): 최대 결과 수. Defaults to 10.
+            search_filter (SearchFilter | None, optional): 스트리머, 채널, 게시 기간 조건. Defaults to None.
+            mode (SearchMode, optional): hybrid(벡터 + 단어), vector, lexical 중 검색 방식.
+                단어 색인이 없으면 hybrid는 vector로 동작합니다. Defaults to "hybrid".
+
+        Raises:
+            ValueError: 검색어가 비어 있거나, 단어 색인 없이 lexical 검색을 요청한 경우
+
+        Returns:
+            list[SearchHit]: 검색 결과 (점수 내림차순, hybrid는 RRF 점수, lexical은 BM25 점수)
+        """
+        query = " ".join(query.split())
+        if not query:
+            raise ValueError("검색어가 비어 있습니다")
+        if self.lexical_index is None:
+            if mode == "lexical":
+                raise ValueError("단어 색인이 비활성화되어 있습니다")
+            mode = "vector"
+        if not self._collection_ready:
+            await self.vector_repo.ensure_collection(self.embedder.dimension)
+            self._collection_ready = True
+
+        started = time.perf_counter()
+        self._metrics.requests += 1
+        candidates = limit if mode != "hybrid" else limit * self.candidate_multiplier
+        vector_hits: list[SearchHit] = []
+        lexical_hits: list[tuple[str, float]] = []
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                if mode != "lexical":
+                    vector_task = task_group.create_task(self._vector_search(query, candidates, search_filter))
+                if mode != "vector":
+                    lexical_task = task_group.create_task(self._lexical_search(query, candidates, search_filter))
+        except ExceptionGroup as e:
+            # 호출한 쪽에서 임베딩/검색 오류를 그대로 처리할 수 있도록 첫 번째 오류를 발생시킴
+            raise e.exceptions[0] from e
+        if mode != "lexical":
+            vector_hits = vector_task.result()
+        if mode != "vector":
+            lexical_hits = lexical_task.result()
+
+        if mode == "vector":
+            hits = vector_hits
+        elif mode == "lexical":
+            hits = await self._resolve(lexical_hits, {})
+        else:
+            fused = reciprocal_rank_fusion(
+                [[hit.chunk_id for hit in vector_hits], [chunk_id for chunk_id, _ in lexical_hits]], k=self.rrf_k
+            )
+            hits = await self._resolve(fused[:limit], {hit.chunk_id: hit for hit in vector_hits})
+        self.latency.record("total", time.perf_counter() - started)
+        return hits
+
+    def metrics(self) -> dict[str, Any]:
+        self._metrics.embedded_queries = self.batcher.query_count
+        self._metrics.embed_batches = self.batcher.batch_count
+        return {**self._metrics.to_dict(), "latency": self.latency.snapshot()}
+
+    async def _vector_search(self, query: str, limit: int, search_filter: SearchFilter | None) -> list[SearchHit]:
+        started = time.perf_counter()
+        vector = await self._embed_query(query)
+        embedded = time.perf_counter()
+        hits = await self.vector_repo.search(vector, limit=limit, search_filter=search_filter)
+        self.latency.record("embed", embedded - started)
+        self.latency.record("search", time.perf_counter() - embedded)
+        return hits
+
+    async def _lexical_search(
+        self, query: str, limit: int, search_filter: SearchFilter | None
+    ) -> list[tuple[str, float]]:
+        started = time.perf_counter()
+        hits = await self.lexical_index.search(query, limit=limit, search_filter=search_filter)
+        self.latency.record("lexical", time.perf_counter() - started)
+        return hits
+
+    async def _resolve(self, scored: list[tuple[str, float]], known: dict[str, SearchHit]) -> list[SearchHit]:
+        # 단어 검색에만 나온 청크는 벡터 저장소에서 페이로드를 조회 (아직 임베딩되지 않은 청크는 제외됨)
+        missing = [chunk_id for chunk_id, _ in scored if chunk_id not in known]
+        hits_by_id = {**known, **await self.vector_repo.get_chunks(missing)}
+        return [replace(hits_by_id[chunk_id], score=score) for chunk_id, score in scored if chunk_id in hits_by_id]
+
+    async def _embed_query(self, query: str) -> list[float]:
+        vector = self._query_cache.get(query)
+        if vector is not None:
+            self._query_cache.move_to_end(query)
+            self._metrics.query_cache_hits += 1
+            return vector
+        vector = await self.batcher.embed(query)
+        if self.query_cache_size > 0:
+            self._query_cache[query] = vector
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return vector
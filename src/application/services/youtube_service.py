@@ -1,33 +1,161 @@
 # application/services/crawl_service.py (응용 서비스 계층)
+import asyncio
 import datetime
+import math
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from dataclasses import asdict, dataclass
+from typing import Any, Literal, TypeVar
 
-from application.exceptions import APIKeyServiceError, YoutubeAPIRequestError
+from application.exceptions import APIKeyServiceError, APIQuotaExhaustedError, YoutubeAPIRequestError
+from application.services.api_quota import request_with_quota
+from application.services.channel_priority import ChannelPriority, prioritize_channels
+from application.services.crawl_engine import CrawlEngine
 from audit.loggers.log_repository import LogRepository
 from audit.loggers.youtube_logger import YoutubeLogEntry
-from domain.adapter.youtube_api_adapter import YoutubeApiAdapter
-from domain.model.youtube import APIKey, YoutubeChannel, YoutubeVideoRawData
+from domain.adapter.transcript_adapter import TranscriptAdapter, TranscriptUnavailableError
+from domain.adapter.youtube_api_adapter import YoutubeApiAdapter, YoutubeQuotaExceededError
+from domain.model.crawl_job import CrawlProgress
+from domain.model.pagination import Page
+from domain.model.youtube import (
+    APIKey,
+    CrawlCheckpoint,
+    VideoFilter,
+    YoutubeChannel,
+    YoutubeTranscript,
+    YoutubeVideoRawData,
+    YoutubeVideoView,
+)
+from domain.repository.crawl_checkpoint import CrawlCheckpointRepository
 from domain.repository.youtube_repository import (
     APIKeyRepository,
+    BulkSaveResult,
     YoutubeRepository,
 )  # 인터페이스만 임포트
-from shared.utils import is_quota_reseted
+from shared.utils import (
+    YOUTUBE_DEFAULT_BACKFILL_START,
+    YOUTUBE_QUOTA_COSTS,
+    YOUTUBE_QUOTA_THRESHOLDS,
+    YOUTUBE_SEARCH_RESULT_CAP,
+    YOUTUBE_VIDEOS_PER_REQUEST,
+    as_utc,
+    format_youtube_datetime,
+    parse_youtube_datetime,
+    split_time_window,
+)
+
+T = TypeVar("T")
+
+# 채널의 비디오 목록을 가져오는 방식
+# - search: search.list (요청당 100 유닛, 게시 시각 필터 지원)
+# - playlist: 업로드 재생목록의 playlistItems.list (요청당 1 유닛)
+EnumerationMode = Literal["search", "playlist"]
+
+
+async def _iter_pages(first_page: Page[T], fetch: Callable[[str], Awaitable[Page[T]]]) -> AsyncIterator[T]:
+    """첫 페이지부터 next_cursor를 따라가며 항목을 하나씩 반환합니다. (한 번에 한 페이지만 메모리에 유지)"""
+    page = first_page
+    while True:
+        for item in page.items:
+            yield item
+        if page.next_cursor is None:
+            return
+        page = await fetch(page.next_cursor)
 
 
 class ChannelReadService:
-    def __init__(self, channel_repo: YoutubeRepository):
+    def __init__(self, channel_repo: YoutubeRepository, stream_page_size: int = 500):
         self.channel_repo = channel_repo
+        self.stream_page_size = stream_page_size
 
-    async def list_channels(self) -> list[YoutubeChannel]:
-        """저장된 모든 채널 정보를 조회하는 메서드
+    async def list_channels(
+        self, streamer_name: str | None = None, cursor: str | None = None, limit: int = 50
+    ) -> Page[YoutubeChannel]:
+        """저장된 채널 정보를 한 페이지씩 조회하는 메서드
+
+        Args:
+            streamer_name (str | None, optional): 이 스트리머의 채널만. Defaults to None.
+            cursor (str | None, optional): 이전 페이지의 next_cursor. Defaults to None (첫 페이지).
+            limit (int, optional): 페이지 크기. Defaults to 50.
+
+        Raises:
+            ValueError: 커서 형식이 잘못된 경우
 
         Returns:
-            list[YoutubeChannel]: 저장된 채널 정보 리스트
+            Page[YoutubeChannel]: 채널 정보 리스트와 다음 페이지 커서
         """
-        try:
-            channels = await self.channel_repo.get_channels()
-            return channels
-        except Exception as e:
-            raise Exception(f"채널 조회 중 오류 발생: {e}")
+        return await self.channel_repo.list_channels(streamer_name=streamer_name, cursor=cursor, limit=limit)
+
+    async def stream_channels(
+        self, streamer_name: str | None = None, cursor: str | None = None
+    ) -> AsyncIterator[YoutubeChannel]:
+        """조건에 맞는 채널을 커서부터 끝까지 stream_page_size개씩 조회하며 하나씩 반환합니다.
+
+        첫 페이지는 바로 조회하므로 잘못된 커서는 반환하기 전에 ValueError로 알 수 있습니다.
+        """
+
+        def fetch(next_cursor: str | None) -> Awaitable[Page[YoutubeChannel]]:
+            return self.channel_repo.list_channels(streamer_name, next_cursor, self.stream_page_size)
+
+        return _iter_pages(await fetch(cursor), fetch)
+
+
+class VideoReadService:
+    # fields를 지정하지 않았을 때 목록에 포함하는 필드 (원본 raw_data와 details 제외)
+    DEFAULT_FIELDS = (
+        "video_id",
+        "channel_id",
+        "streamer_name",
+        "published_at",
+        "created_at",
+        "enriched_at",
+        "transcript_status",
+    )
+
+    def __init__(self, youtube_repo: YoutubeRepository, stream_page_size: int = 500):
+        self.youtube_repo = youtube_repo
+        self.stream_page_size = stream_page_size
+
+    async def list_videos(
+        self,
+        filter: VideoFilter,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[YoutubeVideoView]:
+        """조건에 맞는 비디오를 최근 게시 순서로 한 페이지씩 조회합니다.
+
+        Args:
+            filter (VideoFilter): 조회 조건
+            fields (list[str] | None, optional): 조회할 필드. Defaults to DEFAULT_FIELDS.
+            cursor (str | None, optional): 이전 페이지의 next_cursor. Defaults to None (첫 페이지).
+            limit (int, optional): 페이지 크기. Defaults to 50.
+
+        Raises:
+            ValueError: 커서 형식이 잘못되었거나 비디오 필드가 아닌 이름이 있는 경우
+
+        Returns:
+            Page[YoutubeVideoView]: 비디오 뷰 목록과 다음 페이지 커서
+        """
+        return await self.youtube_repo.list_videos(filter, fields or self.DEFAULT_FIELDS, cursor, limit)
+
+    async def stream_videos(
+        self, filter: VideoFilter, fields: list[str] | None = None, cursor: str | None = None
+    ) -> AsyncIterator[YoutubeVideoView]:
+        """조건에 맞는 비디오를 커서부터 끝까지 stream_page_size개씩 조회하며 하나씩 반환합니다.
+
+        첫 페이지는 바로 조회하므로 잘못된 커서나 필드는 반환하기 전에 ValueError로 알 수 있습니다.
+        """
+
+        def fetch(next_cursor: str | None) -> Awaitable[Page[YoutubeVideoView]]:
+            return self.youtube_repo.list_videos(
+                filter, fields or self.DEFAULT_FIELDS, next_cursor, self.stream_page_size
+            )
+
+        return _iter_pages(await fetch(cursor), fetch)
 
 
 class ChannelCreateService:
@@ -41,8 +169,20 @@ class ChannelCreateService:
         """
         채널 정보를 크롤링하고 저장하는 메서드
         """
-        api_key = await self.api_key_repo.get_api_key()
-        channel_id = await self.api_client.fetch_channel_id(channel_handle, api_key.api_key)
+        api_key = await self.api_key_repo.reserve_quota(
+            amount=YOUTUBE_QUOTA_COSTS["channels"],
+            max_quota_used=YOUTUBE_QUOTA_THRESHOLDS["channels"],
+            endpoint="channels",
+        )
+        if api_key is None:
+            raise APIQuotaExhaustedError("사용 가능한 쿼터가 남은 API 키가 없습니다")
+        try:
+            channel_id = await self.api_client.fetch_channel_id(channel_handle, api_key.api_key)
+        except YoutubeQuotaExceededError as e:
+            await self.api_key_repo.park_api_key(api_key.api_key)
+            raise APIQuotaExhaustedError(f"API 키의 쿼터가 소진되었습니다: {e}")
+        if self.api_client.served_from_cache():
+            await self.api_key_repo.release_quota(api_key.api_key, YOUTUBE_QUOTA_COSTS["channels"], "channels")
         if not channel_id:
             raise ValueError(f"채널 ID를 가져올 수 없습니다: {channel_handle}")
 
@@ -56,6 +196,83 @@ class ChannelCreateService:
         await self.channel_repo.save_channel(channel=channel)
 
 
+@dataclass
+class ChannelCrawlStats:
+    """채널 하나를 수집하는 동안의 진행 상황"""
+
+    quota_used: int = 0
+    collected_count: int = 0
+    latest_published_at: datetime.datetime | None = None
+    # 여러 채널을 묶은 작업 단위 진행 상황 (백그라운드 작업으로 실행할 때만 사용)
+    progress: CrawlProgress | None = None
+
+    def add_quota(self, cost: int) -> None:
+        self.quota_used += cost
+        if self.progress is not None:
+            self.progress.quota_used += cost
+
+    def add_collected(self, count: int) -> None:
+        self.collected_count += count
+        if self.progress is not None:
+            self.progress.videos_collected += count
+
+
+@dataclass
+class EnrichmentReport:
+    """비디오 상세 정보 보강 결과"""
+
+    enriched_count: int = 0
+    missing_count: int = 0  # 삭제/비공개 등으로 videos.list에서 조회되지 않은 비디오 수
+    failed_count: int = 0
+    request_count: int = 0
+    quota_used: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def videos_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.enriched_count + self.missing_count) / self.elapsed_seconds
+
+    @property
+    def quota_per_video(self) -> float:
+        processed = self.enriched_count + self.missing_count
+        if processed == 0:
+            return 0.0
+        return self.quota_used / processed
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "videos_per_second": round(self.videos_per_second, 2),
+            "quota_per_video": round(self.quota_per_video, 4),
+        }
+
+
+@dataclass
+class TranscriptCrawlReport:
+    """자막 수집 결과"""
+
+    saved_count: int = 0
+    unavailable_count: int = 0  # 자막이 없거나 비활성화된 비디오 수
+    failed_count: int = 0  # 재시도 후에도 실패한 비디오 수 (다음 실행에서 다시 시도)
+    retry_count: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def videos_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return (self.saved_count + self.unavailable_count + self.failed_count) / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "videos_per_second": round(self.videos_per_second, 2)}
+
+
+# 자막 수집 워커가 작성자에게 넘기는 결과: (비디오 ID, 자막, 실패 상태, 오류 메시지)
+_TranscriptResult = tuple[str, YoutubeTranscript | None, str | None, str | None]
+
+
 class RawDataCrawlService:
     def __init__(
         self,
@@ -63,189 +280,748 @@ class RawDataCrawlService:
         api_key_repo: APIKeyRepository,
         api_client: YoutubeApiAdapter,
         log_repo: LogRepository,
+        crawl_engine: CrawlEngine | None = None,
+        backfill_start: datetime.datetime | None = None,
+        min_window: datetime.timedelta = datetime.timedelta(hours=1),
+        watermark_lookback: datetime.timedelta = datetime.timedelta(hours=1),
+        enumeration_mode: EnumerationMode = "search",
+        transcript_client: TranscriptAdapter | None = None,
+        transcript_languages: list[str] | None = None,
+        checkpoint_repo: CrawlCheckpointRepository | None = None,
+        upload_rate_lookback: datetime.timedelta = datetime.timedelta(days=90),
+        min_expected_videos: float = 0.5,
     ):
         self.youtube_repo = youtube_repo
         self.api_key_repo = api_key_repo
         self.api_client = api_client
         self.log_repo = log_repo
+        self.crawl_engine = crawl_engine or CrawlEngine()
+        # 워터마크가 없는 채널을 처음 수집할 때의 시작 시각
+        self.backfill_start = backfill_start or parse_youtube_datetime(YOUTUBE_DEFAULT_BACKFILL_START)
+        # 결과 수 제한 때문에 구간을 나눌 때 더 이상 나누지 않는 최소 구간 길이
+        self.min_window = min_window
+        # 검색 색인이 늦게 반영되는 비디오를 놓치지 않도록 워터마크보다 조금 앞에서부터 다시 검색
+        self.watermark_lookback = watermark_lookback
+        # 실행마다 mode를 지정하지 않았을 때 사용할 비디오 목록 조회 방식
+        self.enumeration_mode = enumeration_mode
+        self.transcript_client = transcript_client
+        # 우선순위 순서의 자막 언어 코드
+        self.transcript_languages = transcript_languages or ["ko", "en"]
+        # 채널 초기화 수집의 진행 지점 저장소 (None이면 실패 시 처음부터 다시 수집)
+        self.checkpoint_repo = checkpoint_repo
+        # 채널별 업로드 빈도를 추정할 때 참고하는 기간
+        self.upload_rate_lookback = upload_rate_lookback
+        # 우선순위로 채널을 고를 때, 예상 신규 비디오가 이보다 적은 채널은 이번 실행에서 건너뜀
+        self.min_expected_videos = min_expected_videos
 
-    async def initialize_you_tube_video_data(self) -> None:
+    async def initialize_you_tube_video_data(
+        self,
+        published_after: datetime.datetime | None = None,
+        published_before: datetime.datetime | None = None,
+        mode: EnumerationMode | None = None,
+        progress: CrawlProgress | None = None,
+    ) -> None:
         """유튜브 채널의 원시 비디오 데이터를 초기화합니다.
 
+        채널들은 crawl_engine의 동시성 제한 안에서 병렬로 수집됩니다.
+        저장은 video_id 기준 업서트이므로 한 채널에서 오류가 발생해도 이미 저장한 페이지는 유지되고,
+        채널은 초기화되지 않은 상태로 남아 다음 실행에서 체크포인트(남은 구간, 다음 페이지 토큰)부터 이어서 수집됩니다.
+
+        Args:
+            published_after (datetime.datetime | None, optional): 수집 시작 시각. Defaults to backfill_start.
+            published_before (datetime.datetime | None, optional): 수집 종료 시각. Defaults to 현재 시각.
+            mode (EnumerationMode | None, optional): 비디오 목록 조회 방식. Defaults to enumeration_mode.
+            progress (CrawlProgress | None, optional): 채널/비디오/쿼터 진행 상황을 기록할 객체. Defaults to None.
+
         Raises:
             ValueError: 응답이 없는 경우
             YoutubeAPIRequestError: 유튜브 API 요청 중 오류가 발생한 경우
         """
         youtube_channels = await self.youtube_repo.get_uninitialized_channels()
+        if progress is not None:
+            progress.channels_total = len(youtube_channels)
+        await self.crawl_engine.run(
+            youtube_channels,
+            lambda youtube_channel: self._initialize_channel(
+                youtube_channel,
+                published_after=published_after or self.backfill_start,
+                published_before=published_before or datetime.datetime.now(datetime.timezone.utc),
+                mode=mode or self.enumeration_mode,
+                progress=progress,
+            ),
+        )
 
-        for youtube_channel in youtube_channels:
-            try:
-                api_key = await self.api_key_repo.get_api_key()
-                previously_used = api_key.quota_used
+    async def _initialize_channel(
+        self,
+        youtube_channel: YoutubeChannel,
+        published_after: datetime.datetime,
+        published_before: datetime.datetime,
+        mode: EnumerationMode,
+        progress: CrawlProgress | None = None,
+    ) -> None:
+        """채널 하나의 원시 비디오 데이터를 초기화합니다.
 
-                if not api_key.is_search_quota_available():
-                    await self.log_repo.save_channel_log(
-                        YoutubeLogEntry(
-                            domain_id=youtube_channel.channel_id,
-                            level="INFO",
-                            message="API 키 쿼터 초과",
-                            details={"quota_used": api_key.quota_used, "channel": youtube_channel.to_dict()},
-                        )
-                    )
-                    break
-                for published_after, published_before in [
-                    ("2023-01-01T00:00:00Z", "2024-01-01T00:00:00Z"),
-                    ("2024-01-01T00:01:00Z", "2025-01-01T00:00:00Z"),
-                    ("2025-01-01T00:01:00Z", "2026-01-01T00:00:00Z"),
-                ]:
-                    page_token = None
-                    count = 0
-                    while True:
-                        response = await self._fetch_channel_videos(
-                            channel_id=youtube_channel.channel_id,
-                            api_key=api_key,
-                            page_token=page_token,
-                            published_after=published_after,
-                            published_before=published_before,
-                        )
-                        items = response.get("items", [])
-                        if not items:
-                            break
-                        youtube_raw_data_list = [
-                            YoutubeVideoRawData(
-                                video_id=item.get("id", {}).get("videoId", ""),
-                                channel_id=youtube_channel.channel_id,
-                                streamer_name=youtube_channel.streamer_name,
-                                raw_data=item,
-                                created_at=datetime.datetime.now(datetime.timezone.utc),
-                            )
-                            for item in items
-                            if item.get("id", {}).get("kind") == "youtube#video"  # 동영상 항목만 처리
-                        ]
-                        count += len(youtube_raw_data_list)
-                        await self.log_repo.save_video_raw_data_log(
-                            YoutubeLogEntry(
-                                domain_id=youtube_channel.channel_id,
-                                level="INFO",
-                                message="비디오 원시 데이터 수집 성공",
-                                details={"collected_count": len(youtube_raw_data_list)},
-                            )
-                        )
-                        # 2. 로직 수행 및 저장 요청 (인터페이스 메서드 사용)
-                        await self.youtube_repo.bulk_save_raw_data(raw_data_list=youtube_raw_data_list)
-                        page_token = response.get("nextPageToken")
-                        if not page_token:
-                            # print("더 이상 크롤링할 페이지가 없습니다.")
-                            break
-            # 수집중 에러 발생시에 수집하던 채널 데이터 모두 삭제
-            except Exception as e:
-                await self.log_repo.save_channel_log(
-                    YoutubeLogEntry(
-                        domain_id=youtube_channel.channel_id,
-                        level="ERROR",
-                        message="채널 크롤링 중 오류 발생",
-                        details={"quota_used": api_key.quota_used - previously_used, "error": str(e)},
-                    )
-                )
+        같은 조회 방식으로 저장된 체크포인트가 있으면 수집 구간 인자 대신 체크포인트의 남은 구간과
+        페이지 토큰부터 이어서 수집하고, 페이지를 저장할 때마다 체크포인트를 갱신합니다.
 
-                await self.youtube_repo.clear_raw_data_for_channel(channel=youtube_channel)
-            # 정상 완료시 채널 초기화 상태 업데이트
+        Args:
+            youtube_channel (YoutubeChannel): 수집할 채널
+            published_after (datetime.datetime): 수집 시작 시각
+            published_before (datetime.datetime): 수집 종료 시각
+            mode (EnumerationMode): 비디오 목록 조회 방식
+            progress (CrawlProgress | None, optional): 작업 단위 진행 상황. Defaults to None.
+        """
+        stats = ChannelCrawlStats(progress=progress)
+        try:
+            checkpoint = await self._load_checkpoint(youtube_channel, mode)
+            if checkpoint is None:
+                checkpoint = CrawlCheckpoint.start(youtube_channel.channel_id, mode, published_after, published_before)
             else:
+                stats = ChannelCrawlStats(
+                    quota_used=checkpoint.quota_spent,
+                    collected_count=checkpoint.collected_count,
+                    latest_published_at=checkpoint.latest_published_at,
+                    progress=progress,
+                )
                 await self.log_repo.save_channel_log(
                     YoutubeLogEntry(
                         domain_id=youtube_channel.channel_id,
                         level="INFO",
-                        message="채널 크롤링 성공",
-                        details={"quota_used": api_key.quota_used - previously_used},
+                        message="체크포인트에서 채널 크롤링 재개",
+                        details={"pages_done": checkpoint.pages_done, "quota_spent": checkpoint.quota_spent},
                     )
                 )
-
-                youtube_channel.update_initialized()
-                await self.youtube_repo.update_channel(channel=youtube_channel)
-            # 어떤 경우에도 사용한 쿼터는 업데이트
-            finally:
-                await self.api_key_repo.update_api_key(api_key=api_key)
-
-    async def fetch_videos_from_initialized_channels(self) -> None:
-        """초기화된 유튜브 채널을 가져오는 메서드"""
-        youtube_channels = await self.youtube_repo.get_initialized_channels()
-        for youtube_channel in youtube_channels:
-            api_key = await self.api_key_repo.get_api_key()
-            if not api_key.is_search_quota_available():
-                await self.log_repo.save_channel_log(
+            async for page in self._iter_video_pages(youtube_channel, checkpoint, stats):
+                youtube_raw_data_list = await self._collect_new_videos(page, stats)
+                # 2. 로직 수행 및 저장 요청 (인터페이스 메서드 사용)
+                save_result = BulkSaveResult()
+                if youtube_raw_data_list:
+                    save_result = await self.youtube_repo.bulk_save_raw_data(raw_data_list=youtube_raw_data_list)
+                await self.log_repo.save_video_raw_data_log(
                     YoutubeLogEntry(
                         domain_id=youtube_channel.channel_id,
                         level="INFO",
-                        message="초기화 이후 비디오 수집 도중 API 키 쿼터 초과",
-                        details={"quota_used": api_key.quota_used, "channel": youtube_channel.to_dict()},
+                        message="비디오 원시 데이터 수집 성공",
+                        details={
+                            "collected_count": len(youtube_raw_data_list),
+                            "inserted_count": save_result.inserted_count,
+                            "updated_count": save_result.updated_count,
+                        },
                     )
                 )
-                break
-
-            page_token = None
-            count = 0
-            videos_for_save = []
-            while True:
-                response = await self._fetch_channel_videos(
-                    channel_id=youtube_channel.channel_id,
-                    api_key=api_key,
-                    page_token=page_token,
+                await self._save_checkpoint(checkpoint, stats)
+        # 모든 키의 쿼터가 소진된 경우 남은 채널은 시작하지 않음
+        except APIQuotaExhaustedError as e:
+            await self.log_repo.save_channel_log(
+                YoutubeLogEntry(
+                    domain_id=youtube_channel.channel_id,
+                    level="INFO",
+                    message="API 키 쿼터 초과",
+                    details={"quota_used": stats.quota_used, "error": str(e), "channel": youtube_channel.to_dict()},
                 )
-                if not response:
-                    raise ValueError("응답 데이터를 가져올 수 없습니다")
-                items = response.get("items", [])
-                video_items = [item for item in items if item.get("id", {}).get("kind") == "youtube#video"]
+            )
+            self.crawl_engine.stop()
+        # 수집중 에러가 발생해도 저장된 데이터는 유지 (업서트이므로 다음 실행에서 다시 저장해도 안전)
+        except Exception as e:
+            await self.log_repo.save_channel_log(
+                YoutubeLogEntry(
+                    domain_id=youtube_channel.channel_id,
+                    level="ERROR",
+                    message="채널 크롤링 중 오류 발생",
+                    details={"quota_used": stats.quota_used, "error": str(e)},
+                )
+            )
+        # 정상 완료시 채널 초기화 상태와 워터마크 업데이트
+        else:
+            await self.log_repo.save_channel_log(
+                YoutubeLogEntry(
+                    domain_id=youtube_channel.channel_id,
+                    level="INFO",
+                    message="채널 크롤링 성공",
+                    details={"quota_used": stats.quota_used, "collected_count": stats.collected_count},
+                )
+            )
 
-                crawl_finished = False
-                for item in video_items:
-                    video_id = item.get("id", {}).get("videoId", "")
-                    existing_video = await self.youtube_repo.get_video_by_id(video_id=video_id)
-                    if existing_video:
-                        crawl_finished = True
-                        break  # 이미 저장된 비디오인 경우 데이터 수집 완료
-                    youtube_raw_data = YoutubeVideoRawData(
-                        video_id=item.get("id", {}).get("videoId", ""),
-                        channel_id=youtube_channel.channel_id,
-                        streamer_name=youtube_channel.streamer_name,
-                        raw_data=item,
-                        created_at=datetime.datetime.now(datetime.timezone.utc),
-                    )
+            youtube_channel.update_initialized()
+            youtube_channel.update_watermark(stats.latest_published_at)
+            youtube_channel.last_crawled_at = datetime.datetime.now(datetime.timezone.utc)
+            await self.youtube_repo.update_channel(channel=youtube_channel)
+            if self.checkpoint_repo is not None:
+                await self.checkpoint_repo.delete_checkpoint(youtube_channel.channel_id)
+        finally:
+            if progress is not None:
+                progress.channels_done += 1
+
+    async def fetch_videos_from_initialized_channels(
+        self,
+        mode: EnumerationMode | None = None,
+        progress: CrawlProgress | None = None,
+        channel_ids: list[str] | None = None,
+        quota_budget: int | None = None,
+    ) -> None:
+        """초기화된 유튜브 채널들의 새 비디오를 병렬로 수집하는 메서드
+
+        Args:
+            mode (EnumerationMode | None, optional): 비디오 목록 조회 방식. Defaults to enumeration_mode.
+            progress (CrawlProgress | None, optional): 채널/비디오/쿼터 진행 상황을 기록할 객체. Defaults to None.
+            channel_ids (list[str] | None, optional): 수집할 채널 ID (주어진 순서대로 수집). Defaults to 모든 채널.
+            quota_budget (int | None, optional): 쿼터 예산. 지정하면 channel_ids 대신 업로드 빈도로 계산한
+                예상 신규 비디오 수가 쿼터 대비 높은 채널부터 예산 안에서 골라 수집합니다. Defaults to None.
+        """
+        mode = mode or self.enumeration_mode
+        youtube_channels = await self.youtube_repo.get_initialized_channels()
+        if channel_ids is None and quota_budget is not None:
+            priorities = await self.prioritize_channels(youtube_channels, quota_budget=quota_budget, mode=mode)
+            channel_ids = [priority.channel_id for priority in priorities]
+        if channel_ids is not None:
+            channels_by_id = {youtube_channel.channel_id: youtube_channel for youtube_channel in youtube_channels}
+            youtube_channels = [
+                channels_by_id[channel_id] for channel_id in channel_ids if channel_id in channels_by_id
+            ]
+        if progress is not None:
+            progress.channels_total = len(youtube_channels)
+        await self.crawl_engine.run(
+            youtube_channels,
+            lambda youtube_channel: self._fetch_new_videos_for_channel(youtube_channel, mode, progress),
+        )
+
+    async def prioritize_channels(
+        self,
+        youtube_channels: list[YoutubeChannel] | None = None,
+        quota_budget: int | None = None,
+        mode: EnumerationMode | None = None,
+        now: datetime.datetime | None = None,
+    ) -> list[ChannelPriority]:
+        """저장된 비디오의 게시 시각으로 채널별 업로드 빈도를 추정해 증분 수집 우선순위를 계산합니다.
+
+        Args:
+            youtube_channels (list[YoutubeChannel] | None, optional): 후보 채널. Defaults to 초기화된 모든 채널.
+            quota_budget (int | None, optional): 쿼터 예산. Defaults to None (모든 채널).
+            mode (EnumerationMode | None, optional): 요청당 비용을 정할 조회 방식. Defaults to enumeration_mode.
+            now (datetime.datetime | None, optional): 기준 시각. Defaults to 현재 시각.
+
+        Returns:
+            list[ChannelPriority]: 쿼터 대비 예상 신규 비디오 수가 높은 순서의 채널 목록
+        """
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        if youtube_channels is None:
+            youtube_channels = await self.youtube_repo.get_initialized_channels()
+        upload_stats = await self.youtube_repo.get_channel_upload_stats(since=now - self.upload_rate_lookback)
+        request_endpoint = "playlistItems" if (mode or self.enumeration_mode) == "playlist" else "search"
+        return prioritize_channels(
+            youtube_channels,
+            upload_stats,
+            now=now,
+            lookback=self.upload_rate_lookback,
+            request_cost=YOUTUBE_QUOTA_COSTS[request_endpoint],
+            quota_budget=quota_budget,
+            min_expected_videos=self.min_expected_videos if quota_budget is not None else 0.0,
+        )
+
+    async def _fetch_new_videos_for_channel(
+        self, youtube_channel: YoutubeChannel, mode: EnumerationMode, progress: CrawlProgress | None = None
+    ) -> None:
+        """채널 하나에서 워터마크 이후에 게시된 새 비디오를 수집합니다.
+
+        워터마크는 채널 수집이 끝까지 성공한 경우에만 앞으로 이동하므로,
+        중간에 실패하면 다음 실행에서 같은 구간을 다시 수집하고 저장된 비디오는 건너뜁니다.
+
+        Args:
+            youtube_channel (YoutubeChannel): 수집할 채널
+            mode (EnumerationMode): 비디오 목록 조회 방식
+            progress (CrawlProgress | None, optional): 작업 단위 진행 상황. Defaults to None.
+        """
+        stats = ChannelCrawlStats(progress=progress)
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            watermark = youtube_channel.last_published_at
+            if watermark is None:
+                watermark = await self.youtube_repo.get_latest_published_at(youtube_channel.channel_id)
+            checkpoint = CrawlCheckpoint.start(
+                youtube_channel.channel_id,
+                mode,
+                published_after=watermark - self.watermark_lookback if watermark else self.backfill_start,
+                published_before=datetime.datetime.now(datetime.timezone.utc),
+            )
+            async for page in self._iter_video_pages(youtube_channel, checkpoint, stats):
+                videos_for_save = await self._collect_new_videos(page, stats)
+                for youtube_raw_data in videos_for_save:
                     await self.log_repo.save_video_raw_data_log(
                         YoutubeLogEntry(
-                            domain_id=video_id,
+                            domain_id=youtube_raw_data.video_id,
                             level="INFO",
                             message="초기화 이후 비디오 원시 데이터 수집 성공",
-                            details={"video_id": video_id, "channel": youtube_channel.to_dict()},
+                            details={"video_id": youtube_raw_data.video_id, "channel": youtube_channel.to_dict()},
                         )
                     )
-                    count += 1
-                    videos_for_save.append(youtube_raw_data)
-                if crawl_finished:
-                    break
-                page_token = response.get("nextPageToken")
-                if not page_token:
-                    break
-            if videos_for_save:
-                await self.youtube_repo.bulk_save_raw_data(raw_data_list=videos_for_save)
-            await self.api_key_repo.update_api_key(api_key=api_key)
+                if videos_for_save:
+                    await self.youtube_repo.bulk_save_raw_data(raw_data_list=videos_for_save)
+            youtube_channel.update_watermark(stats.latest_published_at or watermark)
+            youtube_channel.last_crawled_at = started_at
+            await self.youtube_repo.update_channel(channel=youtube_channel)
+        except APIQuotaExhaustedError as e:
+            await self.log_repo.save_channel_log(
+                YoutubeLogEntry(
+                    domain_id=youtube_channel.channel_id,
+                    level="INFO",
+                    message="초기화 이후 비디오 수집 도중 API 키 쿼터 초과",
+                    details={"quota_used": stats.quota_used, "error": str(e), "channel": youtube_channel.to_dict()},
+                )
+            )
+            self.crawl_engine.stop()
+        # 병렬 실행 중 한 채널의 오류가 다른 채널의 수집을 취소하지 않도록 채널 단위로 처리
+        except Exception as e:
+            await self.log_repo.save_channel_log(
+                YoutubeLogEntry(
+                    domain_id=youtube_channel.channel_id,
+                    level="ERROR",
+                    message="초기화 이후 비디오 수집 중 오류 발생",
+                    details={"quota_used": stats.quota_used, "error": str(e)},
+                )
+            )
+        else:
             await self.log_repo.save_channel_log(
                 YoutubeLogEntry(
                     domain_id=youtube_channel.channel_id,
                     level="INFO",
                     message="초기화 이후 비디오 수집 완료",
-                    details={"collected_count": count, "quota_used": api_key.quota_used},
+                    details={"collected_count": stats.collected_count, "quota_used": stats.quota_used},
                 )
             )
+        finally:
+            if progress is not None:
+                progress.channels_done += 1
+
+    def _iter_video_pages(
+        self, youtube_channel: YoutubeChannel, checkpoint: CrawlCheckpoint, stats: ChannelCrawlStats
+    ) -> AsyncIterator[list[YoutubeVideoRawData]]:
+        """체크포인트의 조회 방식에 맞춰 남은 구간의 비디오를 페이지 단위로 반환하는 비동기 이터레이터를 만듭니다.
+
+        이터레이터는 페이지를 반환하기 전에 체크포인트를 "이 페이지까지 처리한" 상태로 갱신하므로,
+        호출하는 쪽은 페이지를 저장한 뒤 체크포인트를 저장하면 됩니다.
+        """
+        if checkpoint.mode == "playlist":
+            return self._iter_playlist_pages(youtube_channel, checkpoint, stats)
+        return self._iter_window_pages(youtube_channel, checkpoint, stats)
+
+    async def _iter_window_pages(
+        self, youtube_channel: YoutubeChannel, checkpoint: CrawlCheckpoint, stats: ChannelCrawlStats
+    ) -> AsyncIterator[list[YoutubeVideoRawData]]:
+        """체크포인트에 남은 publishedAfter/publishedBefore 구간의 검색 결과를 페이지 단위로 반환합니다.
+
+        search API는 한 검색 조건으로 약 500개까지만 결과를 돌려주므로,
+        첫 페이지의 totalResults가 이를 넘으면 구간을 나눠 하위 구간을 각각 수집합니다.
+
+        Args:
+            youtube_channel (YoutubeChannel): 수집할 채널
+            checkpoint (CrawlCheckpoint): 남은 구간 스택과 다음 페이지 토큰 (진행에 따라 갱신됨)
+            stats (ChannelCrawlStats): 사용한 쿼터를 기록할 진행 상황
 
-    async def crawl_transcripts(self) -> None:
-        """유튜브 채널의 비디오 자막 데이터를 크롤링하는 메서드"""
+        Yields:
+            list[YoutubeVideoRawData]: 한 페이지의 동영상 원시 데이터
+        """
+        # 최신 구간부터 처리하도록 오래된 순서로 쌓아두고 뒤에서부터 꺼냄
+        windows = checkpoint.windows
+        while windows:
+            window_after, window_before = windows[-1]
+            first_page = checkpoint.page_token is None
+            while True:
+                response = await self._fetch_channel_videos(
+                    channel_id=youtube_channel.channel_id,
+                    stats=stats,
+                    page_token=checkpoint.page_token,
+                    published_after=format_youtube_datetime(window_after),
+                    published_before=format_youtube_datetime(window_before),
+                )
+                if first_page:
+                    first_page = False
+                    total_results = response.get("pageInfo", {}).get("totalResults", 0)
+                    if total_results > YOUTUBE_SEARCH_RESULT_CAP and window_before - window_after > self.min_window:
+                        # 하위 구간마다 결과 수 제한의 80% 정도가 되도록 나누고, 이 페이지는 하위 구간에서 다시 수집
+                        parts = math.ceil(total_results / (YOUTUBE_SEARCH_RESULT_CAP * 0.8))
+                        windows.pop()
+                        windows.extend(split_time_window(window_after, window_before, parts))
+                        break
+                items = response.get("items", [])
+                checkpoint.page_token = response.get("nextPageToken") if items else None
+                if checkpoint.page_token is None:
+                    windows.pop()
+                video_items = [item for item in items if item.get("id", {}).get("kind") == "youtube#video"]
+                if video_items:
+                    yield [YoutubeVideoRawData.from_search_item(item, youtube_channel) for item in video_items]
+                if checkpoint.page_token is None:
+                    break
 
-        pass
+    async def _iter_playlist_pages(
+        self, youtube_channel: YoutubeChannel, checkpoint: CrawlCheckpoint, stats: ChannelCrawlStats
+    ) -> AsyncIterator[list[YoutubeVideoRawData]]:
+        """업로드 재생목록을 최신순으로 넘기며 체크포인트 구간 안의 비디오를 페이지 단위로 반환합니다.
+
+        playlistItems는 게시 시각 필터가 없으므로, 한 페이지의 비디오가 모두 구간 시작보다
+        오래되었으면 더 이상 넘기지 않습니다. 요청당 1 유닛으로 search의 1/100 비용입니다.
+
+        Args:
+            youtube_channel (YoutubeChannel): 수집할 채널
+            checkpoint (CrawlCheckpoint): 수집 구간과 다음 페이지 토큰 (진행에 따라 갱신됨)
+            stats (ChannelCrawlStats): 사용한 쿼터를 기록할 진행 상황
+
+        Yields:
+            list[YoutubeVideoRawData]: 한 페이지의 동영상 원시 데이터
+        """
+        if not checkpoint.windows:
+            return
+        published_after, published_before = checkpoint.windows[-1]
+        if not youtube_channel.uploads_playlist_id:
+            youtube_channel.uploads_playlist_id = await self._request(
+                "channels",
+                lambda api_key: self.api_client.fetch_uploads_playlist_id(youtube_channel.channel_id, api_key),
+                stats,
+            )
+            await self.youtube_repo.update_channel(channel=youtube_channel)
+        playlist_id = youtube_channel.uploads_playlist_id
+
+        while checkpoint.windows:
+            page_token = checkpoint.page_token
+            response = await self._request(
+                "playlistItems",
+                lambda api_key: self.api_client.fetch_playlist_items(playlist_id, api_key, page_token=page_token),
+                stats,
+            )
+            page = [
+                youtube_raw_data
+                for youtube_raw_data in (
+                    YoutubeVideoRawData.from_playlist_item(item, youtube_channel) for item in response.get("items", [])
+                )
+                if youtube_raw_data.video_id
+            ]
+            # 비공개/삭제된 비디오는 게시 시각(videoPublishedAt)이 없으므로 수집하지 않음
+            published_times = [as_utc(raw_data.published_at) for raw_data in page if raw_data.published_at]
+            in_window = [
+                raw_data
+                for raw_data in page
+                if raw_data.published_at and published_after <= as_utc(raw_data.published_at) <= published_before
+            ]
+            checkpoint.page_token = response.get("nextPageToken")
+            if not checkpoint.page_token or (published_times and max(published_times) < published_after):
+                checkpoint.page_token = None
+                checkpoint.windows.clear()
+            if in_window:
+                yield in_window
+
+    async def _collect_new_videos(
+        self, youtube_raw_data_list: list[YoutubeVideoRawData], stats: ChannelCrawlStats
+    ) -> list[YoutubeVideoRawData]:
+        """한 페이지의 원시 데이터 중 아직 저장되지 않은 비디오만 골라냅니다.
+
+        구간 경계의 비디오는 인접한 두 구간에 모두 포함될 수 있으므로 한 번의 일괄 조회로 걸러냅니다.
+
+        Args:
+            youtube_raw_data_list (list[YoutubeVideoRawData]): 한 페이지의 원시 데이터
+            stats (ChannelCrawlStats): 수집 수와 최신 게시 시각을 기록할 진행 상황
+
+        Returns:
+            list[YoutubeVideoRawData]: 저장할 새 원시 데이터 목록
+        """
+        published_times = [raw_data.published_at for raw_data in youtube_raw_data_list if raw_data.published_at]
+        if stats.latest_published_at is not None:
+            published_times.append(stats.latest_published_at)
+        stats.latest_published_at = max(published_times, default=None)
+
+        existing_video_ids = await self.youtube_repo.get_existing_video_ids(
+            [youtube_raw_data.video_id for youtube_raw_data in youtube_raw_data_list]
+        )
+        new_raw_data_list = []
+        seen_video_ids = set(existing_video_ids)
+        for youtube_raw_data in youtube_raw_data_list:
+            if youtube_raw_data.video_id in seen_video_ids:
+                continue
+            seen_video_ids.add(youtube_raw_data.video_id)
+            new_raw_data_list.append(youtube_raw_data)
+        stats.add_collected(len(new_raw_data_list))
+        return new_raw_data_list
+
+    async def enrich_video_details(
+        self, batch_size: int = 500, max_videos: int | None = None, progress: CrawlProgress | None = None
+    ) -> EnrichmentReport:
+        """상세 정보가 없는 원시 데이터를 videos.list로 보강하는 메서드
+
+        보강되지 않은 비디오를 batch_size개씩 가져와 50개 단위로 나눠 병렬 요청하고,
+        결과를 한 번의 bulk_write로 저장합니다. 저장된 문서에는 enriched_at이 기록되므로
+        중간에 멈춰도 다음 실행에서 남은 비디오부터 이어서 보강합니다.
+
+        Args:
+            batch_size (int, optional): 한 번에 DB에서 가져올 비디오 수. Defaults to 500.
+            max_videos (int | None, optional): 이번 실행에서 보강할 최대 비디오 수. Defaults to None.
+            progress (CrawlProgress | None, optional): 처리한 비디오 수와 쿼터를 기록할 객체. Defaults to None.
+
+        Returns:
+            EnrichmentReport: 보강 결과 (videos/sec, 비디오당 쿼터 포함)
+        """
+        report = EnrichmentReport()
+        stats = ChannelCrawlStats(progress=progress)
+        started = time.perf_counter()
+        while max_videos is None or report.enriched_count + report.missing_count < max_videos:
+            limit = batch_size
+            if max_videos is not None:
+                limit = min(batch_size, max_videos - report.enriched_count - report.missing_count)
+            video_ids = await self.youtube_repo.get_unenriched_video_ids(limit=limit)
+            if not video_ids:
+                break
+
+            details: dict[str, dict | None] = {}
+            failed_chunks: list[Exception] = []
+            chunks = [
+                video_ids[index : index + YOUTUBE_VIDEOS_PER_REQUEST]
+                for index in range(0, len(video_ids), YOUTUBE_VIDEOS_PER_REQUEST)
+            ]
+
+            async def _enrich_chunk(chunk: list[str]) -> None:
+                try:
+                    response = await self._request(
+                        "videos", lambda api_key: self.api_client.fetch_videos(chunk, api_key), stats
+                    )
+                except APIQuotaExhaustedError as e:
+                    failed_chunks.append(e)
+                    self.crawl_engine.stop()
+                    return
+                except Exception as e:
+                    failed_chunks.append(e)
+                    return
+                report.request_count += 1
+                items = {item.get("id"): item for item in response.get("items", [])}
+                for video_id in chunk:
+                    details[video_id] = items.get(video_id)
+
+            await self.crawl_engine.run(chunks, _enrich_chunk)
+            await self.youtube_repo.bulk_update_video_details(details)
+            report.enriched_count += sum(1 for item in details.values() if item is not None)
+            report.missing_count += sum(1 for item in details.values() if item is None)
+            report.failed_count += len(video_ids) - len(details)
+            stats.add_collected(len(details))
+            # 실패한 비디오는 보강되지 않은 채로 남으므로, 같은 비디오를 반복 요청하지 않도록 이번 실행은 종료
+            if failed_chunks:
+                await self.log_repo.save_video_raw_data_log(
+                    YoutubeLogEntry(
+                        domain_id="video_details",
+                        level="ERROR",
+                        message="비디오 상세 정보 보강 중 오류 발생",
+                        details={"failed_count": report.failed_count, "error": str(failed_chunks[0])},
+                    )
+                )
+                break
+
+        report.quota_used = stats.quota_used
+        report.elapsed_seconds = time.perf_counter() - started
+        await self.log_repo.save_video_raw_data_log(
+            YoutubeLogEntry(
+                domain_id="video_details",
+                level="INFO",
+                message="비디오 상세 정보 보강 완료",
+                details=report.to_dict(),
+            )
+        )
+        return report
+
+    async def crawl_transcripts(
+        self,
+        concurrency: int = 4,
+        batch_size: int = 100,
+        max_attempts: int = 3,
+        retries: int = 2,
+        backoff_seconds: float = 1.0,
+        max_videos: int | None = None,
+        progress: CrawlProgress | None = None,
+    ) -> TranscriptCrawlReport:
+        """유튜브 채널의 비디오 자막 데이터를 크롤링하는 메서드
+
+        생산자 → 워커 → 작성자로 이어지는 스트리밍 파이프라인으로 동작합니다.
+        - 생산자: 자막이 없는 비디오 ID를 DB 커서에서 하나씩 읽어 크기가 제한된 큐에 넣습니다.
+        - 워커: 자막 라이브러리가 동기 방식이므로 concurrency 크기의 스레드 풀에서 자막을 가져오고,
+          일시적인 오류는 지수 백오프(지터 포함)로 retries번까지 재시도합니다.
+        - 작성자: 결과를 batch_size개씩 모아 transcripts 컬렉션에 일괄 저장하고, 실패한 비디오의 상태와
+          시도 횟수를 기록합니다. max_attempts번 이상 실패한 비디오는 다음 실행부터 제외됩니다.
+
+        Args:
+            concurrency (int, optional): 동시에 자막을 가져올 워커 수. Defaults to 4.
+            batch_size (int, optional): 한 번에 저장할 결과 수. Defaults to 100.
+            max_attempts (int, optional): 비디오 하나당 최대 실행 횟수. Defaults to 3.
+            retries (int, optional): 한 번의 실행 안에서 일시적인 오류를 재시도할 횟수. Defaults to 2.
+            backoff_seconds (float, optional): 첫 재시도 전 대기 시간(초). Defaults to 1.0.
+            max_videos (int | None, optional): 이번 실행에서 처리할 최대 비디오 수. Defaults to None.
+            progress (CrawlProgress | None, optional): 처리한 비디오 수를 기록할 객체. Defaults to None.
+
+        Raises:
+            ValueError: 자막 수집기가 설정되지 않은 경우
+
+        Returns:
+            TranscriptCrawlReport: 수집 결과
+        """
+        if self.transcript_client is None:
+            raise ValueError("자막 수집기가 설정되지 않았습니다")
+        transcript_client = self.transcript_client
+
+        report = TranscriptCrawlReport()
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        # 기본 실행기는 다른 작업과 공유되므로 워커 수만큼의 전용 스레드 풀을 사용
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="transcript")
+        # 큐 크기를 제한해 DB 커서를 워커보다 너무 앞서 읽지 않도록 함 (None은 종료 신호)
+        video_queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=concurrency * 2)
+        result_queue: asyncio.Queue[_TranscriptResult | None] = asyncio.Queue(maxsize=batch_size)
+
+        async def _produce() -> None:
+            # 커서를 읽는 동안 상태가 바뀐 문서가 다시 나올 수 있으므로 이번 실행에서 본 ID는 건너뜀
+            seen: set[str] = set()
+            video_ids = self.youtube_repo.iter_video_ids_without_transcript(max_attempts=max_attempts)
+            async with aclosing(video_ids):
+                async for video_id in video_ids:
+                    if video_id in seen:
+                        continue
+                    seen.add(video_id)
+                    await video_queue.put(video_id)
+                    if max_videos is not None and len(seen) >= max_videos:
+                        break
+            for _ in range(concurrency):
+                await video_queue.put(None)
+
+        async def _fetch(video_id: str) -> _TranscriptResult:
+            for attempt in range(retries + 1):
+                try:
+                    transcript = await loop.run_in_executor(
+                        executor, transcript_client.fetch_transcript, video_id, self.transcript_languages
+                    )
+                    return video_id, transcript, None, None
+                except TranscriptUnavailableError as e:
+                    return video_id, None, "unavailable", str(e)
+                except Exception as e:
+                    if attempt == retries:
+                        return video_id, None, "failed", str(e)
+                    report.retry_count += 1
+                    await asyncio.sleep(backoff_seconds * (2**attempt) * random.uniform(0.5, 1.5))
+            raise AssertionError("unreachable")
+
+        async def _work() -> None:
+            while (video_id := await video_queue.get()) is not None:
+                await result_queue.put(await _fetch(video_id))
+            await result_queue.put(None)
+
+        async def _write() -> None:
+            finished_workers = 0
+            transcripts: list[YoutubeTranscript] = []
+            statuses: dict[str, tuple[str, str | None]] = {}
+            while finished_workers < concurrency:
+                result = await result_queue.get()
+                if result is None:
+                    finished_workers += 1
+                else:
+                    video_id, transcript, status, error = result
+                    if transcript is not None:
+                        transcripts.append(transcript)
+                    elif status is not None:
+                        statuses[video_id] = (status, error)
+                if len(transcripts) + len(statuses) >= batch_size or finished_workers == concurrency:
+                    await self.youtube_repo.bulk_save_transcripts(transcripts)
+                    await self.youtube_repo.bulk_update_transcript_status(statuses)
+                    report.saved_count += len(transcripts)
+                    report.unavailable_count += sum(1 for status, _ in statuses.values() if status == "unavailable")
+                    report.failed_count += sum(1 for status, _ in statuses.values() if status == "failed")
+                    if progress is not None:
+                        progress.videos_collected += len(transcripts) + len(statuses)
+                    transcripts, statuses = [], {}
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                task_group.create_task(_produce())
+                for _ in range(concurrency):
+                    task_group.create_task(_work())
+                task_group.create_task(_write())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        await self.log_repo.save_video_raw_data_log(
+            YoutubeLogEntry(
+                domain_id="transcripts",
+                level="INFO",
+                message="자막 수집 완료",
+                details=report.to_dict(),
+            )
+        )
+        return report
+
+    async def _load_checkpoint(self, youtube_channel: YoutubeChannel, mode: EnumerationMode) -> CrawlCheckpoint | None:
+        """이어서 수집할 수 있는 채널의 체크포인트를 조회합니다. 조회 방식이 다르면 처음부터 수집합니다."""
+        if self.checkpoint_repo is None:
+            return None
+        checkpoint = await self.checkpoint_repo.get_checkpoint(youtube_channel.channel_id)
+        if checkpoint is None or checkpoint.mode != mode or not checkpoint.windows:
+            return None
+        return checkpoint
+
+    async def _save_checkpoint(self, checkpoint: CrawlCheckpoint, stats: ChannelCrawlStats) -> None:
+        """페이지 하나를 저장한 뒤의 진행 상황을 체크포인트로 저장합니다."""
+        if self.checkpoint_repo is None:
+            return
+        checkpoint.pages_done += 1
+        checkpoint.quota_spent = stats.quota_used
+        checkpoint.collected_count = stats.collected_count
+        checkpoint.latest_published_at = stats.latest_published_at
+        checkpoint.updated_at = datetime.datetime.now(datetime.timezone.utc)
+        await self.checkpoint_repo.save_checkpoint(checkpoint)
+
+    async def _request(
+        self,
+        endpoint: str,
+        call: Callable[[str], Awaitable[T | None]],
+        stats: ChannelCrawlStats | None = None,
+    ) -> T:
+        """쿼터를 예약한 키로 API를 호출하는 내부 헬퍼 메서드 (request_with_quota 참고)
+
+        Args:
+            endpoint (str): 쿼터 비용을 계산할 엔드포인트
+            call (Callable[[str], Awaitable[T | None]]): API 키를 받아 요청을 보내는 함수
+            stats (ChannelCrawlStats | None, optional): 사용한 쿼터를 기록할 진행 상황. Defaults to None.
+
+        Raises:
+            APIQuotaExhaustedError: 예약 가능한 키가 없는 경우
+            YoutubeAPIRequestError: 유튜브 API 요청 중 오류가 발생한 경우
+
+        Returns:
+            T: API 응답
+        """
+
+        async def _log_parked_key(error: YoutubeQuotaExceededError) -> None:
+            await self.log_repo.save_video_raw_data_log(
+                YoutubeLogEntry(
+                    domain_id=endpoint,
+                    level="WARNING",
+                    message="쿼터가 소진된 API 키를 제외하고 다른 키로 재시도",
+                    details={"error": str(error)},
+                )
+            )
+
+        try:
+            response = await request_with_quota(
+                self.api_key_repo,
+                self.api_client,
+                endpoint,
+                call,
+                on_quota_spent=stats.add_quota if stats is not None else None,
+                on_key_parked=_log_parked_key,
+                key_slot=self.crawl_engine.key_slot,
+            )
+        except APIQuotaExhaustedError:
+            raise
+        except Exception as e:
+            raise YoutubeAPIRequestError(f"유튜브 API 요청 중 오류 발생: {e}")
+        if not response:
+            raise YoutubeAPIRequestError("유튜브 API 요청 중 오류 발생: 응답 데이터를 가져올 수 없습니다")
+        return response
 
     async def _fetch_channel_videos(
         self,
         channel_id: str,
-        api_key: APIKey,
+        stats: ChannelCrawlStats | None = None,
         page_token: str | None = None,
         published_after: str | None = None,
         published_before: str | None = None,
@@ -254,7 +1030,7 @@ class RawDataCrawlService:
 
         Args:
             channel_id (str): YouTube 채널 ID
-            api_key (str): YouTube API 키
+            stats (ChannelCrawlStats | None, optional): 사용한 쿼터를 기록할 진행 상황. Defaults to None.
             page_token (str | None, optional): 다음 페이지 토큰. Defaults to None.
             published_after (str | None, optional): 동영상 게시 이후 시간. Defaults to None.
             published_before (str | None, optional): 동영상 게시 이전 시간. Defaults to None.
@@ -262,20 +1038,17 @@ class RawDataCrawlService:
         Returns:
             dict | None: 동영상 목록 또는 None
         """
-        try:
-            response = await self.api_client.fetch_channel_videos(
-                api_key=api_key.api_key,
+        return await self._request(
+            "search",
+            lambda api_key: self.api_client.fetch_channel_videos(
+                api_key=api_key,
                 channel_id=channel_id,
                 published_after=published_after,
                 published_before=published_before,
                 page_token=page_token,
-            )
-            if not response:
-                raise ValueError("응답 데이터를 가져올 수 없습니다")
-        except Exception as e:
-            raise YoutubeAPIRequestError(f"유튜브 API 요청 중 오류 발생: {e}")
-        api_key.use_search_quota()
-        return response
+            ),
+            stats,
+        )
 
 
 class APIKeyService:
@@ -318,22 +1091,3 @@ class APIKeyService:
             await self.api_key_repo.insert_api_key(api_key=api_key_obj)
         except Exception as e:
             raise APIKeyServiceError(f"API 키 저장 중 오류 발생: {e}")
-
-    async def update_quota_used(self, quota_used: int) -> None:
-        """API 키의 사용량을 업데이트하는 메서드
-
-        Args:
-            api_key (str): 업데이트할 API 키
-            quota_used (int): 사용량
-        """
-        try:
-            existing_key = await self.api_key_repo.get_api_key()
-            if not existing_key:
-                raise APIKeyServiceError("존재하지 않는 API 키입니다.")
-            # 만약 updated_at이 전날의 07시 이전이라면 quota_used를 초기화
-            if is_quota_reseted(existing_key.updated_at):
-                existing_key.quota_used = 0
-            existing_key.quota_used += quota_used
-            await self.api_key_repo.update_api_key(api_key=existing_key)
-        except Exception as e:
-            raise APIKeyServiceError(f"API 키 사용량 업데이트 중 오류 발생: {e}")
@@ -2,8 +2,10 @@ import datetime
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
+from shared.utils import data_class_to_dict
 
-@dataclass
+
+@dataclass(slots=True)
 class YoutubeLogEntry:
     domain_id: str
     level: Literal["INFO", "WARNING", "ERROR"]
@@ -12,4 +14,4 @@ class YoutubeLogEntry:
     timestamp: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
 
     def to_dict(self) -> dict[str, Any]:
-        return self.__dict__
+        return data_class_to_dict(self)
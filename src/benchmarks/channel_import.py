@@ -0,0 +1,76 @@
+"""채널 등록 방식별 소요 시간 벤치마크
+
+한 채널씩 등록하는 ChannelCreateService.insert_channel(before)과 ChannelImportService.import_channels(after)로
+같은 채널 목록을 등록하고 소요 시간과 API 요청 수를 비교합니다. 목록의 일부는 이미 등록된 채널이고,
+일부는 채널 ID로만 주어집니다.
+
+    cd src && python -m benchmarks.channel_import --channels 300 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+
+from application.services.channel_import_service import ChannelImportRow, ChannelImportService
+from application.services.youtube_service import ChannelCreateService
+from benchmarks.fakes import FakeYoutubeApiAdapter, InMemoryAPIKeyRepository, InMemoryYoutubeRepository
+from domain.model.youtube import APIKey, YoutubeChannel
+
+
+def make_rows(count: int) -> list[ChannelImportRow]:
+    rows = []
+    for index in range(count):
+        if index % 5 == 4:
+            rows.append(ChannelImportRow(channel_id=f"UCchannel{index}"))
+        else:
+            rows.append(ChannelImportRow(channel_handle=f"@channel{index}", channel_name=f"채널 {index}"))
+    return rows
+
+
+def make_repo(known: int) -> InMemoryYoutubeRepository:
+    # 앞쪽 known개 채널은 이미 등록된 상태
+    return InMemoryYoutubeRepository(
+        [
+            YoutubeChannel(f"채널 {index}", f"@channel{index}", f"UCchannel{index}", f"채널 {index}")
+            for index in range(known)
+        ]
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--channels", type=int, default=300)
+    parser.add_argument("--known", type=int, default=50, help="이미 등록된 채널 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="초, API 응답 하나의 지연 시간")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    rows = make_rows(args.channels)
+
+    api_client = FakeYoutubeApiAdapter(latency=args.latency)
+    repo = make_repo(args.known)
+    service = ChannelCreateService(repo, InMemoryAPIKeyRepository([APIKey(api_key="key-0")]), api_client)
+    started = time.perf_counter()
+    for row in rows:
+        handle = row.channel_handle or f"@{row.channel_id[2:]}"
+        await service.insert_channel(row.channel_name or handle, handle, row.channel_name or handle)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{'before: one by one':<22} channels={len(repo.channels):>5} "
+        f"requests={api_client.request_count:>5} elapsed={elapsed:7.2f}s"
+    )
+
+    api_client = FakeYoutubeApiAdapter(latency=args.latency)
+    repo = make_repo(args.known)
+    import_service = ChannelImportService(
+        repo, InMemoryAPIKeyRepository([APIKey(api_key="key-0")]), api_client, concurrency=args.concurrency
+    )
+    report = await import_service.import_channels(rows)
+    print(
+        f"{'after: bulk import':<22} channels={len(repo.channels):>5} "
+        f"requests={api_client.request_count:>5} elapsed={report.elapsed_seconds:7.2f}s "
+        f"cached={report.cached_count} quota_used={report.quota_used}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
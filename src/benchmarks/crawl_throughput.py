@@ -0,0 +1,79 @@
+"""RawDataCrawlService의 채널 병렬 수집 처리량 벤치마크
+
+지연 시간을 주입한 가짜 YoutubeApiAdapter와 인메모리 리포지토리로
+순차 실행(max_concurrency=1)과 병렬 실행의 처리량을 비교합니다.
+
+    cd src && python -m benchmarks.crawl_throughput --channels 20 --latency 0.05
+    cd src && python -m benchmarks.crawl_throughput --channels 80 --keys 4  # 키 수에 따른 확장성
+    cd src && python -m benchmarks.crawl_throughput --mode playlist  # 재생목록 방식의 비디오당 쿼터
+"""
+
+import argparse
+import asyncio
+import time
+
+from application.services.crawl_engine import CrawlEngine
+from application.services.youtube_service import EnumerationMode, RawDataCrawlService
+from benchmarks.fakes import (
+    FakeYoutubeApiAdapter,
+    InMemoryAPIKeyRepository,
+    InMemoryYoutubeRepository,
+    NullLogRepository,
+)
+from domain.model.youtube import APIKey, YoutubeChannel
+
+
+async def run_once(
+    channels: int, keys: int, latency: float, max_concurrency: int, per_key_concurrency: int, mode: EnumerationMode
+) -> None:
+    youtube_repo = InMemoryYoutubeRepository(
+        [
+            YoutubeChannel(
+                channel_name=f"channel-{index}",
+                channel_handle=f"@channel{index}",
+                channel_id=f"UC{index:04d}",
+                streamer_name=f"streamer-{index}",
+            )
+            for index in range(channels)
+        ]
+    )
+    api_key_repo = InMemoryAPIKeyRepository([APIKey(api_key=f"benchmark-key-{index}") for index in range(keys)])
+    api_client = FakeYoutubeApiAdapter(latency=latency, videos_per_channel=150)
+    service = RawDataCrawlService(
+        youtube_repo,
+        api_key_repo,
+        api_client,
+        NullLogRepository(),
+        CrawlEngine(max_concurrency=max_concurrency, per_key_concurrency=per_key_concurrency),
+        enumeration_mode=mode,
+    )
+
+    started = time.perf_counter()
+    await service.initialize_you_tube_video_data()
+    elapsed = time.perf_counter() - started
+
+    quota_used = sum(api_key.quota_used for api_key in await api_key_repo.list_api_keys())
+    print(
+        f"mode={mode:<8} concurrency={max_concurrency:>3} per_key={per_key_concurrency:>3} "
+        f"elapsed={elapsed:7.2f}s requests={api_client.request_count:>5} "
+        f"pages/s={api_client.request_count / elapsed:8.1f} videos={len(youtube_repo.raw_data):>6} "
+        f"quota_used={quota_used} quota/video={quota_used / max(len(youtube_repo.raw_data), 1):.2f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--channels", type=int, default=20, help="채널당 약 300 유닛, 키 하나당 약 8000 유닛까지 사용")
+    parser.add_argument("--keys", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.05, help="요청 하나당 주입할 지연 시간(초)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--per-key", type=int, default=4)
+    parser.add_argument("--mode", choices=["search", "playlist"], default="search")
+    args = parser.parse_args()
+
+    for max_concurrency in args.concurrency:
+        await run_once(args.channels, args.keys, args.latency, max_concurrency, args.per_key, args.mode)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
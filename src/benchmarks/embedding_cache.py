@@ -0,0 +1,119 @@
+"""임베딩 캐시 효과 벤치마크
+
+embedding_ingestion 벤치마크와 같은 가짜 비디오를 인메모리 Qdrant에 적재한 뒤, 다음 두 경우에 다시 적재하면서
+임베딩 캐시(로컬 디스크 메모리 맵)가 있을 때와 없을 때 임베딩 모델로 보낸 텍스트 수와 소요 시간을 비교합니다.
+
+- reset: 임베딩 상태를 잃어 모든 비디오를 다시 적재하는 경우
+- rechunk: 자막 청크 길이를 바꿔 모든 비디오의 해시가 바뀐 경우
+
+마지막으로 JSON 배열 대비 저장 크기와 캐시 정리(evict, compact) 결과를 출력합니다.
+
+    cd src && python -m benchmarks.embedding_cache --videos 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+import warnings
+
+from qdrant_client import AsyncQdrantClient
+
+from application.services.chunking import ChunkingConfig
+from application.services.embedding_service import EmbeddingIngestionService
+from benchmarks.embedding_ingestion import make_repo
+from benchmarks.fakes import FakeEmbedder, InMemoryEmbeddingStateRepository, InMemoryYoutubeRepository
+from domain.adapter.embedder import Embedder
+from infrastructure.api.cached_embedder import CachedEmbedder, EmbeddingCacheMetrics
+from infrastructure.persistence.embedding_cache import MmapEmbeddingCacheRepository
+from infrastructure.persistence.qdrant_repository import QdrantVectorRepository
+
+
+async def ingest(
+    repo: InMemoryYoutubeRepository,
+    state_repo: InMemoryEmbeddingStateRepository,
+    embedder: Embedder,
+    chunking: ChunkingConfig,
+) -> float:
+    client = AsyncQdrantClient(location=":memory:")
+    service = EmbeddingIngestionService(
+        youtube_repo=repo,
+        state_repo=state_repo,
+        vector_repo=QdrantVectorRepository(client),
+        embedder=embedder,
+        chunking=chunking,
+    )
+    report = await service.ingest()
+    await client.close()
+    return report.elapsed_seconds
+
+
+async def run_scenario(name: str, args: argparse.Namespace, cache_dir: str | None) -> None:
+    repo = make_repo(args.videos, args.transcript_seconds)
+    first = ChunkingConfig(window_seconds=60, overlap_seconds=10)
+    second = ChunkingConfig(window_seconds=60, overlap_seconds=10)
+    if name == "rechunk":
+        # 설명/제목 청크는 그대로이고, 자막 청크는 일부 구간만 겹침
+        second = ChunkingConfig(window_seconds=120, overlap_seconds=60)
+
+    fake = FakeEmbedder(latency=args.latency)
+    embedder: Embedder = fake
+    if cache_dir is not None:
+        embedder = CachedEmbedder(fake, MmapEmbeddingCacheRepository(cache_dir, dimension=fake.dimension))
+    state_repo = InMemoryEmbeddingStateRepository()
+    await ingest(repo, state_repo, embedder, first)
+    if name == "reset":
+        state_repo = InMemoryEmbeddingStateRepository()
+
+    fake.text_count = 0
+    if isinstance(embedder, CachedEmbedder):
+        embedder.metrics = EmbeddingCacheMetrics()
+    elapsed = await ingest(repo, state_repo, embedder, second)
+    label = f"{name}, {'with cache' if cache_dir else 'no cache'}"
+    hit_ratio = f" cache_hit_ratio={embedder.metrics.hit_ratio:.2f}" if isinstance(embedder, CachedEmbedder) else ""
+    print(f"{label:<22} embedded_texts={fake.text_count:>6} elapsed={elapsed:6.2f}s{hit_ratio}")
+    if isinstance(embedder, CachedEmbedder):
+        embedder.repository.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=200)
+    parser.add_argument("--transcript-seconds", type=int, default=600, help="비디오 하나의 자막 길이 (초)")
+    parser.add_argument("--latency", type=float, default=0.05, help="초, 임베딩 요청 하나의 지연 시간")
+    args = parser.parse_args()
+    # 인메모리 Qdrant는 페이로드 인덱스를 지원하지 않는다는 경고를 출력함
+    warnings.filterwarnings("ignore", message="Payload indexes have no effect")
+
+    for name in ("reset", "rechunk"):
+        await run_scenario(name, args, None)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            await run_scenario(name, args, cache_dir)
+
+    # 저장 크기 비교와 캐시 정리
+    with tempfile.TemporaryDirectory() as cache_dir:
+        fake = FakeEmbedder()
+        cache_repo = MmapEmbeddingCacheRepository(cache_dir, dimension=fake.dimension)
+        embedder = CachedEmbedder(fake, cache_repo)
+        repo = make_repo(args.videos, args.transcript_seconds)
+        await ingest(repo, InMemoryEmbeddingStateRepository(), embedder, ChunkingConfig())
+        count = await cache_repo.count()
+        vectors = await fake.embed([f"텍스트 {index}" for index in range(count)])
+        json_size = sum(len(json.dumps(vector)) for vector in vectors)
+        print(
+            f"storage: {count} vectors, float16 file={cache_repo.path.stat().st_size / 1e6:.2f}MB, "
+            f"JSON lists={json_size / 1e6:.2f}MB"
+        )
+        started = time.perf_counter()
+        evicted = await cache_repo.evict(max_entries=count // 2)
+        await cache_repo.compact()
+        print(
+            f"cleanup: evicted={evicted} remaining={await cache_repo.count()} "
+            f"file={cache_repo.path.stat().st_size / 1e6:.2f}MB elapsed={time.perf_counter() - started:.2f}s"
+        )
+        cache_repo.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""임베딩 적재 처리량 벤치마크
+
+가짜 비디오 원문과 자막을 만들어 EmbeddingIngestionService로 인메모리 Qdrant에 적재합니다.
+동시 요청 수별 처리량(chunks/s)과, 일부 비디오만 바뀐 뒤 다시 실행했을 때 건너뛰는 비디오 수를 출력합니다.
+
+    cd src && python -m benchmarks.embedding_ingestion --videos 300 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import datetime
+import warnings
+
+from qdrant_client import AsyncQdrantClient
+
+from application.services.chunking import ChunkingConfig
+from application.services.embedding_service import EmbeddingIngestionService, IngestionReport
+from benchmarks.fakes import FakeEmbedder, InMemoryEmbeddingStateRepository, InMemoryYoutubeRepository
+from domain.model.youtube import YoutubeTranscript, YoutubeVideoRawData
+from infrastructure.persistence.qdrant_repository import QdrantVectorRepository
+
+WORDS = "오늘 방송 게임 노래 합방 리뷰 공지 하이라이트 클립 챌린지 먹방 토크 랭크 보스 공략 신곡".split()
+
+
+def make_repo(videos: int, transcript_seconds: int) -> InMemoryYoutubeRepository:
+    repo = InMemoryYoutubeRepository()
+    published_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    for index in range(videos):
+        video_id = f"video{index}"
+        repo.raw_data[video_id] = YoutubeVideoRawData(
+            video_id=video_id,
+            channel_id=f"UCchannel{index % 10}",
+            streamer_name=f"스트리머 {index % 10}",
+            raw_data={"snippet": {"title": f"{WORDS[index % len(WORDS)]} {index}", "description": "설명 " * 30}},
+            created_at=published_at,
+            published_at=published_at + datetime.timedelta(hours=index),
+        )
+        segments = [
+            {
+                "text": f"{index}번 " + " ".join(WORDS[(index + second + offset) % len(WORDS)] for offset in range(6)),
+                "start": second,
+                "duration": 5,
+            }
+            for second in range(0, transcript_seconds, 5)
+        ]
+        repo.transcripts[video_id] = YoutubeTranscript(video_id, "ko", True, segments)
+    return repo
+
+
+def make_service(
+    repo: InMemoryYoutubeRepository,
+    state_repo: InMemoryEmbeddingStateRepository,
+    client: AsyncQdrantClient,
+    embedder: FakeEmbedder,
+    concurrency: int,
+) -> EmbeddingIngestionService:
+    return EmbeddingIngestionService(
+        youtube_repo=repo,
+        state_repo=state_repo,
+        vector_repo=QdrantVectorRepository(client),
+        embedder=embedder,
+        chunking=ChunkingConfig(window_seconds=60, overlap_seconds=10),
+        embed_batch_size=64,
+        embed_concurrency=concurrency,
+    )
+
+
+def print_report(label: str, report: IngestionReport, embedder: FakeEmbedder) -> None:
+    print(
+        f"{label:<28} embedded={report.documents_embedded:>5} skipped={report.documents_skipped:>5} "
+        f"chunks={report.chunks_embedded:>6} requests={embedder.request_count:>4} "
+        f"elapsed={report.elapsed_seconds:6.2f}s chunks/s={report.chunks_per_second:8.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=300)
+    parser.add_argument("--transcript-seconds", type=int, default=600, help="비디오 하나의 자막 길이 (초)")
+    parser.add_argument("--latency", type=float, default=0.05, help="초, 임베딩 요청 하나의 지연 시간")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--changed", type=float, default=0.1, help="두 번째 실행 전에 내용을 바꿀 비디오 비율")
+    args = parser.parse_args()
+    # 인메모리 Qdrant는 페이로드 인덱스를 지원하지 않는다는 경고를 출력함
+    warnings.filterwarnings("ignore", message="Payload indexes have no effect")
+
+    for concurrency in args.concurrency:
+        client = AsyncQdrantClient(location=":memory:")
+        embedder = FakeEmbedder(latency=args.latency)
+        service = make_service(
+            make_repo(args.videos, args.transcript_seconds),
+            InMemoryEmbeddingStateRepository(),
+            client,
+            embedder,
+            concurrency,
+        )
+        report = await service.ingest()
+        print_report(f"full, concurrency={concurrency}", report, embedder)
+        await client.close()
+
+    # 증분 적재: 같은 저장소로 다시 실행하면 내용이 바뀐 비디오만 임베딩
+    client = AsyncQdrantClient(location=":memory:")
+    repo = make_repo(args.videos, args.transcript_seconds)
+    state_repo = InMemoryEmbeddingStateRepository()
+    await make_service(repo, state_repo, client, FakeEmbedder(), max(args.concurrency)).ingest()
+    for index in range(int(args.videos * args.changed)):
+        repo.raw_data[f"video{index}"].raw_data["snippet"]["title"] += " (수정됨)"
+    embedder = FakeEmbedder(latency=args.latency)
+    report = await make_service(repo, state_repo, client, embedder, max(args.concurrency)).ingest()
+    print_report("incremental rerun", report, embedder)
+    points = (await client.count(QdrantVectorRepository(client).collection_name)).count
+    print(f"points in collection: {points}")
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""RawDataCrawlService.enrich_video_details 처리량 벤치마크
+
+가짜 YoutubeApiAdapter(지연 시간 주입)와 인메모리 리포지토리로 videos.list 50개 단위 병렬 보강의
+videos/sec와 비디오당 쿼터를 측정합니다.
+
+    cd src && python -m benchmarks.enrichment_throughput --videos 5000 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import datetime
+
+from application.services.crawl_engine import CrawlEngine
+from application.services.youtube_service import RawDataCrawlService
+from benchmarks.fakes import (
+    FakeYoutubeApiAdapter,
+    InMemoryAPIKeyRepository,
+    InMemoryYoutubeRepository,
+    NullLogRepository,
+)
+from domain.model.youtube import APIKey, YoutubeVideoRawData
+
+
+async def run_once(videos: int, latency: float, max_concurrency: int) -> None:
+    youtube_repo = InMemoryYoutubeRepository()
+    await youtube_repo.bulk_save_raw_data(
+        [
+            YoutubeVideoRawData(
+                video_id=f"video-{index}",
+                channel_id="UC0000",
+                streamer_name="streamer",
+                raw_data={},
+                created_at=datetime.datetime.now(datetime.timezone.utc),
+            )
+            for index in range(videos)
+        ]
+    )
+    service = RawDataCrawlService(
+        youtube_repo,
+        InMemoryAPIKeyRepository([APIKey(api_key="benchmark-key")]),
+        FakeYoutubeApiAdapter(latency=latency),
+        NullLogRepository(),
+        CrawlEngine(max_concurrency=max_concurrency, per_key_concurrency=max_concurrency),
+    )
+    report = await service.enrich_video_details()
+    print(
+        f"concurrency={max_concurrency:>3} enriched={report.enriched_count:>6} requests={report.request_count:>5} "
+        f"elapsed={report.elapsed_seconds:6.2f}s videos/s={report.videos_per_second:9.1f} "
+        f"quota/video={report.quota_per_video:.3f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.05, help="요청 하나당 주입할 지연 시간(초)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 10])
+    args = parser.parse_args()
+
+    for max_concurrency in args.concurrency:
+        await run_once(args.videos, args.latency, max_concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
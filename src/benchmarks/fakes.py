@@ -0,0 +1,578 @@
+"""벤치마크에서 사용하는 인메모리 리포지토리와 가짜 어댑터 모음
+
+실제 MongoDB와 YouTube API 없이 서비스 계층을 실행하기 위한 용도입니다.
+"""
+
+import asyncio
+import copy
+import datetime
+import json
+import random
+import time
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+from audit.loggers.log_repository import LogRepository
+from audit.loggers.youtube_logger import YoutubeLogEntry
+from domain.adapter.embedder import EmbeddingTask
+from domain.adapter.transcript_adapter import TranscriptAdapter, TranscriptUnavailableError
+from domain.adapter.youtube_api_adapter import YoutubeApiAdapter
+from domain.model.embedding import EmbeddingState, IngestionDocument
+from domain.model.pagination import Page, decode_cursor, encode_cursor
+from domain.model.youtube import (
+    APIKey,
+    ChannelUploadStats,
+    CrawlCheckpoint,
+    VideoFilter,
+    YoutubeChannel,
+    YoutubeTranscript,
+    YoutubeVideoRawData,
+    YoutubeVideoView,
+)
+from domain.repository.crawl_checkpoint import CrawlCheckpointRepository
+from domain.repository.embedding import EmbeddingStateRepository
+from domain.repository.youtube_repository import APIKeyRepository, BulkSaveResult, YoutubeRepository
+from infrastructure.api.hashing_embedder import HashingEmbedder
+from shared.utils import (
+    YOUTUBE_API_QUOTA_LIMIT,
+    YOUTUBE_SEARCH_RESULT_CAP,
+    as_utc,
+    format_youtube_datetime,
+    parse_youtube_datetime,
+)
+
+
+class InMemoryYoutubeRepository(YoutubeRepository):
+    def __init__(self, channels: list[YoutubeChannel] | None = None):
+        self.channels: dict[str, YoutubeChannel] = {channel.channel_id: channel for channel in channels or []}
+        self.raw_data: dict[str, YoutubeVideoRawData] = {}
+        self.transcripts: dict[str, YoutubeTranscript] = {}
+
+    async def get_channels(self) -> list[YoutubeChannel]:
+        return list(self.channels.values())
+
+    async def get_uninitialized_channels(self) -> list[YoutubeChannel]:
+        return [channel for channel in self.channels.values() if not channel.initialized]
+
+    async def get_initialized_channels(self) -> list[YoutubeChannel]:
+        return [channel for channel in self.channels.values() if channel.initialized]
+
+    async def iter_channels(
+        self, initialized: bool | None = None, batch_size: int = 500
+    ) -> AsyncIterator[YoutubeChannel]:
+        for channel in list(self.channels.values()):
+            if initialized is None or channel.initialized == initialized:
+                yield channel
+
+    async def list_channels(
+        self, streamer_name: str | None = None, cursor: str | None = None, limit: int = 50
+    ) -> Page[YoutubeChannel]:
+        # 저장 순서 대신 channel_id 순서로 페이지를 나눔
+        after = decode_cursor(cursor).get("channel_id", "") if cursor else ""
+        channels = sorted(
+            (
+                channel
+                for channel in self.channels.values()
+                if channel.channel_id > after and (streamer_name is None or channel.streamer_name == streamer_name)
+            ),
+            key=lambda channel: channel.channel_id,
+        )
+        next_cursor = encode_cursor({"channel_id": channels[limit - 1].channel_id}) if len(channels) > limit else None
+        return Page(channels[:limit], next_cursor)
+
+    async def list_videos(
+        self,
+        filter: VideoFilter,
+        fields: Iterable[str] | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[YoutubeVideoView]:
+        selected = YoutubeVideoView.projection_fields(fields)
+
+        # 최근 게시 순서 (게시 시각이 없으면 마지막), 같으면 video_id 내림차순
+        def sort_key(raw_data: YoutubeVideoRawData) -> tuple:
+            published_at = as_utc(raw_data.published_at) if raw_data.published_at else None
+            return (published_at is not None, published_at or datetime.datetime.min, raw_data.video_id)
+
+        after = None
+        if cursor:
+            position = decode_cursor(cursor)
+            published_at = position.get("published_at")
+            after = (
+                published_at is not None,
+                datetime.datetime.fromisoformat(published_at) if published_at else datetime.datetime.min,
+                position.get("video_id", ""),
+            )
+        videos = sorted(
+            (
+                raw_data
+                for raw_data in self.raw_data.values()
+                if (filter.channel_id is None or raw_data.channel_id == filter.channel_id)
+                and (filter.streamer_name is None or raw_data.streamer_name == filter.streamer_name)
+                and (
+                    filter.published_after is None
+                    or (raw_data.published_at and as_utc(raw_data.published_at) >= as_utc(filter.published_after))
+                )
+                and (
+                    filter.published_before is None
+                    or (raw_data.published_at and as_utc(raw_data.published_at) < as_utc(filter.published_before))
+                )
+                and (after is None or sort_key(raw_data) < after)
+            ),
+            key=sort_key,
+            reverse=True,
+        )
+        next_cursor = None
+        if len(videos) > limit:
+            last = videos[limit - 1]
+            published_at = as_utc(last.published_at).isoformat() if last.published_at else None
+            next_cursor = encode_cursor({"published_at": published_at, "video_id": last.video_id})
+        return Page([YoutubeVideoView(raw_data.to_dict(), selected) for raw_data in videos[:limit]], next_cursor)
+
+    async def get_video_by_id(self, video_id: str) -> YoutubeVideoRawData | None:
+        return self.raw_data.get(video_id)
+
+    async def get_video_view(self, video_id: str, fields: Iterable[str] | None = None) -> YoutubeVideoView | None:
+        selected = YoutubeVideoView.projection_fields(fields)
+        raw_data = self.raw_data.get(video_id)
+        return YoutubeVideoView(raw_data.to_dict(), selected) if raw_data else None
+
+    async def iter_videos(
+        self, channel_id: str | None = None, fields: Iterable[str] | None = None, batch_size: int = 500
+    ) -> AsyncIterator[YoutubeVideoView]:
+        selected = YoutubeVideoView.projection_fields(fields)
+        for raw_data in list(self.raw_data.values()):
+            if channel_id is None or raw_data.channel_id == channel_id:
+                yield YoutubeVideoView(raw_data.to_dict(), selected)
+
+    async def get_existing_video_ids(self, video_ids: list[str]) -> set[str]:
+        return {video_id for video_id in video_ids if video_id in self.raw_data}
+
+    async def get_latest_published_at(self, channel_id: str) -> datetime.datetime | None:
+        published = [
+            raw_data.published_at
+            for raw_data in self.raw_data.values()
+            if raw_data.channel_id == channel_id and raw_data.published_at is not None
+        ]
+        return max(published, default=None)
+
+    async def get_channel_upload_stats(self, since: datetime.datetime) -> list[ChannelUploadStats]:
+        published_by_channel: dict[str, list[datetime.datetime]] = {}
+        for raw_data in self.raw_data.values():
+            if raw_data.published_at is not None and as_utc(raw_data.published_at) >= as_utc(since):
+                published_by_channel.setdefault(raw_data.channel_id, []).append(raw_data.published_at)
+        return [
+            ChannelUploadStats(
+                channel_id=channel_id,
+                video_count=len(published),
+                first_published_at=min(published),
+                last_published_at=max(published),
+            )
+            for channel_id, published in published_by_channel.items()
+        ]
+
+    async def save_channel(self, channel: YoutubeChannel) -> None:
+        self.channels[channel.channel_id] = channel
+
+    async def bulk_save_channels(self, channels: list[YoutubeChannel]) -> BulkSaveResult:
+        result = BulkSaveResult()
+        for channel in channels:
+            existing = self.channels.get(channel.channel_id)
+            if existing is None:
+                self.channels[channel.channel_id] = channel
+                result.inserted_count += 1
+            else:
+                before = existing.to_dict()
+                existing.channel_name = channel.channel_name
+                existing.channel_handle = channel.channel_handle
+                existing.streamer_name = channel.streamer_name
+                existing.uploads_playlist_id = channel.uploads_playlist_id or existing.uploads_playlist_id
+                if existing.to_dict() != before:
+                    result.updated_count += 1
+        return result
+
+    async def get_channel_ids_by_handles(self, handles: list[str]) -> dict[str, str]:
+        wanted = set(handles)
+        return {
+            channel.channel_handle: channel.channel_id
+            for channel in self.channels.values()
+            if channel.channel_handle in wanted
+        }
+
+    async def bulk_save_raw_data(self, raw_data_list: list[YoutubeVideoRawData]) -> BulkSaveResult:
+        result = BulkSaveResult()
+        for raw_data in raw_data_list:
+            existing = self.raw_data.get(raw_data.video_id)
+            if existing is None:
+                self.raw_data[raw_data.video_id] = raw_data
+                result.inserted_count += 1
+            elif (existing.raw_data, existing.published_at) != (raw_data.raw_data, raw_data.published_at):
+                existing.raw_data = raw_data.raw_data
+                existing.published_at = raw_data.published_at
+                result.updated_count += 1
+        return result
+
+    async def get_unenriched_video_ids(self, limit: int) -> list[str]:
+        return [raw_data.video_id for raw_data in self.raw_data.values() if raw_data.enriched_at is None][:limit]
+
+    async def bulk_update_video_details(self, details: dict[str, dict | None]) -> int:
+        enriched_at = datetime.datetime.now(datetime.timezone.utc)
+        for video_id, item in details.items():
+            self.raw_data[video_id].details = item
+            self.raw_data[video_id].enriched_at = enriched_at
+        return len(details)
+
+    async def iter_video_ids_without_transcript(self, max_attempts: int, batch_size: int = 500) -> AsyncIterator[str]:
+        for raw_data in list(self.raw_data.values()):
+            if raw_data.transcript_status in ("done", "unavailable") or raw_data.transcript_attempts >= max_attempts:
+                continue
+            yield raw_data.video_id
+
+    async def bulk_save_transcripts(self, transcripts: list[YoutubeTranscript]) -> None:
+        for transcript in transcripts:
+            self.transcripts[transcript.video_id] = transcript
+            self.raw_data[transcript.video_id].transcript_status = "done"
+            self.raw_data[transcript.video_id].transcript_attempts += 1
+
+    async def bulk_update_transcript_status(self, statuses: dict[str, tuple[str, str | None]]) -> None:
+        for video_id, (status, _) in statuses.items():
+            self.raw_data[video_id].transcript_status = status
+            self.raw_data[video_id].transcript_attempts += 1
+
+    async def iter_ingestion_documents(self, batch_size: int = 500) -> AsyncIterator[IngestionDocument]:
+        for raw_data in list(self.raw_data.values()):
+            snippet = (raw_data.details or raw_data.raw_data).get("snippet", {})
+            transcript = self.transcripts.get(raw_data.video_id)
+            yield IngestionDocument(
+                video_id=raw_data.video_id,
+                channel_id=raw_data.channel_id,
+                streamer_name=raw_data.streamer_name,
+                title=snippet.get("title") or "",
+                description=snippet.get("description") or "",
+                published_at=raw_data.published_at,
+                segments=transcript.segments if transcript else None,
+            )
+
+    async def iter_raw_data_export_rows(
+        self,
+        created_after: datetime.datetime | None,
+        created_before: datetime.datetime,
+        include_raw: bool = True,
+        batch_size: int = 2000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        rows = [
+            raw_data
+            for raw_data in self.raw_data.values()
+            if (created_after is None or as_utc(raw_data.created_at) > created_after)
+            and as_utc(raw_data.created_at) <= created_before
+        ]
+        for raw_data in sorted(rows, key=lambda row: as_utc(row.created_at)):
+            details = raw_data.details or {}
+            snippet = details.get("snippet") or raw_data.raw_data.get("snippet", {})
+            statistics = details.get("statistics", {})
+            yield {
+                "video_id": raw_data.video_id,
+                "channel_id": raw_data.channel_id,
+                "streamer_name": raw_data.streamer_name,
+                "published_at": as_utc(raw_data.published_at) if raw_data.published_at else None,
+                "created_at": as_utc(raw_data.created_at),
+                "title": snippet.get("title"),
+                "description": snippet.get("description"),
+                "duration": details.get("contentDetails", {}).get("duration"),
+                "view_count": int(statistics["viewCount"]) if "viewCount" in statistics else None,
+                "like_count": int(statistics["likeCount"]) if "likeCount" in statistics else None,
+                "comment_count": int(statistics["commentCount"]) if "commentCount" in statistics else None,
+                "transcript_status": raw_data.transcript_status,
+                "raw_data": json.dumps(raw_data.raw_data, ensure_ascii=False) if include_raw else None,
+                "details": (
+                    json.dumps(raw_data.details, ensure_ascii=False) if include_raw and raw_data.details else None
+                ),
+            }
+
+    async def get_channel_by_id(self, channel_id: str) -> YoutubeChannel | None:
+        return self.channels.get(channel_id)
+
+    async def update_channel(self, channel: YoutubeChannel) -> None:
+        self.channels[channel.channel_id] = channel
+
+    async def clear_raw_data_for_channel(self, channel: YoutubeChannel) -> None:
+        self.raw_data = {
+            video_id: raw_data
+            for video_id, raw_data in self.raw_data.items()
+            if raw_data.channel_id != channel.channel_id
+        }
+
+
+class InMemoryCrawlCheckpointRepository(CrawlCheckpointRepository):
+    def __init__(self):
+        self.checkpoints: dict[str, CrawlCheckpoint] = {}
+
+    async def get_checkpoint(self, channel_id: str) -> CrawlCheckpoint | None:
+        checkpoint = self.checkpoints.get(channel_id)
+        # 저장소처럼 저장 시점의 사본을 돌려줌
+        return copy.deepcopy(checkpoint) if checkpoint else None
+
+    async def save_checkpoint(self, checkpoint: CrawlCheckpoint) -> None:
+        self.checkpoints[checkpoint.channel_id] = copy.deepcopy(checkpoint)
+
+    async def delete_checkpoint(self, channel_id: str) -> None:
+        self.checkpoints.pop(channel_id, None)
+
+
+class InMemoryEmbeddingStateRepository(EmbeddingStateRepository):
+    def __init__(self):
+        self.states: dict[str, EmbeddingState] = {}
+
+    async def get_states(self, video_ids: list[str]) -> dict[str, EmbeddingState]:
+        return {video_id: self.states[video_id] for video_id in video_ids if video_id in self.states}
+
+    async def save_states(self, states: list[EmbeddingState]) -> None:
+        for state in states:
+            self.states[state.video_id] = state
+
+
+class InMemoryAPIKeyRepository(APIKeyRepository):
+    def __init__(self, api_keys: list[APIKey] | None = None):
+        self.api_keys: dict[str, APIKey] = {api_key.api_key: api_key for api_key in api_keys or []}
+
+    async def list_api_keys(self) -> list[APIKey]:
+        return list(self.api_keys.values())
+
+    async def get_api_key(self) -> APIKey:
+        if not self.api_keys:
+            raise ValueError("No API key found for YouTube service")
+        return min(self.api_keys.values(), key=lambda api_key: api_key.quota_used)
+
+    async def reserve_quota(self, amount: int, max_quota_used: int, endpoint: str | None = None) -> APIKey | None:
+        # await 없이 조회와 증가를 처리하므로 이벤트 루프 안에서는 원자적
+        candidates = [api_key for api_key in self.api_keys.values() if api_key.quota_used <= max_quota_used]
+        if not candidates:
+            return None
+        api_key = min(candidates, key=lambda candidate: candidate.quota_used)
+        api_key.quota_used += amount
+        if endpoint:
+            api_key.quota_used_by_endpoint[endpoint] = api_key.quota_used_by_endpoint.get(endpoint, 0) + amount
+        return api_key
+
+    async def release_quota(self, api_key: str, amount: int, endpoint: str | None = None) -> None:
+        key = self.api_keys.get(api_key)
+        if key is None or key.quota_used < amount:
+            return
+        key.quota_used -= amount
+        if endpoint:
+            key.quota_used_by_endpoint[endpoint] = key.quota_used_by_endpoint.get(endpoint, 0) - amount
+
+    async def park_api_key(self, api_key: str) -> None:
+        if api_key in self.api_keys:
+            self.api_keys[api_key].quota_used = YOUTUBE_API_QUOTA_LIMIT
+
+    async def insert_api_key(self, api_key: APIKey) -> None:
+        self.api_keys[api_key.api_key] = api_key
+
+
+class NullLogRepository(LogRepository):
+    def __init__(self):
+        self.count = 0
+
+    async def save_channel_log(self, log: YoutubeLogEntry) -> None:
+        self.count += 1
+
+    async def save_video_raw_data_log(self, log: YoutubeLogEntry) -> None:
+        self.count += 1
+
+
+class FakeYoutubeApiAdapter(YoutubeApiAdapter):
+    """응답마다 지연 시간을 주입하는 가짜 YouTube API 어댑터
+
+    채널마다 videos_per_channel 개의 동영상이 start부터 upload_interval 간격으로 올라와 있다고 가정하고,
+    search API처럼 게시 시각 필터, 최신순 정렬, 페이지(50개), 검색 조건당 500개 결과 제한을 흉내냅니다.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        videos_per_channel: int = 100,
+        items_per_page: int = 50,
+        start: datetime.datetime = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+        upload_interval: datetime.timedelta = datetime.timedelta(days=1),
+    ):
+        self.latency = latency
+        self.videos_per_channel = videos_per_channel
+        self.items_per_page = items_per_page
+        self.start = start
+        self.upload_interval = upload_interval
+        self.request_count = 0
+
+    def _published_times(self) -> list[datetime.datetime]:
+        return [self.start + self.upload_interval * index for index in range(self.videos_per_channel)]
+
+    async def fetch_channel_id(self, handle: str, api_key: str) -> str | None:
+        await asyncio.sleep(self.latency)
+        self.request_count += 1
+        return f"UC{handle.lstrip('@')}"
+
+    def _channel_item(self, channel_id: str) -> dict:
+        return {
+            "kind": "youtube#channel",
+            "id": channel_id,
+            "snippet": {"title": f"channel {channel_id[2:]}", "customUrl": f"@{channel_id[2:].lower()}"},
+            "contentDetails": {"relatedPlaylists": {"uploads": f"UU{channel_id[2:]}"}},
+        }
+
+    async def fetch_channel_by_handle(self, handle: str, api_key: str) -> dict | None:
+        await asyncio.sleep(self.latency)
+        self.request_count += 1
+        return self._channel_item(f"UC{handle.lstrip('@')}")
+
+    async def fetch_channels(self, channel_ids: list[str], api_key: str) -> dict | None:
+        await asyncio.sleep(self.latency)
+        self.request_count += 1
+        return {"items": [self._channel_item(channel_id) for channel_id in channel_ids]}
+
+    async def fetch_channel_videos(
+        self,
+        channel_id: str,
+        api_key: str,
+        page_token: str | None = None,
+        published_after: str | None = None,
+        published_before: str | None = None,
+    ) -> dict | None:
+        await asyncio.sleep(self.latency)
+        self.request_count += 1
+        after = parse_youtube_datetime(published_after)
+        before = parse_youtube_datetime(published_before)
+        matched = [
+            (index, published_at)
+            for index, published_at in enumerate(self._published_times())
+            if (after is None or published_at >= after) and (before is None or published_at <= before)
+        ]
+        matched.reverse()  # order=date
+        offset = int(page_token) if page_token else 0
+        reachable = matched[:YOUTUBE_SEARCH_RESULT_CAP]
+        page = reachable[offset : offset + self.items_per_page]
+        response: dict = {
+            "pageInfo": {"totalResults": len(matched), "resultsPerPage": self.items_per_page},
+            "items": [
+                {
+                    "kind": "youtube#searchResult",
+                    "id": {"kind": "youtube#video", "videoId": f"{channel_id}-{index}"},
+                    "snippet": {
+                        "channelId": channel_id,
+                        "title": f"video {index}",
+                        "publishedAt": format_youtube_datetime(published_at),
+                    },
+                }
+                for index, published_at in page
+            ],
+        }
+        if offset + self.items_per_page < len(reachable):
+            response["nextPageToken"] = str(offset + self.items_per_page)
+        return response
+
+    async def fetch_uploads_playlist_id(self, channel_id: str, api_key: str) -> str | None:
+        await asyncio.sleep(self.latency)
+        self.request_count += 1
+        return f"UU{channel_id[2:]}"
+
+    async def fetch_playlist_items(
+        self,
+        playlist_id: str,
+        api_key: str,
+        page_token: str | None = None,
+    ) -> dict | None:
+        await asyncio.sleep(self.latency)
+        self.request_count += 1
+        channel_id = f"UC{playlist_id[2:]}"
+        uploads = list(enumerate(self._published_times()))
+        uploads.reverse()  # 업로드 재생목록은 최신순
+        offset = int(page_token) if page_token else 0
+        page = uploads[offset : offset + self.items_per_page]
+        response: dict = {
+            "pageInfo": {"totalResults": len(uploads), "resultsPerPage": self.items_per_page},
+            "items": [
+                {
+                    "kind": "youtube#playlistItem",
+                    "snippet": {
+                        "channelId": channel_id,
+                        "title": f"video {index}",
+                        "resourceId": {"kind": "youtube#video", "videoId": f"{channel_id}-{index}"},
+                    },
+                    "contentDetails": {
+                        "videoId": f"{channel_id}-{index}",
+                        "videoPublishedAt": format_youtube_datetime(published_at),
+                    },
+                }
+                for index, published_at in page
+            ],
+        }
+        if offset + self.items_per_page < len(uploads):
+            response["nextPageToken"] = str(offset + self.items_per_page)
+        return response
+
+    async def fetch_videos(self, video_ids: list[str], api_key: str) -> dict | None:
+        await asyncio.sleep(self.latency)
+        self.request_count += 1
+        return {
+            "items": [
+                {
+                    "kind": "youtube#video",
+                    "id": video_id,
+                    "contentDetails": {"duration": "PT1H2M3S"},
+                    "statistics": {"viewCount": "100"},
+                }
+                for video_id in video_ids
+            ]
+        }
+
+
+class FakeTranscriptClient(TranscriptAdapter):
+    """지연 시간과 실패를 주입할 수 있는 가짜 자막 수집기
+
+    실제 라이브러리처럼 동기 방식으로 동작하며 latency만큼 스레드를 블로킹합니다.
+    """
+
+    def __init__(self, latency: float = 0.0, unavailable_rate: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.unavailable_rate = unavailable_rate
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.request_count = 0
+
+    def fetch_transcript(self, video_id: str, languages: list[str]) -> YoutubeTranscript:
+        self.request_count += 1
+        time.sleep(self.latency)
+        roll = self._random.random()
+        if roll < self.unavailable_rate:
+            raise TranscriptUnavailableError(f"{video_id}: TranscriptsDisabled")
+        if roll < self.unavailable_rate + self.error_rate:
+            raise ConnectionError(f"{video_id}: simulated network error")
+        return YoutubeTranscript(
+            video_id=video_id,
+            language_code=languages[0],
+            is_generated=True,
+            segments=[{"text": f"segment {index}", "start": index * 2.0, "duration": 2.0} for index in range(100)],
+        )
+
+
+class FakeEmbedder(HashingEmbedder):
+    """요청마다 latency초의 지연이 있는 임베딩 API를 흉내 내는 임베더 (벡터는 HashingEmbedder와 같음)
+
+    max_concurrency를 주면 동시에 처리하는 요청 수가 제한된 API처럼 나머지 요청은 대기합니다.
+    """
+
+    def __init__(self, dimension: int = 256, latency: float = 0.0, max_concurrency: int | None = None):
+        super().__init__(dimension=dimension)
+        self.latency = latency
+        self.request_count = 0
+        self.text_count = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def embed(self, texts: list[str], task: EmbeddingTask = "document") -> list[list[float]]:
+        self.request_count += 1
+        self.text_count += len(texts)
+        if self._semaphore is None:
+            await asyncio.sleep(self.latency)
+        else:
+            async with self._semaphore:
+                await asyncio.sleep(self.latency)
+        return await super().embed(texts, task)
@@ -0,0 +1,88 @@
+"""YoutubeAPIClient의 커넥션 풀 재사용 효과를 측정하는 마이크로벤치마크
+
+keep-alive를 지원하는 로컬 HTTP 서버를 띄우고, 요청마다 httpx.AsyncClient를 새로 만드는
+기존 방식(before)과 커넥션 풀을 공유하는 YoutubeAPIClient(after)의 초당 요청 수를 비교합니다.
+로컬 서버라 TLS 핸드셰이크 비용은 빠져 있으므로 실제 환경에서는 차이가 더 커집니다.
+
+    cd src && python -m benchmarks.http_transport --requests 500 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from infrastructure.api.resilience import RequestPipeline
+from infrastructure.api.youtube_api_client import YoutubeAPIClient
+
+RESPONSE_BODY = json.dumps({"items": [{"id": {"kind": "youtube#video", "videoId": "x"}}] * 50}).encode()
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            if not request:
+                break
+            keep_alive = b"connection: close" not in request.lower()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                + f"Content-Length: {len(RESPONSE_BODY)}\r\n".encode()
+                + (b"Connection: keep-alive\r\n\r\n" if keep_alive else b"Connection: close\r\n\r\n")
+                + RESPONSE_BODY
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _bench(name: str, total: int, concurrency: int, call) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one() -> None:
+        async with semaphore:
+            await call()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    print(f"{name:<28} requests={total:>6} elapsed={elapsed:7.3f}s req/s={total / elapsed:9.1f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    async def per_call_client() -> None:
+        # 기존 구현: 요청마다 클라이언트(와 커넥션)를 새로 생성
+        async with httpx.AsyncClient() as client:
+            await client.get(f"{base_url}/search", params={"key": "k", "channelId": "c"})
+
+    # 전송 계층만 비교하기 위해 키별 속도 제한은 사실상 끔
+    pipeline = RequestPipeline(rate_per_key=1e9, burst_per_key=1e9)
+    pooled = YoutubeAPIClient(base_url=base_url, max_connections=args.concurrency, pipeline=pipeline)
+
+    async def pooled_client() -> None:
+        await pooled.fetch_channel_videos(api_key="k", channel_id="c")
+
+    async with server:
+        await _bench("before: client per request", args.requests, args.concurrency, per_call_client)
+        async with pooled:
+            await _bench("after: pooled keep-alive", args.requests, args.concurrency, pooled_client)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
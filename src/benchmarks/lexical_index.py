@@ -0,0 +1,136 @@
+"""BM25 단어 색인 구축/검색 벤치마크
+
+무작위 한글 단어(Zipf 분포)로 만든 가짜 자막 청크를 디스크 색인에 추가하면서 초당 색인 청크 수와 색인 크기를 측정하고,
+세그먼트를 합치기 전과 후의 검색 p50/p95 지연 시간을 필터 유무에 따라 비교합니다.
+마지막으로 비디오 일부를 다시 색인(이전 청크 삭제)한 뒤의 검색 지연 시간도 측정합니다.
+
+    cd src && python -m benchmarks.lexical_index --chunks 1000000 --queries 200
+"""
+
+import argparse
+import asyncio
+import datetime
+import tempfile
+import time
+
+import numpy as np
+
+from application.services.chunking import make_chunk_id
+from application.services.search_service import LatencyTracker
+from domain.model.embedding import DocumentChunk
+from domain.model.search import SearchFilter
+from infrastructure.persistence.bm25_index import DiskBm25Index
+
+CHUNKS_PER_VIDEO = 20
+CHANNELS = 100
+
+
+def make_vocabulary(size: int, rng: np.random.Generator) -> list[str]:
+    syllables = rng.integers(0xAC00, 0xD7A4, size=(size, 4))
+    lengths = rng.integers(2, 5, size=size)
+    return ["".join(map(chr, row[:length])) for row, length in zip(syllables, lengths)]
+
+
+def make_video(
+    index: int, vocabulary: list[str], weights: np.ndarray, words_per_chunk: int, rng: np.random.Generator
+) -> list[DocumentChunk]:
+    video_id = f"video{index}"
+    published_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(hours=index)
+    word_ids = rng.choice(len(vocabulary), size=(CHUNKS_PER_VIDEO, words_per_chunk), p=weights)
+    return [
+        DocumentChunk(
+            chunk_id=make_chunk_id(video_id, "transcript", chunk_index),
+            video_id=video_id,
+            channel_id=f"UCchannel{index % CHANNELS}",
+            streamer_name=f"스트리머 {index % CHANNELS}",
+            source="transcript",
+            chunk_index=chunk_index,
+            text=" ".join(vocabulary[word_id] for word_id in row),
+            start_seconds=chunk_index * 60.0,
+            end_seconds=chunk_index * 60.0 + 60.0,
+            published_at=published_at,
+        )
+        for chunk_index, row in enumerate(word_ids)
+    ]
+
+
+async def measure(index: DiskBm25Index, name: str, queries: list[str], search_filter: SearchFilter | None) -> None:
+    latency = LatencyTracker(window=len(queries))
+    for query in queries:
+        started = time.perf_counter()
+        await index.search(query, limit=40, search_filter=search_filter)
+        latency.record("search", time.perf_counter() - started)
+    snapshot = latency.snapshot()["search"]
+    print(f"{name:<28} p50={snapshot['p50_ms']:7.2f}ms p95={snapshot['p95_ms']:7.2f}ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=1_000_000)
+    parser.add_argument("--vocabulary", type=int, default=50_000, help="서로 다른 단어 수")
+    parser.add_argument("--words-per-chunk", type=int, default=40)
+    parser.add_argument("--commit-every", type=int, default=200_000, help="세그먼트 하나에 들어갈 청크 수")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vocabulary = make_vocabulary(args.vocabulary, rng)
+    weights = 1 / np.arange(1, len(vocabulary) + 1)
+    weights /= weights.sum()
+    # 검색어는 너무 흔하지 않은 단어 2~3개로 구성
+    queries = [
+        " ".join(vocabulary[word_id] for word_id in rng.integers(50, 5000, size=rng.integers(2, 4)))
+        for _ in range(args.queries)
+    ]
+    channel_filter = SearchFilter(channel_id="UCchannel7")
+    period_filter = SearchFilter(
+        published_from=datetime.datetime(2024, 3, 1, tzinfo=datetime.timezone.utc),
+        published_to=datetime.datetime(2024, 6, 1, tzinfo=datetime.timezone.utc),
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = DiskBm25Index(directory)
+        videos = args.chunks // CHUNKS_PER_VIDEO
+        generation_seconds = 0.0
+        started = time.perf_counter()
+        uncommitted = 0
+        for video_index in range(videos):
+            generated = time.perf_counter()
+            chunks = make_video(video_index, vocabulary, weights, args.words_per_chunk, rng)
+            generation_seconds += time.perf_counter() - generated
+            await index.add_video(chunks[0].video_id, "hash", chunks)
+            uncommitted += len(chunks)
+            if uncommitted >= args.commit_every:
+                await index.commit()
+                uncommitted = 0
+        await index.commit()
+        elapsed = time.perf_counter() - started - generation_seconds
+        stats = await index.stats()
+        print(
+            f"build: {stats['chunks']} chunks in {elapsed:.1f}s ({stats['chunks'] / elapsed:,.0f} chunks/s), "
+            f"segments={stats['segments']} terms={stats['terms']} size={stats['size_bytes'] / 1e6:.1f}MB"
+        )
+
+        await measure(index, f"{stats['segments']} segments", queries, None)
+        await measure(index, f"{stats['segments']} segments, channel", queries, channel_filter)
+        await measure(index, f"{stats['segments']} segments, period", queries, period_filter)
+
+        started = time.perf_counter()
+        await index.merge_segments()
+        stats = await index.stats()
+        print(f"merge: {time.perf_counter() - started:.1f}s, size={stats['size_bytes'] / 1e6:.1f}MB")
+        await measure(index, "1 segment", queries, None)
+        await measure(index, "1 segment, channel", queries, channel_filter)
+        await measure(index, "1 segment, period", queries, period_filter)
+
+        # 비디오 10%를 다시 색인하면 이전 청크는 삭제 목록에 남고 새 세그먼트가 생김
+        for video_index in range(0, videos, 10):
+            chunks = make_video(video_index, vocabulary, weights, args.words_per_chunk, rng)
+            await index.add_video(chunks[0].video_id, "hash2", chunks)
+        await index.commit()
+        stats = await index.stats()
+        await measure(index, f"reindexed, {stats['deleted_chunks']} deleted", queries, None)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
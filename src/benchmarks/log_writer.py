@@ -0,0 +1,77 @@
+"""감사 로그 저장 방식별 호출 지연 벤치마크
+
+insert_one을 매번 기다리는 MongoLogRepository와 큐에 넣고 바로 반환하는 BufferedMongoLogRepository를
+왕복 지연을 주입한 가짜 컬렉션으로 비교합니다. 크롤링 경로에서 체감되는 것은 호출당 지연이므로
+log() 호출 시간과 DB 왕복 횟수를 함께 출력합니다.
+
+    cd src && python -m benchmarks.log_writer --logs 2000 --latency 0.002
+"""
+
+import argparse
+import asyncio
+import time
+
+from audit.loggers.youtube_logger import YoutubeLogEntry
+from infrastructure.persistence.mongo_repository import BufferedMongoLogRepository, MongoLogRepository
+
+
+class FakeLogCollection:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.round_trips = 0
+        self.documents: list[dict] = []
+
+    async def insert_one(self, document: dict) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        self.documents.append(document)
+
+    async def insert_many(self, documents: list[dict], ordered: bool = True) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        self.documents.extend(documents)
+
+
+class FakeLogDatabase(dict):
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def __missing__(self, collection_name: str) -> FakeLogCollection:
+        self[collection_name] = FakeLogCollection(self.latency)
+        return self[collection_name]
+
+
+async def run_once(name: str, log_repo: MongoLogRepository, logs: int, latency: float) -> None:
+    database = FakeLogDatabase(latency)
+    log_repo._db = database  # type: ignore[assignment]
+    started = time.perf_counter()
+    for index in range(logs):
+        await log_repo.save_video_raw_data_log(
+            YoutubeLogEntry(domain_id=f"UC{index % 20:04d}", level="INFO", message="비디오 원시 데이터 수집 완료")
+        )
+    call_elapsed = time.perf_counter() - started
+    if isinstance(log_repo, BufferedMongoLogRepository):
+        await log_repo.aclose()
+    total_elapsed = time.perf_counter() - started
+    stored = sum(len(collection.documents) for collection in database.values())
+    round_trips = sum(collection.round_trips for collection in database.values())
+    print(
+        f"{name:<10} stored={stored:>6} round_trips={round_trips:>6} "
+        f"per_call={call_elapsed / logs * 1e6:9.1f}us total={total_elapsed:6.2f}s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logs", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.002, help="DB 왕복 한 번당 주입할 지연 시간(초)")
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    await run_once("direct", MongoLogRepository(), args.logs, args.latency)
+    await run_once("buffered", BufferedMongoLogRepository(batch_size=args.batch_size), args.logs, args.latency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,144 @@
+"""도메인 모델 변환(from_dict/to_dict) 벤치마크
+
+MongoDB에서 읽은 것과 같은 형태의 문서(_id 포함)를 모델로 변환하는 시간과 객체당 메모리를 측정합니다.
+
+- 이전 방식: __slots__ 없는 데이터클래스 + 호출마다 fields()로 필드 이름 리스트를 만들어 키를 거르는 from_dict,
+  to_dict는 인스턴스의 __dict__를 그대로 반환
+- 현재 방식: slots 데이터클래스 + 클래스별로 캐시한 변환기(frozenset 조회, 필드 값으로 새 딕셔너리 생성)
+
+메모리는 변환한 객체 목록을 만드는 동안 tracemalloc으로 측정한 증가량을 객체 수로 나눈 값입니다.
+필드 값은 원본 문서와 공유하므로 인스턴스 자체(과 __dict__)의 크기만 포함됩니다.
+
+    cd src && python -m benchmarks.model_hydration --documents 100000
+"""
+
+import argparse
+import datetime
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import MISSING, field, fields, is_dataclass, make_dataclass
+from typing import Any
+
+from audit.loggers.youtube_logger import YoutubeLogEntry
+from domain.model.youtube import APIKey, YoutubeChannel, YoutubeVideoRawData
+from shared.utils import data_class_from_dict, data_class_to_dict
+
+
+def unslotted(cls: type) -> type:
+    """같은 필드를 가진 __slots__ 없는 데이터클래스 (이전 모델과 같은 구조)"""
+    return make_dataclass(
+        f"Legacy{cls.__name__}",
+        [
+            (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+            if f.default is not MISSING or f.default_factory is not MISSING
+            else (f.name, f.type)
+            for f in fields(cls)
+        ],
+    )
+
+
+def legacy_from_dict(cls: type, data: dict[str, Any]) -> Any:
+    if not is_dataclass(cls):
+        raise ValueError(f"{cls} is not a dataclass")
+    valid_keys = [field.name for field in fields(cls)]
+    data = {k: v for k, v in data.items() if k in valid_keys}
+    return cls(**data)
+
+
+def make_documents(cls: type, count: int) -> list[dict[str, Any]]:
+    now = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    documents = []
+    for index in range(count):
+        if cls is YoutubeChannel:
+            document = YoutubeChannel(
+                channel_name=f"채널 {index}",
+                channel_handle=f"@channel{index}",
+                channel_id=f"UC{index:022d}",
+                streamer_name=f"스트리머 {index}",
+                initialized=True,
+                created_at=now,
+                last_published_at=now,
+                uploads_playlist_id=f"UU{index:022d}",
+                last_crawled_at=now,
+            ).to_dict()
+        elif cls is YoutubeVideoRawData:
+            video_id = f"video{index:07d}"
+            document = YoutubeVideoRawData(
+                video_id=video_id,
+                channel_id=f"UC{index % 50:022d}",
+                streamer_name=f"스트리머 {index % 50}",
+                raw_data={"id": {"videoId": video_id}, "snippet": {"title": f"방송 #{index}"}},
+                created_at=now,
+                published_at=now,
+                details={"contentDetails": {"duration": "PT1H"}, "statistics": {"viewCount": str(index)}},
+                transcript_status="done",
+            ).to_dict()
+        elif cls is APIKey:
+            api_key = APIKey(api_key=f"key{index}", quota_used=index % 10_000, updated_at=now, created_at=now)
+            document = api_key.to_dict()
+        else:
+            document = YoutubeLogEntry(
+                domain_id=f"video{index:07d}",
+                level="INFO",
+                message="저장 완료",
+                details={"count": index},
+                timestamp=now,
+            ).to_dict()
+        documents.append(document | {"_id": index})
+    return documents
+
+
+def measure(
+    documents: list[dict[str, Any]], from_dict: Callable[[dict[str, Any]], Any], to_dict: Callable[[Any], dict]
+) -> tuple[float, float, float]:
+    """(객체당 from_dict 시간 ns, 객체당 메모리 bytes, 객체당 to_dict 시간 ns)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    models = [from_dict(document) for document in documents]
+    memory = (tracemalloc.get_traced_memory()[0] - before) / len(documents)
+    tracemalloc.stop()
+    del models
+
+    # 객체를 많이 만들 때 실행되는 순환 GC가 측정값을 흔들지 않도록 끄고, 세 번 중 가장 빠른 값을 사용
+    gc.disable()
+    hydrate = dump = float("inf")
+    try:
+        for _ in range(3):
+            started = time.perf_counter()
+            models = [from_dict(document) for document in documents]
+            hydrate = min(hydrate, (time.perf_counter() - started) / len(documents) * 1e9)
+            started = time.perf_counter()
+            for model in models:
+                to_dict(model)
+            dump = min(dump, (time.perf_counter() - started) / len(documents) * 1e9)
+            del models
+    finally:
+        gc.enable()
+    return hydrate, memory, dump
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'model':<22} {'method':<8} {'from_dict':>12} {'memory':>12} {'to_dict':>12}")
+    for cls in (YoutubeChannel, YoutubeVideoRawData, APIKey, YoutubeLogEntry):
+        documents = make_documents(cls, args.documents)
+        legacy = unslotted(cls)
+        results = {
+            # 이전 to_dict는 복사하지 않고 __dict__를 그대로 반환했음
+            "before": measure(
+                documents, lambda document: legacy_from_dict(legacy, document), lambda model: model.__dict__
+            ),
+            "after": measure(documents, lambda document: data_class_from_dict(cls, document), data_class_to_dict),
+        }
+        for method, (hydrate, memory, dump) in results.items():
+            print(f"{cls.__name__:<22} {method:<8} {hydrate:>9,.0f} ns {memory:>8,.0f} B/obj {dump:>9,.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
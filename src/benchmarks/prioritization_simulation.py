@@ -0,0 +1,202 @@
+"""증분 수집 채널 선택 정책 시뮬레이션
+
+채널별 업로드 기록을 시간 순서대로 재생하면서, 하루 쿼터 예산 안에서 모든 채널을 돌아가며 방문하는 방식(round_robin)과
+업로드 빈도로 계산한 우선순위(application.services.channel_priority)로 방문하는 방식(adaptive)을 비교합니다.
+시뮬레이션 기간 이전의 기록은 초기화 수집으로 이미 저장되었다고 가정하고, 1시간마다 쿼터를 나눠 씁니다.
+
+두 정책 모두 주어진 예산을 다 쓰므로 videos/quota는 기간이 끝날 때까지 수집한 비디오 수의 차이입니다.
+예산이 넉넉해 round_robin도 거의 모든 비디오를 수집하는 경우에는 차이가 작고(대신 지연 시간이 줄어듦),
+예산이 부족할수록 업로드가 잦은 채널에 방문을 몰아주는 adaptive의 효율이 높아집니다.
+채널은 업로드 수로 hot/warm/cold 3개 구간으로 나눠 구간별 채널당 하루 방문 횟수를 출력합니다.
+
+    cd src && python -m benchmarks.prioritization_simulation --channels 200 --days 14 --daily-budget 1000 2000 5000
+    cd src && python -m benchmarks.prioritization_simulation --history uploads.json --days 30
+
+--history 파일은 {"채널 ID": ["2024-01-01T00:00:00Z", ...]} 형식의 JSON입니다.
+"""
+
+import argparse
+import bisect
+import datetime
+import json
+import math
+import random
+from dataclasses import dataclass, field
+
+from application.services.channel_priority import prioritize_channels
+from domain.model.youtube import ChannelUploadStats, YoutubeChannel
+from shared.utils import YOUTUBE_QUOTA_COSTS, YOUTUBE_VIDEOS_PER_REQUEST, parse_youtube_datetime
+
+TICK = datetime.timedelta(hours=1)
+TIERS = ("hot", "warm", "cold")
+
+
+@dataclass
+class SimulationResult:
+    policy: str
+    published: int = 0
+    captured: int = 0
+    quota_used: int = 0
+    visits: int = 0
+    latency_hours: float = 0.0
+    visits_by_tier: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TIERS, 0))
+
+    def print(self, tier_sizes: dict[str, int], days: float) -> None:
+        videos_per_quota = self.captured / self.quota_used if self.quota_used else 0.0
+        mean_latency = self.latency_hours / self.captured if self.captured else 0.0
+        # 구간별 채널 하나의 하루 평균 방문 횟수
+        visit_rates = "/".join(f"{self.visits_by_tier[tier] / max(tier_sizes[tier], 1) / days:.2f}" for tier in TIERS)
+        print(
+            f"{self.policy:<12} captured={self.captured:>6}/{self.published:<6} visits={self.visits:>6} "
+            f"quota={self.quota_used:>8} videos/quota={videos_per_quota:8.4f} mean_latency={mean_latency:7.1f}h "
+            f"visits/day(hot/warm/cold)={visit_rates}"
+        )
+
+
+def generate_history(
+    channels: int, start: datetime.datetime, end: datetime.datetime, seed: int
+) -> dict[str, list[datetime.datetime]]:
+    """하루 1/60개부터 4개까지 로그 균등 분포의 업로드 빈도를 가진 채널들의 포아송 업로드 기록을 만듭니다."""
+    rng = random.Random(seed)
+    history = {}
+    for index in range(channels):
+        rate_per_day = math.exp(rng.uniform(math.log(1 / 60), math.log(4)))
+        uploads = []
+        current = start
+        while True:
+            current += datetime.timedelta(days=rng.expovariate(rate_per_day))
+            if current >= end:
+                break
+            uploads.append(current)
+        history[f"UC{index:04d}"] = uploads
+    return history
+
+
+def load_history(path: str) -> dict[str, list[datetime.datetime]]:
+    with open(path, encoding="utf-8") as file:
+        raw_history = json.load(file)
+    history = {}
+    for channel_id, published_times in raw_history.items():
+        parsed = (parse_youtube_datetime(value) for value in published_times)
+        history[channel_id] = sorted(value for value in parsed if value is not None)
+    return history
+
+
+def assign_tiers(history: dict[str, list[datetime.datetime]]) -> dict[str, str]:
+    """업로드 수 순서로 채널을 hot/warm/cold 3개 구간에 같은 수만큼 나눕니다."""
+    ranked = sorted(history, key=lambda channel_id: len(history[channel_id]), reverse=True)
+    return {
+        channel_id: TIERS[min(index * len(TIERS) // len(ranked), len(TIERS) - 1)]
+        for index, channel_id in enumerate(ranked)
+    }
+
+
+def simulate(
+    policy: str,
+    history: dict[str, list[datetime.datetime]],
+    tiers: dict[str, str],
+    start: datetime.datetime,
+    end: datetime.datetime,
+    daily_budget: int,
+    lookback: datetime.timedelta,
+    request_cost: int,
+    min_expected_videos: float,
+) -> SimulationResult:
+    result = SimulationResult(policy=policy)
+    channels = [
+        YoutubeChannel(
+            channel_name=channel_id,
+            channel_handle=channel_id,
+            channel_id=channel_id,
+            streamer_name=channel_id,
+            initialized=True,
+            created_at=start - lookback,
+            last_crawled_at=start,
+        )
+        for channel_id in history
+    ]
+    # 채널별로 이미 수집한 비디오 수 (업로드 기록에서 이 위치까지가 저장된 비디오)
+    captured_index = {channel_id: bisect.bisect_right(uploads, start) for channel_id, uploads in history.items()}
+    result.published = sum(len(uploads) - captured_index[channel_id] for channel_id, uploads in history.items())
+    round_robin_position = 0
+    remaining = 0.0
+    now = start
+
+    def visit(channel: YoutubeChannel) -> None:
+        uploads = history[channel.channel_id]
+        new_index = bisect.bisect_right(uploads, now)
+        new_uploads = uploads[captured_index[channel.channel_id] : new_index]
+        captured_index[channel.channel_id] = new_index
+        channel.last_crawled_at = now
+        cost = request_cost * max(1, math.ceil(len(new_uploads) / YOUTUBE_VIDEOS_PER_REQUEST))
+        nonlocal remaining
+        remaining -= cost
+        result.quota_used += cost
+        result.visits += 1
+        result.visits_by_tier[tiers[channel.channel_id]] += 1
+        result.captured += len(new_uploads)
+        result.latency_hours += sum((now - published_at).total_seconds() / 3600 for published_at in new_uploads)
+
+    while now < end:
+        now += TICK
+        # 남은 예산은 다음 시간으로 넘겨 하루 동안 고르게 씀
+        remaining += daily_budget * TICK / datetime.timedelta(days=1)
+        if policy == "round_robin":
+            while remaining >= request_cost:
+                visit(channels[round_robin_position % len(channels)])
+                round_robin_position += 1
+        else:
+            upload_stats = []
+            for channel_id, uploads in history.items():
+                known = uploads[bisect.bisect_left(uploads, now - lookback) : captured_index[channel_id]]
+                if known:
+                    upload_stats.append(ChannelUploadStats(channel_id, len(known), known[0], known[-1]))
+            by_id = {channel.channel_id: channel for channel in channels}
+            for priority in prioritize_channels(
+                channels,
+                upload_stats,
+                now,
+                lookback,
+                request_cost,
+                quota_budget=int(remaining),
+                min_expected_videos=min_expected_videos,
+            ):
+                visit(by_id[priority.channel_id])
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", help="채널별 업로드 시각 JSON 파일 (지정하지 않으면 합성 데이터 사용)")
+    parser.add_argument("--channels", type=int, default=200, help="합성 데이터의 채널 수")
+    parser.add_argument("--days", type=int, default=14, help="재생할 기간(일), 기록의 마지막 N일")
+    parser.add_argument("--lookback-days", type=int, default=90, help="업로드 빈도를 추정할 기간(일)")
+    parser.add_argument("--daily-budget", type=int, nargs="+", default=[1000, 2000, 5000], help="하루 쿼터 예산")
+    parser.add_argument("--mode", choices=["search", "playlist"], default="search")
+    parser.add_argument("--min-expected", type=float, default=0.5, help="adaptive가 방문하는 최소 예상 신규 비디오 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    lookback = datetime.timedelta(days=args.lookback_days)
+    if args.history:
+        history = load_history(args.history)
+        end = max(uploads[-1] for uploads in history.values() if uploads)
+    else:
+        end = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        history = generate_history(args.channels, end - lookback - datetime.timedelta(days=args.days), end, args.seed)
+    start = end - datetime.timedelta(days=args.days)
+    request_cost = YOUTUBE_QUOTA_COSTS["playlistItems" if args.mode == "playlist" else "search"]
+
+    tiers = assign_tiers(history)
+    tier_sizes = {tier: list(tiers.values()).count(tier) for tier in TIERS}
+    for daily_budget in args.daily_budget:
+        print(f"channels={len(history)} days={args.days} daily_budget={daily_budget} mode={args.mode}")
+        for policy in ("round_robin", "adaptive"):
+            result = simulate(
+                policy, history, tiers, start, end, daily_budget, lookback, request_cost, args.min_expected
+            )
+            result.print(tier_sizes, args.days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""raw_data 내보내기 벤치마크
+
+가짜 비디오 원시 데이터(search 결과 항목 + videos.list 상세 정보)를 형식별로 내보내며 초당 행 수와 파일 크기를 측정하고,
+채널별 조회수 합계를 구하는 분석 작업을 두 가지 방식으로 비교합니다.
+
+- from_dict: 지금처럼 문서를 모두 YoutubeVideoRawData로 변환한 뒤 계산
+- 내보낸 파일: 필요한 열(channel_id, view_count)만 메모리 맵으로 읽어 계산
+
+MongoDB 대신 인메모리 저장소를 사용하므로 네트워크 전송 시간은 포함되지 않습니다.
+
+    cd src && python -m benchmarks.raw_data_export --videos 100000
+"""
+
+import argparse
+import asyncio
+import datetime
+import tempfile
+import time
+from collections import defaultdict
+
+from application.services.raw_data_export_service import RawDataExportService
+from benchmarks.fakes import InMemoryYoutubeRepository
+from domain.model.youtube import YoutubeVideoRawData
+from infrastructure.persistence.raw_data_export import PYARROW_AVAILABLE, ArrowExportStore, JsonlExportStore
+
+CHANNELS = 50
+
+
+def make_repo(videos: int) -> InMemoryYoutubeRepository:
+    repo = InMemoryYoutubeRepository()
+    created_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    for index in range(videos):
+        video_id = f"video{index:07d}"
+        channel_id = f"UCchannel{index % CHANNELS:02d}"
+        published_at = created_at + datetime.timedelta(minutes=10 * index)
+        snippet = {
+            "publishedAt": published_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "channelId": channel_id,
+            "title": f"[{index % 97}번째 방송] 오늘의 게임 하이라이트 모음 #{index}",
+            "description": "방송 다시보기와 하이라이트를 올립니다. 구독과 좋아요 부탁드려요! " * 4,
+            "thumbnails": {
+                size: {"url": f"https://i.ytimg.com/vi/{video_id}/{size}.jpg", "width": 480, "height": 360}
+                for size in ("default", "medium", "high")
+            },
+            "channelTitle": f"채널 {index % CHANNELS}",
+            "liveBroadcastContent": "none",
+        }
+        repo.raw_data[video_id] = YoutubeVideoRawData(
+            video_id=video_id,
+            channel_id=channel_id,
+            streamer_name=f"스트리머 {index % CHANNELS}",
+            raw_data={
+                "kind": "youtube#searchResult",
+                "id": {"kind": "youtube#video", "videoId": video_id},
+                "snippet": snippet,
+            },
+            created_at=created_at + datetime.timedelta(seconds=index),
+            published_at=published_at,
+            details={
+                "id": video_id,
+                "snippet": snippet,
+                "contentDetails": {"duration": f"PT{index % 5 + 1}H{index % 60}M", "definition": "hd"},
+                "statistics": {"viewCount": str(index * 7 % 100_000), "likeCount": str(index % 1000)},
+            },
+            transcript_status="done",
+        )
+    return repo
+
+
+def views_with_from_dict(documents: list[dict]) -> dict[str, int]:
+    totals: dict[str, int] = defaultdict(int)
+    for document in documents:
+        raw_data = YoutubeVideoRawData.from_dict(document)
+        totals[raw_data.channel_id] += int((raw_data.details or {}).get("statistics", {}).get("viewCount", 0))
+    return totals
+
+
+def views_from_export(store: ArrowExportStore | JsonlExportStore) -> dict[str, int]:
+    totals: dict[str, int] = defaultdict(int)
+    if isinstance(store, ArrowExportStore):
+        table = store.read_table(columns=["channel_id", "view_count"])
+        for row in table.group_by("channel_id").aggregate([("view_count", "sum")]).to_pylist():
+            totals[row["channel_id"]] = row["view_count_sum"]
+        return totals
+    for row in store.iter_rows(columns=["channel_id", "view_count"]):
+        totals[row["channel_id"]] += row["view_count"] or 0
+    return totals
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=100_000)
+    args = parser.parse_args()
+
+    repo = make_repo(args.videos)
+    now = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+    # MongoDB에서 읽은 문서와 같은 형태의 딕셔너리
+    documents = [raw_data.to_dict() | {"_id": index} for index, raw_data in enumerate(repo.raw_data.values())]
+    started = time.perf_counter()
+    expected = views_with_from_dict(documents)
+    print(f"{'from_dict':<28} views by channel in {time.perf_counter() - started:.2f}s")
+
+    formats = ["parquet", "arrow", "jsonl"] if PYARROW_AVAILABLE else ["jsonl"]
+    for file_format in formats:
+        for include_raw in (True, False):
+            with tempfile.TemporaryDirectory() as directory:
+                store: ArrowExportStore | JsonlExportStore = (
+                    JsonlExportStore(directory) if file_format == "jsonl" else ArrowExportStore(directory, file_format)
+                )
+                service = RawDataExportService(repo, store, include_raw=include_raw)
+                report = await service.export(now=now)
+                label = f"{file_format}{'' if include_raw else ' (no raw)'}"
+                started = time.perf_counter()
+                totals = views_from_export(store)
+                elapsed = time.perf_counter() - started
+                assert totals == expected
+                print(
+                    f"{label:<28} export {report.rows_per_second:>9,.0f} rows/s "
+                    f"size={report.bytes_written / 1e6:6.1f}MB shards={report.shards_written} "
+                    f"views by channel in {elapsed:.2f}s"
+                )
+                # 증분 내보내기: 새로 저장된 비디오가 없으면 아무것도 쓰지 않음
+                report = await service.export(now=now)
+                assert report.rows_exported == 0
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
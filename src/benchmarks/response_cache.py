@@ -0,0 +1,97 @@
+"""YouTube API 응답 캐시(TTL + LRU, ETag 조건부 요청)의 효과를 측정하는 벤치마크
+
+httpx.MockTransport로 ETag를 지원하는 가짜 API를 띄우고 두 가지 요청 패턴을 캐시 없이(before)와
+캐시를 켜고(after) 실행해 HTTP 요청 수, 실제 사용한 쿼터, 캐시 적중률을 비교합니다.
+
+- 채널 등록: 일부 핸들이 반복되는 채널 등록 요청 (channels.list forHandle)
+- 증분 수집: 변경이 없는 업로드 재생목록 첫 페이지를 여러 번 조회 (playlistItems.list).
+  TTL을 0으로 두어 매번 If-None-Match 조건부 요청(304)이 나가도록 합니다.
+
+    cd src && python -m benchmarks.response_cache --channels 200 --repeat 3
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+
+import httpx
+
+from application.services.crawl_engine import CrawlEngine
+from application.services.youtube_service import ChannelCreateService, RawDataCrawlService
+from benchmarks.fakes import InMemoryAPIKeyRepository, InMemoryYoutubeRepository, NullLogRepository
+from domain.model.youtube import APIKey
+from infrastructure.api.resilience import RequestPipeline
+from infrastructure.api.response_cache import ResponseCache
+from infrastructure.api.youtube_api_client import YoutubeAPIClient
+
+
+class FakeYoutubeServer:
+    def __init__(self):
+        self.requests = 0
+        self.not_modified = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        params = request.url.params
+        if request.url.path.endswith("/channels"):
+            body = {"items": [{"id": "UC" + hashlib.md5(params["forHandle"].encode()).hexdigest()[:22]}]}
+        else:
+            body = {"items": [{"contentDetails": {"videoId": f"{params['playlistId']}-{i}"}} for i in range(50)]}
+        etag = hashlib.md5(json.dumps(body, sort_keys=True).encode()).hexdigest()
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json={**body, "etag": etag}, headers={"ETag": etag})
+
+
+async def run(name: str, cache: ResponseCache | None, args: argparse.Namespace) -> None:
+    server = FakeYoutubeServer()
+    api_key_repo = InMemoryAPIKeyRepository([APIKey(api_key="key-0")])
+    client = YoutubeAPIClient(
+        base_url="https://youtube.test/v3",
+        transport=httpx.MockTransport(server.handle),
+        pipeline=RequestPipeline(rate_per_key=1e9, burst_per_key=1e9),
+        cache=cache,
+    )
+    channel_service = ChannelCreateService(InMemoryYoutubeRepository(), api_key_repo, client)
+    crawl_service = RawDataCrawlService(
+        InMemoryYoutubeRepository(), api_key_repo, client, NullLogRepository(), CrawlEngine()
+    )
+
+    rng = random.Random(args.seed)
+    handles = [f"@channel{i}" for i in range(args.channels)]
+    # 등록 요청의 절반은 이미 등록을 시도한 핸들을 다시 보냄 (중복 제출, 재시도 등)
+    submissions = handles + [rng.choice(handles) for _ in range(args.channels)]
+    async with client:
+        for handle in submissions:
+            await channel_service.insert_channel(handle, handle, handle)
+        for _ in range(args.repeat):
+            for i in range(args.channels):
+                await crawl_service._request(
+                    "playlistItems", lambda key, i=i: client.fetch_playlist_items(f"UU{i}", key)
+                )
+
+    quota_used = sum(api_key.quota_used for api_key in api_key_repo.api_keys.values())
+    line = f"{name:<10} http_requests={server.requests:>5} not_modified={server.not_modified:>5}"
+    line += f" quota_used={quota_used:>5}"
+    if cache is not None:
+        metrics = cache.metrics
+        line += f" hit_ratio={metrics.hit_ratio:6.1%} quota_saved={metrics.quota_saved:>5}"
+    print(line)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--channels", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3, help="증분 수집 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    await run("before", None, args)
+    await run("after", ResponseCache(ttl_by_endpoint={"channels": 7 * 24 * 3600, "playlistItems": 0}), args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
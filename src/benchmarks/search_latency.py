@@ -0,0 +1,82 @@
+"""검색 API 지연 시간 벤치마크
+
+가짜 비디오를 인메모리 Qdrant에 적재한 뒤, 여러 클라이언트가 동시에 검색하는 상황에서 검색어 임베딩 LRU와
+배치 여부에 따른 임베딩 요청 수와 p50/p95 지연 시간을 비교합니다. 임베딩 API는 요청마다 지연이 있고
+동시에 처리하는 요청 수가 제한되어 있다고 가정하며, 검색어는 자주 쓰이는 검색어가 몰리도록(Zipf) 뽑습니다.
+인메모리 Qdrant는 페이로드 인덱스 없이 필터를 처리해 느리므로 필터 없이 검색합니다.
+
+    cd src && python -m benchmarks.search_latency --clients 32 --requests 20 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import random
+import warnings
+
+from qdrant_client import AsyncQdrantClient
+
+from application.services.embedding_service import EmbeddingIngestionService
+from application.services.search_service import SearchService
+from benchmarks.embedding_ingestion import WORDS, make_repo
+from benchmarks.fakes import FakeEmbedder, InMemoryEmbeddingStateRepository
+from infrastructure.persistence.qdrant_repository import QdrantVectorRepository
+
+CONFIGS = {
+    "baseline": {"query_cache_size": 0, "batch_max_size": 1},
+    "lru": {"query_cache_size": 1024, "batch_max_size": 1},
+    "batching": {"query_cache_size": 0, "batch_max_size": 16},
+    "lru + batching": {"query_cache_size": 1024, "batch_max_size": 16},
+}
+
+
+def make_queries(count: int, rng: random.Random) -> list[str]:
+    return [" ".join(rng.sample(WORDS, 3)) for _ in range(count)]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=32, help="동시에 검색하는 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=20, help="클라이언트 하나가 보내는 검색 요청 수")
+    parser.add_argument("--distinct-queries", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05, help="초, 임베딩 요청 하나의 지연 시간")
+    parser.add_argument("--api-concurrency", type=int, default=4, help="임베딩 API가 동시에 처리하는 요청 수")
+    args = parser.parse_args()
+    # 인메모리 Qdrant는 페이로드 인덱스를 지원하지 않는다는 경고를 출력함
+    warnings.filterwarnings("ignore", message="Payload indexes have no effect")
+
+    client = AsyncQdrantClient(location=":memory:")
+    vector_repo = QdrantVectorRepository(client)
+    await EmbeddingIngestionService(
+        make_repo(args.videos, 600), InMemoryEmbeddingStateRepository(), vector_repo, FakeEmbedder()
+    ).ingest()
+
+    rng = random.Random(0)
+    queries = make_queries(args.distinct_queries, rng)
+    weights = [1 / rank for rank in range(1, len(queries) + 1)]
+    workload = [rng.choices(queries, weights, k=args.requests) for _ in range(args.clients)]
+
+    for name, config in CONFIGS.items():
+        embedder = FakeEmbedder(latency=args.latency, max_concurrency=args.api_concurrency)
+        service = SearchService(embedder, vector_repo, **config)
+
+        async def _client(client_queries: list[str]) -> None:
+            for query in client_queries:
+                await service.search(query, limit=10)
+
+        async with asyncio.TaskGroup() as task_group:
+            for client_queries in workload:
+                task_group.create_task(_client(client_queries))
+        metrics = service.metrics()
+        latency = metrics["latency"]
+        print(
+            f"{name:<16} embed_requests={embedder.request_count:>5} "
+            f"cache_hit_ratio={metrics['query_cache_hit_ratio']:.2f} "
+            f"embed p50={latency['embed']['p50_ms']:7.1f}ms p95={latency['embed']['p95_ms']:7.1f}ms "
+            f"total p50={latency['total']['p50_ms']:7.1f}ms p95={latency['total']['p95_ms']:7.1f}ms"
+        )
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
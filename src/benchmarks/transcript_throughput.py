@@ -0,0 +1,69 @@
+"""RawDataCrawlService.crawl_transcripts 처리량 벤치마크
+
+가짜 자막 수집기(블로킹 지연, 자막 없음/일시적 오류 비율 주입)와 인메모리 리포지토리로
+스레드 워커 수에 따른 videos/sec와 재시도 횟수를 측정합니다.
+
+    cd src && python -m benchmarks.transcript_throughput --videos 500 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import datetime
+
+from application.services.youtube_service import RawDataCrawlService
+from benchmarks.fakes import (
+    FakeTranscriptClient,
+    FakeYoutubeApiAdapter,
+    InMemoryAPIKeyRepository,
+    InMemoryYoutubeRepository,
+    NullLogRepository,
+)
+from domain.model.youtube import YoutubeVideoRawData
+
+
+async def run_once(videos: int, latency: float, concurrency: int, unavailable_rate: float, error_rate: float) -> None:
+    youtube_repo = InMemoryYoutubeRepository()
+    await youtube_repo.bulk_save_raw_data(
+        [
+            YoutubeVideoRawData(
+                video_id=f"video-{index}",
+                channel_id="UC0000",
+                streamer_name="streamer",
+                raw_data={},
+                created_at=datetime.datetime.now(datetime.timezone.utc),
+            )
+            for index in range(videos)
+        ]
+    )
+    transcript_client = FakeTranscriptClient(latency=latency, unavailable_rate=unavailable_rate, error_rate=error_rate)
+    service = RawDataCrawlService(
+        youtube_repo,
+        InMemoryAPIKeyRepository(),
+        FakeYoutubeApiAdapter(),
+        NullLogRepository(),
+        transcript_client=transcript_client,
+    )
+    report = await service.crawl_transcripts(concurrency=concurrency, backoff_seconds=0.01)
+    print(
+        f"concurrency={concurrency:>3} saved={report.saved_count:>5} unavailable={report.unavailable_count:>4} "
+        f"failed={report.failed_count:>4} retries={report.retry_count:>4} "
+        f"requests={transcript_client.request_count:>5} elapsed={report.elapsed_seconds:6.2f}s "
+        f"videos/s={report.videos_per_second:8.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05, help="자막 요청 하나당 블로킹 지연 시간(초)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--unavailable-rate", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        await run_once(args.videos, args.latency, concurrency, args.unavailable_rate, args.error_rate)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
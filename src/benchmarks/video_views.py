@@ -0,0 +1,132 @@
+"""비디오 목록 조회 방식별 메모리/시간 벤치마크
+
+MongoDB 서버 대신 BSON으로 인코딩한 문서(커서가 받는 바이트)를 준비해 두고, 비디오 ID와 게시 시각만 필요한
+작업(채널별 최근 게시 시각 계산)을 세 가지 방식으로 실행합니다.
+
+- 리스트: 문서를 모두 딕셔너리로 디코딩해 YoutubeVideoRawData 리스트로 모은 뒤 계산
+- 스트리밍 뷰: RawBSONDocument를 YoutubeVideoView로 감싸 하나씩 처리. raw_data, details는 디코딩하지 않음
+- 스트리밍 뷰 + projection: 서버가 필요한 필드만 보낸 경우 (해당 필드만 인코딩한 문서)
+
+메모리는 준비한 바이트를 제외하고 tracemalloc으로 측정한 최대 증가량입니다.
+
+    cd src && python -m benchmarks.video_views --videos 100000
+"""
+
+import argparse
+import datetime
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+from domain.model.youtube import YoutubeVideoRawData, YoutubeVideoView
+
+FIELDS = frozenset({"video_id", "channel_id", "published_at"})
+CODEC_OPTIONS = CodecOptions()
+RAW_CODEC_OPTIONS = CODEC_OPTIONS.with_options(document_class=RawBSONDocument)
+
+
+def make_documents(videos: int, fields: frozenset[str] | None = None) -> list[bytes]:
+    created_at = datetime.datetime(2024, 1, 1)
+    documents = []
+    for index in range(videos):
+        video_id = f"video{index:07d}"
+        published_at = created_at + datetime.timedelta(minutes=10 * index)
+        snippet = {
+            "publishedAt": published_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "channelId": f"UCchannel{index % 50:02d}",
+            "title": f"[{index % 97}번째 방송] 오늘의 게임 하이라이트 모음 #{index}",
+            "description": "방송 다시보기와 하이라이트를 올립니다. 구독과 좋아요 부탁드려요! " * 4,
+            "thumbnails": {
+                size: {"url": f"https://i.ytimg.com/vi/{video_id}/{size}.jpg", "width": 480, "height": 360}
+                for size in ("default", "medium", "high")
+            },
+        }
+        document = {
+            "_id": bson.ObjectId(),
+            "video_id": video_id,
+            "channel_id": f"UCchannel{index % 50:02d}",
+            "streamer_name": f"스트리머 {index % 50}",
+            "raw_data": {"kind": "youtube#searchResult", "id": {"videoId": video_id}, "snippet": snippet},
+            "created_at": created_at,
+            "published_at": published_at,
+            "details": {"snippet": snippet, "statistics": {"viewCount": str(index)}},
+            "transcript_status": "done",
+            "transcript_attempts": 1,
+        }
+        if fields is not None:
+            document = {name: document[name] for name in fields}
+        documents.append(bson.encode(document))
+    return documents
+
+
+def latest_from_list(documents: list[bytes]) -> dict[str, datetime.datetime]:
+    videos = [YoutubeVideoRawData.from_dict(bson.decode(document, CODEC_OPTIONS)) for document in documents]
+    latest: dict[str, datetime.datetime] = {}
+    for video in videos:
+        if video.published_at is not None and video.published_at > latest.get(video.channel_id, datetime.datetime.min):
+            latest[video.channel_id] = video.published_at
+    return latest
+
+
+def decode(value: RawBSONDocument) -> dict:
+    return bson.decode(value.raw, CODEC_OPTIONS)
+
+
+def iter_views(documents: list[bytes], fields: frozenset[str] | None) -> Iterator[YoutubeVideoView]:
+    for document in documents:
+        yield YoutubeVideoView(RawBSONDocument(document, RAW_CODEC_OPTIONS), fields, decode=decode)
+
+
+def latest_from_views(views: Iterator[YoutubeVideoView]) -> dict[str, datetime.datetime]:
+    latest: dict[str, datetime.datetime] = {}
+    for view in views:
+        if view.published_at is not None and view.published_at > latest.get(view.channel_id, datetime.datetime.min):
+            latest[view.channel_id] = view.published_at
+    return latest
+
+
+def measure(run: Callable[[], dict]) -> tuple[dict, float, float]:
+    """(결과, 실행 시간, 최대 메모리 증가량). tracemalloc이 실행을 느리게 하므로 시간은 따로 측정"""
+    gc.collect()
+    started = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--videos", type=int, default=100_000)
+    args = parser.parse_args()
+
+    documents = make_documents(args.videos)
+    print(f"videos={args.videos} bson={sum(map(len, documents)) / 1e6:.1f}MB")
+    expected, elapsed, peak = measure(lambda: latest_from_list(documents))
+    print(f"{'list':<26} elapsed={elapsed:6.2f}s peak={peak / 1e3:9,.0f}KB")
+    result, elapsed, peak = measure(lambda: latest_from_views(iter_views(documents, None)))
+    assert result == expected
+    print(f"{'streaming view':<26} elapsed={elapsed:6.2f}s peak={peak / 1e3:9,.0f}KB")
+    del documents
+
+    documents = make_documents(args.videos, FIELDS)
+    result, elapsed, peak = measure(lambda: latest_from_views(iter_views(documents, FIELDS)))
+    assert result == expected
+    print(
+        f"{'streaming view+projection':<26} elapsed={elapsed:6.2f}s peak={peak / 1e3:9,.0f}KB "
+        f"bson={sum(map(len, documents)) / 1e6:.1f}MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -32,3 +32,30 @@ if st.button("크롤링 작업 시작 (API 호출)"):
 
     except requests.exceptions.ConnectionError:
         st.error("⚠️ FastAPI 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
+
+# 여러 채널 한 번에 등록 (CSV 또는 JSON 파일)
+st.header("채널 일괄 등록")
+st.caption("CSV 헤더: channel_handle, channel_name, streamer_name (channel_handle 대신 channel_id나 채널 URL도 가능)")
+uploaded_file = st.file_uploader("채널 목록 파일", type=["csv", "json"])
+
+if uploaded_file is not None and st.button("채널 일괄 등록 (API 호출)"):
+    IMPORT_API_URL = "http://localhost:8000/youtube/channels/import/"
+    try:
+        response = requests.post(
+            IMPORT_API_URL,
+            files={"file": (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)},
+        )
+        if response.status_code == 200:
+            report = response.json()
+            st.success(
+                f"✅ {report['total']}개 중 새로 등록 {report['inserted_count']}개, 갱신 {report['updated_count']}개"
+            )
+            if report["failed"]:
+                st.warning(f"조회에 실패한 채널 {len(report['failed'])}개")
+            st.json(report)
+        else:
+            st.error(f"❌ API 호출 실패. 상태 코드: {response.status_code}")
+            st.json(response.json())
+
+    except requests.exceptions.ConnectionError:
+        st.error("⚠️ FastAPI 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
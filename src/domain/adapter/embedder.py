@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Literal
+
+EmbeddingTask = Literal["document", "query"]
+
+
+class Embedder(ABC):
+    """텍스트를 벡터로 변환하는 임베딩 모델 어댑터"""
+
+    @property
+    @abstractmethod
+    def model_id(self) -> str:
+        """임베딩 모델 식별자 (모델이 바뀌면 다시 임베딩하는 기준)"""
+        pass
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """임베딩 벡터의 차원"""
+        pass
+
+    @abstractmethod
+    async def embed(self, texts: list[str], task: EmbeddingTask = "document") -> list[list[float]]:
+        """텍스트 목록을 한 번의 요청으로 임베딩합니다.
+
+        Args:
+            texts (list[str]): 임베딩할 텍스트 목록
+            task (EmbeddingTask, optional): 저장할 문서("document")인지 검색어("query")인지. Defaults to "document".
+
+        Returns:
+            list[list[float]]: 입력 순서대로의 임베딩 벡터 목록
+        """
+        pass
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+
+from domain.model.youtube import YoutubeTranscript
+
+
+class TranscriptUnavailableError(Exception):
+    """자막이 없거나 비활성화되어 다시 시도해도 가져올 수 없는 경우의 예외 클래스
+
+    Args:
+        Exception (_type_): _description_
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return f"TranscriptUnavailableError: {self.message}"
+
+
+class TranscriptAdapter(ABC):
+    @abstractmethod
+    def fetch_transcript(self, video_id: str, languages: list[str]) -> YoutubeTranscript:
+        """동영상 자막을 가져옵니다.
+
+        동기(블로킹) 메서드이므로 비동기 코드에서는 스레드로 넘겨서 호출해야 합니다.
+
+        Args:
+            video_id (str): YouTube 동영상 ID
+            languages (list[str]): 우선순위 순서의 자막 언어 코드 목록
+
+        Raises:
+            TranscriptUnavailableError: 자막이 없거나 비활성화된 경우 (재시도 불필요)
+            Exception: 네트워크 오류, 요청 차단 등 일시적인 오류 (재시도 가능)
+
+        Returns:
+            YoutubeTranscript: 자막 데이터
+        """
+        pass
@@ -1,7 +1,38 @@
 from abc import ABC, abstractmethod
 
 
+class YoutubeApiError(Exception):
+    """YouTube API가 오류 응답을 돌려줬거나 요청을 보내지 못한 경우의 예외 클래스
+
+    Args:
+        Exception (_type_): _description_
+    """
+
+    def __init__(self, message: str, status_code: int | None = None, reason: str | None = None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.reason = reason
+
+    def __str__(self):
+        return f"YoutubeApiError: {self.message}"
+
+
+class YoutubeQuotaExceededError(YoutubeApiError):
+    """API 키의 일일 쿼터가 소진된 경우(403 quotaExceeded)의 예외 클래스. 다른 키로 다시 요청해야 합니다."""
+
+    def __str__(self):
+        return f"YoutubeQuotaExceededError: {self.message}"
+
+
 class YoutubeApiAdapter(ABC):
+    def served_from_cache(self) -> bool:
+        """현재 작업에서 마지막으로 보낸 요청이 API를 호출하지 않고 캐시로 응답되었는지 여부
+
+        캐시로 응답된 요청은 쿼터를 사용하지 않으므로, 미리 예약한 쿼터를 돌려주는 데 사용합니다.
+        """
+        return False
+
     @abstractmethod
     async def fetch_channel_id(self, handle: str, api_key: str) -> str | None:
         """YouTube 채널 ID를 가져옵니다.
@@ -15,6 +46,32 @@ class YoutubeApiAdapter(ABC):
         """
         pass
 
+    @abstractmethod
+    async def fetch_channel_by_handle(self, handle: str, api_key: str) -> dict | None:
+        """핸들로 채널 정보(snippet, contentDetails)를 가져옵니다. (channels.list forHandle, 1 유닛)
+
+        Args:
+            handle (str): YouTube 채널 핸들
+            api_key (str): YouTube API 키
+
+        Returns:
+            dict | None: 채널 항목 또는 채널이 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    async def fetch_channels(self, channel_ids: list[str], api_key: str) -> dict | None:
+        """채널 정보(snippet, contentDetails)를 최대 50개씩 한 번에 가져옵니다. (channels.list id, 1 유닛)
+
+        Args:
+            channel_ids (list[str]): 조회할 채널 ID 목록 (최대 50개)
+            api_key (str): YouTube API 키
+
+        Returns:
+            dict | None: 채널 목록
+        """
+        pass
+
     @abstractmethod
     async def fetch_channel_videos(
         self,
@@ -37,3 +94,48 @@ class YoutubeApiAdapter(ABC):
             dict | None: 동영상 목록 또는 None
         """
         pass
+
+    @abstractmethod
+    async def fetch_uploads_playlist_id(self, channel_id: str, api_key: str) -> str | None:
+        """채널의 업로드 재생목록 ID를 가져옵니다. (channels.list contentDetails, 1 유닛)
+
+        Args:
+            channel_id (str): YouTube 채널 ID
+            api_key (str): YouTube API 키
+
+        Returns:
+            str | None: 업로드 재생목록 ID 또는 None
+        """
+        pass
+
+    @abstractmethod
+    async def fetch_playlist_items(
+        self,
+        playlist_id: str,
+        api_key: str,
+        page_token: str | None = None,
+    ) -> dict | None:
+        """재생목록의 동영상 목록을 가져옵니다. (playlistItems.list, 1 유닛)
+
+        Args:
+            playlist_id (str): YouTube 재생목록 ID
+            api_key (str): YouTube API 키
+            page_token (str | None, optional): 다음 페이지 토큰. Defaults to None.
+
+        Returns:
+            dict | None: 재생목록 항목 목록 또는 None
+        """
+        pass
+
+    @abstractmethod
+    async def fetch_videos(self, video_ids: list[str], api_key: str) -> dict | None:
+        """동영상 상세 정보를 최대 50개씩 한 번에 가져옵니다. (videos.list, 1 유닛)
+
+        Args:
+            video_ids (list[str]): 조회할 동영상 ID 목록 (최대 50개)
+            api_key (str): YouTube API 키
+
+        Returns:
+            dict | None: 동영상 상세 정보 목록 (snippet, contentDetails, statistics) 또는 None
+        """
+        pass
@@ -0,0 +1,32 @@
+import datetime
+from dataclasses import dataclass, field
+from typing import Any
+
+from shared.utils import as_utc, data_class_from_dict, data_class_to_dict
+
+
+@dataclass(slots=True)
+class ApiResponseCacheEntry:
+    """캐시된 YouTube API 응답
+
+    expires_at 전까지는 요청 없이 그대로 사용하고, 그 이후에는 etag로 조건부 요청(If-None-Match)을 보내
+    304 응답이면 본문을 재사용합니다.
+    """
+
+    cache_key: str  # 엔드포인트와 API 키를 제외한 요청 파라미터로 만든 키
+    endpoint: str
+    body: dict[str, Any]
+    etag: str | None = None
+    cached_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    expires_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    purge_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+    def is_fresh(self, now: datetime.datetime) -> bool:
+        return as_utc(now) < as_utc(self.expires_at)
+
+    @staticmethod
+    def from_dict(data: dict) -> "ApiResponseCacheEntry":
+        return data_class_from_dict(ApiResponseCacheEntry, data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return data_class_to_dict(self)
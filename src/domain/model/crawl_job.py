@@ -0,0 +1,65 @@
+import datetime
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from shared.utils import data_class_from_dict, data_class_to_dict
+
+CrawlJobType = Literal[
+    "initialize",
+    "fetch",
+    "enrich_details",
+    "crawl_transcripts",
+    "ingest_embeddings",
+    "build_lexical_index",
+    "export_raw_data",
+]
+CrawlJobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+@dataclass(slots=True)
+class CrawlProgress:
+    """크롤링 작업의 진행 상황"""
+
+    channels_total: int = 0
+    channels_done: int = 0
+    videos_collected: int = 0
+    quota_used: int = 0
+
+    @staticmethod
+    def from_dict(data: dict) -> "CrawlProgress":
+        return data_class_from_dict(CrawlProgress, data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return data_class_to_dict(self)
+
+
+@dataclass(slots=True)
+class CrawlJob:
+    job_type: CrawlJobType
+    # 서비스 메서드에 그대로 전달할 인자 (예: published_after, published_before, mode)
+    params: dict[str, Any] = field(default_factory=dict)
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: CrawlJobStatus = "queued"
+    progress: CrawlProgress = field(default_factory=CrawlProgress)
+    error: str | None = None
+    # 작업이 끝났을 때 서비스가 반환한 결과 보고서 (예: EnrichmentReport.to_dict())
+    result: dict[str, Any] | None = None
+    cancel_requested: bool = False
+    created_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    started_at: datetime.datetime | None = None
+    finished_at: datetime.datetime | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    @staticmethod
+    def from_dict(data: dict) -> "CrawlJob":
+        job = data_class_from_dict(CrawlJob, data)
+        if isinstance(job.progress, dict):
+            job.progress = CrawlProgress.from_dict(job.progress)
+        return job
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**data_class_to_dict(self), "progress": self.progress.to_dict()}
@@ -0,0 +1,67 @@
+import datetime
+import zlib
+from dataclasses import dataclass, field
+from typing import Any
+
+from shared.utils import as_utc, data_class_from_dict, data_class_to_dict, get_last_quota_reset_time, next_cron_time
+
+
+@dataclass(slots=True)
+class CrawlerSchedule:
+    """채널별 증분 수집 주기
+
+    interval_minutes(일정 간격) 또는 cron(분 시 일 월 요일, UTC) 중 하나로 주기를 지정합니다.
+    """
+
+    channel_id: str
+    interval_minutes: int | None = None
+    cron: str | None = None
+    priority: int = 0  # 같은 시각에 실행할 채널이 많을 때 높은 값부터 수집
+    enabled: bool = True
+    next_run_at: datetime.datetime | None = None
+    last_run_at: datetime.datetime | None = None
+    last_job_id: str | None = None
+    created_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+    def __post_init__(self):
+        if (self.interval_minutes is None) == (self.cron is None):
+            raise ValueError("interval_minutes와 cron 중 하나만 지정해야 합니다")
+        if self.interval_minutes is not None and self.interval_minutes < 1:
+            raise ValueError("interval_minutes는 1 이상이어야 합니다")
+
+    def compute_next_run(self, now: datetime.datetime) -> datetime.datetime:
+        """now 이후의 다음 실행 시각을 계산합니다.
+
+        간격 일정은 쿼터 리셋 시각(07:00 UTC)을 기준으로 채널마다 고정된 위상만큼 밀어서 배치하므로,
+        같은 간격의 채널들이 한꺼번에 실행되지 않고 하루에 고르게 퍼집니다.
+
+        Args:
+            now (datetime.datetime): 기준 시각
+
+        Returns:
+            datetime.datetime: 다음 실행 시각 (UTC)
+        """
+        now = as_utc(now)
+        if self.cron is not None:
+            return next_cron_time(self.cron, now)
+        assert self.interval_minutes is not None
+        interval = datetime.timedelta(minutes=self.interval_minutes)
+        anchor = get_last_quota_reset_time(now) + self.phase_offset(interval)
+        periods = (now - anchor) // interval + 1
+        return anchor + interval * periods
+
+    def phase_offset(self, interval: datetime.timedelta) -> datetime.timedelta:
+        """채널 ID로 정해지는 간격 안의 고정 위상 (재시작해도 같은 값)"""
+        return datetime.timedelta(seconds=zlib.crc32(self.channel_id.encode()) % int(interval.total_seconds()))
+
+    def mark_run(self, now: datetime.datetime, job_id: str | None) -> None:
+        self.last_run_at = as_utc(now)
+        self.last_job_id = job_id
+        self.next_run_at = self.compute_next_run(now)
+
+    @staticmethod
+    def from_dict(data: dict) -> "CrawlerSchedule":
+        return data_class_from_dict(CrawlerSchedule, data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return data_class_to_dict(self)
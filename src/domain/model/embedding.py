@@ -0,0 +1,70 @@
+import datetime
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from shared.utils import as_utc, data_class_from_dict, data_class_to_dict
+
+ChunkSource = Literal["snippet", "transcript"]
+
+
+@dataclass(slots=True)
+class IngestionDocument:
+    """임베딩할 비디오 하나의 원문 (제목, 설명, 자막)"""
+
+    video_id: str
+    channel_id: str
+    streamer_name: str
+    title: str = ""
+    description: str = ""
+    published_at: datetime.datetime | None = None
+    segments: list[dict] | None = None  # 자막 [{"text": str, "start": float, "duration": float}, ...]
+
+
+@dataclass(slots=True)
+class DocumentChunk:
+    """벡터 저장소에 저장되는 청크 하나"""
+
+    chunk_id: str  # video_id, source, chunk_index로 만든 UUID (같은 청크는 같은 ID로 덮어씀)
+    video_id: str
+    channel_id: str
+    streamer_name: str
+    source: ChunkSource
+    chunk_index: int
+    text: str
+    start_seconds: float | None = None  # 자막 청크의 시작 시각 (초)
+    end_seconds: float | None = None
+    published_at: datetime.datetime | None = None
+
+    def to_payload(self) -> dict[str, Any]:
+        """벡터 저장소에 함께 저장할 페이로드. 게시 시각은 범위 필터를 위해 타임스탬프로도 저장합니다."""
+        published_at = as_utc(self.published_at) if self.published_at else None
+        return {
+            "video_id": self.video_id,
+            "channel_id": self.channel_id,
+            "streamer_name": self.streamer_name,
+            "source": self.source,
+            "chunk_index": self.chunk_index,
+            "text": self.text,
+            "start_seconds": self.start_seconds,
+            "end_seconds": self.end_seconds,
+            "published_at": published_at.isoformat() if published_at else None,
+            "published_ts": published_at.timestamp() if published_at else None,
+        }
+
+
+@dataclass(slots=True)
+class EmbeddingState:
+    """비디오별 마지막 임베딩 상태. content_hash가 같으면 다시 임베딩하지 않습니다."""
+
+    video_id: str
+    content_hash: str  # 청크 텍스트, 청크 설정, 임베딩 모델로 만든 해시
+    chunk_count: int
+    model_id: str
+    embedded_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+    @staticmethod
+    def from_dict(data: dict) -> "EmbeddingState":
+        return data_class_from_dict(EmbeddingState, data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return data_class_to_dict(self)
@@ -0,0 +1,48 @@
+import datetime
+from dataclasses import dataclass
+from typing import Any
+
+from shared.utils import data_class_from_dict, data_class_to_dict
+
+# 내보내기 행의 열 이름과 자료형. 행은 dataclass로 만들지 않고 이 열을 키로 하는 딕셔너리로 다룹니다.
+# raw_data, details는 JSON 문자열이며 원본을 포함하지 않도록 내보내면 None입니다.
+RAW_DATA_EXPORT_COLUMNS: dict[str, str] = {
+    "video_id": "string",
+    "channel_id": "string",
+    "streamer_name": "string",
+    "published_at": "timestamp",
+    "created_at": "timestamp",
+    "title": "string",
+    "description": "string",
+    "duration": "string",  # ISO 8601 (예: PT1H2M3S)
+    "view_count": "int64",
+    "like_count": "int64",
+    "comment_count": "int64",
+    "transcript_status": "string",
+    "raw_data": "string",
+    "details": "string",
+}
+
+
+def export_month(row: dict[str, Any]) -> str:
+    """행이 들어갈 월 파티션 (게시 시각 기준, 없으면 최초 저장 시각 기준, 예: "2024-01")"""
+    timestamp: datetime.datetime = row.get("published_at") or row["created_at"]
+    return timestamp.strftime("%Y-%m")
+
+
+@dataclass(slots=True)
+class ExportShard:
+    """내보낸 파일 하나. 채널과 월로 나눈 파티션 하나에 여러 파일이 있을 수 있습니다."""
+
+    path: str  # 내보내기 디렉터리 기준 상대 경로
+    channel_id: str
+    month: str
+    rows: int
+    size_bytes: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return data_class_to_dict(self)
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "ExportShard":
+        return data_class_from_dict(ExportShard, data)
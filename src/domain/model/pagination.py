@@ -0,0 +1,43 @@
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """키셋 페이지네이션으로 조회한 한 페이지"""
+
+    items: list[T]
+    # 다음 페이지를 조회할 커서. 마지막 페이지면 None
+    next_cursor: str | None = None
+
+
+def encode_cursor(position: dict[str, Any]) -> str:
+    """마지막 항목의 정렬 키를 URL에 그대로 넣을 수 있는 문자열로 만듭니다.
+
+    Args:
+        position (dict[str, Any]): JSON으로 직렬화할 수 있는 정렬 키 값
+
+    Returns:
+        str: base64url로 인코딩한 커서
+    """
+    data = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """encode_cursor로 만든 커서를 정렬 키 값으로 되돌립니다.
+
+    Raises:
+        ValueError: 커서 형식이 잘못된 경우
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValueError("잘못된 커서입니다") from None
+    if not isinstance(position, dict):
+        raise ValueError("잘못된 커서입니다")
+    return position
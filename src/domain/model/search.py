@@ -0,0 +1,52 @@
+import datetime
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class SearchFilter:
+    """벡터 검색 조건 (지정한 조건만 적용)"""
+
+    streamer_name: str | None = None
+    channel_id: str | None = None
+    published_from: datetime.datetime | None = None  # 이 시각 이후에 게시된 비디오만
+    published_to: datetime.datetime | None = None  # 이 시각 이전에 게시된 비디오만
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """검색 결과 청크 하나"""
+
+    chunk_id: str
+    score: float
+    video_id: str
+    channel_id: str
+    streamer_name: str
+    source: str  # "snippet" 또는 "transcript"
+    text: str
+    start_seconds: float | None = None  # 자막 청크면 비디오 안에서의 시작 시각 (초)
+    end_seconds: float | None = None
+    published_at: str | None = None
+
+    @staticmethod
+    def from_payload(chunk_id: str, payload: dict[str, Any], score: float) -> "SearchHit":
+        """벡터 저장소의 청크 페이로드(DocumentChunk.to_payload)로부터 검색 결과를 만듭니다."""
+        return SearchHit(
+            chunk_id=chunk_id,
+            score=score,
+            video_id=payload["video_id"],
+            channel_id=payload["channel_id"],
+            streamer_name=payload["streamer_name"],
+            source=payload["source"],
+            text=payload["text"],
+            start_seconds=payload.get("start_seconds"),
+            end_seconds=payload.get("end_seconds"),
+            published_at=payload.get("published_at"),
+        )
+
+    @property
+    def url(self) -> str:
+        """자막 청크면 해당 시각부터 재생되는 비디오 URL"""
+        if self.start_seconds is None:
+            return f"https://www.youtube.com/watch?v={self.video_id}"
+        return f"https://www.youtube.com/watch?v={self.video_id}&t={int(self.start_seconds)}s"
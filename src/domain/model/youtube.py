@@ -1,17 +1,27 @@
 import datetime
 import os
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import MISSING, dataclass, field, fields
 from typing import Any
 
 import dotenv
 
-from shared.utils import data_class_from_dict
+from shared.utils import (
+    YOUTUBE_CHANNEL_QUOTA_THRESHOLD,
+    YOUTUBE_QUOTA_COSTS,
+    YOUTUBE_QUOTA_THRESHOLDS,
+    YOUTUBE_SEARCH_QUOTA_THRESHOLD,
+    as_utc,
+    data_class_from_dict,
+    data_class_to_dict,
+    parse_youtube_datetime,
+)
 
 dotenv.load_dotenv()
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 
 
-@dataclass
+@dataclass(slots=True)
 class YoutubeChannel:
     channel_name: str
     channel_handle: str
@@ -19,46 +29,268 @@ class YoutubeChannel:
     streamer_name: str
     initialized: bool = field(default=False)
     created_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+    # 지금까지 수집한 비디오 중 가장 최근 게시 시각 (다음 수집의 publishedAfter)
+    last_published_at: datetime.datetime | None = field(default=None)
+    # 채널 업로드 재생목록 ID (channels.list contentDetails에서 한 번 조회 후 재사용)
+    uploads_playlist_id: str | None = field(default=None)
+    # 마지막으로 새 비디오 수집을 끝까지 마친 시각 (업로드 빈도 기반 우선순위 계산에 사용)
+    last_crawled_at: datetime.datetime | None = field(default=None)
 
     @staticmethod
     def from_dict(data: dict) -> "YoutubeChannel":
         return data_class_from_dict(YoutubeChannel, data)
 
     def to_dict(self) -> dict[str, Any]:
-        return self.__dict__
+        return data_class_to_dict(self)
 
     def update_initialized(self) -> None:
         self.initialized = True
 
+    def update_watermark(self, published_at: datetime.datetime | None) -> None:
+        """수집한 비디오의 게시 시각으로 워터마크를 갱신합니다. 워터마크는 앞으로만 이동합니다."""
+        if published_at is None:
+            return
+        published_at = as_utc(published_at)
+        if self.last_published_at is None or published_at > as_utc(self.last_published_at):
+            self.last_published_at = published_at
 
-@dataclass
+
+@dataclass(slots=True)
+class ChannelUploadStats:
+    """일정 기간 동안 저장된 비디오로 집계한 채널의 업로드 기록"""
+
+    channel_id: str
+    video_count: int
+    first_published_at: datetime.datetime | None = None
+    last_published_at: datetime.datetime | None = None
+
+
+@dataclass(slots=True)
 class YoutubeVideoRawData:
     video_id: str
     channel_id: str
     streamer_name: str
     raw_data: dict
     created_at: datetime.datetime
+    published_at: datetime.datetime | None = None
+    # videos.list 상세 정보 (contentDetails, statistics 등). 보강 전에는 None
+    details: dict | None = None
+    enriched_at: datetime.datetime | None = None
+    # 자막 수집 상태 (None: 미수집, "done", "unavailable", "failed")와 시도 횟수
+    transcript_status: str | None = None
+    transcript_attempts: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return data_class_to_dict(self)
 
     @staticmethod
     def from_dict(data: dict) -> "YoutubeVideoRawData":
         return data_class_from_dict(YoutubeVideoRawData, data)
 
+    @staticmethod
+    def from_search_item(item: dict, channel: YoutubeChannel) -> "YoutubeVideoRawData":
+        """search API 결과 항목으로부터 원시 데이터를 생성합니다."""
+        return YoutubeVideoRawData(
+            video_id=item.get("id", {}).get("videoId", ""),
+            channel_id=channel.channel_id,
+            streamer_name=channel.streamer_name,
+            raw_data=item,
+            created_at=datetime.datetime.now(datetime.timezone.utc),
+            published_at=parse_youtube_datetime(item.get("snippet", {}).get("publishedAt")),
+        )
+
+    @staticmethod
+    def from_playlist_item(item: dict, channel: YoutubeChannel) -> "YoutubeVideoRawData":
+        """playlistItems API 결과 항목으로부터 원시 데이터를 생성합니다.
+
+        playlistItems의 snippet.publishedAt은 재생목록에 추가된 시각이므로
+        게시 시각은 contentDetails.videoPublishedAt을 사용합니다.
+        """
+        content_details = item.get("contentDetails", {})
+        return YoutubeVideoRawData(
+            video_id=content_details.get("videoId") or item.get("snippet", {}).get("resourceId", {}).get("videoId", ""),
+            channel_id=channel.channel_id,
+            streamer_name=channel.streamer_name,
+            raw_data=item,
+            created_at=datetime.datetime.now(datetime.timezone.utc),
+            published_at=parse_youtube_datetime(content_details.get("videoPublishedAt")),
+        )
+
+
+# 비디오 문서의 필드 이름 (YoutubeVideoRawData의 필드 순서)
+VIDEO_FIELD_NAMES = tuple(field.name for field in fields(YoutubeVideoRawData))
+VIDEO_FIELDS = frozenset(VIDEO_FIELD_NAMES)
+# 크기가 커서 접근할 때 디코딩하는 필드 (search/playlistItems 응답 원본, videos.list 상세 정보)
+VIDEO_PAYLOAD_FIELDS = frozenset({"raw_data", "details"})
+_VIDEO_DEFAULTS = {field.name: field.default for field in fields(YoutubeVideoRawData) if field.default is not MISSING}
+_NOT_LOADED = object()
+
+
+class YoutubeVideoView:
+    """조회한 필드만 담는 raw_data 문서의 읽기 전용 뷰
+
+    YoutubeVideoRawData로 변환하지 않고 저장소가 읽은 문서를 그대로 감쌉니다. raw_data, details는
+    처음 접근할 때 decode로 디코딩한 뒤 보관하므로, 접근하지 않으면 디코딩 비용이 들지 않습니다.
+    조회하지 않은 필드에 접근하면 AttributeError가 발생합니다.
+    """
+
+    __slots__ = ("_document", "_fields", "_decode", "_raw_data", "_details")
+
+    def __init__(
+        self,
+        document: Mapping[str, Any],
+        fields: frozenset[str] | None = None,
+        decode: Callable[[Any], dict] | None = None,
+    ):
+        """
+        Args:
+            document (Mapping[str, Any]): 저장소에서 읽은 문서
+            fields (frozenset[str] | None, optional): 조회한 필드. None이면 모든 필드. Defaults to None.
+            decode (Callable[[Any], dict] | None, optional): raw_data, details 값을 딕셔너리로 바꾸는 함수.
+                None이면 값을 그대로 사용합니다. Defaults to None.
+        """
+        self._document = document
+        self._fields = VIDEO_FIELDS if fields is None else fields
+        self._decode = decode
+        self._raw_data: Any = _NOT_LOADED
+        self._details: Any = _NOT_LOADED
+
+    @staticmethod
+    def projection_fields(names: Iterable[str] | None) -> frozenset[str] | None:
+        """조회할 필드 이름을 검사합니다. video_id는 항상 포함합니다.
+
+        Raises:
+            ValueError: YoutubeVideoRawData의 필드가 아닌 이름이 있는 경우
+        """
+        if names is None:
+            return None
+        selected = frozenset(names) | {"video_id"}
+        unknown = selected - VIDEO_FIELDS
+        if unknown:
+            raise ValueError(f"알 수 없는 비디오 필드입니다: {', '.join(sorted(unknown))}")
+        return selected
+
+    @property
+    def fields(self) -> frozenset[str]:
+        return self._fields
+
+    def _get(self, name: str) -> Any:
+        if name not in self._fields:
+            raise AttributeError(f"조회하지 않은 필드입니다: {name}")
+        return self._document.get(name, _VIDEO_DEFAULTS.get(name))
+
+    def _payload(self, name: str) -> dict | None:
+        value = self._get(name)
+        if value is not None and self._decode is not None:
+            value = self._decode(value)
+        return value
+
+    @property
+    def video_id(self) -> str:
+        return self._get("video_id")
+
+    @property
+    def channel_id(self) -> str:
+        return self._get("channel_id")
+
+    @property
+    def streamer_name(self) -> str:
+        return self._get("streamer_name")
+
+    @property
+    def raw_data(self) -> dict:
+        if self._raw_data is _NOT_LOADED:
+            self._raw_data = self._payload("raw_data")
+        return self._raw_data
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        return self._get("created_at")
+
+    @property
+    def published_at(self) -> datetime.datetime | None:
+        return self._get("published_at")
+
+    @property
+    def details(self) -> dict | None:
+        if self._details is _NOT_LOADED:
+            self._details = self._payload("details")
+        return self._details
+
+    @property
+    def enriched_at(self) -> datetime.datetime | None:
+        return self._get("enriched_at")
+
+    @property
+    def transcript_status(self) -> str | None:
+        return self._get("transcript_status")
+
+    @property
+    def transcript_attempts(self) -> int:
+        return self._get("transcript_attempts")
+
+    def to_dict(self) -> dict[str, Any]:
+        """조회한 필드만 담은 딕셔너리 (raw_data, details는 디코딩한 값)"""
+        return {name: getattr(self, name) for name in VIDEO_FIELD_NAMES if name in self._fields}
+
+    def to_raw_data(self) -> YoutubeVideoRawData:
+        """모든 필드를 조회한 뷰를 YoutubeVideoRawData로 변환합니다.
+
+        Raises:
+            AttributeError: 조회하지 않은 필드가 있는 경우
+        """
+        return YoutubeVideoRawData(**{name: getattr(self, name) for name in VIDEO_FIELD_NAMES})
+
 
-@dataclass
+@dataclass(slots=True)
+class VideoFilter:
+    """비디오 목록 조회 조건 (지정한 조건을 모두 만족하는 비디오)"""
+
+    channel_id: str | None = None
+    streamer_name: str | None = None
+    published_after: datetime.datetime | None = None  # 이 시각 이후(포함)에 게시된 비디오
+    published_before: datetime.datetime | None = None  # 이 시각 이전(제외)에 게시된 비디오
+
+
+@dataclass(slots=True)
 class APIKey:
     api_key: str
     service: str = field(default="youtube")
     quota_used: int = 0
+    # 엔드포인트별 사용량 (예: {"search": 8000, "playlistItems": 120})
+    quota_used_by_endpoint: dict[str, int] = field(default_factory=dict)
     updated_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
     created_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
 
+    def is_quota_available(self, endpoint: str) -> bool:
+        """엔드포인트 요청에 쓸 쿼터가 남아있는지 확인합니다.
+
+        Args:
+            endpoint (str): YouTube Data API 엔드포인트 (예: "search", "playlistItems")
+
+        Returns:
+            bool: 쿼터 사용 가능 여부
+        """
+        return self.quota_used <= YOUTUBE_QUOTA_THRESHOLDS[endpoint]
+
+    def use_quota(self, endpoint: str) -> None:
+        """엔드포인트 요청 1회의 비용만큼 쿼터를 사용합니다.
+
+        Args:
+            endpoint (str): YouTube Data API 엔드포인트 (예: "search", "playlistItems")
+        """
+        amount = YOUTUBE_QUOTA_COSTS[endpoint]
+        self.quota_used += amount
+        self.quota_used_by_endpoint[endpoint] = self.quota_used_by_endpoint.get(endpoint, 0) + amount
+        self.updated_at = datetime.datetime.now(datetime.timezone.utc)
+
     def is_search_quota_available(self) -> bool:
         """검색 쿼터를 사용 가능한지 확인합니다.
 
         Returns:
             bool: 검색 쿼터 사용 가능 여부
         """
-        if self.quota_used <= 8000:
+        if self.quota_used <= YOUTUBE_SEARCH_QUOTA_THRESHOLD:
             return True
         return False
 
@@ -68,7 +300,7 @@ class APIKey:
         Returns:
             bool: 채널 쿼터 사용 가능 여부
         """
-        if self.quota_used <= 9900:
+        if self.quota_used <= YOUTUBE_CHANNEL_QUOTA_THRESHOLD:
             return True
         return False
 
@@ -91,8 +323,62 @@ class APIKey:
         self.updated_at = datetime.datetime.now(datetime.timezone.utc)
 
     def to_dict(self) -> dict[str, Any]:
-        return self.__dict__
+        return data_class_to_dict(self)
 
     @staticmethod
     def from_dict(data: dict) -> "APIKey":
         return data_class_from_dict(APIKey, data)
+
+
+@dataclass(slots=True)
+class YoutubeTranscript:
+    video_id: str
+    language_code: str
+    is_generated: bool
+    segments: list[dict]  # [{"text": str, "start": float, "duration": float}, ...]
+    created_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+    def to_dict(self) -> dict[str, Any]:
+        return data_class_to_dict(self)
+
+    @staticmethod
+    def from_dict(data: dict) -> "YoutubeTranscript":
+        return data_class_from_dict(YoutubeTranscript, data)
+
+
+@dataclass(slots=True)
+class CrawlCheckpoint:
+    """채널 초기화 수집의 진행 지점
+
+    페이지를 저장할 때마다 갱신되어, 실패하거나 쿼터가 소진된 수집을 다음 실행에서 멈춘 지점부터 이어갑니다.
+    """
+
+    channel_id: str
+    mode: str  # 비디오 목록 조회 방식 ("search" 또는 "playlist")
+    # 아직 끝나지 않은 (publishedAfter, publishedBefore) 구간 스택. 마지막 원소가 현재 수집 중인 구간
+    windows: list[tuple[datetime.datetime, datetime.datetime]]
+    # 현재 구간에서 다음에 요청할 페이지 토큰 (None이면 구간의 첫 페이지부터)
+    page_token: str | None = None
+    pages_done: int = 0
+    quota_spent: int = 0
+    collected_count: int = 0
+    latest_published_at: datetime.datetime | None = None
+    updated_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
+
+    @staticmethod
+    def start(
+        channel_id: str, mode: str, published_after: datetime.datetime, published_before: datetime.datetime
+    ) -> "CrawlCheckpoint":
+        return CrawlCheckpoint(
+            channel_id=channel_id, mode=mode, windows=[(as_utc(published_after), as_utc(published_before))]
+        )
+
+    @staticmethod
+    def from_dict(data: dict) -> "CrawlCheckpoint":
+        checkpoint = data_class_from_dict(CrawlCheckpoint, data)
+        # MongoDB는 튜플을 배열로, 시각을 타임존 없이 저장하므로 되돌림
+        checkpoint.windows = [(as_utc(after), as_utc(before)) for after, before in checkpoint.windows]
+        return checkpoint
+
+    def to_dict(self) -> dict[str, Any]:
+        return data_class_to_dict(self)
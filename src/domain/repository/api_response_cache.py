@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from domain.model.api_response_cache import ApiResponseCacheEntry
+
+
+class ApiResponseCacheRepository(ABC):
+    @abstractmethod
+    async def get_entry(self, cache_key: str) -> ApiResponseCacheEntry | None:
+        """캐시된 API 응답을 조회합니다.
+
+        Args:
+            cache_key (str): 캐시 키
+
+        Returns:
+            ApiResponseCacheEntry | None: 캐시된 응답 (없으면 None)
+        """
+        pass
+
+    @abstractmethod
+    async def save_entry(self, entry: ApiResponseCacheEntry) -> None:
+        """API 응답을 캐시에 저장합니다. 같은 키의 기존 응답은 덮어씁니다.
+
+        Args:
+            entry (ApiResponseCacheEntry): 저장할 응답
+        """
+        pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+
+from domain.model.youtube import CrawlCheckpoint
+
+
+class CrawlCheckpointRepository(ABC):
+    @abstractmethod
+    async def get_checkpoint(self, channel_id: str) -> CrawlCheckpoint | None:
+        """채널의 수집 체크포인트를 조회합니다.
+
+        Args:
+            channel_id (str): 채널 ID
+
+        Returns:
+            CrawlCheckpoint | None: 체크포인트 (없으면 None)
+        """
+        pass
+
+    @abstractmethod
+    async def save_checkpoint(self, checkpoint: CrawlCheckpoint) -> None:
+        """채널의 수집 체크포인트를 저장합니다. 같은 채널의 기존 체크포인트는 덮어씁니다.
+
+        Args:
+            checkpoint (CrawlCheckpoint): 저장할 체크포인트
+        """
+        pass
+
+    @abstractmethod
+    async def delete_checkpoint(self, channel_id: str) -> None:
+        """수집이 끝난 채널의 체크포인트를 삭제합니다.
+
+        Args:
+            channel_id (str): 채널 ID
+        """
+        pass
@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from domain.model.crawl_job import CrawlJob, CrawlProgress
+
+
+class CrawlJobRepository(ABC):
+    @abstractmethod
+    async def insert_job(self, job: CrawlJob) -> None:
+        """새 크롤링 작업을 저장합니다.
+
+        Args:
+            job (CrawlJob): 저장할 작업
+        """
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> CrawlJob | None:
+        """작업을 조회합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            CrawlJob | None: 작업 (없으면 None)
+        """
+        pass
+
+    @abstractmethod
+    async def list_jobs(self, limit: int = 50) -> list[CrawlJob]:
+        """최근에 생성된 순서로 작업 목록을 조회합니다.
+
+        Args:
+            limit (int, optional): 최대 조회 수. Defaults to 50.
+
+        Returns:
+            list[CrawlJob]: 작업 목록
+        """
+        pass
+
+    @abstractmethod
+    async def list_queued_job_ids(self) -> list[str]:
+        """대기 중인 작업 ID를 생성된 순서로 조회합니다.
+
+        Returns:
+            list[str]: 작업 ID 목록
+        """
+        pass
+
+    @abstractmethod
+    async def claim_job(self, job_id: str) -> CrawlJob | None:
+        """대기 중인 작업을 원자적으로 실행 중 상태로 바꾸고 반환합니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            CrawlJob | None: 실행할 작업 (이미 다른 곳에서 가져갔거나 취소된 경우 None)
+        """
+        pass
+
+    @abstractmethod
+    async def update_progress(self, job_id: str, progress: CrawlProgress) -> None:
+        """작업의 진행 상황을 저장합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            progress (CrawlProgress): 진행 상황
+        """
+        pass
+
+    @abstractmethod
+    async def finish_job(
+        self,
+        job_id: str,
+        status: str,
+        progress: CrawlProgress,
+        error: str | None = None,
+        result: dict[str, Any] | None = None,
+    ) -> None:
+        """작업을 종료 상태로 저장합니다.
+
+        Args:
+            job_id (str): 작업 ID
+            status (str): 종료 상태 ("succeeded", "failed", "cancelled")
+            progress (CrawlProgress): 최종 진행 상황
+            error (str | None, optional): 실패 사유. Defaults to None.
+            result (dict[str, Any] | None, optional): 작업 결과 보고서. Defaults to None.
+        """
+        pass
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> CrawlJob | None:
+        """작업 취소를 요청합니다. 대기 중인 작업은 바로 취소 상태가 됩니다.
+
+        Args:
+            job_id (str): 작업 ID
+
+        Returns:
+            CrawlJob | None: 갱신된 작업 (없으면 None)
+        """
+        pass
+
+    @abstractmethod
+    async def requeue_interrupted_jobs(self) -> int:
+        """서버 종료 등으로 실행 중 상태에 멈춰 있는 작업을 다시 대기 상태로 돌립니다.
+
+        취소가 요청된 작업은 취소 상태로 종료합니다.
+
+        Returns:
+            int: 다시 대기 상태가 된 작업 수
+        """
+        pass
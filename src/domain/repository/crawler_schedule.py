@@ -1,13 +1,57 @@
+import datetime
 from abc import ABC, abstractmethod
 
+from domain.model.crawler_schedule import CrawlerSchedule
+
 
 class RawDataCrawlerScheduleRepository(ABC):
     @abstractmethod
-    def add_schedule(self, schedule: dict) -> None:
+    async def add_schedule(self, schedule: CrawlerSchedule) -> None:
+        """채널의 수집 일정을 저장합니다. 같은 채널의 기존 일정은 덮어씁니다.
+
+        Args:
+            schedule (CrawlerSchedule): 저장할 일정
+        """
+        pass
+
+    @abstractmethod
+    async def get_schedules(self) -> list[CrawlerSchedule]:
+        """모든 수집 일정을 다음 실행 시각 순서로 조회합니다.
+
+        Returns:
+            list[CrawlerSchedule]: 수집 일정 목록
+        """
+        pass
+
+    @abstractmethod
+    async def get_due_schedules(self, now: datetime.datetime, limit: int) -> list[CrawlerSchedule]:
+        """실행 시각이 된 일정을 우선순위가 높은 순서, 같으면 오래 기다린 순서로 조회합니다.
+
+        Args:
+            now (datetime.datetime): 기준 시각
+            limit (int): 최대 조회 수
+
+        Returns:
+            list[CrawlerSchedule]: 실행할 일정 목록
+        """
+        pass
+
+    @abstractmethod
+    async def update_schedule(self, schedule: CrawlerSchedule) -> None:
+        """일정의 실행 기록과 다음 실행 시각을 저장합니다.
+
+        Args:
+            schedule (CrawlerSchedule): 갱신할 일정
+        """
         pass
 
     @abstractmethod
-    def get_schedules(self) -> list[dict]:
+    async def delete_schedule(self, channel_id: str) -> None:
+        """채널의 수집 일정을 삭제합니다.
+
+        Args:
+            channel_id (str): 채널 ID
+        """
         pass
 
     # @abstractmethod
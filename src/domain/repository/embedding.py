@@ -0,0 +1,77 @@
+import datetime
+from abc import ABC, abstractmethod
+
+from domain.model.embedding import EmbeddingState
+
+
+class EmbeddingStateRepository(ABC):
+    @abstractmethod
+    async def get_states(self, video_ids: list[str]) -> dict[str, EmbeddingState]:
+        """비디오별 마지막 임베딩 상태를 조회합니다.
+
+        Args:
+            video_ids (list[str]): 조회할 비디오 ID 목록
+
+        Returns:
+            dict[str, EmbeddingState]: 임베딩된 적이 있는 비디오의 상태
+        """
+        pass
+
+    @abstractmethod
+    async def save_states(self, states: list[EmbeddingState]) -> None:
+        """비디오별 임베딩 상태를 video_id 기준으로 일괄 저장합니다.
+
+        Args:
+            states (list[EmbeddingState]): 저장할 상태 목록
+        """
+        pass
+
+
+class EmbeddingCacheRepository(ABC):
+    """(정규화한 텍스트, 모델, 작업 종류)의 해시를 키로 임베딩 벡터를 저장하는 캐시 저장소"""
+
+    @abstractmethod
+    async def get_vectors(self, keys: list[str]) -> dict[str, list[float]]:
+        """저장된 벡터를 조회하고 조회한 항목의 마지막 사용 시각을 갱신합니다.
+
+        Args:
+            keys (list[str]): 조회할 캐시 키 목록
+
+        Returns:
+            dict[str, list[float]]: 캐시에 있는 키의 벡터
+        """
+        pass
+
+    @abstractmethod
+    async def save_vectors(self, vectors: dict[str, list[float]]) -> None:
+        """벡터를 일괄 저장합니다. 이미 있는 키는 덮어쓰지 않습니다.
+
+        Args:
+            vectors (dict[str, list[float]]): 캐시 키별 벡터
+        """
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        """저장된 벡터 수를 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def evict(self, max_entries: int | None = None, unused_before: datetime.datetime | None = None) -> int:
+        """오래 사용하지 않은 벡터를 삭제합니다.
+
+        Args:
+            max_entries (int | None, optional): 남길 최대 벡터 수. 넘으면 가장 오래 사용하지 않은 벡터부터 삭제.
+                Defaults to None.
+            unused_before (datetime.datetime | None, optional): 이 시각 이후로 사용하지 않은 벡터를 삭제.
+                Defaults to None.
+
+        Returns:
+            int: 삭제한 벡터 수
+        """
+        pass
+
+    @abstractmethod
+    async def compact(self) -> None:
+        """삭제된 벡터가 차지하던 저장 공간을 회수합니다."""
+        pass
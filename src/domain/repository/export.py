@@ -0,0 +1,65 @@
+import datetime
+from abc import ABC, abstractmethod
+from typing import Any
+
+from domain.model.export import ExportShard
+
+
+class RawDataExportStore(ABC):
+    """raw_data를 채널/월 단위 파일(샤드)로 내보내는 저장소
+
+    write_shard로 쓴 파일은 commit하기 전까지 목록(list_shards)에 나타나지 않습니다.
+    """
+
+    format: str  # 파일 형식 이름 (예: "parquet")
+
+    @abstractmethod
+    async def get_watermark(self) -> datetime.datetime | None:
+        """마지막으로 내보낸 행의 최초 저장 시각(created_at)을 조회합니다.
+
+        Returns:
+            datetime.datetime | None: 내보낸 적이 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    async def write_shard(self, channel_id: str, month: str, rows: list[dict[str, Any]]) -> ExportShard:
+        """한 파티션의 행을 새 파일로 씁니다.
+
+        Args:
+            channel_id (str): 채널 ID
+            month (str): 월 (예: "2024-01")
+            rows (list[dict[str, Any]]): RAW_DATA_EXPORT_COLUMNS를 키로 하는 행 목록
+
+        Returns:
+            ExportShard: 쓴 파일 정보
+        """
+        pass
+
+    @abstractmethod
+    async def commit(self, shards: list[ExportShard], watermark: datetime.datetime | None) -> None:
+        """새로 쓴 파일을 목록에 추가하고 워터마크를 갱신합니다.
+
+        Args:
+            shards (list[ExportShard]): 이번 실행에서 쓴 파일
+            watermark (datetime.datetime | None): 새 워터마크. None이면 이전 값을 유지합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def reset(self) -> None:
+        """내보낸 파일과 워터마크를 모두 삭제합니다. (처음부터 다시 내보낼 때 사용)"""
+        pass
+
+    @abstractmethod
+    async def list_shards(self, channel_id: str | None = None, month: str | None = None) -> list[ExportShard]:
+        """내보낸 파일 목록을 조회합니다.
+
+        Args:
+            channel_id (str | None, optional): 이 채널의 파일만. Defaults to None.
+            month (str | None, optional): 이 월의 파일만. Defaults to None.
+
+        Returns:
+            list[ExportShard]: 파일 목록
+        """
+        pass
@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from domain.model.embedding import DocumentChunk
+from domain.model.search import SearchFilter
+
+
+class LexicalIndexRepository(ABC):
+    """청크 텍스트의 단어(토큰) 기준 검색 색인"""
+
+    @abstractmethod
+    async def get_content_hashes(self, video_ids: list[str]) -> dict[str, str]:
+        """비디오별로 마지막에 색인한 내용의 해시를 조회합니다.
+
+        Args:
+            video_ids (list[str]): 조회할 비디오 ID 목록
+
+        Returns:
+            dict[str, str]: 색인된 적이 있는 비디오의 해시
+        """
+        pass
+
+    @abstractmethod
+    async def add_video(self, video_id: str, content_hash: str, chunks: list[DocumentChunk]) -> None:
+        """비디오의 청크를 색인에 추가합니다. 이미 색인된 비디오면 기존 청크를 대체합니다.
+
+        commit을 호출하기 전까지는 검색 결과에 반영되지 않습니다.
+
+        Args:
+            video_id (str): 비디오 ID
+            content_hash (str): 청크 내용의 해시
+            chunks (list[DocumentChunk]): 색인할 청크 목록
+        """
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """추가하거나 대체한 청크를 저장하고 검색 결과에 반영합니다."""
+        pass
+
+    @abstractmethod
+    async def search(
+        self, query: str, limit: int = 10, search_filter: SearchFilter | None = None
+    ) -> list[tuple[str, float]]:
+        """검색어와 일치하는 청크를 점수 순서로 조회합니다.
+
+        Args:
+            query (str): 검색어
+            limit (int, optional): 최대 결과 수. Defaults to 10.
+            search_filter (SearchFilter | None, optional): 스트리머, 채널, 게시 기간 조건. Defaults to None.
+
+        Returns:
+            list[tuple[str, float]]: (청크 ID, 점수) 목록 (점수 내림차순)
+        """
+        pass
+
+    @abstractmethod
+    async def merge_segments(self) -> None:
+        """여러 번에 나눠 저장된 색인을 하나로 합치고 대체된 청크가 차지하던 공간을 회수합니다."""
+        pass
+
+    @abstractmethod
+    async def stats(self) -> dict[str, Any]:
+        """색인된 비디오 수, 청크 수, 세그먼트 수 등 색인 상태를 반환합니다."""
+        pass
@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+
+from domain.model.embedding import DocumentChunk
+from domain.model.search import SearchFilter, SearchHit
+
+
+class VectorRepository(ABC):
+    @abstractmethod
+    async def ensure_collection(self, dimension: int) -> None:
+        """청크를 저장할 컬렉션과 필터용 인덱스가 없으면 생성합니다.
+
+        Args:
+            dimension (int): 임베딩 벡터의 차원
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_chunks(self, chunks: list[DocumentChunk], vectors: list[list[float]]) -> None:
+        """청크와 벡터를 chunk_id 기준으로 일괄 업서트합니다.
+
+        Args:
+            chunks (list[DocumentChunk]): 저장할 청크 목록
+            vectors (list[list[float]]): 청크 순서대로의 임베딩 벡터
+        """
+        pass
+
+    @abstractmethod
+    async def delete_video_chunks(self, video_ids: list[str]) -> None:
+        """비디오들의 기존 청크를 모두 삭제합니다. (다시 임베딩하기 전에 남는 청크 정리)
+
+        Args:
+            video_ids (list[str]): 비디오 ID 목록
+        """
+        pass
+
+    @abstractmethod
+    async def search(
+        self, vector: list[float], limit: int = 10, search_filter: SearchFilter | None = None
+    ) -> list[SearchHit]:
+        """벡터와 가까운 청크를 조건에 맞는 것만 유사도 순서로 조회합니다.
+
+        Args:
+            vector (list[float]): 검색어 임베딩 벡터
+            limit (int, optional): 최대 결과 수. Defaults to 10.
+            search_filter (SearchFilter | None, optional): 스트리머, 채널, 게시 기간 조건. Defaults to None.
+
+        Returns:
+            list[SearchHit]: 검색 결과 (유사도 내림차순)
+        """
+        pass
+
+    @abstractmethod
+    async def get_chunks(self, chunk_ids: list[str]) -> dict[str, SearchHit]:
+        """청크 ID로 저장된 청크를 조회합니다. (다른 검색 결과와 합칠 때 사용, 점수는 0)
+
+        Args:
+            chunk_ids (list[str]): 조회할 청크 ID 목록
+
+        Returns:
+            dict[str, SearchHit]: 저장소에 있는 청크의 청크 ID별 결과
+        """
+        pass
@@ -1,6 +1,29 @@
+import datetime
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
 
-from domain.model.youtube import APIKey, YoutubeChannel, YoutubeVideoRawData
+from domain.model.embedding import IngestionDocument
+from domain.model.pagination import Page
+from domain.model.youtube import (
+    APIKey,
+    ChannelUploadStats,
+    VideoFilter,
+    YoutubeChannel,
+    YoutubeTranscript,
+    YoutubeVideoRawData,
+    YoutubeVideoView,
+)
+
+
+@dataclass
+class BulkSaveResult:
+    """일괄 업서트 결과"""
+
+    inserted_count: int = 0
+    # 값이 실제로 바뀐 기존 문서 수 (같은 값으로 다시 저장된 문서는 제외)
+    updated_count: int = 0
 
 
 class YoutubeRepository(ABC):
@@ -34,6 +57,63 @@ class YoutubeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_channels(self, initialized: bool | None = None, batch_size: int = 500) -> AsyncIterator[YoutubeChannel]:
+        """채널을 리스트로 모으지 않고 커서에서 하나씩 반환합니다.
+
+        Args:
+            initialized (bool | None, optional): 초기화 여부로 거를 때 사용. None이면 모든 채널. Defaults to None.
+            batch_size (int, optional): 커서가 한 번에 가져올 문서 수. Defaults to 500.
+
+        Returns:
+            AsyncIterator[YoutubeChannel]: 채널 비동기 이터레이터
+        """
+        pass
+
+    @abstractmethod
+    async def list_channels(
+        self, streamer_name: str | None = None, cursor: str | None = None, limit: int = 50
+    ) -> Page[YoutubeChannel]:
+        """채널을 저장된 순서로 한 페이지씩 조회합니다. (키셋 페이지네이션)
+
+        Args:
+            streamer_name (str | None, optional): 이 스트리머의 채널만. Defaults to None.
+            cursor (str | None, optional): 이전 페이지의 next_cursor. None이면 첫 페이지. Defaults to None.
+            limit (int, optional): 페이지 크기. Defaults to 50.
+
+        Raises:
+            ValueError: 커서 형식이 잘못된 경우
+
+        Returns:
+            Page[YoutubeChannel]: 채널 목록과 다음 페이지 커서
+        """
+        pass
+
+    @abstractmethod
+    async def list_videos(
+        self,
+        filter: VideoFilter,
+        fields: Iterable[str] | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[YoutubeVideoView]:
+        """비디오를 최근 게시 순서로 한 페이지씩 조회합니다. (키셋 페이지네이션, 게시 시각이 없는 비디오는 마지막)
+
+        Args:
+            filter (VideoFilter): 조회 조건
+            fields (Iterable[str] | None, optional): 조회할 필드 (video_id는 항상 포함). None이면 모든 필드.
+                Defaults to None.
+            cursor (str | None, optional): 이전 페이지의 next_cursor. None이면 첫 페이지. Defaults to None.
+            limit (int, optional): 페이지 크기. Defaults to 50.
+
+        Raises:
+            ValueError: 커서 형식이 잘못되었거나 비디오 필드가 아닌 이름이 있는 경우
+
+        Returns:
+            Page[YoutubeVideoView]: 비디오 뷰 목록과 다음 페이지 커서
+        """
+        pass
+
     @abstractmethod
     async def get_video_by_id(self, video_id: str) -> YoutubeVideoRawData | None:
         """비디오 ID로 원시 비디오 데이터를 조회합니다.
@@ -46,6 +126,61 @@ class YoutubeRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_video_view(self, video_id: str, fields: Iterable[str] | None = None) -> YoutubeVideoView | None:
+        """비디오 ID로 필요한 필드만 조회합니다.
+
+        Args:
+            video_id (str): 비디오 ID
+            fields (Iterable[str] | None, optional): 조회할 필드 (video_id는 항상 포함). None이면 모든 필드.
+                Defaults to None.
+
+        Raises:
+            ValueError: 비디오 필드가 아닌 이름이 있는 경우
+
+        Returns:
+            YoutubeVideoView | None: raw_data, details를 접근할 때 디코딩하는 뷰 또는 None
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing_video_ids(self, video_ids: list[str]) -> set[str]:
+        """주어진 비디오 ID 중 이미 저장된 ID들을 한 번의 조회로 반환합니다.
+
+        Args:
+            video_ids (list[str]): 확인할 비디오 ID 목록
+
+        Returns:
+            set[str]: 이미 저장된 비디오 ID 집합
+        """
+        pass
+
+    @abstractmethod
+    async def get_latest_published_at(self, channel_id: str) -> datetime.datetime | None:
+        """채널에 저장된 비디오 중 가장 최근 게시 시각을 조회합니다.
+
+        워터마크가 없는 기존 채널의 증분 수집 시작점을 정할 때 사용합니다.
+
+        Args:
+            channel_id (str): 채널 ID
+
+        Returns:
+            datetime.datetime | None: 가장 최근 게시 시각 또는 저장된 비디오가 없으면 None
+        """
+        pass
+
+    @abstractmethod
+    async def get_channel_upload_stats(self, since: datetime.datetime) -> list[ChannelUploadStats]:
+        """since 이후에 게시된 저장 비디오를 채널별로 집계합니다.
+
+        Args:
+            since (datetime.datetime): 집계 시작 시각
+
+        Returns:
+            list[ChannelUploadStats]: 채널별 비디오 수와 첫/마지막 게시 시각 (비디오가 없는 채널은 제외)
+        """
+        pass
+
     @abstractmethod
     async def save_channel(self, channel: YoutubeChannel) -> None:
         """채널 정보를 저장합니다.
@@ -58,11 +193,158 @@ class YoutubeRepository(ABC):
         pass
 
     @abstractmethod
-    async def bulk_save_raw_data(self, raw_data_list: list[YoutubeVideoRawData]) -> None:
-        """원시 데이터를 일괄 저장합니다.
+    async def bulk_save_channels(self, channels: list[YoutubeChannel]) -> BulkSaveResult:
+        """채널 정보를 channel_id 기준으로 한 번에 업서트합니다.
+
+        이미 저장된 채널은 이름, 핸들, 스트리머 이름(과 업로드 재생목록 ID)만 갱신하고
+        수집 상태(initialized, 워터마크 등)는 그대로 둡니다.
+
+        Args:
+            channels (list[YoutubeChannel]): 저장할 채널 목록
+
+        Returns:
+            BulkSaveResult: 새로 추가된 채널 수와 갱신된 채널 수
+        """
+        pass
+
+    @abstractmethod
+    async def get_channel_ids_by_handles(self, handles: list[str]) -> dict[str, str]:
+        """이미 저장된 채널의 핸들 → 채널 ID 매핑을 조회합니다.
+
+        Args:
+            handles (list[str]): 조회할 채널 핸들 목록
+
+        Returns:
+            dict[str, str]: 저장된 채널의 핸들별 채널 ID
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_save_raw_data(self, raw_data_list: list[YoutubeVideoRawData]) -> BulkSaveResult:
+        """원시 데이터를 video_id 기준으로 일괄 업서트합니다.
+
+        이미 저장된 비디오는 수집 데이터만 갱신하므로 같은 데이터를 여러 번 저장해도 안전합니다.
+
+        Args:
+            raw_data_list (list[YoutubeVideoRawData]): 원시 데이터
+
+        Returns:
+            BulkSaveResult: 새로 저장된 수와 갱신된 수
+        """
+        pass
+
+    @abstractmethod
+    async def get_unenriched_video_ids(self, limit: int) -> list[str]:
+        """상세 정보가 아직 보강되지 않은 비디오 ID를 조회합니다.
+
+        Args:
+            limit (int): 최대 조회 개수
+
+        Returns:
+            list[str]: 비디오 ID 목록
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_update_video_details(self, details: dict[str, dict | None]) -> int:
+        """비디오 상세 정보를 일괄 저장합니다.
+
+        Args:
+            details (dict[str, dict | None]): 비디오 ID별 videos.list 항목. 삭제/비공개로 조회되지 않은 비디오는 None
+
+        Returns:
+            int: 갱신된 문서 수
+        """
+        pass
+
+    @abstractmethod
+    def iter_videos(
+        self, channel_id: str | None = None, fields: Iterable[str] | None = None, batch_size: int = 500
+    ) -> AsyncIterator[YoutubeVideoView]:
+        """비디오를 리스트로 모으지 않고 필요한 필드만 커서에서 하나씩 반환합니다.
 
         Args:
-            raw_data (list[YoutubeVideoRawData]): 원시 데이터
+            channel_id (str | None, optional): 이 채널의 비디오만. Defaults to None.
+            fields (Iterable[str] | None, optional): 조회할 필드 (video_id는 항상 포함). None이면 모든 필드.
+                Defaults to None.
+            batch_size (int, optional): 커서가 한 번에 가져올 문서 수. Defaults to 500.
+
+        Raises:
+            ValueError: 비디오 필드가 아닌 이름이 있는 경우
+
+        Returns:
+            AsyncIterator[YoutubeVideoView]: 비디오 뷰 비동기 이터레이터
+        """
+        pass
+
+    @abstractmethod
+    def iter_video_ids_without_transcript(self, max_attempts: int, batch_size: int = 500) -> AsyncIterator[str]:
+        """자막이 아직 수집되지 않은 비디오 ID를 커서로 하나씩 반환합니다.
+
+        자막이 없는 것으로 확인된 비디오와 max_attempts번 이상 실패한 비디오는 제외합니다.
+
+        Args:
+            max_attempts (int): 최대 시도 횟수
+            batch_size (int, optional): 커서가 한 번에 가져올 문서 수. Defaults to 500.
+
+        Returns:
+            AsyncIterator[str]: 비디오 ID 비동기 이터레이터
+        """
+        pass
+
+    @abstractmethod
+    def iter_ingestion_documents(self, batch_size: int = 500) -> AsyncIterator[IngestionDocument]:
+        """임베딩할 비디오 원문(제목, 설명, 자막)을 커서로 하나씩 반환합니다.
+
+        보강된 상세 정보(videos.list)가 있으면 잘리지 않은 제목과 설명을 사용합니다.
+
+        Args:
+            batch_size (int, optional): 커서가 한 번에 가져올 문서 수. Defaults to 500.
+
+        Returns:
+            AsyncIterator[IngestionDocument]: 비디오 원문 비동기 이터레이터
+        """
+        pass
+
+    @abstractmethod
+    def iter_raw_data_export_rows(
+        self,
+        created_after: datetime.datetime | None,
+        created_before: datetime.datetime,
+        include_raw: bool = True,
+        batch_size: int = 2000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """내보낼 비디오 원시 데이터를 최초 저장 시각(created_at) 순서로 커서에서 하나씩 반환합니다.
+
+        필요한 필드만 조회해 RAW_DATA_EXPORT_COLUMNS를 키로 하는 평평한 딕셔너리로 반환하며,
+        YoutubeVideoRawData로 변환하지 않습니다.
+
+        Args:
+            created_after (datetime.datetime | None): 이 시각 이후(제외)에 저장된 비디오만. None이면 처음부터.
+            created_before (datetime.datetime): 이 시각 이전(포함)에 저장된 비디오만
+            include_raw (bool, optional): 원본 raw_data와 details를 JSON 문자열로 포함할지 여부. Defaults to True.
+            batch_size (int, optional): 커서가 한 번에 가져올 문서 수. Defaults to 2000.
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: 내보내기 행 비동기 이터레이터
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_save_transcripts(self, transcripts: list[YoutubeTranscript]) -> None:
+        """자막을 transcripts 컬렉션에 일괄 저장하고 원시 데이터의 자막 상태를 "done"으로 표시합니다.
+
+        Args:
+            transcripts (list[YoutubeTranscript]): 저장할 자막 목록
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_update_transcript_status(self, statuses: dict[str, tuple[str, str | None]]) -> None:
+        """자막을 가져오지 못한 비디오들의 자막 상태를 일괄 기록하고 시도 횟수를 늘립니다.
+
+        Args:
+            statuses (dict[str, tuple[str, str | None]]): 비디오 ID별 (상태, 오류 메시지)
         """
         pass
 
@@ -109,7 +391,7 @@ class APIKeyRepository(ABC):
 
     @abstractmethod
     async def get_api_key(self) -> APIKey:
-        """API 키를 조회합니다.
+        """남은 쿼터가 가장 많은 API 키를 조회합니다.
 
         Returns:
             APIKey | None: API 키 정보 또는 None
@@ -117,19 +399,49 @@ class APIKeyRepository(ABC):
         pass
 
     @abstractmethod
-    async def insert_api_key(self, api_key: APIKey) -> None:
-        """API 키를 저장합니다.
+    async def reserve_quota(self, amount: int, max_quota_used: int, endpoint: str | None = None) -> APIKey | None:
+        """남은 쿼터가 가장 많은 API 키에서 쿼터를 원자적으로 예약합니다.
+
+        사용량이 max_quota_used 이하인 키만 대상이 되므로, 동시에 여러 작업이 예약해도
+        한 키가 한도를 넘어 할당되지 않습니다.
 
         Args:
-            api_key (APIKey): 저장할 API 키 객체
+            amount (int): 예약할 쿼터 양
+            max_quota_used (int): 예약 가능한 키의 최대 사용량
+            endpoint (str | None, optional): 엔드포인트별 사용량에 함께 기록할 엔드포인트. Defaults to None.
+
+        Returns:
+            APIKey | None: 예약된 사용량이 반영된 API 키 또는 예약 가능한 키가 없으면 None
         """
         pass
 
     @abstractmethod
-    async def update_api_key(self, api_key: APIKey) -> None:
-        """API 키를 업데이트합니다.
+    async def release_quota(self, api_key: str, amount: int, endpoint: str | None = None) -> None:
+        """예약했지만 사용하지 않은 쿼터를 API 키에 돌려줍니다. (예: 캐시로 응답된 요청)
 
         Args:
-            api_key (APIKey): 업데이트할 API 키 객체
+            api_key (str): 쿼터를 예약한 API 키
+            amount (int): 돌려줄 쿼터 양
+            endpoint (str | None, optional): 엔드포인트별 사용량에서도 함께 뺄 엔드포인트. Defaults to None.
+        """
+        pass
+
+    @abstractmethod
+    async def park_api_key(self, api_key: str) -> None:
+        """일일 쿼터가 소진된 API 키를 다음 쿼터 리셋 시각까지 예약 대상에서 제외합니다.
+
+        YouTube API가 quotaExceeded를 돌려준 키는 저장된 사용량과 관계없이 한도까지 사용한 것으로 기록합니다.
+
+        Args:
+            api_key (str): 제외할 API 키
+        """
+        pass
+
+    @abstractmethod
+    async def insert_api_key(self, api_key: APIKey) -> None:
+        """API 키를 저장합니다.
+
+        Args:
+            api_key (APIKey): 저장할 API 키 객체
         """
         pass
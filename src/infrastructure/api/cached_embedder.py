@@ -0,0 +1,89 @@
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Any
+
+from domain.adapter.embedder import Embedder, EmbeddingTask
+from domain.repository.embedding import EmbeddingCacheRepository
+from shared.utils import data_class_to_dict
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화 형식이나 공백만 다른 텍스트가 같은 캐시 항목을 사용하도록 정규화합니다."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def make_embedding_key(text: str, model_id: str, task: EmbeddingTask) -> str:
+    """(모델 ID, 작업 유형, 정규화한 텍스트)의 sha256으로 만든 내용 기반 캐시 키"""
+    return hashlib.sha256(f"{model_id}\x00{task}\x00{normalize_text(text)}".encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class EmbeddingCacheMetrics:
+    """임베딩 캐시 통계
+
+    hits는 임베딩 모델을 호출하지 않고 응답한 텍스트 수입니다. (한 번의 호출 안에서 중복된 텍스트 포함)
+    """
+
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+    embed_calls: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**data_class_to_dict(self), "hit_ratio": self.hit_ratio}
+
+
+class CachedEmbedder(Embedder):
+    """감싼 임베더를 호출하기 전에 내용 기반 벡터 캐시를 먼저 조회하는 임베더
+
+    캐시에 없는 텍스트만 한 번의 호출로 감싼 임베더에 보내고, 받은 벡터를 캐시에 저장합니다.
+    캐시 키에 모델 ID가 들어가므로 모델을 바꿔도 이전 모델의 벡터를 반환하지 않습니다.
+    """
+
+    def __init__(self, embedder: Embedder, repository: EmbeddingCacheRepository):
+        self.embedder = embedder
+        self.repository = repository
+        self.metrics = EmbeddingCacheMetrics()
+
+    @property
+    def model_id(self) -> str:
+        return self.embedder.model_id
+
+    @property
+    def dimension(self) -> int:
+        return self.embedder.dimension
+
+    async def embed(self, texts: list[str], task: EmbeddingTask = "document") -> list[list[float]]:
+        if not texts:
+            return []
+        model_id = self.embedder.model_id
+        keys = [make_embedding_key(text, model_id, task) for text in texts]
+        vectors = await self.repository.get_vectors(list(dict.fromkeys(keys)))
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+        self.metrics.lookups += len(texts)
+        self.metrics.misses += len(missing)
+        self.metrics.hits += len(texts) - len(missing)
+
+        if missing:
+            self.metrics.embed_calls += 1
+            embedded = await self.embedder.embed(list(missing.values()), task)
+            if len(embedded) != len(missing):
+                raise ValueError(f"Embedder returned {len(embedded)} vectors for {len(missing)} texts")
+            new_vectors = dict(zip(missing, embedded))
+            await self.repository.save_vectors(new_vectors)
+            vectors.update(new_vectors)
+        return [vectors[key] for key in keys]
@@ -0,0 +1,38 @@
+from google import genai
+from google.genai import types
+
+from domain.adapter.embedder import Embedder, EmbeddingTask
+
+# 저장할 문서와 검색 쿼리에 사용하는 Gemini 임베딩 작업 유형
+_TASK_TYPES = {"document": "RETRIEVAL_DOCUMENT", "query": "RETRIEVAL_QUERY"}
+
+
+class GeminiEmbedder(Embedder):
+    """Gemini 임베딩 API(google-genai)를 사용하는 임베더
+
+    embed 호출 한 번에 모든 텍스트를 embed_content 요청 하나로 보내므로, 호출하는 쪽에서 배치 크기를
+    API 제한(요청당 텍스트 100개) 이하로 맞춰야 합니다.
+    """
+
+    def __init__(self, api_key: str | None = None, model: str = "gemini-embedding-001", dimension: int = 768):
+        self._client = genai.Client(api_key=api_key)
+        self._model = model
+        self._dimension = dimension
+
+    @property
+    def model_id(self) -> str:
+        return f"{self._model}@{self._dimension}"
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    async def embed(self, texts: list[str], task: EmbeddingTask = "document") -> list[list[float]]:
+        if not texts:
+            return []
+        response = await self._client.aio.models.embed_content(
+            model=self._model,
+            contents=texts,
+            config=types.EmbedContentConfig(task_type=_TASK_TYPES[task], output_dimensionality=self._dimension),
+        )
+        return [list(embedding.values or []) for embedding in response.embeddings or []]
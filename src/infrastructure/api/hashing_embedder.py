@@ -0,0 +1,43 @@
+import hashlib
+import math
+import re
+
+from domain.adapter.embedder import Embedder, EmbeddingTask
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class HashingEmbedder(Embedder):
+    """Deterministic, dependency-free embedder based on feature hashing.
+
+    Each word and character bigram is hashed into one of ``dimension`` buckets with a signed weight,
+    and the result is L2-normalized. Texts sharing words end up close in cosine distance, which is
+    enough for local development and benchmarks without an embedding API.
+    """
+
+    def __init__(self, dimension: int = 256):
+        self._dimension = dimension
+
+    @property
+    def model_id(self) -> str:
+        return f"hashing-{self._dimension}"
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    async def embed(self, texts: list[str], task: EmbeddingTask = "document") -> list[list[float]]:
+        return [self.embed_one(text) for text in texts]
+
+    def embed_one(self, text: str) -> list[float]:
+        vector = [0.0] * self._dimension
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            features = [token] + [token[i : i + 2] for i in range(len(token) - 1)]
+            for feature in features:
+                digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % self._dimension
+                vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = math.sqrt(sum(value * value for value in vector))
+        if norm == 0:
+            return vector
+        return [value / norm for value in vector]
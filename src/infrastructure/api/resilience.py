@@ -0,0 +1,207 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from domain.adapter.youtube_api_adapter import YoutubeApiError, YoutubeQuotaExceededError
+
+# 재시도할 상태 코드 (요청 제한, 일시적인 서버 오류)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# 키의 일일 할당량을 모두 사용했음을 뜻하는 403 사유. 같은 키로 재시도해도 소용없음
+QUOTA_EXCEEDED_REASONS = frozenset({"quotaExceeded", "dailyLimitExceeded"})
+# 잠시 후 재시도하면 되는 단기 요청 제한 403 사유
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+
+class CircuitOpenError(YoutubeApiError):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않고 실패한 경우"""
+
+    def __str__(self):
+        return f"CircuitOpenError: {self.message}"
+
+
+class TokenBucket:
+    """토큰 버킷 요청 제한기. 초당 rate개의 토큰이 채워지고 최대 capacity개까지 한 번에 사용할 수 있습니다."""
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰이 생길 때까지 기다린 뒤 하나를 사용합니다."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """일시적인 오류가 failure_threshold번 연속으로 발생하면 요청을 보내지 않고 바로 실패합니다.
+
+    reset_timeout초가 지나면 시험 요청 하나만 통과시키고(half-open), 성공하면 다시 닫히고 실패하면 다시 열립니다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self, name: str) -> None:
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            raise CircuitOpenError(f"circuit open for {name}, retry after {self.reset_timeout:.0f}s")
+        if state == "half_open":
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+class RequestPipeline:
+    """API 요청 하나에 요청 제한, 재시도/백오프, 할당량 초과 감지, 서킷 브레이커를 적용합니다.
+
+    - API 키마다 토큰 버킷을 따로 둡니다.
+    - 429, 5xx, 403 rateLimitExceeded, 네트워크 오류는 지수 백오프와 full jitter로 최대 max_attempts번까지
+      재시도합니다. (Retry-After 헤더가 있으면 그 시간만큼 대기)
+    - 403 quotaExceeded는 호출한 쪽이 키를 교체할 수 있도록 바로 YoutubeQuotaExceededError를 발생시킵니다.
+    - 엔드포인트마다 서킷 브레이커를 두어 일시적인 오류가 반복되면 열립니다.
+    - 그 밖의 오류 응답은 재시도하지 않고 YoutubeApiError를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        rate_per_key: float = 10.0,
+        burst_per_key: float = 20.0,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        self.rate_per_key = rate_per_key
+        self.burst_per_key = burst_per_key
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._buckets: dict[str, TokenBucket] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self.retry_count = 0
+
+    def bucket(self, api_key: str) -> TokenBucket:
+        if api_key not in self._buckets:
+            self._buckets[api_key] = TokenBucket(self.rate_per_key, self.burst_per_key)
+        return self._buckets[api_key]
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        if endpoint not in self._breakers:
+            self._breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self._breakers[endpoint]
+
+    def backoff_delay(self, attempt: int) -> float:
+        """attempt번째(0부터 시작) 재시도 전에 기다릴 시간 (full jitter 지수 백오프)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def send(
+        self, endpoint: str, api_key: str, request: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """요청을 파이프라인을 거쳐 보내고 성공한 응답(200 또는 304 Not Modified)을 반환합니다.
+
+        Args:
+            endpoint (str): API 엔드포인트 이름 (서킷 브레이커 구분에 사용)
+            api_key (str): 요청에 사용하는 API 키 (요청 제한에 사용)
+            request (Callable[[], Awaitable[httpx.Response]]): HTTP 요청을 한 번 보내는 함수
+
+        Raises:
+            YoutubeQuotaExceededError: 키의 일일 할당량을 모두 사용한 경우
+            CircuitOpenError: 엔드포인트의 서킷 브레이커가 열려 있는 경우
+            YoutubeApiError: 재시도하지 않는 오류 응답을 받았거나 재시도 횟수를 모두 사용한 경우
+
+        Returns:
+            httpx.Response: 200 또는 304 응답
+        """
+        breaker = self.breaker(endpoint)
+        for attempt in range(self.max_attempts):
+            breaker.before_call(endpoint)
+            await self.bucket(api_key).acquire()
+            retry_after = None
+            try:
+                response = await request()
+            except httpx.TransportError as e:
+                error = YoutubeApiError(f"{endpoint}: {type(e).__name__}: {e}")
+            else:
+                if response.status_code in (200, 304):
+                    breaker.record_success()
+                    return response
+                reason = error_reason(response)
+                message = f"{endpoint}: {response.status_code} {reason or response.text[:200]}"
+                if response.status_code == 403 and reason in QUOTA_EXCEEDED_REASONS:
+                    breaker.record_success()
+                    raise YoutubeQuotaExceededError(message, response.status_code, reason)
+                retryable = response.status_code in RETRYABLE_STATUS_CODES or (
+                    response.status_code == 403 and reason in RATE_LIMIT_REASONS
+                )
+                if not retryable:
+                    # API는 정상이고 요청 자체의 문제이므로 장애로 보지 않음
+                    breaker.record_success()
+                    raise YoutubeApiError(message, response.status_code, reason)
+                error = YoutubeApiError(message, response.status_code, reason)
+                retry_after = parse_retry_after(response)
+            breaker.record_failure()
+            if attempt + 1 == self.max_attempts:
+                raise error
+            self.retry_count += 1
+            await asyncio.sleep(retry_after if retry_after is not None else self.backoff_delay(attempt))
+        raise AssertionError("unreachable")
+
+
+def error_reason(response: httpx.Response) -> str | None:
+    """YouTube API 오류 응답 본문에서 error.errors[0].reason 값을 꺼냅니다."""
+    try:
+        errors = response.json().get("error", {}).get("errors", [])
+    except ValueError:
+        return None
+    if errors and isinstance(errors[0], dict):
+        return errors[0].get("reason")
+    return None
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,150 @@
+import datetime
+import hashlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from domain.model.api_response_cache import ApiResponseCacheEntry
+from domain.repository.api_response_cache import ApiResponseCacheRepository
+from shared.utils import YOUTUBE_QUOTA_COSTS, data_class_to_dict
+
+# 응답에 영향을 주지 않아 캐시 키에서 제외할 파라미터
+EXCLUDED_PARAMS = frozenset({"key"})
+
+
+@dataclass(slots=True)
+class ResponseCacheMetrics:
+    """응답 캐시 통계
+
+    fresh_hits는 HTTP 요청 없이 응답하므로 그만큼 할당량을 아낍니다.
+    revalidated(304 Not Modified)는 요청은 보내지만 응답 본문을 받지 않습니다.
+    """
+
+    lookups: int = 0
+    fresh_hits: int = 0
+    memory_hits: int = 0
+    mongo_hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    quota_saved: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        if self.lookups == 0:
+            return 0.0
+        return (self.fresh_hits + self.revalidated) / self.lookups
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**data_class_to_dict(self), "hit_ratio": self.hit_ratio}
+
+
+class ResponseCache:
+    """YouTube API 응답을 (엔드포인트, API 키를 제외한 파라미터) 기준으로 저장하는 2단계 캐시
+
+    1단계는 최대 max_entries개를 보관하는 메모리 LRU입니다. repository가 주어지면 항목을 저장소에도 읽고 쓰므로
+    재시작 후에도 캐시가 유지되고 여러 프로세스가 같은 캐시를 사용합니다.
+
+    항목은 엔드포인트별 TTL 동안 요청 없이 그대로 반환하고, 그 뒤로도 stale_ttl까지 보관해 저장한 ETag로
+    If-None-Match 재검증 요청을 보낼 수 있게 합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_by_endpoint: Mapping[str, float] | None = None,
+        default_ttl: float = 300.0,
+        stale_ttl: float = 7 * 24 * 3600.0,
+        repository: ApiResponseCacheRepository | None = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl_by_endpoint = dict(ttl_by_endpoint or {})
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.repository = repository
+        self.metrics = ResponseCacheMetrics()
+        self._entries: OrderedDict[str, ApiResponseCacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(endpoint: str, params: Mapping[str, Any]) -> str:
+        canonical = urlencode(sorted((k, str(v)) for k, v in params.items() if k not in EXCLUDED_PARAMS))
+        return hashlib.sha256(f"{endpoint}?{canonical}".encode()).hexdigest()
+
+    def ttl(self, endpoint: str) -> float:
+        return self.ttl_by_endpoint.get(endpoint, self.default_ttl)
+
+    async def lookup(self, endpoint: str, params: Mapping[str, Any]) -> ApiResponseCacheEntry | None:
+        """요청에 해당하는 캐시 항목(유효하거나 만료된 항목)을 반환하고 조회 통계를 기록합니다.
+
+        유효한 항목은 적중으로 세고 할당량 비용을 아낀 것으로 기록합니다. 만료된 항목은 호출한 쪽이 재검증할 수
+        있도록 그대로 반환하며, 결과에 따라 revalidate() 또는 record_miss()가 통계를 마저 기록합니다.
+        """
+        self.metrics.lookups += 1
+        cache_key = self.make_key(endpoint, params)
+        entry = self._entries.get(cache_key)
+        source = "memory"
+        if entry is not None:
+            self._entries.move_to_end(cache_key)
+        elif self.repository is not None:
+            entry = await self.repository.get_entry(cache_key)
+            if entry is not None:
+                self._remember(entry)
+            source = "mongo"
+        if entry is None:
+            self.metrics.misses += 1
+            return None
+        if entry.is_fresh(datetime.datetime.now(datetime.timezone.utc)):
+            self.metrics.fresh_hits += 1
+            self.metrics.quota_saved += YOUTUBE_QUOTA_COSTS.get(endpoint, 1)
+            if source == "memory":
+                self.metrics.memory_hits += 1
+            else:
+                self.metrics.mongo_hits += 1
+        return entry
+
+    async def store(self, endpoint: str, params: Mapping[str, Any], body: dict, etag: str | None) -> None:
+        """200 응답 본문을 ETag와 함께 저장합니다."""
+        now = datetime.datetime.now(datetime.timezone.utc)
+        ttl = self.ttl(endpoint)
+        entry = ApiResponseCacheEntry(
+            cache_key=self.make_key(endpoint, params),
+            endpoint=endpoint,
+            body=body,
+            etag=etag,
+            cached_at=now,
+            expires_at=now + datetime.timedelta(seconds=ttl),
+            purge_at=now + datetime.timedelta(seconds=max(ttl, self.stale_ttl)),
+        )
+        await self._save(entry)
+
+    async def revalidate(self, entry: ApiResponseCacheEntry) -> None:
+        """API가 304 Not Modified로 응답한 만료 항목의 유효 기간을 연장합니다."""
+        self.metrics.revalidated += 1
+        now = datetime.datetime.now(datetime.timezone.utc)
+        ttl = self.ttl(entry.endpoint)
+        entry.expires_at = now + datetime.timedelta(seconds=ttl)
+        entry.purge_at = now + datetime.timedelta(seconds=max(ttl, self.stale_ttl))
+        await self._save(entry)
+
+    def record_miss(self) -> None:
+        """재검증 요청에 새 응답 본문이 돌아온 만료 항목을 미스로 셉니다."""
+        self.metrics.misses += 1
+
+    async def _save(self, entry: ApiResponseCacheEntry) -> None:
+        self._remember(entry)
+        if self.repository is not None:
+            await self.repository.save_entry(entry)
+
+    def _remember(self, entry: ApiResponseCacheEntry) -> None:
+        self._entries[entry.cache_key] = entry
+        self._entries.move_to_end(entry.cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.metrics.evictions += 1
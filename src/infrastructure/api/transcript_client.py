@@ -0,0 +1,43 @@
+from youtube_transcript_api import (
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    YouTubeTranscriptApi,
+)
+
+from domain.adapter.transcript_adapter import TranscriptAdapter, TranscriptUnavailableError
+from domain.model.youtube import YoutubeTranscript
+
+
+class YoutubeTranscriptClient(TranscriptAdapter):
+    """youtube-transcript-api로 자막을 가져오는 클라이언트
+
+    라이브러리가 동기 방식이므로 호출하는 쪽에서 fetch_transcript를 워커 스레드에서 실행해야 합니다.
+    """
+
+    def __init__(self):
+        self._api = YouTubeTranscriptApi()
+
+    def fetch_transcript(self, video_id: str, languages: list[str]) -> YoutubeTranscript:
+        """비디오의 자막을 가져옵니다.
+
+        Args:
+            video_id (str): 유튜브 비디오 ID
+            languages (list[str]): 우선순위 순서의 언어 코드 목록
+
+        Raises:
+            TranscriptUnavailableError: 요청한 언어의 자막이 없거나, 자막이 비활성화되었거나, 비디오를 볼 수 없는 경우
+
+        Returns:
+            YoutubeTranscript: 가져온 자막
+        """
+        try:
+            fetched = self._api.fetch(video_id, languages=languages)
+        except (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable) as e:
+            raise TranscriptUnavailableError(f"{video_id}: {type(e).__name__}")
+        return YoutubeTranscript(
+            video_id=video_id,
+            language_code=fetched.language_code,
+            is_generated=fetched.is_generated,
+            segments=fetched.to_raw_data(),
+        )
@@ -1,11 +1,113 @@
+import datetime
+from contextvars import ContextVar
+
 import httpx
 
 from domain.adapter.youtube_api_adapter import YoutubeApiAdapter
+from infrastructure.api.resilience import RequestPipeline
+from infrastructure.api.response_cache import ResponseCache
+
+# Whether the last request made by the current task was answered from a fresh cache entry.
+_served_from_cache: ContextVar[bool] = ContextVar("served_from_cache", default=False)
 
 
 class YoutubeAPIClient(YoutubeApiAdapter):
-    def __init__(self):
-        self.base_url = "https://www.googleapis.com/youtube/v3"
+    """YouTube Data API client backed by a long-lived, connection-pooled httpx client.
+
+    The underlying ``httpx.AsyncClient`` is created on ``start()`` (or lazily on the first request)
+    and reused for every call, so keep-alive connections skip TCP/TLS setup after the first request.
+    Call ``aclose()`` on shutdown, or use the client as an async context manager.
+
+    Every request goes through a ``RequestPipeline`` (per-key rate limiting, retry with backoff,
+    quota detection, circuit breaking). Error responses raise ``YoutubeApiError`` and its subclasses;
+    ``None`` is only returned when the API answers successfully but the resource does not exist.
+
+    With a ``ResponseCache``, fresh responses are served without a request and stale ones are
+    revalidated with ``If-None-Match``; a 304 reuses the cached body.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://www.googleapis.com/youtube/v3",
+        http2: bool = False,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+        pipeline: RequestPipeline | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        self.base_url = base_url
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self.pipeline = pipeline if pipeline is not None else RequestPipeline()
+        self.cache = cache
+
+    async def start(self) -> None:
+        """Open the pooled HTTP client. Safe to call more than once."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "YoutubeAPIClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def served_from_cache(self) -> bool:
+        return _served_from_cache.get()
+
+    async def _get(self, path: str, params: dict) -> dict:
+        _served_from_cache.set(False)
+        entry = None
+        if self.cache is not None:
+            entry = await self.cache.lookup(path, params)
+            if entry is not None and entry.is_fresh(datetime.datetime.now(datetime.timezone.utc)):
+                _served_from_cache.set(True)
+                return entry.body
+
+        if self._client is None or self._client.is_closed:
+            await self.start()
+        client = self._client
+        assert client is not None
+        url = f"{self.base_url}/{path}"
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+
+        async def request() -> httpx.Response:
+            return await client.get(url, params=params, headers=headers)
+
+        response = await self.pipeline.send(path, params["key"], request)
+        if response.status_code == 304 and self.cache is not None and entry is not None:
+            await self.cache.revalidate(entry)
+            return entry.body
+
+        body = response.json()
+        if self.cache is not None:
+            if entry is not None:
+                self.cache.record_miss()
+            await self.cache.store(path, params, body, response.headers.get("ETag") or body.get("etag"))
+        return body
 
     async def fetch_channel_id(self, handle: str, api_key: str) -> str | None:
         """Fetch YouTube channel ID by handle.
@@ -17,17 +119,46 @@ class YoutubeAPIClient(YoutubeApiAdapter):
         Returns:
             str | None: The YouTube channel ID or None if not found.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/channels",
-                params={"key": api_key, "forHandle": handle},
-            )
-        if response.status_code == 200:
-            return response.json().get("items", [])[0].get("id")
-        else:
-            print(f"Error fetching channel data: {response.status_code, response.text}")
+        response = await self._get("channels", params={"key": api_key, "forHandle": handle})
+        items = response.get("items", [])
+        if items:
+            return items[0].get("id")
+        return None
+
+    async def fetch_channel_by_handle(self, handle: str, api_key: str) -> dict | None:
+        """Fetch a channel (snippet, contentDetails) by handle.
+
+        Args:
+            handle (str): The YouTube channel handle.
+            api_key (str): The API key for authentication.
+
+        Returns:
+            dict | None: The channel resource or None if not found.
+        """
+        params = {"key": api_key, "forHandle": handle, "part": "snippet,contentDetails"}
+        items = (await self._get("channels", params=params)).get("items", [])
+        if items:
+            return items[0]
         return None
 
+    async def fetch_channels(self, channel_ids: list[str], api_key: str) -> dict | None:
+        """Fetch up to 50 channels (snippet, contentDetails) in one request (channels.list).
+
+        Args:
+            channel_ids (list[str]): Up to 50 YouTube channel IDs.
+            api_key (str): API key for authentication.
+
+        Returns:
+            dict | None: The channels response.
+        """
+        params = {
+            "key": api_key,
+            "id": ",".join(channel_ids),
+            "part": "snippet,contentDetails",
+            "maxResults": "50",
+        }
+        return await self._get("channels", params=params)
+
     async def fetch_channel_videos(
         self,
         api_key: str,
@@ -62,10 +193,65 @@ class YoutubeAPIClient(YoutubeApiAdapter):
         if page_token:
             params["pageToken"] = page_token
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.base_url}/search", params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"Error fetching videos: {response.status_code, response.text}")
+        return await self._get("search", params=params)
+
+    async def fetch_uploads_playlist_id(self, channel_id: str, api_key: str) -> str | None:
+        """Fetch the uploads playlist ID of a channel (channels.list, contentDetails).
+
+        Args:
+            channel_id (str): YouTube channel ID.
+            api_key (str): API key for authentication.
+
+        Returns:
+            str | None: The uploads playlist ID or None if not found.
+        """
+        response = await self._get("channels", params={"key": api_key, "id": channel_id, "part": "contentDetails"})
+        items = response.get("items", [])
+        if items:
+            return items[0].get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
         return None
+
+    async def fetch_playlist_items(
+        self,
+        playlist_id: str,
+        api_key: str,
+        page_token: str | None = None,
+    ) -> dict | None:
+        """Fetch a page of playlist items (playlistItems.list).
+
+        Args:
+            playlist_id (str): YouTube playlist ID.
+            api_key (str): API key for authentication.
+            page_token (str | None, optional): page token for pagination. Defaults to None.
+
+        Returns:
+            dict | None: The playlist items response.
+        """
+        params = {
+            "key": api_key,
+            "playlistId": playlist_id,
+            "part": "snippet,contentDetails",
+            "maxResults": "50",
+        }
+        if page_token:
+            params["pageToken"] = page_token
+
+        return await self._get("playlistItems", params=params)
+
+    async def fetch_videos(self, video_ids: list[str], api_key: str) -> dict | None:
+        """Fetch video details for up to 50 videos in one request (videos.list).
+
+        Args:
+            video_ids (list[str]): Up to 50 YouTube video IDs.
+            api_key (str): API key for authentication.
+
+        Returns:
+            dict | None: The videos response.
+        """
+        params = {
+            "key": api_key,
+            "id": ",".join(video_ids),
+            "part": "snippet,contentDetails,statistics",
+            "maxResults": "50",
+        }
+        return await self._get("videos", params=params)
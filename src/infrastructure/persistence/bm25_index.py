@@ -0,0 +1,439 @@
+import json
+import math
+import os
+import re
+import shutil
+import unicodedata
+import uuid
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from domain.model.embedding import DocumentChunk
+from domain.model.search import SearchFilter
+from domain.repository.lexical_index import LexicalIndexRepository
+from shared.utils import as_utc
+
+# 한글(음절, 호환/조합형 자모), 가나, 한자는 띄어쓰기와 조사에 영향받지 않도록 문자 n-gram으로 나누고
+# 나머지 문자(영문, 숫자 등)는 단어 단위로 색인
+_CJK = "\u1100-\u11ff\u3040-\u30ff\u3131-\u318e\u4e00-\u9fff\uac00-\ud7a3"
+_TOKEN_PATTERN = re.compile(rf"([{_CJK}]+)|([^\W_{_CJK}]+)")
+_MAX_TF = 65535  # 단어 빈도는 uint16으로 저장
+_MANIFEST = "manifest.json"
+
+
+def tokenize(text: str, ngram: int = 2) -> list[str]:
+    """텍스트를 색인/검색용 토큰으로 나눕니다.
+
+    한글 등은 ngram 글자씩 겹쳐서 자르고(ngram보다 짧으면 그대로), 나머지는 소문자 단어로 나눕니다.
+    예: "시부키가 ASMR 했음" → ["시부", "부키", "키가", "asmr", "했음"]
+    """
+    tokens = []
+    for cjk, word in _TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower()):
+        if len(cjk) > ngram:
+            tokens.extend([cjk[index : index + ngram] for index in range(len(cjk) - ngram + 1)])
+        else:
+            tokens.append(cjk or word)
+    return tokens
+
+
+def _load_array(path: Path, dtype: Any) -> np.ndarray:
+    # 빈 파일은 메모리 맵으로 열 수 없음
+    if path.stat().st_size == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+class _Segment:
+    """디스크에 저장된 변경 불가능한 색인 조각. 문서 ID는 [base, base + count) 범위를 연속으로 사용합니다.
+
+    단어 → 순번은 메모리의 딕셔너리로, 포스팅(문서 ID, 단어 빈도)과 문서별 값은 메모리 맵 배열로 읽습니다.
+    """
+
+    def __init__(self, path: Path):
+        meta = json.loads((path / "meta.json").read_text())
+        self.path = path
+        self.base: int = meta["base"]
+        self.count: int = meta["count"]
+        self.total_tokens: int = meta["total_tokens"]
+        self.channels: list[str] = meta["channels"]
+        self.streamers: list[str] = meta["streamers"]
+        self.channel_codes = {value: code for code, value in enumerate(self.channels)}
+        self.streamer_codes = {value: code for code, value in enumerate(self.streamers)}
+        terms = (path / "terms.txt").read_text("utf-8")
+        self.terms = {term: index for index, term in enumerate(terms.split("\n"))} if terms else {}
+        self.offsets = _load_array(path / "offsets.u64", np.uint64)
+        self.postings = _load_array(path / "postings.u32", np.uint32)
+        self.tfs = _load_array(path / "tfs.u16", np.uint16)
+        self.doc_lengths = _load_array(path / "doc_lengths.u32", np.uint32)
+        self.doc_channels = _load_array(path / "channels.u32", np.uint32)
+        self.doc_streamers = _load_array(path / "streamers.u32", np.uint32)
+        self.doc_published = _load_array(path / "published.f64", np.float64)
+        self.chunk_ids = _load_array(path / "chunk_ids.bin", np.uint8).reshape(-1, 16)
+        self.deleted = np.zeros(self.count, dtype=bool)
+
+    def postings_of(self, term: str) -> tuple[np.ndarray, np.ndarray] | None:
+        index = self.terms.get(term)
+        if index is None:
+            return None
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return self.postings[start:end], self.tfs[start:end]
+
+    def chunk_id(self, doc_id: int) -> str:
+        return str(uuid.UUID(bytes=self.chunk_ids[doc_id - self.base].tobytes()))
+
+
+class _SegmentWriter:
+    """새 세그먼트에 들어갈 청크를 메모리에 모았다가 배열 파일로 기록합니다.
+
+    청크마다 (단어 순번, 빈도)를 이어 붙여 두고, 기록할 때 단어 순번으로 안정 정렬해 포스팅을 만듭니다.
+    """
+
+    def __init__(self, base: int, ngram: int):
+        self.base = base
+        self.ngram = ngram
+        self.term_ids: dict[str, int] = {}
+        self.doc_terms = array("I")
+        self.doc_tfs = array("I")
+        self.doc_term_counts = array("I")
+        self.doc_lengths = array("I")
+        self.doc_channels = array("I")
+        self.doc_streamers = array("I")
+        self.doc_published = array("d")
+        self.chunk_ids = bytearray()
+        self.channels: dict[str, int] = {}
+        self.streamers: dict[str, int] = {}
+
+    @property
+    def count(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, chunk: DocumentChunk) -> None:
+        frequencies = Counter(tokenize(chunk.text, self.ngram))
+        term_ids = self.term_ids
+        self.doc_terms.extend([term_ids.setdefault(term, len(term_ids)) for term in frequencies])
+        self.doc_tfs.extend(frequencies.values())
+        self.doc_term_counts.append(len(frequencies))
+        self.doc_lengths.append(sum(frequencies.values()))
+        self.doc_channels.append(self.channels.setdefault(chunk.channel_id, len(self.channels)))
+        self.doc_streamers.append(self.streamers.setdefault(chunk.streamer_name, len(self.streamers)))
+        published_at = as_utc(chunk.published_at).timestamp() if chunk.published_at else math.nan
+        self.doc_published.append(published_at)
+        self.chunk_ids += uuid.UUID(chunk.chunk_id).bytes
+
+    def write(self, path: Path) -> None:
+        doc_terms = np.frombuffer(self.doc_terms, dtype=np.uint32)
+        doc_ids = np.repeat(
+            np.arange(self.base, self.base + self.count, dtype=np.uint32),
+            np.frombuffer(self.doc_term_counts, dtype=np.uint32),
+        )
+        # 같은 단어 안에서는 문서 ID 순서를 유지
+        order = np.argsort(doc_terms, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(doc_terms, minlength=len(self.term_ids)))])
+        _write_segment(
+            path,
+            meta={
+                "base": self.base,
+                "count": self.count,
+                "total_tokens": sum(self.doc_lengths),
+                "channels": list(self.channels),
+                "streamers": list(self.streamers),
+            },
+            terms=list(self.term_ids),
+            arrays={
+                "offsets.u64": offsets.astype(np.uint64),
+                "postings.u32": doc_ids[order],
+                "tfs.u16": np.minimum(np.frombuffer(self.doc_tfs, dtype=np.uint32)[order], _MAX_TF).astype(np.uint16),
+                "doc_lengths.u32": self.doc_lengths,
+                "channels.u32": self.doc_channels,
+                "streamers.u32": self.doc_streamers,
+                "published.f64": self.doc_published,
+                "chunk_ids.bin": self.chunk_ids,
+            },
+        )
+
+
+def _write_segment(path: Path, meta: dict[str, Any], terms: list[str], arrays: dict[str, Any]) -> None:
+    # 임시 디렉터리에 모두 기록한 뒤 이름을 바꿔, 중간에 종료되어도 반쯤 쓰인 세그먼트가 남지 않도록 함
+    temp_path = path.with_name(path.name + ".tmp")
+    shutil.rmtree(temp_path, ignore_errors=True)
+    temp_path.mkdir(parents=True)
+    for name, values in arrays.items():
+        with open(temp_path / name, "wb") as file:
+            file.write(memoryview(values).cast("B") if not isinstance(values, np.ndarray) else values.tobytes())
+    (temp_path / "terms.txt").write_text("\n".join(terms), "utf-8")
+    (temp_path / "meta.json").write_text(json.dumps(meta, ensure_ascii=False))
+    os.replace(temp_path, path)
+
+
+class DiskBm25Index(LexicalIndexRepository):
+    """청크 텍스트의 BM25 역색인을 로컬 디스크에 세그먼트 단위로 저장합니다.
+
+    - commit할 때마다 새 세그먼트(배열 파일 묶음)를 쓰고, manifest.json을 원자적으로 교체해 반영합니다.
+    - 포스팅은 단어별로 정렬된 uint32 문서 ID와 uint16 빈도 배열이며, 검색할 때 메모리 맵으로 읽어 numpy로
+      점수를 계산합니다.
+    - 다시 색인한 비디오의 이전 청크는 삭제 목록에 기록해 두고 검색에서 제외하며, merge_segments에서 실제로 제거합니다.
+    - 색인을 쓰는 프로세스는 하나여야 하고, 다른 프로세스는 manifest.json이 바뀌면 다시 읽어 새 색인을 검색합니다.
+    """
+
+    def __init__(self, directory: str, k1: float = 1.2, b: float = 0.75, ngram: int = 2):
+        self.directory = Path(directory)
+        self.k1 = k1
+        self.b = b
+        self.ngram = ngram
+        self._segments: list[_Segment] = []
+        self._videos: dict[str, list] = {}  # video_id → [content_hash, 첫 문서 ID, 청크 수]
+        self._deleted: set[int] = set()
+        self._next_doc_id = 0
+        self._generation = 0
+        self._manifest_mtime: int | None = None
+        self._writer: _SegmentWriter | None = None
+        self._pending_videos: dict[str, list] = {}
+        self._pending_deleted: set[int] = set()
+        self._load()
+
+    async def get_content_hashes(self, video_ids: list[str]) -> dict[str, str]:
+        hashes = {}
+        for video_id in video_ids:
+            entry = self._pending_videos.get(video_id) or self._videos.get(video_id)
+            if entry is not None:
+                hashes[video_id] = entry[0]
+        return hashes
+
+    async def add_video(self, video_id: str, content_hash: str, chunks: list[DocumentChunk]) -> None:
+        previous = self._pending_videos.get(video_id) or self._videos.get(video_id)
+        if previous is not None:
+            _, first_doc_id, count = previous
+            self._pending_deleted.update(range(first_doc_id, first_doc_id + count))
+        if self._writer is None:
+            self._writer = _SegmentWriter(self._next_doc_id, self.ngram)
+        first_doc_id = self._writer.base + self._writer.count
+        for chunk in chunks:
+            self._writer.add(chunk)
+        self._pending_videos[video_id] = [content_hash, first_doc_id, len(chunks)]
+
+    async def commit(self) -> None:
+        if not self._pending_videos and not self._pending_deleted:
+            return
+        segment_names = [segment.path.name for segment in self._segments]
+        next_doc_id = self._next_doc_id
+        if self._writer is not None and self._writer.count:
+            name = f"seg-{self._writer.base:012d}"
+            self._writer.write(self.directory / name)
+            segment_names.append(name)
+            next_doc_id = self._writer.base + self._writer.count
+        videos = {**self._videos, **self._pending_videos}
+        # 같은 실행에서 추가했다가 다시 대체한 청크는 세그먼트에 기록되지 않았을 수도 있으므로 범위 안의 것만 남김
+        deleted = {doc_id for doc_id in self._deleted | self._pending_deleted if doc_id < next_doc_id}
+        self._write_manifest(segment_names, videos, deleted, next_doc_id)
+        self._writer = None
+        self._pending_videos = {}
+        self._pending_deleted = set()
+        self._load()
+
+    async def search(
+        self, query: str, limit: int = 10, search_filter: SearchFilter | None = None
+    ) -> list[tuple[str, float]]:
+        self._reload_if_changed()
+        frequencies = Counter(tokenize(query, self.ngram))
+        live_docs = sum(entry[2] for entry in self._videos.values())
+        if not frequencies or live_docs == 0 or limit < 1:
+            return []
+        total_docs = sum(segment.count for segment in self._segments)
+        average_length = max(sum(segment.total_tokens for segment in self._segments) / total_docs, 1e-9)
+        idfs = {}
+        for term in frequencies:
+            document_frequency = sum(
+                len(postings[0]) for segment in self._segments if (postings := segment.postings_of(term)) is not None
+            )
+            if document_frequency:
+                idfs[term] = math.log(1 + (live_docs - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        candidates: list[tuple[float, _Segment, int]] = []
+        for segment in self._segments:
+            scores = self._score_segment(segment, frequencies, idfs, average_length)
+            if scores is None:
+                continue
+            mask = (scores > 0) & ~segment.deleted
+            if search_filter is not None and not self._apply_filter(segment, search_filter, mask):
+                continue
+            doc_indexes = np.flatnonzero(mask)
+            if len(doc_indexes) > limit:
+                doc_indexes = doc_indexes[np.argpartition(-scores[doc_indexes], limit)[:limit]]
+            candidates.extend((float(scores[index]), segment, int(index)) for index in doc_indexes)
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        return [(segment.chunk_id(segment.base + index), score) for score, segment, index in candidates[:limit]]
+
+    async def merge_segments(self) -> None:
+        """모든 세그먼트를 하나로 합치면서 삭제된 청크를 포스팅에서 제거합니다.
+
+        세그먼트의 문서 ID 범위는 연속이므로 문서별 배열은 그대로 이어 붙이고, 포스팅은 단어 순번으로 안정 정렬해
+        단어별 문서 ID 순서를 유지합니다.
+        """
+        self._reload_if_changed()
+        if len(self._segments) <= 1 and not self._deleted:
+            return
+        terms = sorted(set().union(*(segment.terms for segment in self._segments)))
+        term_ids = {term: index for index, term in enumerate(terms)}
+        channels: dict[str, int] = {}
+        streamers: dict[str, int] = {}
+        parts: dict[str, list[np.ndarray]] = {name: [] for name in ("terms", "postings", "tfs")}
+        doc_arrays: dict[str, list[np.ndarray]] = {
+            name: [] for name in ("doc_lengths", "channels", "streamers", "published", "chunk_ids")
+        }
+        for segment in self._segments:
+            segment_term_ids = np.fromiter((term_ids[term] for term in segment.terms), dtype=np.uint32)
+            posting_terms = np.repeat(segment_term_ids, np.diff(segment.offsets.astype(np.int64)))
+            keep = ~segment.deleted[segment.postings.astype(np.int64) - segment.base]
+            parts["terms"].append(posting_terms[keep])
+            parts["postings"].append(segment.postings[keep])
+            parts["tfs"].append(segment.tfs[keep])
+            doc_lengths = np.where(segment.deleted, 0, segment.doc_lengths).astype(np.uint32)
+            channel_map = np.array([channels.setdefault(c, len(channels)) for c in segment.channels], dtype=np.uint32)
+            streamer_map = np.array(
+                [streamers.setdefault(s, len(streamers)) for s in segment.streamers], dtype=np.uint32
+            )
+            doc_arrays["doc_lengths"].append(doc_lengths)
+            doc_arrays["channels"].append(channel_map[segment.doc_channels])
+            doc_arrays["streamers"].append(streamer_map[segment.doc_streamers])
+            doc_arrays["published"].append(np.asarray(segment.doc_published))
+            doc_arrays["chunk_ids"].append(np.asarray(segment.chunk_ids))
+
+        posting_terms = np.concatenate(parts["terms"])
+        order = np.argsort(posting_terms, kind="stable")
+        term_counts = np.bincount(posting_terms, minlength=len(terms))
+        offsets = np.concatenate([[0], np.cumsum(term_counts)]).astype(np.uint64)
+        # 삭제된 청크에만 있던 단어는 포스팅이 빈 채로 남음 (다음 병합에서도 무시됨)
+        doc_lengths = np.concatenate(doc_arrays["doc_lengths"])
+        base = self._segments[0].base
+        name = f"seg-{base:012d}-m{self._generation + 1}"
+        _write_segment(
+            self.directory / name,
+            meta={
+                "base": base,
+                "count": len(doc_lengths),
+                "total_tokens": int(doc_lengths.sum()),
+                "channels": list(channels),
+                "streamers": list(streamers),
+            },
+            terms=terms,
+            arrays={
+                "offsets.u64": offsets,
+                "postings.u32": np.concatenate(parts["postings"])[order],
+                "tfs.u16": np.concatenate(parts["tfs"])[order],
+                "doc_lengths.u32": doc_lengths,
+                "channels.u32": np.concatenate(doc_arrays["channels"]).astype(np.uint32),
+                "streamers.u32": np.concatenate(doc_arrays["streamers"]).astype(np.uint32),
+                "published.f64": np.concatenate(doc_arrays["published"]),
+                "chunk_ids.bin": np.concatenate(doc_arrays["chunk_ids"]),
+            },
+        )
+        # 삭제된 청크는 포스팅에서 제거되었으므로 삭제 목록도 비움
+        self._write_manifest([name], self._videos, set(), self._next_doc_id)
+        self._load()
+
+    async def stats(self) -> dict[str, Any]:
+        self._reload_if_changed()
+        return {
+            "videos": len(self._videos),
+            "chunks": sum(entry[2] for entry in self._videos.values()),
+            "deleted_chunks": len(self._deleted),
+            "segments": len(self._segments),
+            "terms": sum(len(segment.terms) for segment in self._segments),
+            "size_bytes": sum(file.stat().st_size for segment in self._segments for file in segment.path.iterdir()),
+        }
+
+    def _score_segment(
+        self, segment: _Segment, frequencies: Counter, idfs: dict[str, float], average_length: float
+    ) -> np.ndarray | None:
+        scores = None
+        for term, query_frequency in frequencies.items():
+            idf = idfs.get(term)
+            postings = segment.postings_of(term) if idf is not None else None
+            if postings is None:
+                continue
+            doc_indexes = postings[0].astype(np.int64) - segment.base
+            tf = postings[1].astype(np.float32)
+            length_norm = 1 - self.b + self.b * segment.doc_lengths[doc_indexes].astype(np.float32) / average_length
+            if scores is None:
+                scores = np.zeros(segment.count, dtype=np.float32)
+            # 한 단어의 포스팅 안에서 문서 ID는 중복되지 않으므로 fancy indexing으로 더해도 됨
+            scores[doc_indexes] += query_frequency * idf * tf * (self.k1 + 1) / (tf + self.k1 * length_norm)
+        return scores
+
+    @staticmethod
+    def _apply_filter(segment: _Segment, search_filter: SearchFilter, mask: np.ndarray) -> bool:
+        """조건에 맞지 않는 문서를 mask에서 제외합니다. 조건에 맞는 문서가 있을 수 없으면 False를 반환합니다."""
+        if search_filter.channel_id:
+            code = segment.channel_codes.get(search_filter.channel_id)
+            if code is None:
+                return False
+            mask &= segment.doc_channels == code
+        if search_filter.streamer_name:
+            code = segment.streamer_codes.get(search_filter.streamer_name)
+            if code is None:
+                return False
+            mask &= segment.doc_streamers == code
+        # 게시 시각이 없는 문서(NaN)는 비교 결과가 항상 False라 기간 조건이 있으면 제외됨
+        if search_filter.published_from:
+            mask &= segment.doc_published >= as_utc(search_filter.published_from).timestamp()
+        if search_filter.published_to:
+            mask &= segment.doc_published <= as_utc(search_filter.published_to).timestamp()
+        return True
+
+    def _write_manifest(
+        self, segment_names: list[str], videos: dict[str, list], deleted: set[int], next_doc_id: int
+    ) -> None:
+        generation = self._generation + 1
+        (self.directory / f"videos-{generation}.json").write_text(json.dumps(videos))
+        with open(self.directory / f"deleted-{generation}.u64", "wb") as file:
+            array("Q", sorted(deleted)).tofile(file)
+        manifest = {
+            "generation": generation,
+            "segments": segment_names,
+            "next_doc_id": next_doc_id,
+            "ngram": self.ngram,
+        }
+        temp_path = self.directory / f"{_MANIFEST}.tmp"
+        temp_path.write_text(json.dumps(manifest))
+        os.replace(temp_path, self.directory / _MANIFEST)
+        # 이전 세대의 파일과 더 이상 쓰지 않는 세그먼트 정리
+        for path in self.directory.iterdir():
+            if path.name.startswith(("videos-", "deleted-")) and not path.stem.endswith(f"-{generation}"):
+                path.unlink()
+            elif path.is_dir() and path.name.startswith("seg-") and path.name not in segment_names:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _load(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.directory / _MANIFEST
+        if not manifest_path.exists():
+            return
+        self._manifest_mtime = manifest_path.stat().st_mtime_ns
+        manifest = json.loads(manifest_path.read_text())
+        if manifest["ngram"] != self.ngram:
+            raise ValueError(
+                f"색인의 ngram({manifest['ngram']})이 설정({self.ngram})과 다릅니다. 색인을 다시 만들어야 합니다"
+            )
+        generation = manifest["generation"]
+        self._generation = generation
+        self._next_doc_id = manifest["next_doc_id"]
+        self._videos = json.loads((self.directory / f"videos-{generation}.json").read_text())
+        self._deleted = set(np.fromfile(self.directory / f"deleted-{generation}.u64", dtype=np.uint64).tolist())
+        self._segments = [_Segment(self.directory / name) for name in manifest["segments"]]
+        deleted = np.fromiter(self._deleted, dtype=np.int64, count=len(self._deleted))
+        for segment in self._segments:
+            in_segment = deleted[(deleted >= segment.base) & (deleted < segment.base + segment.count)]
+            segment.deleted[in_segment - segment.base] = True
+
+    def _reload_if_changed(self) -> None:
+        manifest_path = self.directory / _MANIFEST
+        try:
+            mtime = manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime != self._manifest_mtime and self._writer is None:
+            self._load()
@@ -0,0 +1,146 @@
+import datetime
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Literal
+
+from domain.repository.embedding import EmbeddingCacheRepository
+
+VectorDType = Literal["float16", "float32"]
+
+_STRUCT_CODES: dict[VectorDType, str] = {"float16": "e", "float32": "f"}
+_KEY_SIZE = 32  # sha256 다이제스트
+_HEADER = struct.Struct(f"<{_KEY_SIZE}sd")  # (키, 마지막 사용 시각)
+_EMPTY_KEY = bytes(_KEY_SIZE)
+
+
+def encode_vector(vector: list[float], dtype: VectorDType) -> bytes:
+    """벡터를 리틀 엔디언 float16/float32 배열 바이트로 변환합니다."""
+    return struct.pack(f"<{len(vector)}{_STRUCT_CODES[dtype]}", *vector)
+
+
+def decode_vector(data: bytes, dtype: VectorDType) -> list[float]:
+    """encode_vector로 만든 바이트를 벡터로 되돌립니다."""
+    code = _STRUCT_CODES[dtype]
+    return list(struct.unpack(f"<{len(data) // struct.calcsize(code)}{code}", data))
+
+
+class MmapEmbeddingCacheRepository(EmbeddingCacheRepository):
+    """임베딩 캐시를 로컬 디스크의 고정 길이 레코드 파일에 저장하고 메모리 맵으로 읽습니다.
+
+    - 레코드는 (키 32바이트, 마지막 사용 시각, 벡터)이고 파일 끝에 추가만 합니다.
+    - 키 → 레코드 위치 색인은 파일을 열 때 만들고, 벡터는 필요한 레코드만 메모리 맵에서 읽습니다.
+    - 삭제한 레코드는 키를 0으로 지워두기만 하므로 compact로 파일을 다시 써야 공간이 회수됩니다.
+    - 파일은 차원과 자료형별로 나뉘며, 한 프로세스에서만 사용해야 합니다.
+    """
+
+    def __init__(self, directory: str, dimension: int, dtype: VectorDType = "float16"):
+        self.dimension = dimension
+        self.dtype = dtype
+        self.path = Path(directory) / f"embeddings-{dimension}-{dtype}.bin"
+        self._vector_size = struct.calcsize(f"<{dimension}{_STRUCT_CODES[dtype]}")
+        self._record_size = _HEADER.size + self._vector_size
+        self._index: dict[bytes, int] = {}
+        self._record_count = 0
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._open()
+
+    async def get_vectors(self, keys: list[str]) -> dict[str, list[float]]:
+        vectors = {}
+        now = time.time()
+        for key in keys:
+            slot = self._index.get(bytes.fromhex(key))
+            if slot is None:
+                continue
+            offset = slot * self._record_size
+            struct.pack_into("<d", self._map, offset + _KEY_SIZE, now)
+            vectors[key] = decode_vector(self._map[offset + _HEADER.size : offset + self._record_size], self.dtype)
+        return vectors
+
+    async def save_vectors(self, vectors: dict[str, list[float]]) -> None:
+        now = time.time()
+        records = bytearray()
+        new_keys = []
+        for key, vector in vectors.items():
+            digest = bytes.fromhex(key)
+            if digest in self._index or len(vector) != self.dimension:
+                continue
+            records += _HEADER.pack(digest, now) + encode_vector(vector, self.dtype)
+            new_keys.append(digest)
+        if not records:
+            return
+        # 파일은 추가 모드로 열려 있으므로 항상 마지막 레코드 뒤에 기록됨
+        self._close_map()
+        self._file.write(records)
+        self._file.flush()
+        for digest in new_keys:
+            self._index[digest] = self._record_count
+            self._record_count += 1
+        self._open_map()
+
+    async def count(self) -> int:
+        return len(self._index)
+
+    async def evict(self, max_entries: int | None = None, unused_before: datetime.datetime | None = None) -> int:
+        last_used = {
+            digest: _HEADER.unpack_from(self._map, slot * self._record_size)[1] for digest, slot in self._index.items()
+        }
+        evicted = set()
+        if unused_before is not None:
+            cutoff = unused_before.timestamp()
+            evicted.update(digest for digest, used_at in last_used.items() if used_at < cutoff)
+        if max_entries is not None and len(last_used) - len(evicted) > max_entries:
+            remaining = sorted((used_at, digest) for digest, used_at in last_used.items() if digest not in evicted)
+            evicted.update(digest for _, digest in remaining[: len(remaining) - max_entries])
+        for digest in evicted:
+            offset = self._index.pop(digest) * self._record_size
+            self._map[offset : offset + _KEY_SIZE] = _EMPTY_KEY
+        if evicted:
+            self._map.flush()
+        return len(evicted)
+
+    async def compact(self) -> None:
+        """남은 레코드만 임시 파일에 다시 쓴 뒤 원래 파일과 교체합니다."""
+        temp_path = self.path.with_suffix(".tmp")
+        slots = sorted(self._index.values())
+        with open(temp_path, "wb") as temp_file:
+            for slot in slots:
+                offset = slot * self._record_size
+                temp_file.write(self._map[offset : offset + self._record_size])
+        self.close()
+        os.replace(temp_path, self.path)
+        self._open()
+
+    def close(self) -> None:
+        self._close_map()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a+b")
+        # 추가 도중 종료되어 잘린 마지막 레코드는 버림
+        size = os.fstat(self._file.fileno()).st_size
+        self._record_count = size // self._record_size
+        if size % self._record_size:
+            self._file.truncate(self._record_count * self._record_size)
+        self._open_map()
+        self._index = {}
+        for slot in range(self._record_count):
+            offset = slot * self._record_size
+            digest = self._map[offset : offset + _KEY_SIZE]
+            if digest != _EMPTY_KEY:
+                self._index[digest] = slot
+
+    def _open_map(self) -> None:
+        if self._record_count:
+            self._map = mmap.mmap(self._file.fileno(), self._record_count * self._record_size)
+
+    def _close_map(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
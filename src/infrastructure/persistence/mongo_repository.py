@@ -1,13 +1,45 @@
+import asyncio
 import datetime
+import json
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, Literal
 
 # from pymongo import AsyncMongoClient
-from pymongo.errors import PyMongoError
+import bson
+from bson import Binary, ObjectId
+from bson.raw_bson import RawBSONDocument
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import OperationFailure, PyMongoError
 
 from audit.loggers.log_repository import LogRepository
 from audit.loggers.youtube_logger import YoutubeLogEntry
-from domain.model.youtube import APIKey, YoutubeChannel, YoutubeVideoRawData
-from domain.repository.youtube_repository import APIKeyRepository, YoutubeRepository
+from domain.model.api_response_cache import ApiResponseCacheEntry
+from domain.model.crawl_job import CrawlJob, CrawlProgress
+from domain.model.crawler_schedule import CrawlerSchedule
+from domain.model.embedding import EmbeddingState, IngestionDocument
+from domain.model.pagination import Page, decode_cursor, encode_cursor
+from domain.model.youtube import (
+    APIKey,
+    ChannelUploadStats,
+    CrawlCheckpoint,
+    VideoFilter,
+    YoutubeChannel,
+    YoutubeTranscript,
+    YoutubeVideoRawData,
+    YoutubeVideoView,
+)
+from domain.repository.api_response_cache import ApiResponseCacheRepository
+from domain.repository.crawl_checkpoint import CrawlCheckpointRepository
+from domain.repository.crawl_job import CrawlJobRepository
+from domain.repository.crawler_schedule import RawDataCrawlerScheduleRepository
+from domain.repository.embedding import EmbeddingCacheRepository, EmbeddingStateRepository
+from domain.repository.youtube_repository import APIKeyRepository, BulkSaveResult, YoutubeRepository
 from infrastructure.persistence.client import get_mongo_db
+from infrastructure.persistence.embedding_cache import VectorDType, decode_vector, encode_vector
+from shared.utils import YOUTUBE_API_QUOTA_LIMIT, as_utc, get_last_quota_reset_time, parse_youtube_datetime
 
 
 class MongoYoutubeRepository(YoutubeRepository):
@@ -16,31 +48,128 @@ class MongoYoutubeRepository(YoutubeRepository):
 
     """
 
+    # 한 번의 bulk_write로 보낼 최대 작업 수
+    BULK_WRITE_CHUNK_SIZE = 1000
+    # 다시 수집했을 때 덮어쓰는 원시 데이터 필드 (나머지는 최초 저장 시에만 기록)
+    RAW_DATA_CRAWL_FIELDS = ("video_id", "channel_id", "streamer_name", "raw_data", "published_at")
+    # 채널을 다시 등록했을 때 덮어쓰는 필드 (수집 상태는 최초 저장 시에만 기록)
+    CHANNEL_IMPORT_FIELDS = ("channel_id", "channel_name", "channel_handle", "streamer_name")
+
     def __init__(self, db_name: str = "youtube_db"):
         # 환경 변수나 기본값으로 클라이언트 초기화
         # 데이터베이스는 생성자에서 전달받은 이름으로 설정
         self._db = get_mongo_db(db_name)
 
-    async def _get_channels(self, filter: dict | None = None) -> list[YoutubeChannel]:
+    async def ensure_indexes(self) -> None:
+        """조회와 중복 제거에 필요한 인덱스를 생성합니다. (애플리케이션 시작 시 호출)"""
+        try:
+            await self._db["channels"].create_index("channel_id", unique=True)
+            await self._db["channels"].create_index("channel_handle")
+            await self._db["channels"].create_index([("streamer_name", ASCENDING), ("_id", ASCENDING)])
+            await self._ensure_unique_video_id_index()
+            # 비디오 목록(최근 게시 순, _id로 동점 정렬)의 키셋 페이지네이션용 인덱스. 조건별로 하나씩
+            await self._db["raw_data"].create_index([("published_at", DESCENDING), ("_id", DESCENDING)])
+            await self._db["raw_data"].create_index(
+                [("channel_id", ASCENDING), ("published_at", DESCENDING), ("_id", DESCENDING)]
+            )
+            await self._db["raw_data"].create_index(
+                [("streamer_name", ASCENDING), ("published_at", DESCENDING), ("_id", DESCENDING)]
+            )
+            await self._db["raw_data"].create_index("enriched_at")
+            await self._db["raw_data"].create_index("transcript_status")
+            await self._db["raw_data"].create_index("created_at")
+            await self._db["transcripts"].create_index("video_id", unique=True)
+            await self._db["crawl_checkpoints"].create_index("channel_id", unique=True)
+        except PyMongoError as e:
+            raise e
+
+    async def _ensure_unique_video_id_index(self) -> None:
+        """raw_data.video_id 고유 인덱스를 만듭니다.
+
+        고유 인덱스가 없던 때 저장된 중복 비디오가 있으면 인덱스를 만들 수 없으므로, 인덱스가 아직 없을 때만
+        중복을 먼저 정리합니다. 그래도 실패하면(정리 중에 중복이 다시 저장된 경우 등) 애플리케이션 시작을 막지 않고
+        경고만 출력하며, 다음 시작 시 다시 시도합니다.
+        """
+        try:
+            indexes = await self._db["raw_data"].index_information()
+            if indexes.get("video_id_1", {}).get("unique"):
+                return
+            removed = await self.dedupe_raw_data()
+            if removed:
+                print(f"Removed {removed} duplicate raw_data documents before creating the video_id index")
+            await self._db["raw_data"].create_index("video_id", unique=True)
+        except OperationFailure as e:
+            # 중복 키(11000)나 같은 이름의 고유하지 않은 인덱스가 이미 있는 경우(85, 86)
+            print(f"Could not create unique index on raw_data.video_id, duplicates may be saved: {e}")
+
+    async def dedupe_raw_data(self) -> int:
+        """video_id가 같은 raw_data 문서를 하나만 남기고 삭제합니다.
+
+        보강된(enriched_at이 있는) 문서를 우선하고, 그다음으로 가장 최근에 저장된(_id가 큰) 문서를 남깁니다.
+
+        Returns:
+            int: 삭제한 문서 수
+        """
         try:
-            if filter is None:
-                filter = {}
-            cursor = self._db["channels"].find(filter)
-            channels = []
+            cursor = await self._db["raw_data"].aggregate(
+                [
+                    {"$sort": {"video_id": ASCENDING, "enriched_at": DESCENDING, "_id": DESCENDING}},
+                    {"$group": {"_id": "$video_id", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+                    {"$match": {"count": {"$gt": 1}}},
+                    {"$project": {"_id": 0, "duplicates": {"$slice": ["$ids", 1, {"$size": "$ids"}]}}},
+                ],
+                allowDiskUse=True,
+            )
+            removed = 0
             async for document in cursor:
-                channels.append(YoutubeChannel.from_dict(document))
-            return channels
+                result = await self._db["raw_data"].delete_many({"_id": {"$in": document["duplicates"]}})
+                removed += result.deleted_count
+            return removed
+        except PyMongoError as e:
+            raise e
+
+    async def iter_channels(
+        self, initialized: bool | None = None, batch_size: int = 500
+    ) -> AsyncIterator[YoutubeChannel]:
+        try:
+            filter = {} if initialized is None else {"initialized": initialized}
+            cursor = self._db["channels"].find(filter, batch_size=batch_size)
+            async for document in cursor:
+                yield YoutubeChannel.from_dict(document)
         except PyMongoError as e:
             raise e
 
     async def get_channels(self) -> list[YoutubeChannel]:
-        return await self._get_channels()
+        return [channel async for channel in self.iter_channels()]
+
+    @staticmethod
+    def _cursor_id(position: dict[str, Any]) -> ObjectId:
+        # ObjectId(None)은 새 ID를 만들므로 문자열인지 먼저 확인
+        if not isinstance(position.get("id"), str) or not ObjectId.is_valid(position["id"]):
+            raise ValueError("잘못된 커서입니다")
+        return ObjectId(position["id"])
+
+    async def list_channels(
+        self, streamer_name: str | None = None, cursor: str | None = None, limit: int = 50
+    ) -> Page[YoutubeChannel]:
+        query: dict[str, Any] = {}
+        if streamer_name is not None:
+            query["streamer_name"] = streamer_name
+        if cursor is not None:
+            query["_id"] = {"$gt": self._cursor_id(decode_cursor(cursor))}
+        try:
+            # 다음 페이지가 있는지 알기 위해 하나 더 조회
+            documents = await self._db["channels"].find(query, sort=[("_id", ASCENDING)], limit=limit + 1).to_list()
+        except PyMongoError as e:
+            raise e
+        next_cursor = encode_cursor({"id": str(documents[limit - 1]["_id"])}) if len(documents) > limit else None
+        return Page([YoutubeChannel.from_dict(document) for document in documents[:limit]], next_cursor)
 
     async def get_initialized_channels(self) -> list[YoutubeChannel]:
-        return await self._get_channels(filter={"initialized": True})
+        return [channel async for channel in self.iter_channels(initialized=True)]
 
     async def get_uninitialized_channels(self) -> list[YoutubeChannel]:
-        return await self._get_channels(filter={"initialized": False})
+        return [channel async for channel in self.iter_channels(initialized=False)]
 
     async def get_video_by_id(self, video_id: str) -> YoutubeVideoRawData | None:
         try:
@@ -51,6 +180,179 @@ class MongoYoutubeRepository(YoutubeRepository):
         except PyMongoError as e:
             raise e
 
+    def _raw_videos(self) -> AsyncCollection:
+        """문서를 RawBSONDocument로 읽는 raw_data 컬렉션
+
+        최상위 필드는 처음 접근할 때 한 번에 디코딩하고, raw_data/details 같은 하위 문서는 바이트로 남겨 둡니다.
+        """
+        collection = self._db["raw_data"]
+        return collection.with_options(
+            codec_options=collection.codec_options.with_options(document_class=RawBSONDocument)
+        )
+
+    def _decode_payload(self, value: RawBSONDocument) -> dict:
+        return bson.decode(value.raw, self._db.codec_options)
+
+    @staticmethod
+    def _video_projection(fields: frozenset[str] | None) -> dict[str, int]:
+        if fields is None:
+            return {"_id": 0}
+        return {"_id": 0, **{name: 1 for name in fields}}
+
+    async def get_video_view(self, video_id: str, fields: Iterable[str] | None = None) -> YoutubeVideoView | None:
+        selected = YoutubeVideoView.projection_fields(fields)
+        try:
+            document = await self._raw_videos().find_one(
+                filter={"video_id": video_id}, projection=self._video_projection(selected)
+            )
+        except PyMongoError as e:
+            raise e
+        if document is None:
+            return None
+        return YoutubeVideoView(document, selected, decode=self._decode_payload)
+
+    async def iter_videos(
+        self, channel_id: str | None = None, fields: Iterable[str] | None = None, batch_size: int = 500
+    ) -> AsyncIterator[YoutubeVideoView]:
+        selected = YoutubeVideoView.projection_fields(fields)
+        try:
+            cursor = self._raw_videos().find(
+                filter={} if channel_id is None else {"channel_id": channel_id},
+                projection=self._video_projection(selected),
+                batch_size=batch_size,
+            )
+            async for document in cursor:
+                yield YoutubeVideoView(document, selected, decode=self._decode_payload)
+        except PyMongoError as e:
+            raise e
+
+    async def list_videos(
+        self,
+        filter: VideoFilter,
+        fields: Iterable[str] | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> Page[YoutubeVideoView]:
+        selected = YoutubeVideoView.projection_fields(fields)
+        conditions: list[dict[str, Any]] = []
+        if filter.channel_id is not None:
+            conditions.append({"channel_id": filter.channel_id})
+        if filter.streamer_name is not None:
+            conditions.append({"streamer_name": filter.streamer_name})
+        published: dict[str, datetime.datetime] = {}
+        if filter.published_after is not None:
+            published["$gte"] = filter.published_after
+        if filter.published_before is not None:
+            published["$lt"] = filter.published_before
+        if published:
+            conditions.append({"published_at": published})
+        if cursor is not None:
+            conditions.append(self._after_video_cursor(decode_cursor(cursor)))
+        # 커서를 만들 수 있도록 _id와 published_at은 항상 조회 (뷰에는 요청한 필드만 노출)
+        projection = None if selected is None else {"published_at": 1, **{name: 1 for name in selected}}
+        try:
+            documents = await (
+                self._raw_videos()
+                .find(
+                    {"$and": conditions} if conditions else {},
+                    projection=projection,
+                    sort=[("published_at", DESCENDING), ("_id", DESCENDING)],
+                    limit=limit + 1,
+                )
+                .to_list()
+            )
+        except PyMongoError as e:
+            raise e
+        next_cursor = None
+        if len(documents) > limit:
+            last = documents[limit - 1]
+            published_at = last.get("published_at")
+            next_cursor = encode_cursor(
+                {"published_at": published_at.isoformat() if published_at else None, "id": str(last["_id"])}
+            )
+        views = [YoutubeVideoView(document, selected, decode=self._decode_payload) for document in documents[:limit]]
+        return Page(views, next_cursor)
+
+    def _after_video_cursor(self, position: dict[str, Any]) -> dict[str, Any]:
+        """(published_at 내림차순, _id 내림차순) 정렬에서 커서 다음에 오는 비디오 조건
+
+        게시 시각이 없는 비디오는 내림차순 정렬의 마지막에 옵니다.
+        """
+        last_id = self._cursor_id(position)
+        if position.get("published_at") is None:
+            return {"published_at": None, "_id": {"$lt": last_id}}
+        try:
+            published_at = datetime.datetime.fromisoformat(position["published_at"])
+        except (TypeError, ValueError):
+            raise ValueError("잘못된 커서입니다") from None
+        return {
+            "$or": [
+                {"published_at": {"$lt": published_at}},
+                {"published_at": published_at, "_id": {"$lt": last_id}},
+                {"published_at": None},
+            ]
+        }
+
+    async def get_existing_video_ids(self, video_ids: list[str]) -> set[str]:
+        if not video_ids:
+            return set()
+        try:
+            cursor = self._db["raw_data"].find(
+                filter={"video_id": {"$in": video_ids}},
+                projection={"video_id": 1, "_id": 0},
+            )
+            return {document["video_id"] async for document in cursor}
+        except PyMongoError as e:
+            raise e
+
+    async def get_latest_published_at(self, channel_id: str) -> datetime.datetime | None:
+        try:
+            data = await self._db["raw_data"].find_one(
+                filter={"channel_id": channel_id, "published_at": {"$ne": None}},
+                projection={"published_at": 1, "_id": 0},
+                sort=[("published_at", DESCENDING)],
+            )
+            if data:
+                return data["published_at"]
+            # published_at 필드가 생기기 전에 저장된 문서는 검색 결과의 publishedAt 문자열로 계산
+            data = await self._db["raw_data"].find_one(
+                filter={"channel_id": channel_id},
+                projection={"raw_data.snippet.publishedAt": 1, "_id": 0},
+                sort=[("raw_data.snippet.publishedAt", DESCENDING)],
+            )
+            if data:
+                return parse_youtube_datetime(data.get("raw_data", {}).get("snippet", {}).get("publishedAt"))
+            return None
+        except PyMongoError as e:
+            raise e
+
+    async def get_channel_upload_stats(self, since: datetime.datetime) -> list[ChannelUploadStats]:
+        try:
+            cursor = await self._db["raw_data"].aggregate(
+                [
+                    {"$match": {"published_at": {"$gte": since}}},
+                    {
+                        "$group": {
+                            "_id": "$channel_id",
+                            "video_count": {"$sum": 1},
+                            "first_published_at": {"$min": "$published_at"},
+                            "last_published_at": {"$max": "$published_at"},
+                        }
+                    },
+                ]
+            )
+            return [
+                ChannelUploadStats(
+                    channel_id=document["_id"],
+                    video_count=document["video_count"],
+                    first_published_at=document["first_published_at"],
+                    last_published_at=document["last_published_at"],
+                )
+                async for document in cursor
+            ]
+        except PyMongoError as e:
+            raise e
+
     async def save_channel(self, channel: YoutubeChannel) -> None:
         try:
             youtube_channel_data = channel.to_dict()
@@ -64,6 +366,45 @@ class MongoYoutubeRepository(YoutubeRepository):
         except PyMongoError as e:
             raise e
 
+    async def bulk_save_channels(self, channels: list[YoutubeChannel]) -> BulkSaveResult:
+        result = BulkSaveResult()
+        if not channels:
+            return result
+        try:
+            operations = []
+            for channel in channels:
+                document = channel.to_dict()
+                updated_fields = {field: document[field] for field in self.CHANNEL_IMPORT_FIELDS}
+                if channel.uploads_playlist_id is not None:
+                    updated_fields["uploads_playlist_id"] = channel.uploads_playlist_id
+                operations.append(
+                    UpdateOne(
+                        {"channel_id": channel.channel_id},
+                        {
+                            "$set": updated_fields,
+                            "$setOnInsert": {k: v for k, v in document.items() if k not in updated_fields},
+                        },
+                        upsert=True,
+                    )
+                )
+            bulk_result = await self._db["channels"].bulk_write(operations, ordered=False)
+            result.inserted_count = bulk_result.upserted_count
+            result.updated_count = bulk_result.modified_count
+            return result
+        except PyMongoError as e:
+            raise e
+
+    async def get_channel_ids_by_handles(self, handles: list[str]) -> dict[str, str]:
+        if not handles:
+            return {}
+        try:
+            cursor = self._db["channels"].find(
+                {"channel_handle": {"$in": handles}}, projection={"_id": 0, "channel_handle": 1, "channel_id": 1}
+            )
+            return {document["channel_handle"]: document["channel_id"] async for document in cursor}
+        except PyMongoError as e:
+            raise e
+
     async def update_channel(self, channel: YoutubeChannel) -> None:
         try:
             await self._db["channels"].update_one(
@@ -74,6 +415,9 @@ class MongoYoutubeRepository(YoutubeRepository):
                         "channel_handle": channel.channel_handle,
                         "streamer_name": channel.streamer_name,
                         "initialized": channel.initialized,
+                        "last_published_at": channel.last_published_at,
+                        "uploads_playlist_id": channel.uploads_playlist_id,
+                        "last_crawled_at": channel.last_crawled_at,
                     }
                 },
             )
@@ -89,9 +433,220 @@ class MongoYoutubeRepository(YoutubeRepository):
         except PyMongoError as e:
             raise e
 
-    async def bulk_save_raw_data(self, raw_data_list: list[YoutubeVideoRawData]) -> None:
+    async def bulk_save_raw_data(self, raw_data_list: list[YoutubeVideoRawData]) -> BulkSaveResult:
+        result = BulkSaveResult()
         try:
-            await self._db["raw_data"].insert_many([data.__dict__ for data in raw_data_list])
+            for index in range(0, len(raw_data_list), self.BULK_WRITE_CHUNK_SIZE):
+                operations = []
+                for data in raw_data_list[index : index + self.BULK_WRITE_CHUNK_SIZE]:
+                    document = data.to_dict()
+                    # 수집 결과만 갱신하고, 최초 저장 시각과 보강/자막 상태는 처음 저장할 때만 기록
+                    crawled = {key: document[key] for key in self.RAW_DATA_CRAWL_FIELDS}
+                    on_insert = {key: value for key, value in document.items() if key not in crawled}
+                    operations.append(
+                        UpdateOne(
+                            {"video_id": data.video_id}, {"$set": crawled, "$setOnInsert": on_insert}, upsert=True
+                        )
+                    )
+                write_result = await self._db["raw_data"].bulk_write(operations, ordered=False)
+                result.inserted_count += write_result.upserted_count
+                result.updated_count += write_result.modified_count
+            return result
+        except PyMongoError as e:
+            raise e
+
+    async def get_unenriched_video_ids(self, limit: int) -> list[str]:
+        try:
+            # {"enriched_at": None}은 필드가 없는 문서도 포함하며 enriched_at 인덱스를 사용
+            cursor = self._db["raw_data"].find(
+                filter={"enriched_at": None},
+                projection={"video_id": 1, "_id": 0},
+                limit=limit,
+            )
+            return [document["video_id"] async for document in cursor]
+        except PyMongoError as e:
+            raise e
+
+    async def bulk_update_video_details(self, details: dict[str, dict | None]) -> int:
+        if not details:
+            return 0
+        enriched_at = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            result = await self._db["raw_data"].bulk_write(
+                [
+                    UpdateOne(
+                        {"video_id": video_id},
+                        {"$set": {"details": item, "enriched_at": enriched_at}},
+                    )
+                    for video_id, item in details.items()
+                ],
+                ordered=False,
+            )
+            return result.modified_count
+        except PyMongoError as e:
+            raise e
+
+    async def iter_video_ids_without_transcript(self, max_attempts: int, batch_size: int = 500) -> AsyncIterator[str]:
+        try:
+            cursor = self._db["raw_data"].find(
+                filter={
+                    "transcript_status": {"$nin": ["done", "unavailable"]},
+                    "transcript_attempts": {"$not": {"$gte": max_attempts}},
+                },
+                projection={"video_id": 1, "_id": 0},
+                batch_size=batch_size,
+            )
+            async for document in cursor:
+                yield document["video_id"]
+        except PyMongoError as e:
+            raise e
+
+    async def iter_ingestion_documents(self, batch_size: int = 500) -> AsyncIterator[IngestionDocument]:
+        try:
+            cursor = await self._db["raw_data"].aggregate(
+                [
+                    {
+                        "$lookup": {
+                            "from": "transcripts",
+                            "localField": "video_id",
+                            "foreignField": "video_id",
+                            "as": "transcript",
+                        }
+                    },
+                    {
+                        "$project": {
+                            "_id": 0,
+                            "video_id": 1,
+                            "channel_id": 1,
+                            "streamer_name": 1,
+                            "published_at": 1,
+                            "title": {"$ifNull": ["$details.snippet.title", "$raw_data.snippet.title"]},
+                            "description": {
+                                "$ifNull": ["$details.snippet.description", "$raw_data.snippet.description"]
+                            },
+                            "segments": {"$first": "$transcript.segments"},
+                        }
+                    },
+                ],
+                batchSize=batch_size,
+            )
+            async for document in cursor:
+                yield IngestionDocument(
+                    video_id=document["video_id"],
+                    channel_id=document["channel_id"],
+                    streamer_name=document["streamer_name"],
+                    title=document.get("title") or "",
+                    description=document.get("description") or "",
+                    published_at=document.get("published_at"),
+                    segments=document.get("segments"),
+                )
+        except PyMongoError as e:
+            raise e
+
+    async def iter_raw_data_export_rows(
+        self,
+        created_after: datetime.datetime | None,
+        created_before: datetime.datetime,
+        include_raw: bool = True,
+        batch_size: int = 2000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        created_at: dict[str, Any] = {"$lte": created_before}
+        if created_after is not None:
+            created_at["$gt"] = created_after
+        # 통계 값은 API 응답에서 문자열이므로 서버에서 정수로 변환
+        statistics = {"view_count": "viewCount", "like_count": "likeCount", "comment_count": "commentCount"}
+        counts = {
+            column: {
+                "$convert": {"input": f"$details.statistics.{field}", "to": "long", "onError": None, "onNull": None}
+            }
+            for column, field in statistics.items()
+        }
+        projection: dict[str, Any] = {
+            "_id": 0,
+            "video_id": 1,
+            "channel_id": 1,
+            "streamer_name": 1,
+            "published_at": 1,
+            "created_at": 1,
+            "transcript_status": 1,
+            "title": {"$ifNull": ["$details.snippet.title", "$raw_data.snippet.title"]},
+            "description": {"$ifNull": ["$details.snippet.description", "$raw_data.snippet.description"]},
+            "duration": "$details.contentDetails.duration",
+            **counts,
+        }
+        if include_raw:
+            projection.update({"raw_data": 1, "details": 1})
+        try:
+            # created_at 인덱스로 정렬하므로 메모리에서 정렬하지 않음
+            cursor = await self._db["raw_data"].aggregate(
+                [
+                    {"$match": {"created_at": created_at}},
+                    {"$sort": {"created_at": ASCENDING}},
+                    {"$project": projection},
+                ],
+                batchSize=batch_size,
+            )
+            async for document in cursor:
+                published_at = document.get("published_at")
+                raw_data = document.get("raw_data")
+                details = document.get("details")
+                yield {
+                    "video_id": document["video_id"],
+                    "channel_id": document["channel_id"],
+                    "streamer_name": document["streamer_name"],
+                    "published_at": as_utc(published_at) if published_at else None,
+                    "created_at": as_utc(document["created_at"]),
+                    "title": document.get("title"),
+                    "description": document.get("description"),
+                    "duration": document.get("duration"),
+                    "view_count": document.get("view_count"),
+                    "like_count": document.get("like_count"),
+                    "comment_count": document.get("comment_count"),
+                    "transcript_status": document.get("transcript_status"),
+                    "raw_data": json.dumps(raw_data, ensure_ascii=False, default=str) if raw_data else None,
+                    "details": json.dumps(details, ensure_ascii=False, default=str) if details else None,
+                }
+        except PyMongoError as e:
+            raise e
+
+    async def bulk_save_transcripts(self, transcripts: list[YoutubeTranscript]) -> None:
+        if not transcripts:
+            return
+        try:
+            await self._db["transcripts"].bulk_write(
+                [
+                    UpdateOne({"video_id": transcript.video_id}, {"$set": transcript.to_dict()}, upsert=True)
+                    for transcript in transcripts
+                ],
+                ordered=False,
+            )
+            await self._db["raw_data"].update_many(
+                filter={"video_id": {"$in": [transcript.video_id for transcript in transcripts]}},
+                update={
+                    "$set": {"transcript_status": "done", "transcript_error": None},
+                    "$inc": {"transcript_attempts": 1},
+                },
+            )
+        except PyMongoError as e:
+            raise e
+
+    async def bulk_update_transcript_status(self, statuses: dict[str, tuple[str, str | None]]) -> None:
+        if not statuses:
+            return
+        try:
+            await self._db["raw_data"].bulk_write(
+                [
+                    UpdateOne(
+                        {"video_id": video_id},
+                        {
+                            "$set": {"transcript_status": status, "transcript_error": error},
+                            "$inc": {"transcript_attempts": 1},
+                        },
+                    )
+                    for video_id, (status, error) in statuses.items()
+                ],
+                ordered=False,
+            )
         except PyMongoError as e:
             raise e
 
@@ -127,9 +682,24 @@ class MongoAPIKeyRepository(APIKeyRepository):
         except PyMongoError as e:
             raise e
 
-    async def get_api_key(self) -> APIKey:
+    async def _reset_expired_quotas(self, service: str) -> None:
+        """마지막 쿼터 리셋 시각 이전에 사용된 키들의 사용량을 초기화합니다."""
+        await self._db["api_keys"].update_many(
+            filter={
+                "service": service,
+                "updated_at": {"$lt": get_last_quota_reset_time()},
+                "quota_used": {"$gt": 0},
+            },
+            update={"$set": {"quota_used": 0, "quota_used_by_endpoint": {}}},
+        )
+
+    async def get_api_key(self, service: str = "youtube") -> APIKey:
         try:
-            data = await self._db["api_keys"].find_one(filter={"service": "youtube"})
+            await self._reset_expired_quotas(service)
+            data = await self._db["api_keys"].find_one(
+                filter={"service": service},
+                sort=[("quota_used", ASCENDING)],
+            )
             if data:
                 return APIKey.from_dict(data)
             else:
@@ -137,27 +707,448 @@ class MongoAPIKeyRepository(APIKeyRepository):
         except PyMongoError as e:
             raise e
 
+    async def reserve_quota(
+        self, amount: int, max_quota_used: int, endpoint: str | None = None, service: str = "youtube"
+    ) -> APIKey | None:
+        try:
+            await self._reset_expired_quotas(service)
+            increments = {"quota_used": amount}
+            if endpoint:
+                increments[f"quota_used_by_endpoint.{endpoint}"] = amount
+            # 조건 검사와 증가를 한 번의 원자적 연산으로 처리해 동시 예약시에도 한도를 넘지 않도록 함
+            data = await self._db["api_keys"].find_one_and_update(
+                filter={"service": service, "quota_used": {"$lte": max_quota_used}},
+                update={
+                    "$inc": increments,
+                    "$set": {"updated_at": datetime.datetime.now(datetime.timezone.utc)},
+                },
+                sort=[("quota_used", ASCENDING)],
+                return_document=ReturnDocument.AFTER,
+            )
+            if data:
+                return APIKey.from_dict(data)
+            return None
+        except PyMongoError as e:
+            raise e
+
+    async def release_quota(self, api_key: str, amount: int, endpoint: str | None = None) -> None:
+        try:
+            decrements = {"quota_used": -amount}
+            if endpoint:
+                decrements[f"quota_used_by_endpoint.{endpoint}"] = -amount
+            # 예약 이후 리셋되어 사용량이 줄어든 키는 음수가 되지 않도록 건너뜀
+            await self._db["api_keys"].update_one(
+                filter={"api_key": api_key, "quota_used": {"$gte": amount}},
+                update={"$inc": decrements},
+            )
+        except PyMongoError as e:
+            raise e
+
+    async def park_api_key(self, api_key: str) -> None:
+        try:
+            # 리셋 시각이 지나면 _reset_expired_quotas가 사용량을 다시 0으로 되돌림
+            await self._db["api_keys"].update_one(
+                filter={"api_key": api_key},
+                update={
+                    "$set": {
+                        "quota_used": YOUTUBE_API_QUOTA_LIMIT,
+                        "updated_at": datetime.datetime.now(datetime.timezone.utc),
+                    }
+                },
+            )
+        except PyMongoError as e:
+            raise e
+
     async def insert_api_key(self, api_key: APIKey) -> None:
         try:
             await self._db["api_keys"].update_one(
-                filter={"service": "youtube"},
+                filter={"api_key": api_key.api_key},
                 update={"$set": api_key.to_dict()},
                 upsert=True,
             )
         except PyMongoError as e:
             raise e
 
-    async def update_api_key(self, api_key: APIKey) -> None:
+
+class MongoCrawlCheckpointRepository(CrawlCheckpointRepository):
+    """채널별 수집 체크포인트를 crawl_checkpoints 컬렉션에 channel_id당 하나씩 저장합니다."""
+
+    def __init__(self, db_name: str = "youtube_db"):
+        self._db = get_mongo_db(db_name)
+
+    async def get_checkpoint(self, channel_id: str) -> CrawlCheckpoint | None:
         try:
-            api_key_data = api_key.to_dict()
-            api_key_data["updated_at"] = datetime.datetime.now(datetime.timezone.utc)
-            await self._db["api_keys"].update_one(
-                filter={"service": "youtube"},
-                update={"$set": api_key_data},
+            data = await self._db["crawl_checkpoints"].find_one({"channel_id": channel_id}, projection={"_id": 0})
+            if data:
+                return CrawlCheckpoint.from_dict(data)
+            return None
+        except PyMongoError as e:
+            raise e
+
+    async def save_checkpoint(self, checkpoint: CrawlCheckpoint) -> None:
+        try:
+            await self._db["crawl_checkpoints"].replace_one(
+                {"channel_id": checkpoint.channel_id}, checkpoint.to_dict(), upsert=True
+            )
+        except PyMongoError as e:
+            raise e
+
+    async def delete_checkpoint(self, channel_id: str) -> None:
+        try:
+            await self._db["crawl_checkpoints"].delete_one({"channel_id": channel_id})
+        except PyMongoError as e:
+            raise e
+
+
+class MongoApiResponseCacheRepository(ApiResponseCacheRepository):
+    """YouTube API 응답 캐시를 api_response_cache 컬렉션에 저장합니다.
+
+    purge_at이 지난 응답은 TTL 인덱스로 삭제됩니다.
+    """
+
+    def __init__(self, db_name: str = "youtube_db"):
+        self._db = get_mongo_db(db_name)
+
+    async def ensure_indexes(self) -> None:
+        try:
+            await self._db["api_response_cache"].create_index("cache_key", unique=True)
+            await self._db["api_response_cache"].create_index("purge_at", expireAfterSeconds=0)
+        except PyMongoError as e:
+            raise e
+
+    async def get_entry(self, cache_key: str) -> ApiResponseCacheEntry | None:
+        try:
+            data = await self._db["api_response_cache"].find_one({"cache_key": cache_key}, projection={"_id": 0})
+            if data:
+                return ApiResponseCacheEntry.from_dict(data)
+            return None
+        except PyMongoError as e:
+            raise e
+
+    async def save_entry(self, entry: ApiResponseCacheEntry) -> None:
+        try:
+            await self._db["api_response_cache"].replace_one(
+                {"cache_key": entry.cache_key}, entry.to_dict(), upsert=True
+            )
+        except PyMongoError as e:
+            raise e
+
+
+class MongoEmbeddingStateRepository(EmbeddingStateRepository):
+    """비디오별 임베딩 상태를 embedding_states 컬렉션에 video_id당 하나씩 저장합니다."""
+
+    def __init__(self, db_name: str = "youtube_db"):
+        self._db = get_mongo_db(db_name)
+
+    async def ensure_indexes(self) -> None:
+        try:
+            await self._db["embedding_states"].create_index("video_id", unique=True)
+        except PyMongoError as e:
+            raise e
+
+    async def get_states(self, video_ids: list[str]) -> dict[str, EmbeddingState]:
+        if not video_ids:
+            return {}
+        try:
+            cursor = self._db["embedding_states"].find({"video_id": {"$in": video_ids}}, projection={"_id": 0})
+            return {document["video_id"]: EmbeddingState.from_dict(document) async for document in cursor}
+        except PyMongoError as e:
+            raise e
+
+    async def save_states(self, states: list[EmbeddingState]) -> None:
+        if not states:
+            return
+        try:
+            await self._db["embedding_states"].bulk_write(
+                [UpdateOne({"video_id": state.video_id}, {"$set": state.to_dict()}, upsert=True) for state in states],
+                ordered=False,
+            )
+        except PyMongoError as e:
+            raise e
+
+
+class MongoEmbeddingCacheRepository(EmbeddingCacheRepository):
+    """임베딩 캐시를 embedding_cache 컬렉션에 저장합니다.
+
+    벡터는 JSON 배열이 아닌 float16/float32 바이트 배열(BSON Binary)로 저장하며, 문서마다 자료형을 함께 저장해
+    설정을 바꿔도 이전 벡터를 읽을 수 있습니다.
+    """
+
+    def __init__(self, dtype: VectorDType = "float16", db_name: str = "youtube_db"):
+        self._db = get_mongo_db(db_name)
+        self.dtype = dtype
+
+    async def ensure_indexes(self) -> None:
+        try:
+            await self._db["embedding_cache"].create_index("last_used_at")
+        except PyMongoError as e:
+            raise e
+
+    async def get_vectors(self, keys: list[str]) -> dict[str, list[float]]:
+        if not keys:
+            return {}
+        try:
+            cursor = self._db["embedding_cache"].find({"_id": {"$in": keys}}, projection={"vector": 1, "dtype": 1})
+            vectors = {
+                document["_id"]: decode_vector(document["vector"], document["dtype"]) async for document in cursor
+            }
+            if vectors:
+                await self._db["embedding_cache"].update_many(
+                    {"_id": {"$in": list(vectors)}},
+                    {"$set": {"last_used_at": datetime.datetime.now(datetime.timezone.utc)}},
+                )
+            return vectors
+        except PyMongoError as e:
+            raise e
+
+    async def save_vectors(self, vectors: dict[str, list[float]]) -> None:
+        if not vectors:
+            return
+        now = datetime.datetime.now(datetime.timezone.utc)
+        try:
+            await self._db["embedding_cache"].bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": key},
+                        {
+                            "$setOnInsert": {
+                                "vector": Binary(encode_vector(vector, self.dtype)),
+                                "dtype": self.dtype,
+                                "created_at": now,
+                                "last_used_at": now,
+                            }
+                        },
+                        upsert=True,
+                    )
+                    for key, vector in vectors.items()
+                ],
+                ordered=False,
             )
         except PyMongoError as e:
             raise e
 
+    async def count(self) -> int:
+        try:
+            return await self._db["embedding_cache"].estimated_document_count()
+        except PyMongoError as e:
+            raise e
+
+    async def evict(self, max_entries: int | None = None, unused_before: datetime.datetime | None = None) -> int:
+        deleted = 0
+        try:
+            if unused_before is not None:
+                result = await self._db["embedding_cache"].delete_many({"last_used_at": {"$lt": unused_before}})
+                deleted += result.deleted_count
+            if max_entries is not None:
+                excess = await self._db["embedding_cache"].count_documents({}) - max_entries
+                if excess > 0:
+                    cursor = (
+                        self._db["embedding_cache"]
+                        .find({}, projection={"_id": 1})
+                        .sort("last_used_at", ASCENDING)
+                        .limit(excess)
+                    )
+                    keys = [document["_id"] async for document in cursor]
+                    result = await self._db["embedding_cache"].delete_many({"_id": {"$in": keys}})
+                    deleted += result.deleted_count
+            return deleted
+        except PyMongoError as e:
+            raise e
+
+    async def compact(self) -> None:
+        """compact 명령으로 삭제된 문서가 차지하던 디스크 공간을 운영체제에 돌려줍니다. (관리자 권한 필요)"""
+        try:
+            await self._db.command("compact", "embedding_cache")
+        except PyMongoError as e:
+            raise e
+
+
+class MongoCrawlJobRepository(CrawlJobRepository):
+    """크롤링 작업을 crawl_jobs 컬렉션에 저장합니다. 서버가 재시작되어도 작업 상태가 유지됩니다."""
+
+    def __init__(self, db_name: str = "youtube_db"):
+        self._db = get_mongo_db(db_name)
+
+    async def ensure_indexes(self) -> None:
+        try:
+            await self._db["crawl_jobs"].create_index("job_id", unique=True)
+            await self._db["crawl_jobs"].create_index([("status", ASCENDING), ("created_at", ASCENDING)])
+        except PyMongoError as e:
+            raise e
+
+    async def insert_job(self, job: CrawlJob) -> None:
+        try:
+            await self._db["crawl_jobs"].insert_one(job.to_dict())
+        except PyMongoError as e:
+            raise e
+
+    async def get_job(self, job_id: str) -> CrawlJob | None:
+        try:
+            data = await self._db["crawl_jobs"].find_one({"job_id": job_id}, projection={"_id": 0})
+            if data:
+                return CrawlJob.from_dict(data)
+            return None
+        except PyMongoError as e:
+            raise e
+
+    async def list_jobs(self, limit: int = 50) -> list[CrawlJob]:
+        try:
+            cursor = self._db["crawl_jobs"].find(projection={"_id": 0}, sort=[("created_at", DESCENDING)], limit=limit)
+            return [CrawlJob.from_dict(data) async for data in cursor]
+        except PyMongoError as e:
+            raise e
+
+    async def list_queued_job_ids(self) -> list[str]:
+        try:
+            cursor = self._db["crawl_jobs"].find(
+                {"status": "queued"}, projection={"job_id": 1, "_id": 0}, sort=[("created_at", ASCENDING)]
+            )
+            return [data["job_id"] async for data in cursor]
+        except PyMongoError as e:
+            raise e
+
+    async def claim_job(self, job_id: str) -> CrawlJob | None:
+        try:
+            data = await self._db["crawl_jobs"].find_one_and_update(
+                {"job_id": job_id, "status": "queued"},
+                {"$set": {"status": "running", "started_at": datetime.datetime.now(datetime.timezone.utc)}},
+                projection={"_id": 0},
+                return_document=ReturnDocument.AFTER,
+            )
+            if data:
+                return CrawlJob.from_dict(data)
+            return None
+        except PyMongoError as e:
+            raise e
+
+    async def update_progress(self, job_id: str, progress: CrawlProgress) -> None:
+        try:
+            await self._db["crawl_jobs"].update_one({"job_id": job_id}, {"$set": {"progress": progress.to_dict()}})
+        except PyMongoError as e:
+            raise e
+
+    async def finish_job(
+        self,
+        job_id: str,
+        status: str,
+        progress: CrawlProgress,
+        error: str | None = None,
+        result: dict[str, Any] | None = None,
+    ) -> None:
+        try:
+            await self._db["crawl_jobs"].update_one(
+                {"job_id": job_id},
+                {
+                    "$set": {
+                        "status": status,
+                        "progress": progress.to_dict(),
+                        "error": error,
+                        "result": result,
+                        "finished_at": datetime.datetime.now(datetime.timezone.utc),
+                    }
+                },
+            )
+        except PyMongoError as e:
+            raise e
+
+    async def request_cancel(self, job_id: str) -> CrawlJob | None:
+        try:
+            now = datetime.datetime.now(datetime.timezone.utc)
+            # 대기 중인 작업은 바로 취소하고, 실행 중인 작업은 실행하는 쪽에서 취소 요청을 확인해 중단
+            await self._db["crawl_jobs"].update_one(
+                {"job_id": job_id, "status": "queued"}, {"$set": {"status": "cancelled", "finished_at": now}}
+            )
+            data = await self._db["crawl_jobs"].find_one_and_update(
+                {"job_id": job_id},
+                {"$set": {"cancel_requested": True}},
+                projection={"_id": 0},
+                return_document=ReturnDocument.AFTER,
+            )
+            if data:
+                return CrawlJob.from_dict(data)
+            return None
+        except PyMongoError as e:
+            raise e
+
+    async def requeue_interrupted_jobs(self) -> int:
+        try:
+            await self._db["crawl_jobs"].update_many(
+                {"status": "running", "cancel_requested": True},
+                {"$set": {"status": "cancelled", "finished_at": datetime.datetime.now(datetime.timezone.utc)}},
+            )
+            result = await self._db["crawl_jobs"].update_many(
+                {"status": "running"}, {"$set": {"status": "queued", "started_at": None}}
+            )
+            return result.modified_count
+        except PyMongoError as e:
+            raise e
+
+
+class MongoCrawlerScheduleRepository(RawDataCrawlerScheduleRepository):
+    """채널별 수집 일정을 crawler_schedules 컬렉션에 저장합니다."""
+
+    def __init__(self, db_name: str = "youtube_db"):
+        self._db = get_mongo_db(db_name)
+
+    async def ensure_indexes(self) -> None:
+        try:
+            await self._db["crawler_schedules"].create_index("channel_id", unique=True)
+            # 실행할 일정 조회: enabled 일치, priority/next_run_at 정렬, next_run_at 범위 순서로 인덱스 구성
+            await self._db["crawler_schedules"].create_index(
+                [("enabled", ASCENDING), ("priority", DESCENDING), ("next_run_at", ASCENDING)]
+            )
+            await self._db["crawler_schedules"].create_index([("enabled", ASCENDING), ("next_run_at", ASCENDING)])
+        except PyMongoError as e:
+            raise e
+
+    async def add_schedule(self, schedule: CrawlerSchedule) -> None:
+        try:
+            await self._db["crawler_schedules"].replace_one(
+                {"channel_id": schedule.channel_id}, schedule.to_dict(), upsert=True
+            )
+        except PyMongoError as e:
+            raise e
+
+    async def get_schedules(self) -> list[CrawlerSchedule]:
+        try:
+            cursor = self._db["crawler_schedules"].find(projection={"_id": 0}, sort=[("next_run_at", ASCENDING)])
+            return [CrawlerSchedule.from_dict(data) async for data in cursor]
+        except PyMongoError as e:
+            raise e
+
+    async def get_due_schedules(self, now: datetime.datetime, limit: int) -> list[CrawlerSchedule]:
+        try:
+            cursor = self._db["crawler_schedules"].find(
+                {"enabled": True, "next_run_at": {"$lte": now}},
+                projection={"_id": 0},
+                sort=[("priority", DESCENDING), ("next_run_at", ASCENDING)],
+                limit=limit,
+            )
+            return [CrawlerSchedule.from_dict(data) async for data in cursor]
+        except PyMongoError as e:
+            raise e
+
+    async def update_schedule(self, schedule: CrawlerSchedule) -> None:
+        try:
+            await self._db["crawler_schedules"].update_one(
+                {"channel_id": schedule.channel_id},
+                {
+                    "$set": {
+                        "next_run_at": schedule.next_run_at,
+                        "last_run_at": schedule.last_run_at,
+                        "last_job_id": schedule.last_job_id,
+                    }
+                },
+            )
+        except PyMongoError as e:
+            raise e
+
+    async def delete_schedule(self, channel_id: str) -> None:
+        try:
+            await self._db["crawler_schedules"].delete_one({"channel_id": channel_id})
+        except PyMongoError as e:
+            raise e
+
 
 class MongoLogRepository(LogRepository):
     def __init__(self, db_name: str = "log_db"):
@@ -174,3 +1165,112 @@ class MongoLogRepository(LogRepository):
 
     async def save_video_raw_data_log(self, log: YoutubeLogEntry) -> None:
         await self._save_log(log, "video_raw_data_logs")
+
+
+class BufferedMongoLogRepository(MongoLogRepository):
+    """로그를 메모리 큐에 모았다가 insert_many로 한 번에 저장하는 로그 저장소입니다.
+
+    - 로그 저장 호출은 큐에 넣기만 하므로 크롤링 경로에서 DB 왕복을 기다리지 않습니다.
+    - 백그라운드 작업이 batch_size개가 모이거나 flush_interval초가 지나면 컬렉션별로 저장합니다.
+    - 큐가 가득 차면 overflow_policy에 따라 자리가 날 때까지 기다리거나("block") 새 로그를 버립니다("drop").
+    - aclose()는 큐에 남은 로그를 모두 저장한 뒤 종료하므로, 종료 시 반드시 호출해야 합니다.
+      aclose() 이후에 들어온 로그는 백그라운드 작업을 다시 시작하지 않고 바로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        db_name: str = "log_db",
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        overflow_policy: Literal["block", "drop"] = "block",
+    ):
+        super().__init__(db_name)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self._queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: asyncio.Task | None = None
+        self._closing = asyncio.Event()
+        self._closed = False
+        self.dropped_count = 0
+        self.failed_count = 0
+
+    async def start(self) -> None:
+        """백그라운드 저장 작업을 시작합니다. 여러 번 호출해도 안전합니다."""
+        self._closed = False
+        if self._task is None or self._task.done():
+            self._closing.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """남은 로그를 모두 저장하고 백그라운드 저장 작업을 종료합니다."""
+        # 종료 중이나 종료 후에 들어온 로그가 아무도 기다리지 않는 작업을 새로 만들지 않도록 먼저 표시
+        self._closed = True
+        if self._task is None:
+            return
+        self._closing.set()
+        await self._task
+        self._task = None
+
+    async def __aenter__(self) -> "BufferedMongoLogRepository":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _save_log(self, log: YoutubeLogEntry, collection_name: str) -> None:
+        if self._closed:
+            await super()._save_log(log, collection_name)
+            return
+        if self._task is None or self._task.done():
+            await self.start()
+        item = (collection_name, log.to_dict())
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self.overflow_policy == "drop":
+                self.dropped_count += 1
+                return
+            await self._queue.put(item)
+
+    async def _run(self) -> None:
+        while not (self._closing.is_set() and self._queue.empty()):
+            batch = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _collect_batch(self) -> list[tuple[str, dict[str, Any]]]:
+        """batch_size개가 모이거나, flush_interval초가 지나거나, 종료 요청이 올 때까지 로그를 모읍니다."""
+        batch: list[tuple[str, dict[str, Any]]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._closing.is_set():
+                break
+            get_task = asyncio.ensure_future(self._queue.get())
+            closing_task = asyncio.ensure_future(self._closing.wait())
+            await asyncio.wait({get_task, closing_task}, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            closing_task.cancel()
+            # wait가 반환된 뒤에 완료됐을 수도 있으므로 done 집합 대신 작업 상태를 직접 확인
+            if get_task.done():
+                batch.append(get_task.result())
+            else:
+                get_task.cancel()
+        return batch
+
+    async def _flush(self, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        documents_by_collection: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for collection_name, document in batch:
+            documents_by_collection[collection_name].append(document)
+        for collection_name, documents in documents_by_collection.items():
+            try:
+                await self._db[collection_name].insert_many(documents, ordered=False)
+            except PyMongoError as e:
+                # 로그 저장 실패가 크롤링을 멈추지 않도록 백그라운드 작업에서는 예외를 기록만 함
+                self.failed_count += len(documents)
+                print(f"Error flushing logs to {collection_name}: {e}")
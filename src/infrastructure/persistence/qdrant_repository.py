@@ -0,0 +1,101 @@
+from qdrant_client import AsyncQdrantClient, models
+
+from domain.model.embedding import DocumentChunk
+from domain.model.search import SearchFilter, SearchHit
+from domain.repository.vector_repository import VectorRepository
+from shared.utils import as_utc
+
+
+class QdrantVectorRepository(VectorRepository):
+    """비디오 청크를 Qdrant 컬렉션에 저장합니다.
+
+    포인트 ID는 청크 ID(UUID)이고, 페이로드의 video_id, channel_id, streamer_name, published_ts에
+    필터용 인덱스를 만듭니다.
+    """
+
+    KEYWORD_FIELDS = ("video_id", "channel_id", "streamer_name", "source")
+
+    def __init__(self, client: AsyncQdrantClient, collection_name: str = "video_chunks"):
+        self._client = client
+        self.collection_name = collection_name
+
+    async def ensure_collection(self, dimension: int) -> None:
+        if await self._client.collection_exists(self.collection_name):
+            return
+        await self._client.create_collection(
+            self.collection_name,
+            vectors_config=models.VectorParams(size=dimension, distance=models.Distance.COSINE),
+        )
+        for field_name in self.KEYWORD_FIELDS:
+            await self._client.create_payload_index(
+                self.collection_name, field_name, field_schema=models.PayloadSchemaType.KEYWORD
+            )
+        await self._client.create_payload_index(
+            self.collection_name, "published_ts", field_schema=models.PayloadSchemaType.FLOAT
+        )
+
+    async def upsert_chunks(self, chunks: list[DocumentChunk], vectors: list[list[float]]) -> None:
+        if not chunks:
+            return
+        await self._client.upsert(
+            self.collection_name,
+            points=[
+                models.PointStruct(id=chunk.chunk_id, vector=vector, payload=chunk.to_payload())
+                for chunk, vector in zip(chunks, vectors, strict=True)
+            ],
+            wait=True,
+        )
+
+    async def delete_video_chunks(self, video_ids: list[str]) -> None:
+        if not video_ids:
+            return
+        await self._client.delete(
+            self.collection_name,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(must=[models.FieldCondition(key="video_id", match=models.MatchAny(any=video_ids))])
+            ),
+            wait=True,
+        )
+
+    async def search(
+        self, vector: list[float], limit: int = 10, search_filter: SearchFilter | None = None
+    ) -> list[SearchHit]:
+        response = await self._client.query_points(
+            self.collection_name,
+            query=vector,
+            query_filter=self._build_filter(search_filter),
+            limit=limit,
+            with_payload=True,
+        )
+        return [SearchHit.from_payload(str(point.id), point.payload or {}, point.score) for point in response.points]
+
+    async def get_chunks(self, chunk_ids: list[str]) -> dict[str, SearchHit]:
+        if not chunk_ids:
+            return {}
+        records = await self._client.retrieve(self.collection_name, ids=chunk_ids, with_payload=True)
+        return {str(record.id): SearchHit.from_payload(str(record.id), record.payload or {}, 0.0) for record in records}
+
+    @staticmethod
+    def _build_filter(search_filter: SearchFilter | None) -> models.Filter | None:
+        if search_filter is None:
+            return None
+        conditions: list[models.Condition] = []
+        if search_filter.streamer_name:
+            conditions.append(
+                models.FieldCondition(key="streamer_name", match=models.MatchValue(value=search_filter.streamer_name))
+            )
+        if search_filter.channel_id:
+            conditions.append(
+                models.FieldCondition(key="channel_id", match=models.MatchValue(value=search_filter.channel_id))
+            )
+        if search_filter.published_from or search_filter.published_to:
+            conditions.append(
+                models.FieldCondition(
+                    key="published_ts",
+                    range=models.Range(
+                        gte=as_utc(search_filter.published_from).timestamp() if search_filter.published_from else None,
+                        lte=as_utc(search_filter.published_to).timestamp() if search_filter.published_to else None,
+                    ),
+                )
+            )
+        return models.Filter(must=conditions) if conditions else None
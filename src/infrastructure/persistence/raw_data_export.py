@@ -0,0 +1,239 @@
+import asyncio
+import datetime
+import gzip
+import json
+import os
+import shutil
+import uuid
+from abc import abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
+
+from domain.model.export import RAW_DATA_EXPORT_COLUMNS, ExportShard
+from domain.repository.export import RawDataExportStore
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow가 없으면 JSONL로만 내보냄
+    pa = None
+    pq = None
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+
+PYARROW_AVAILABLE = pa is not None
+ExportFormat = Literal["parquet", "arrow", "jsonl"]
+_MANIFEST = "manifest.json"
+
+
+class _FileExportStore(RawDataExportStore):
+    """디렉터리에 채널/월 파티션별 파일을 쓰고 manifest.json으로 목록과 워터마크를 관리합니다.
+
+    파일은 channel_id=<채널>/month=<YYYY-MM>/part-<실행 ID>-<순번>.<확장자> 경로에 쓰므로
+    Hive 파티션 형식을 읽는 도구로도 읽을 수 있습니다. manifest.json에 없는 파일(중단된 실행이 남긴 파일)은
+    다음 commit이나 reset에서 삭제합니다.
+    """
+
+    format: str
+    extension: str
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._run_id = uuid.uuid4().hex[:8]
+        self._sequence = 0
+        manifest = self._read_manifest()
+        if manifest is not None and manifest["format"] != self.format:
+            raise ValueError(
+                f"내보내기 디렉터리의 형식({manifest['format']})이 설정({self.format})과 다릅니다. "
+                "디렉터리를 비우고 다시 내보내야 합니다"
+            )
+
+    async def get_watermark(self) -> datetime.datetime | None:
+        manifest = self._read_manifest()
+        if manifest is None or manifest["watermark"] is None:
+            return None
+        return datetime.datetime.fromisoformat(manifest["watermark"])
+
+    async def write_shard(self, channel_id: str, month: str, rows: list[dict[str, Any]]) -> ExportShard:
+        self._sequence += 1
+        relative_path = Path(f"channel_id={channel_id}", f"month={month}", f"part-{self._run_id}-{self._sequence:05d}")
+        path = self.directory / relative_path.with_name(f"{relative_path.name}.{self.extension}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 파일 쓰기와 압축은 CPU를 쓰므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        temp_path = path.with_name(path.name + ".tmp")
+        await asyncio.to_thread(self._write_file, temp_path, rows)
+        os.replace(temp_path, path)
+        return ExportShard(
+            path=path.relative_to(self.directory).as_posix(),
+            channel_id=channel_id,
+            month=month,
+            rows=len(rows),
+            size_bytes=path.stat().st_size,
+        )
+
+    async def commit(self, shards: list[ExportShard], watermark: datetime.datetime | None) -> None:
+        manifest = self._read_manifest() or {"format": self.format, "watermark": None, "shards": []}
+        manifest["shards"].extend(shard.to_dict() for shard in shards)
+        if watermark is not None:
+            manifest["watermark"] = watermark.isoformat()
+        temp_path = self.directory / f"{_MANIFEST}.tmp"
+        temp_path.write_text(json.dumps(manifest, ensure_ascii=False))
+        os.replace(temp_path, self.directory / _MANIFEST)
+        self._remove_unlisted({shard["path"] for shard in manifest["shards"]})
+
+    async def reset(self) -> None:
+        (self.directory / _MANIFEST).unlink(missing_ok=True)
+        self._remove_unlisted(set())
+
+    async def list_shards(self, channel_id: str | None = None, month: str | None = None) -> list[ExportShard]:
+        return self._shards(channel_id, month)
+
+    def _shards(self, channel_id: str | None, month: str | None) -> list[ExportShard]:
+        manifest = self._read_manifest()
+        if manifest is None:
+            return []
+        shards = [ExportShard.from_dict(shard) for shard in manifest["shards"]]
+        return [
+            shard
+            for shard in shards
+            if (channel_id is None or shard.channel_id == channel_id) and (month is None or shard.month == month)
+        ]
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        path = self.directory / _MANIFEST
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def _remove_unlisted(self, listed: set[str]) -> None:
+        for path in self.directory.glob("channel_id=*/month=*/part-*"):
+            if path.relative_to(self.directory).as_posix() not in listed:
+                path.unlink()
+        for partition in self.directory.glob("channel_id=*"):
+            for month_dir in partition.iterdir():
+                if not any(month_dir.iterdir()):
+                    month_dir.rmdir()
+            if not any(partition.iterdir()):
+                shutil.rmtree(partition)
+
+    @abstractmethod
+    def _write_file(self, path: Path, rows: list[dict[str, Any]]) -> None:
+        pass
+
+
+class ArrowExportStore(_FileExportStore):
+    """raw_data를 Parquet 또는 Arrow IPC 파일로 내보냅니다. (pyarrow 필요)
+
+    - parquet: zstd로 압축해 크기가 작고, 읽을 때 필요한 열만 메모리 맵으로 읽어 풉니다.
+    - arrow: 압축하지 않은 Arrow IPC 파일이라 크지만, 메모리 맵으로 열면 복사 없이 바로 읽습니다.
+    """
+
+    def __init__(self, directory: str, file_format: Literal["parquet", "arrow"] = "parquet"):
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("Parquet/Arrow 형식으로 내보내려면 pyarrow가 필요합니다")
+        self.format = file_format
+        self.extension = file_format
+        self.schema = pa.schema(
+            [
+                (name, {"string": pa.string(), "int64": pa.int64(), "timestamp": pa.timestamp("us", tz="UTC")}[kind])
+                for name, kind in RAW_DATA_EXPORT_COLUMNS.items()
+            ]
+        )
+        super().__init__(directory)
+
+    def iter_batches(
+        self,
+        columns: list[str] | None = None,
+        channel_id: str | None = None,
+        month: str | None = None,
+        batch_size: int = 65536,
+    ) -> Iterator["pa.RecordBatch"]:
+        """내보낸 파일을 메모리 맵으로 열어 레코드 배치를 하나씩 반환합니다.
+
+        Args:
+            columns (list[str] | None, optional): 읽을 열. None이면 모든 열. Defaults to None.
+            channel_id (str | None, optional): 이 채널의 파일만. Defaults to None.
+            month (str | None, optional): 이 월의 파일만. Defaults to None.
+            batch_size (int, optional): parquet 파일에서 한 번에 읽을 최대 행 수. Defaults to 65536.
+
+        Yields:
+            pa.RecordBatch: 레코드 배치
+        """
+        for shard in self._shards(channel_id, month):
+            path = str(self.directory / shard.path)
+            if self.format == "parquet":
+                yield from pq.ParquetFile(path, memory_map=True).iter_batches(batch_size=batch_size, columns=columns)
+                continue
+            reader = pa.ipc.open_file(pa.memory_map(path))
+            for index in range(reader.num_record_batches):
+                batch = reader.get_batch(index)
+                yield batch.select(columns) if columns else batch
+
+    def read_table(
+        self, columns: list[str] | None = None, channel_id: str | None = None, month: str | None = None
+    ) -> "pa.Table":
+        """조건에 맞는 파일을 하나의 테이블로 읽습니다."""
+        schema = pa.schema([self.schema.field(name) for name in columns]) if columns else self.schema
+        return pa.Table.from_batches(list(self.iter_batches(columns, channel_id, month)), schema=schema)
+
+    def _write_file(self, path: Path, rows: list[dict[str, Any]]) -> None:
+        table = pa.Table.from_pydict({name: [row[name] for row in rows] for name in self.schema.names}, self.schema)
+        if self.format == "parquet":
+            pq.write_table(table, path, compression="zstd")
+            return
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, self.schema) as writer:
+            writer.write_table(table)
+
+
+class JsonlExportStore(_FileExportStore):
+    """raw_data를 압축한 JSON Lines 파일로 내보냅니다. pyarrow가 없을 때 사용합니다.
+
+    Python 3.14 이상이면 zstd, 아니면 gzip으로 압축합니다. 압축 파일이라 메모리 맵으로 읽을 수는 없고 순서대로 읽습니다.
+    """
+
+    format = "jsonl"
+
+    def __init__(self, directory: str):
+        self.extension = "jsonl.zst" if zstd is not None else "jsonl.gz"
+        super().__init__(directory)
+
+    def iter_rows(
+        self, columns: list[str] | None = None, channel_id: str | None = None, month: str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """내보낸 파일의 행을 하나씩 반환합니다. 시각 열은 datetime으로 변환합니다."""
+        names = columns or list(RAW_DATA_EXPORT_COLUMNS)
+        timestamps = [name for name in names if RAW_DATA_EXPORT_COLUMNS[name] == "timestamp"]
+        for shard in self._shards(channel_id, month):
+            with self._open(self.directory / shard.path, "rt", shard.path) as file:
+                for line in file:
+                    data = json.loads(line)
+                    row = {name: data.get(name) for name in names}
+                    for name in timestamps:
+                        if row[name] is not None:
+                            row[name] = datetime.datetime.fromisoformat(row[name])
+                    yield row
+
+    def _write_file(self, path: Path, rows: list[dict[str, Any]]) -> None:
+        with self._open(path, "wt", self.extension) as file:
+            for row in rows:
+                file.write(json.dumps(row, ensure_ascii=False, default=datetime.datetime.isoformat))
+                file.write("\n")
+
+    @staticmethod
+    def _open(path: Path, mode: str, name: str) -> Any:
+        # 압축 방식은 파일 이름(확장자)으로 결정하므로 Python 버전이 바뀌어도 이전 파일을 읽을 수 있음
+        if name.endswith(".zst"):
+            return zstd.open(path, mode, encoding="utf-8")
+        return gzip.open(path, mode, encoding="utf-8")
+
+
+def create_raw_data_export_store(directory: str, file_format: ExportFormat) -> RawDataExportStore:
+    """설정한 형식의 내보내기 저장소를 만듭니다. pyarrow가 없으면 JSON Lines 형식을 사용합니다."""
+    if file_format == "jsonl" or not PYARROW_AVAILABLE:
+        return JsonlExportStore(directory)
+    return ArrowExportStore(directory, file_format)
@@ -1,11 +1,129 @@
 # infrastructure/config/settings.py
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
+from shared.utils import YOUTUBE_DEFAULT_BACKFILL_START
+
 
 class Settings(BaseSettings):
     YOUTUBE_API_KEY: str
     MONGO_URI: str
 
+    # 크롤링 동시성 설정
+    CRAWL_MAX_CONCURRENCY: int = 8  # 한 번의 실행에서 동시에 처리할 최대 채널 수
+    CRAWL_PER_KEY_CONCURRENCY: int = 4  # API 키 하나당 동시에 보낼 수 있는 최대 요청 수
+    CRAWL_BACKFILL_START: str = YOUTUBE_DEFAULT_BACKFILL_START  # 워터마크가 없는 채널의 수집 시작 시각
+    CRAWL_WATERMARK_LOOKBACK_MINUTES: int = 60  # 증분 수집 시 워터마크보다 앞당겨 검색할 시간
+    CRAWL_ENUMERATION_MODE: Literal["search", "playlist"] = "search"  # 비디오 목록 조회 방식의 기본값
+    CRAWL_UPLOAD_RATE_LOOKBACK_DAYS: int = 90  # 채널별 업로드 빈도를 추정할 때 참고하는 기간
+    # 증분 수집 한 번의 쿼터 예산. 지정하면 업로드 빈도로 계산한 우선순위가 높은 채널부터 예산 안에서만 수집
+    CRAWL_FETCH_QUOTA_BUDGET: int | None = None
+    CRAWL_MIN_EXPECTED_NEW_VIDEOS: float = 0.5  # 예산을 지정한 수집에서 이보다 예상 신규 비디오가 적은 채널은 건너뜀
+
+    # 백그라운드 크롤링 작업 설정
+    CRAWL_JOB_WORKERS: int = 1  # 동시에 실행할 크롤링 작업 수 (작업 안의 채널 병렬도는 CRAWL_MAX_CONCURRENCY)
+    CRAWL_JOB_PROGRESS_INTERVAL: float = 2.0  # 초, 진행 상황 저장 및 취소 요청 확인 주기
+
+    # 수집 스케줄러 설정
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_POLL_INTERVAL: float = 60.0  # 초, 실행 시각이 된 일정을 확인하는 주기
+    SCHEDULER_MAX_CHANNELS_PER_RUN: int = 20  # 작업 하나에 묶을 최대 채널 수
+
+    # YouTube API HTTP 커넥션 풀 설정 (HTTP/2를 사용하려면 h2 패키지가 필요)
+    YOUTUBE_HTTP2: bool = False
+    YOUTUBE_HTTP_MAX_CONNECTIONS: int = 20
+    YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    YOUTUBE_HTTP_KEEPALIVE_EXPIRY: float = 30.0  # 초
+    YOUTUBE_HTTP_TIMEOUT: float = 10.0  # 초
+    YOUTUBE_HTTP_CONNECT_TIMEOUT: float = 5.0  # 초
+
+    # YouTube API 요청 안정성 설정 (키별 속도 제한, 429/5xx 재시도, 엔드포인트별 서킷 브레이커)
+    YOUTUBE_RATE_LIMIT_PER_SECOND: float = 10.0  # 키 하나로 초당 보낼 수 있는 요청 수
+    YOUTUBE_RATE_LIMIT_BURST: float = 20.0  # 키 하나로 한 번에 몰아서 보낼 수 있는 요청 수
+    YOUTUBE_RETRY_MAX_ATTEMPTS: int = 4  # 첫 요청을 포함한 최대 시도 횟수 (1이면 재시도하지 않음)
+    YOUTUBE_RETRY_BASE_DELAY: float = 0.5  # 초, 지수 백오프의 첫 대기 시간
+    YOUTUBE_RETRY_MAX_DELAY: float = 30.0  # 초
+    YOUTUBE_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속으로 이만큼 실패하면 엔드포인트 요청을 잠시 차단
+    YOUTUBE_CIRCUIT_RESET_TIMEOUT: float = 30.0  # 초, 차단 후 시험 요청을 보내기까지의 시간
+
+    # YouTube API 응답 캐시 설정 (TTL 안의 응답은 요청 없이 재사용, 이후에는 ETag로 조건부 요청)
+    YOUTUBE_CACHE_ENABLED: bool = True
+    YOUTUBE_CACHE_MAX_ENTRIES: int = 10000  # 메모리 LRU에 보관할 최대 응답 수
+    YOUTUBE_CACHE_TTL: dict[str, float] = {  # 초, 엔드포인트별 응답 유효 시간 (JSON 객체로 지정)
+        "channels": 7 * 24 * 3600,
+        "search": 300,
+        "playlistItems": 300,
+        "videos": 3600,
+    }
+    YOUTUBE_CACHE_STALE_TTL: float = 7 * 24 * 3600  # 초, 유효 시간이 지난 응답을 조건부 요청용으로 보관하는 시간
+    YOUTUBE_CACHE_MONGO_ENABLED: bool = False  # MongoDB(api_response_cache)에도 저장해 재시작 후에도 재사용
+
+    # 벡터 저장소 및 임베딩 설정
+    QDRANT_URL: str = "http://localhost:6333"  # ":memory:"이면 프로세스 안의 인메모리 Qdrant 사용
+    QDRANT_API_KEY: str | None = None
+    QDRANT_COLLECTION: str = "video_chunks"
+    EMBEDDING_PROVIDER: Literal["gemini", "hashing"] = "gemini"  # hashing은 API 없이 동작하는 로컬 개발용
+    GEMINI_API_KEY: str | None = None  # 지정하지 않으면 google-genai가 GOOGLE_API_KEY 환경 변수를 사용
+    EMBEDDING_MODEL: str = "gemini-embedding-001"
+    EMBEDDING_DIMENSION: int = 768
+    EMBEDDING_BATCH_SIZE: int = 64  # 임베딩 요청 하나에 담을 청크 수 (Gemini는 최대 100)
+    EMBEDDING_CONCURRENCY: int = 4  # 동시에 보낼 임베딩 요청 수
+    EMBEDDING_UPSERT_BATCH_SIZE: int = 512  # Qdrant 업서트 한 번에 담을 포인트 수
+    CHUNK_STRATEGY: Literal["time", "token"] = "time"
+    CHUNK_WINDOW_SECONDS: float = 60.0  # 시간 기준 청크의 길이
+    CHUNK_OVERLAP_SECONDS: float = 10.0
+    CHUNK_MAX_TOKENS: int = 200  # 단어 기준 청크의 길이 (제목/설명은 항상 단어 기준)
+    CHUNK_OVERLAP_TOKENS: int = 40
+
+    # 임베딩 캐시 설정 (정규화한 청크 텍스트와 모델의 해시 → 벡터)
+    EMBEDDING_CACHE_BACKEND: Literal["none", "mongo", "disk"] = "mongo"  # disk는 로컬 파일을 메모리 맵으로 사용
+    EMBEDDING_CACHE_DTYPE: Literal["float16", "float32"] = "float16"  # 벡터 저장 자료형
+    EMBEDDING_CACHE_DIR: str = ".cache/embeddings"  # disk 백엔드의 파일 위치
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 1_000_000  # 정리할 때 남길 최대 벡터 수
+    EMBEDDING_CACHE_MAX_UNUSED_DAYS: int = 90  # 정리할 때 이 기간 동안 사용하지 않은 벡터는 삭제
+
+    # 검색 API 설정
+    SEARCH_QUERY_CACHE_SIZE: int = 1024  # 임베딩을 보관할 최근 검색어 수 (0이면 보관하지 않음)
+    SEARCH_BATCH_MAX_SIZE: int = 16  # 한 번의 임베딩 요청으로 묶을 최대 검색어 수 (1이면 묶지 않음)
+    SEARCH_BATCH_MAX_WAIT: float = 0.005  # 초, 다른 검색어가 모이기를 기다리는 최대 시간
+    SEARCH_LATENCY_WINDOW: int = 1000  # p50/p95를 계산할 최근 요청 수
+    SEARCH_RRF_K: int = 60  # 벡터/단어 검색 순위를 합칠 때 낮은 순위의 영향을 줄이는 상수
+    SEARCH_CANDIDATE_MULTIPLIER: int = 4  # hybrid 검색에서 방식별로 limit의 몇 배만큼 후보를 가져올지
+
+    # 단어 색인(BM25) 설정
+    LEXICAL_INDEX_ENABLED: bool = True  # False면 검색은 벡터 검색만 사용
+    LEXICAL_INDEX_DIR: str = ".cache/lexical_index"
+    LEXICAL_INDEX_COMMIT_EVERY: int = 200_000  # 색인할 때 이 수만큼 청크가 모이면 세그먼트로 저장
+    LEXICAL_INDEX_MAX_SEGMENTS: int = 8  # 세그먼트가 이보다 많아지면 하나로 합침
+
+    # raw_data 내보내기 설정 (채널/월 파티션별 파일)
+    RAW_DATA_EXPORT_DIR: str = "exports/raw_data"
+    RAW_DATA_EXPORT_FORMAT: Literal["parquet", "arrow", "jsonl"] = "parquet"  # pyarrow가 없으면 jsonl로 내보냄
+    RAW_DATA_EXPORT_BATCH_SIZE: int = 2000  # MongoDB 커서가 한 번에 가져올 문서 수
+    RAW_DATA_EXPORT_ROWS_PER_SHARD: int = 100_000  # 파일 하나에 들어갈 최대 행 수
+    RAW_DATA_EXPORT_INCLUDE_RAW: bool = True  # 원본 raw_data와 details를 JSON 문자열 열로 포함할지 여부
+    RAW_DATA_EXPORT_SETTLE_MINUTES: int = 10  # 이보다 최근에 저장된 비디오는 다음 실행에서 내보냄
+
+    # 채널/비디오 목록 조회 설정
+    LIST_STREAM_PAGE_SIZE: int = 500  # NDJSON으로 스트리밍할 때 한 번에 조회하는 문서 수
+
+    # 채널 일괄 등록 설정
+    CHANNEL_IMPORT_CONCURRENCY: int = 8  # 핸들을 동시에 조회하는 요청 수
+    CHANNEL_IMPORT_MAX_ROWS: int = 5000  # 한 번에 등록할 수 있는 최대 채널 수
+
+    # 자막 수집 설정 (요청이 많으면 YouTube가 IP를 차단할 수 있으므로 동시성을 낮게 유지)
+    TRANSCRIPT_LANGUAGES: list[str] = ["ko", "en"]  # 우선순위 순서의 자막 언어 코드 (JSON 배열로 지정)
+    TRANSCRIPT_CONCURRENCY: int = 4
+    TRANSCRIPT_BATCH_SIZE: int = 100
+    TRANSCRIPT_MAX_ATTEMPTS: int = 3  # 이 횟수만큼 실패한 비디오는 더 이상 시도하지 않음
+
+    # 감사 로그 버퍼 설정
+    LOG_BATCH_SIZE: int = 200  # 이 개수만큼 모이면 즉시 저장
+    LOG_FLUSH_INTERVAL: float = 1.0  # 초, 로그가 적어도 이 간격마다 저장
+    LOG_MAX_QUEUE_SIZE: int = 10000
+    LOG_OVERFLOW_POLICY: Literal["block", "drop"] = "block"  # 큐가 가득 찼을 때 기다릴지, 새 로그를 버릴지
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,9 +1,31 @@
 import datetime
 from dataclasses import fields, is_dataclass
-from typing import Any, Type, TypeVar
+from functools import cache
+from typing import Any, Callable, Generic, Type, TypeVar
 
 YOUTUBE_API_RESET_HOUR = 7
 YOUTUBE_API_QUOTA_LIMIT = 10000
+YOUTUBE_SEARCH_QUOTA_COST = 100
+YOUTUBE_CHANNEL_QUOTA_COST = 1
+YOUTUBE_SEARCH_QUOTA_THRESHOLD = 8000  # 이 사용량 이하일 때만 검색(100 유닛) 요청을 허용
+YOUTUBE_CHANNEL_QUOTA_THRESHOLD = 9900  # 이 사용량 이하일 때만 채널(1 유닛) 요청을 허용
+# 엔드포인트별 요청 1회당 쿼터 비용과 요청을 허용하는 최대 사용량
+YOUTUBE_QUOTA_COSTS = {
+    "search": YOUTUBE_SEARCH_QUOTA_COST,
+    "channels": YOUTUBE_CHANNEL_QUOTA_COST,
+    "playlistItems": 1,
+    "videos": 1,
+}
+YOUTUBE_QUOTA_THRESHOLDS = {
+    "search": YOUTUBE_SEARCH_QUOTA_THRESHOLD,
+    "channels": YOUTUBE_CHANNEL_QUOTA_THRESHOLD,
+    "playlistItems": YOUTUBE_CHANNEL_QUOTA_THRESHOLD,
+    "videos": YOUTUBE_CHANNEL_QUOTA_THRESHOLD,
+}
+YOUTUBE_SEARCH_RESULT_CAP = 500  # search API가 하나의 검색 조건으로 돌려주는 최대 결과 수
+YOUTUBE_VIDEOS_PER_REQUEST = 50  # videos.list 한 번에 조회할 수 있는 최대 동영상 수
+YOUTUBE_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+YOUTUBE_DEFAULT_BACKFILL_START = "2023-01-01T00:00:00Z"  # 워터마크가 없는 채널의 기본 수집 시작 시각
 
 
 def is_quota_reseted(updated_at: datetime.datetime) -> bool:
@@ -25,6 +47,132 @@ def is_quota_reseted(updated_at: datetime.datetime) -> bool:
     return False
 
 
+def parse_youtube_datetime(value: str | None) -> datetime.datetime | None:
+    """YouTube API의 RFC 3339 시간 문자열을 UTC datetime으로 변환하는 유틸리티 함수
+
+    Args:
+        value (str | None): 예) "2024-01-01T12:34:56Z"
+
+    Returns:
+        datetime.datetime | None: 변환된 시간 또는 값이 없거나 형식이 잘못된 경우 None
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return as_utc(parsed)
+
+
+def as_utc(value: datetime.datetime) -> datetime.datetime:
+    """datetime을 tzinfo가 있는 UTC 시간으로 맞추는 유틸리티 함수
+
+    MongoDB에서 읽은 시간은 tzinfo가 없는 UTC 값이므로 UTC로 간주합니다.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value.astimezone(datetime.timezone.utc)
+
+
+def format_youtube_datetime(value: datetime.datetime) -> str:
+    """datetime을 YouTube API 요청 파라미터 형식(RFC 3339, UTC)으로 변환하는 유틸리티 함수"""
+    return as_utc(value).strftime(YOUTUBE_DATETIME_FORMAT)
+
+
+def split_time_window(
+    published_after: datetime.datetime, published_before: datetime.datetime, parts: int
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """시간 구간을 같은 길이의 하위 구간으로 나누는 유틸리티 함수
+
+    Returns:
+        list[tuple[datetime.datetime, datetime.datetime]]: 오래된 순서로 정렬된 하위 구간 목록
+    """
+    parts = max(parts, 2)
+    step = (published_before - published_after) / parts
+    boundaries = [published_after + step * index for index in range(parts)] + [published_before]
+    return [(boundaries[index], boundaries[index + 1]) for index in range(parts)]
+
+
+def get_last_quota_reset_time(now: datetime.datetime | None = None) -> datetime.datetime:
+    """가장 최근의 쿼터 리셋 시각(UTC)을 계산하는 유틸리티 함수
+
+    Args:
+        now (datetime.datetime | None, optional): 기준 시각. Defaults to 현재 시각.
+
+    Returns:
+        datetime.datetime: 기준 시각 이전의 가장 최근 리셋 시각
+    """
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+    reset_time = now.replace(hour=YOUTUBE_API_RESET_HOUR, minute=0, second=0, microsecond=0)
+    if now < reset_time:
+        reset_time -= datetime.timedelta(days=1)
+    return reset_time
+
+
+def parse_cron_field(value: str, minimum: int, maximum: int) -> set[int]:
+    """cron 필드 하나를 허용 값 집합으로 변환하는 유틸리티 함수
+
+    "*", "5", "1,15", "9-18", "*/10", "0-30/5" 형식을 지원합니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 범위를 벗어난 경우
+    """
+    allowed: set[int] = set()
+    for part in value.split(","):
+        range_part, _, step_part = part.partition("/")
+        step = int(step_part) if step_part else 1
+        if range_part == "*":
+            start, end = minimum, maximum
+        elif "-" in range_part:
+            start, end = (int(bound) for bound in range_part.split("-", 1))
+        else:
+            start = end = int(range_part)
+        if step < 1 or start < minimum or end > maximum or start > end:
+            raise ValueError(f"잘못된 cron 필드입니다: {value}")
+        allowed.update(range(start, end + 1, step))
+    return allowed
+
+
+def next_cron_time(expression: str, after: datetime.datetime) -> datetime.datetime:
+    """cron 표현식(분 시 일 월 요일, UTC 기준)으로 after 이후의 다음 실행 시각을 계산하는 유틸리티 함수
+
+    요일은 0(일요일)부터 6(토요일)까지이며, 일과 요일이 모두 지정되면 둘 다 만족하는 날만 실행합니다.
+
+    Args:
+        expression (str): 예) "30 */6 * * *" (6시간마다 30분)
+        after (datetime.datetime): 기준 시각
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 1년 안에 실행 시각이 없는 경우
+
+    Returns:
+        datetime.datetime: 다음 실행 시각 (UTC)
+    """
+    fields_ = expression.split()
+    if len(fields_) != 5:
+        raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression}")
+    minutes = sorted(parse_cron_field(fields_[0], 0, 59))
+    hours = sorted(parse_cron_field(fields_[1], 0, 23))
+    days = parse_cron_field(fields_[2], 1, 31)
+    months = parse_cron_field(fields_[3], 1, 12)
+    weekdays = parse_cron_field(fields_[4], 0, 6)
+
+    start = as_utc(after).replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+    day = start.replace(hour=0, minute=0)
+    for _ in range(366):
+        # datetime.weekday()는 월요일이 0이므로 cron 요일(일요일 0)로 맞춤
+        if day.day in days and day.month in months and (day.weekday() + 1) % 7 in weekdays:
+            for hour in hours:
+                for minute in minutes:
+                    candidate = day.replace(hour=hour, minute=minute)
+                    if candidate >= start:
+                        return candidate
+        day += datetime.timedelta(days=1)
+    raise ValueError(f"1년 안에 실행 시각이 없는 cron 표현식입니다: {expression}")
+
+
 def is_quota_exceeded(quota_used: int, updated_at: datetime.datetime) -> bool:
     """API 키의 쿼터 사용량이 한도를 초과했는지 확인하는 유틸리티 함수
 
@@ -43,12 +191,53 @@ def is_quota_exceeded(quota_used: int, updated_at: datetime.datetime) -> bool:
 T = TypeVar("T")
 
 
+def _compile_to_dict(field_names: tuple[str, ...]) -> Callable[[Any], dict[str, Any]]:
+    # dataclasses가 __init__을 만들 때처럼, 필드를 속성으로 직접 읽어 딕셔너리를 만드는 함수를 클래스마다 한 번 생성
+    items = ", ".join(f"{name!r}: instance.{name}" for name in field_names)
+    namespace: dict[str, Any] = {}
+    exec(f"def to_dict(instance):\n    return {{{items}}}\n", namespace)
+    return namespace["to_dict"]
+
+
+class DataClassConverter(Generic[T]):
+    """데이터클래스와 딕셔너리를 변환하는 클래스별 변환기
+
+    필드 이름 목록과 집합, to_dict 함수를 처음 만들 때 한 번만 만들어 호출마다 fields()를 다시 읽지 않습니다.
+    dataclass_converter로 클래스마다 하나씩 만들어 재사용합니다.
+    """
+
+    __slots__ = ("cls", "field_names", "_field_set", "_to_dict")
+
+    def __init__(self, cls: Type[T]):
+        if not is_dataclass(cls):
+            raise ValueError(f"{cls} is not a dataclass")
+        self.cls = cls
+        self.field_names = tuple(field.name for field in fields(cls))
+        self._field_set = frozenset(self.field_names)
+        self._to_dict = _compile_to_dict(self.field_names)
+
+    def from_dict(self, data: dict[str, Any]) -> T:
+        """필드가 아닌 키(예: MongoDB의 _id)는 무시하고 인스턴스를 생성합니다."""
+        field_set = self._field_set
+        return self.cls(**{key: value for key, value in data.items() if key in field_set})
+
+    def to_dict(self, instance: T) -> dict[str, Any]:
+        """필드 값으로 새 딕셔너리를 만듭니다. (얕은 복사, 반환한 딕셔너리를 바꿔도 인스턴스는 바뀌지 않음)"""
+        return self._to_dict(instance)
+
+
+@cache
+def dataclass_converter(cls: Type[T]) -> DataClassConverter[T]:
+    """클래스별 변환기를 반환합니다. 클래스마다 한 번만 만듭니다."""
+    return DataClassConverter(cls)
+
+
 def data_class_from_dict(cls: Type[T], data: dict[str, Any]) -> T:
     """딕셔너리로 부터 데이터클래스 인스턴스를 생성하는 유틸리티 함수
 
     Args:
-        cls (Type[T]): _description_
-        data (dict[str, Any]): _description_
+        cls (Type[T]): 생성할 데이터클래스
+        data (dict[str, Any]): 필드 값 딕셔너리. 필드가 아닌 키는 무시합니다.
 
     Raises:
         ValueError: _cls_ 가 데이터클래스가 아닐 경우
@@ -56,8 +245,18 @@ def data_class_from_dict(cls: Type[T], data: dict[str, Any]) -> T:
     Returns:
         T: _cls_ 타입의 데이터클래스 인스턴스
     """
-    if not is_dataclass(cls):
-        raise ValueError(f"{cls} is not a dataclass")
-    valid_keys = [field.name for field in fields(cls)]
-    data = {k: v for k, v in data.items() if k in valid_keys}
-    return cls(**data)
+    return dataclass_converter(cls).from_dict(data)
+
+
+def data_class_to_dict(instance: Any) -> dict[str, Any]:
+    """데이터클래스 인스턴스의 필드 값으로 새 딕셔너리를 만드는 유틸리티 함수
+
+    dataclasses.asdict와 달리 값을 재귀적으로 복사하지 않습니다.
+
+    Args:
+        instance (Any): 데이터클래스 인스턴스
+
+    Returns:
+        dict[str, Any]: 필드 이름 → 값
+    """
+    return dataclass_converter(type(instance)).to_dict(instance)
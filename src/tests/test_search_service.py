@@ -0,0 +1,249 @@
+"""SearchService를 인메모리 Qdrant, 디스크 BM25 색인, HashingEmbedder로 검증합니다.
+
+cd src && python -m pytest tests
+"""
+
+import asyncio
+import datetime
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+
+from application.services.chunking import make_chunk_id
+from application.services.search_service import QueryEmbeddingBatcher, SearchService
+from domain.adapter.embedder import EmbeddingTask
+from domain.model.embedding import DocumentChunk
+from domain.model.search import SearchFilter
+from infrastructure.api.hashing_embedder import HashingEmbedder
+from infrastructure.persistence.bm25_index import DiskBm25Index
+from infrastructure.persistence.qdrant_repository import QdrantVectorRepository
+
+# 인메모리 Qdrant는 페이로드 인덱스 없이 필터를 처리한다는 경고를 출력함
+pytestmark = pytest.mark.filterwarnings("ignore:Payload indexes have no effect")
+
+
+def _chunk(video_id: str, channel_id: str, streamer_name: str, published_at: datetime.date, text: str) -> DocumentChunk:
+    return DocumentChunk(
+        chunk_id=make_chunk_id(video_id, "snippet", 0),
+        video_id=video_id,
+        channel_id=channel_id,
+        streamer_name=streamer_name,
+        source="snippet",
+        chunk_index=0,
+        text=text,
+        published_at=datetime.datetime.combine(published_at, datetime.time(), tzinfo=datetime.timezone.utc),
+    )
+
+
+CHUNKS = [
+    _chunk("v1", "UC_a", "alice", datetime.date(2024, 1, 10), "minecraft survival build"),
+    _chunk("v2", "UC_b", "bob", datetime.date(2024, 3, 5), "minecraft speedrun record"),
+    _chunk("v3", "UC_a", "alice", datetime.date(2024, 6, 20), "minecraft hardcore ending"),
+    _chunk("v4", "UC_c", "carol", datetime.date(2023, 12, 1), "cooking ramen stream"),
+]
+
+
+class FailingEmbedder(HashingEmbedder):
+    """fail이 True이면 요청마다 오류를 발생시키고, drop이 True이면 벡터를 하나 덜 반환하는 임베더"""
+
+    def __init__(self):
+        super().__init__()
+        self.fail = True
+        self.drop = False
+        self.request_count = 0
+
+    async def embed(self, texts: list[str], task: EmbeddingTask = "document") -> list[list[float]]:
+        self.request_count += 1
+        if self.fail:
+            raise RuntimeError("embedding API unavailable")
+        vectors = await super().embed(texts, task)
+        return vectors[:-1] if self.drop else vectors
+
+
+async def _make_service(
+    tmp_path,
+    chunks: list[DocumentChunk] = CHUNKS,
+    vectors: list[list[float]] | None = None,
+    unembedded: list[DocumentChunk] | None = None,
+    embedder: HashingEmbedder | None = None,
+    lexical: bool = True,
+    **kwargs,
+) -> SearchService:
+    """chunks를 벡터 저장소와 단어 색인에 넣고, unembedded는 단어 색인에만 넣습니다."""
+    embedder = embedder or HashingEmbedder()
+    vector_repo = QdrantVectorRepository(AsyncQdrantClient(location=":memory:"))
+    await vector_repo.ensure_collection(embedder.dimension)
+    if vectors is None:
+        vectors = await HashingEmbedder(embedder.dimension).embed([chunk.text for chunk in chunks])
+    await vector_repo.upsert_chunks(chunks, vectors)
+    lexical_index = None
+    if lexical:
+        lexical_index = DiskBm25Index(str(tmp_path / "bm25"))
+        for chunk in [*chunks, *(unembedded or [])]:
+            await lexical_index.add_video(chunk.video_id, chunk.text, [chunk])
+        await lexical_index.commit()
+    return SearchService(embedder, vector_repo, lexical_index, **kwargs)
+
+
+@pytest.mark.parametrize("mode", ["vector", "lexical", "hybrid"])
+@pytest.mark.parametrize(
+    ("search_filter", "expected"),
+    [
+        (SearchFilter(streamer_name="alice"), {"v1", "v3"}),
+        (SearchFilter(channel_id="UC_b"), {"v2"}),
+        (
+            SearchFilter(
+                published_from=datetime.datetime(2024, 2, 1, tzinfo=datetime.timezone.utc),
+                published_to=datetime.datetime(2024, 4, 1, tzinfo=datetime.timezone.utc),
+            ),
+            {"v2"},
+        ),
+        (
+            SearchFilter(channel_id="UC_a", published_from=datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc)),
+            {"v3"},
+        ),
+        (SearchFilter(streamer_name="nobody"), set()),
+    ],
+)
+def test_search_applies_filter(tmp_path, mode, search_filter, expected):
+    async def scenario():
+        service = await _make_service(tmp_path)
+        return await service.search("minecraft", limit=10, search_filter=search_filter, mode=mode)
+
+    hits = asyncio.run(scenario())
+    assert {hit.video_id for hit in hits} == expected
+
+
+def test_vector_mode_ranks_by_similarity(tmp_path):
+    async def scenario():
+        service = await _make_service(tmp_path)
+        return await service.search("Minecraft  speedrun record", limit=2, mode="vector")
+
+    hits = asyncio.run(scenario())
+    assert len(hits) == 2
+    assert hits[0].video_id == "v2"
+    assert hits[0].score == pytest.approx(1.0)
+    assert hits[0].score >= hits[1].score
+
+
+def test_lexical_mode_returns_bm25_scores(tmp_path):
+    async def scenario():
+        service = await _make_service(tmp_path)
+        hits = await service.search("speedrun", mode="lexical")
+        return hits, await service.lexical_index.search("speedrun")
+
+    hits, expected = asyncio.run(scenario())
+    assert [(hit.chunk_id, hit.score) for hit in hits] == expected
+    assert [hit.video_id for hit in hits] == ["v2"]
+    assert hits[0].text == "minecraft speedrun record"
+
+
+def test_lexical_mode_skips_chunks_missing_from_vector_store(tmp_path):
+    unembedded = _chunk("v5", "UC_a", "alice", datetime.date(2024, 7, 1), "minecraft speedrun again")
+
+    async def scenario():
+        service = await _make_service(tmp_path, unembedded=[unembedded])
+        return await service.search("speedrun", mode="lexical")
+
+    hits = asyncio.run(scenario())
+    assert [hit.video_id for hit in hits] == ["v2"]
+
+
+def test_hybrid_mode_resolves_lexical_only_hits(tmp_path):
+    # 벡터가 검색어와 같은 청크 5개는 단어가 겹치지 않고, 단어가 일치하는 청크는 벡터가 반대 방향이라
+    # 벡터 후보(limit * candidate_multiplier = 4개)에 들어가지 않고 단어 검색에만 나옴
+    embedder = HashingEmbedder()
+    query_vector = embedder.embed_one("zeppelin")
+    near = [_chunk(f"n{index}", "UC_a", "alice", datetime.date(2024, 1, index + 1), "unrelated") for index in range(5)]
+    lexical_only = _chunk("z1", "UC_b", "bob", datetime.date(2024, 2, 1), "zeppelin")
+    vectors = [query_vector] * len(near) + [[-value for value in query_vector]]
+
+    async def scenario():
+        service = await _make_service(
+            tmp_path, chunks=[*near, lexical_only], vectors=vectors, embedder=embedder, rrf_k=60, candidate_multiplier=2
+        )
+        vector_hits = await service.search("zeppelin", limit=4, mode="vector")
+        hybrid_hits = await service.search("zeppelin", limit=2, mode="hybrid")
+        return vector_hits, hybrid_hits
+
+    vector_hits, hybrid_hits = asyncio.run(scenario())
+    assert lexical_only.chunk_id not in {hit.chunk_id for hit in vector_hits}
+    by_id = {hit.chunk_id: hit for hit in hybrid_hits}
+    assert len(hybrid_hits) == 2
+    assert lexical_only.chunk_id in by_id
+    # 벡터 저장소에서 조회한 페이로드와 RRF 점수(단어 검색 1위)
+    assert by_id[lexical_only.chunk_id].video_id == "z1"
+    assert by_id[lexical_only.chunk_id].text == "zeppelin"
+    assert by_id[lexical_only.chunk_id].score == pytest.approx(1 / 61)
+
+
+def test_hybrid_mode_fuses_both_rankings(tmp_path):
+    async def scenario():
+        service = await _make_service(tmp_path)
+        return await service.search("minecraft speedrun", limit=4, mode="hybrid")
+
+    hits = asyncio.run(scenario())
+    assert hits[0].video_id == "v2"
+    # 벡터와 단어 검색 모두 1위면 두 순위의 점수를 더함
+    assert hits[0].score == pytest.approx(2 / 61)
+    assert [hit.score for hit in hits] == sorted((hit.score for hit in hits), reverse=True)
+
+
+def test_without_lexical_index(tmp_path):
+    async def scenario():
+        service = await _make_service(tmp_path, lexical=False)
+        hybrid_hits = await service.search("minecraft speedrun", limit=1, mode="hybrid")
+        with pytest.raises(ValueError):
+            await service.search("minecraft", mode="lexical")
+        return hybrid_hits
+
+    hits = asyncio.run(scenario())
+    # 단어 색인이 없으면 hybrid는 벡터 검색 결과(코사인 유사도)를 반환
+    assert [hit.video_id for hit in hits] == ["v2"]
+    assert 0 < hits[0].score <= 1
+
+
+def test_batcher_propagates_batch_failure_to_every_waiter():
+    embedder = FailingEmbedder()
+    batcher = QueryEmbeddingBatcher(embedder, max_batch_size=16, max_wait=0.01)
+
+    async def scenario():
+        return await asyncio.gather(
+            batcher.embed("minecraft"), batcher.embed("ramen"), batcher.embed("minecraft"), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert embedder.request_count == 1
+    assert batcher.batch_count == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len({id(result) for result in results}) == 1
+
+
+def test_batcher_rejects_mismatched_vector_count():
+    embedder = FailingEmbedder()
+    embedder.fail = False
+    embedder.drop = True
+    batcher = QueryEmbeddingBatcher(embedder, max_batch_size=2, max_wait=1.0)
+
+    async def scenario():
+        return await asyncio.gather(batcher.embed("minecraft"), batcher.embed("ramen"), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.parametrize("mode", ["vector", "hybrid"])
+def test_search_propagates_embedding_failure_without_caching(tmp_path, mode):
+    embedder = FailingEmbedder()
+
+    async def scenario():
+        service = await _make_service(tmp_path, embedder=embedder)
+        with pytest.raises(RuntimeError, match="embedding API unavailable"):
+            await service.search("minecraft speedrun", mode=mode)
+        embedder.fail = False
+        return await service.search("minecraft speedrun", limit=1, mode=mode)
+
+    hits = asyncio.run(scenario())
+    # 실패한 검색어는 캐시되지 않아 다시 임베딩함
+    assert embedder.request_count == 2
+    assert [hit.video_id for hit in hits] == ["v2"]